@@ -5,29 +5,69 @@
 - 에러 핸들링 강화
 - 구조 확인 기능 추가
 
-last_updated : 2025.09.30
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 
 import time
 import pandas as pd
 import os
+import sys
 import glob
 from datetime import datetime
 from random import randint
+from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from driver_coupang import make_driver
 from navigator_coupang import go_to_page
+from config_coupang import (
+    DETAIL_BRAND_TEXT,
+    CATEGORY_USE_BREADCRUMB,
+    PARSE_REVIEW_ARTICLE,
+    PARSE_REVIEWER_NAME,
+    PARSE_REVIEW_RATING,
+    PARSE_REVIEW_DATE,
+    PARSE_REVIEW_TEXT,
+    PARSE_REVIEW_OPTION,
+    PARSE_REVIEW_HELP,
+    PARSE_SURVEY,
+    PARSE_SURVEY_ROW,
+    PARSE_SURVEY_LABEL,
+    PARSE_SURVEY_VALUE
+)
+
+# collector 공통 모듈 (스냅샷, HTML 파서 백엔드, 워커 풀)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from snapshot import SnapshotRecorder
+from html_backend import Selector, parse_html
+from worker_pool import CrawlerWorkerPool
+
+# 리뷰 저장 폴더 (제품별 CSV, 통합 CSV, 워커 풀 체크포인트)
+REVIEWS_DIR = os.path.join("data", "data_coupang", "raw_data", "reviews_coupang")
+
+# 파싱 셀렉터 (모듈 로드 시 한 번만 컴파일)
+SEL_BRAND = Selector(DETAIL_BRAND_TEXT)
+SEL_BREADCRUMB = Selector(CATEGORY_USE_BREADCRUMB)
+SEL_ARTICLE = Selector(PARSE_REVIEW_ARTICLE)
+SEL_REVIEWER_NAME = Selector(PARSE_REVIEWER_NAME)
+SEL_RATING = Selector(PARSE_REVIEW_RATING)
+SEL_DATE = Selector(PARSE_REVIEW_DATE)
+SEL_CONTENT = Selector(PARSE_REVIEW_TEXT)
+SEL_OPTION = Selector(PARSE_REVIEW_OPTION)
+SEL_HELP = Selector(PARSE_REVIEW_HELP)
+SEL_SURVEY = Selector(PARSE_SURVEY)
+SEL_SURVEY_ROW = Selector(PARSE_SURVEY_ROW)
+SEL_SURVEY_LABEL = Selector(PARSE_SURVEY_LABEL)
+SEL_SURVEY_VALUE = Selector(PARSE_SURVEY_VALUE)
 
 #//==============================================================================//#
 # 디버깅: 페이지 구조 확인
 #//==============================================================================//#
 def debug_page_structure(driver, product_name):
     """현재 페이지의 리뷰 구조를 분석"""
-    from bs4 import BeautifulSoup
-    
     print(f"\n{'='*60}")
     print(f"🔍 페이지 구조 디버깅: {product_name[:50]}")
     print(f"{'='*60}")
@@ -94,13 +134,178 @@ def debug_page_structure(driver, product_name):
     print(f"\n{'='*60}\n")
     return True
 
+#//==============================================================================//#
+# 페이지 파싱 (드라이버 없이 HTML만 사용 - 스냅샷 재생에서도 같은 함수 사용)
+#//==============================================================================//#
+def parse_product_meta(html):
+    """제품 상세 페이지에서 브랜드명, 세부 카테고리(breadcrumb 마지막 두 항목) 추출"""
+    doc = parse_html(html)
+
+    brand_name = ""
+    brand_elem = doc.select_one(SEL_BRAND)
+    if brand_elem:
+        brand_name = brand_elem.text.strip()
+
+    category_use = ""
+    breadcrumb_items = doc.select(SEL_BREADCRUMB)
+    if breadcrumb_items:
+        if len(breadcrumb_items) >= 2:
+            category_use = f"{breadcrumb_items[-2].text.strip()} > {breadcrumb_items[-1].text.strip()}"
+        else:
+            category_use = breadcrumb_items[-1].text.strip()
+
+    return brand_name, category_use
+
+
+def parse_review_page(html, product_info, page, collection_date, brand_name="", category_use="", debug_mode=False):
+    """
+    리뷰 페이지 HTML → 리뷰 데이터 리스트
+
+    Args:
+        html: 리뷰 탭이 열린 페이지의 page_source
+        product_info: 제품 CSV 행
+        page: 리뷰 페이지 번호 (review_id 생성)
+        collection_date: 수집 시작 시각
+        brand_name, category_use: parse_product_meta 결과
+
+    Returns:
+        (리뷰 리스트, 리뷰 컨테이너 수) - 컨테이너가 0이면 빈 페이지
+    """
+    doc = parse_html(html)
+
+    # 리뷰 컨테이너 찾기
+    review_containers = doc.select(SEL_ARTICLE)
+    if not review_containers:
+        return [], 0
+
+    # 모든 help_count를 data-count 속성에서 수집 (page_source에 그대로 있으므로 드라이버 조회 불필요)
+    all_help_counts = [elem.get("data-count") or "0" for elem in doc.select(SEL_HELP)]
+    print(f"(help_count {len(all_help_counts)}개)", end=" ")
+
+    # 평가 항목 수집 (향 만족도, 발색 등) - 있으면
+    all_survey_data = []
+    try:
+        survey_containers = doc.select(SEL_SURVEY)
+
+        if debug_mode and page == 1:
+            print(f"\n  🔍 Survey 컨테이너 발견: {len(survey_containers)}개")
+
+        for survey_elem in survey_containers:
+            survey_dict = {}
+            items = survey_elem.select(SEL_SURVEY_ROW)
+
+            for item in items:
+                label_elem = item.select_one(SEL_SURVEY_LABEL)
+                value_elem = item.select_one(SEL_SURVEY_VALUE)
+                if label_elem and value_elem:
+                    label = label_elem.text.strip()
+                    value = value_elem.text.strip()
+                    survey_dict[label] = value
+
+                    if debug_mode and page == 1 and len(all_survey_data) == 0:
+                        print(f"    • {label}: {value}")
+
+            all_survey_data.append(survey_dict)
+
+        if debug_mode and page == 1:
+            print(f"  📊 총 survey_data 수집: {len(all_survey_data)}개")
+            if len(all_survey_data) == 0:
+                print(f"  ⚠️ Survey 데이터 없음 - 이 제품에는 평가 항목이 없을 수 있습니다")
+
+    except Exception as e:
+        if debug_mode:
+            print(f"  ❌ Survey 수집 오류: {e}")
+
+    reviews = []
+    for idx, container in enumerate(review_containers):
+        try:
+            # 리뷰어 이름
+            reviewer_name_elem = container.select_one(SEL_REVIEWER_NAME)
+            reviewer_name = reviewer_name_elem.text.strip() if reviewer_name_elem else "익명"
+
+            # 평점
+            rating_elem = container.select_one(SEL_RATING)
+            rating = rating_elem.get("data-rating") if rating_elem else "0"
+
+            # 리뷰 날짜
+            date_elem = container.select_one(SEL_DATE)
+            review_date = date_elem.text.strip() if date_elem else ""
+
+            # 리뷰 내용
+            content_elem = container.select_one(SEL_CONTENT)
+            review_text = content_elem.text.strip() if content_elem else None
+
+            if not review_text:
+                continue
+
+            # 도움이 됨 카운트 (순서 매칭)
+            helpful_count = all_help_counts[idx] if idx < len(all_help_counts) else "0"
+
+            # 선택 옵션 (구매 옵션)
+            selected_option = ""
+            try:
+                option_elem = container.select_one(SEL_OPTION)
+                if option_elem:
+                    selected_option = option_elem.text.strip()
+            except:
+                pass
+
+            # 평가 항목 (향 만족도, 발색 등) - 순서 매칭
+            survey_data = all_survey_data[idx] if idx < len(all_survey_data) else {}
+
+            if debug_mode and page == 1 and idx == 0:
+                print(f"\n  📋 첫 번째 리뷰의 survey_data: {survey_data}")
+
+            # review_id 생성
+            review_id = f"coupang_{product_info['rank']:03d}_{page:03d}_{idx+1:03d}"
+
+            # 리뷰 데이터 구성 (표준 컬럼명 사용 + survey_data 포함)
+            review_data = {
+                'review_id': review_id,
+                'captured_at': collection_date,
+                'channel': 'Coupang',
+                'product_url': product_info['url'],
+                'product_name': product_info['name'],
+                'brand': brand_name,
+                'category': product_info['category'],
+                'category_use': category_use,
+                'product_price_sale': product_info.get('sale_price', ''),
+                'product_price_origin': product_info.get('original_price', ''),
+                'sort_type': product_info['sort_type'],
+                'ranking': product_info['rank'],
+                'reviewer_name': reviewer_name,
+                'rating': rating,
+                'review_date': review_date,
+                'selected_option': selected_option,
+                'helpful_count': helpful_count,
+                'review_text': review_text
+            }
+
+            # survey_data 추가 (향 만족도, 발색 등)
+            review_data.update(survey_data)
+
+            if debug_mode and page == 1 and idx == 0:
+                print(f"  💾 첫 번째 리뷰 전체 데이터 키: {list(review_data.keys())}")
+
+            reviews.append(review_data)
+
+        except Exception as e:
+            if debug_mode:
+                print(f"\n  ⚠️ 리뷰 파싱 오류 (idx={idx}): {e}")
+            continue
+
+    return reviews, len(review_containers)
+
 #//==============================================================================//#
 # 리뷰 수집 함수 (개선 버전)
 #//==============================================================================//#
-def collect_product_reviews(driver, product_info, max_pages_per_product, collection_date, debug_mode=False):
-    """개별 제품의 리뷰 수집 (페이지네이션 포함)"""
-    from bs4 import BeautifulSoup
-    
+def collect_product_reviews(driver, product_info, max_pages_per_product, collection_date, debug_mode=False,
+                            recorder=None):
+    """
+    개별 제품의 리뷰 수집 (페이지네이션 포함)
+
+    recorder(SnapshotRecorder)가 있으면 파싱한 페이지 HTML을 스냅샷으로 저장
+    """
     all_reviews = []
     page = 1
     
@@ -114,20 +319,8 @@ def collect_product_reviews(driver, product_info, max_pages_per_product, collect
     category_use = ""
     
     try:
-        doc_initial = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # 브랜드명 추출
-        brand_elem = doc_initial.find("div", class_="twc-text-sm twc-text-blue-600")
-        if brand_elem:
-            brand_name = brand_elem.text.strip()
-        
-        # 세부 카테고리 추출 (breadcrumb 마지막 두 항목)
-        breadcrumb_items = doc_initial.select("ul.breadcrumb li a")
-        if breadcrumb_items:
-            if len(breadcrumb_items) >= 2:
-                category_use = f"{breadcrumb_items[-2].text.strip()} > {breadcrumb_items[-1].text.strip()}"
-            else:
-                category_use = breadcrumb_items[-1].text.strip()
+        brand_name, category_use = parse_product_meta(driver.page_source)
+        if category_use:
             print(f"    [브랜드: {brand_name}] [세부카테고리: {category_use}]")
     except Exception as e:
         print(f"    [제품정보 추출 실패: {e}]")
@@ -139,13 +332,19 @@ def collect_product_reviews(driver, product_info, max_pages_per_product, collect
         try:
             print(f"  페이지 {page} 처리 중...", end=" ")
             
-            # BeautifulSoup 파싱
-            doc = BeautifulSoup(driver.page_source, "html.parser")
+            html = driver.page_source
+            if recorder:
+                recorder.save(
+                    "coupang_review_page", html,
+                    product_info=product_info, page=page, collection_date=collection_date,
+                    brand_name=brand_name, category_use=category_use
+                )
             
-            # 리뷰 컨테이너 찾기
-            review_containers = doc.find_all("article", class_="sdp-review__article__list")
+            page_review_list, container_count = parse_review_page(
+                html, product_info, page, collection_date, brand_name, category_use, debug_mode=debug_mode
+            )
             
-            if not review_containers:
+            if not container_count:
                 print("리뷰 없음", end=" ")
                 consecutive_empty_pages += 1
                 
@@ -164,127 +363,8 @@ def collect_product_reviews(driver, product_info, max_pages_per_product, collect
             # 리뷰 있으면 카운터 리셋
             consecutive_empty_pages = 0
             
-            # 모든 help_count를 data-count 속성에서 수집
-            all_help_counts = []
-            try:
-                help_containers = driver.find_elements(By.CSS_SELECTOR, ".sdp-review__article__list__help")
-                all_help_counts = [elem.get_attribute("data-count") or "0" for elem in help_containers]
-                print(f"(help_count {len(all_help_counts)}개)", end=" ")
-            except Exception as e:
-                print(f"(help_count오류:{e})", end=" ")
-            
-            # 평가 항목 수집 (향 만족도, 발색 등) - 있으면
-            all_survey_data = []
-            try:
-                survey_containers = doc.find_all("div", class_="sdp-review__article__list__survey")
-                
-                if debug_mode and page == 1:
-                    print(f"\n  🔍 Survey 컨테이너 발견: {len(survey_containers)}개")
-                
-                for survey_elem in survey_containers:
-                    survey_dict = {}
-                    items = survey_elem.find_all("div", class_="sdp-review__article__list__survey__row")
-                    
-                    for item in items:
-                        label_elem = item.find("span", class_="sdp-review__article__list__survey__row__label")
-                        value_elem = item.find("span", class_="sdp-review__article__list__survey__row__value")
-                        if label_elem and value_elem:
-                            label = label_elem.text.strip()
-                            value = value_elem.text.strip()
-                            survey_dict[label] = value
-                            
-                            if debug_mode and page == 1 and len(all_survey_data) == 0:
-                                print(f"    • {label}: {value}")
-                    
-                    all_survey_data.append(survey_dict)
-                
-                if debug_mode and page == 1:
-                    print(f"  📊 총 survey_data 수집: {len(all_survey_data)}개")
-                    if len(all_survey_data) == 0:
-                        print(f"  ⚠️ Survey 데이터 없음 - 이 제품에는 평가 항목이 없을 수 있습니다")
-                    
-            except Exception as e:
-                if debug_mode:
-                    print(f"  ❌ Survey 수집 오류: {e}")
-            
-            page_reviews = 0
-            for idx, container in enumerate(review_containers):
-                try:
-                    # 리뷰어 이름
-                    reviewer_name_elem = container.find("span", class_="sdp-review__article__list__info__user__name")
-                    reviewer_name = reviewer_name_elem.text.strip() if reviewer_name_elem else "익명"
-                    
-                    # 평점
-                    rating_elem = container.find(attrs={"data-rating": True})
-                    rating = rating_elem.get("data-rating") if rating_elem else "0"
-                    
-                    # 리뷰 날짜
-                    date_elem = container.find(class_='sdp-review__article__list__info__product-info__reg-date')
-                    review_date = date_elem.text.strip() if date_elem else ""
-                    
-                    # 리뷰 내용
-                    content_elem = container.find(class_='sdp-review__article__list__review__content')
-                    review_text = content_elem.text.strip() if content_elem else None
-                    
-                    if not review_text:
-                        continue
-                    
-                    # 도움이 됨 카운트 (순서 매칭)
-                    helpful_count = all_help_counts[idx] if idx < len(all_help_counts) else "0"
-                    
-                    # 선택 옵션 (구매 옵션)
-                    selected_option = ""
-                    try:
-                        option_elem = container.find("div", class_="sdp-review__article__list__info__product-info__name")
-                        if option_elem:
-                            selected_option = option_elem.text.strip()
-                    except:
-                        pass
-                    
-                    # 평가 항목 (향 만족도, 발색 등) - 순서 매칭
-                    survey_data = all_survey_data[idx] if idx < len(all_survey_data) else {}
-                    
-                    if debug_mode and page == 1 and idx == 0:
-                        print(f"\n  📋 첫 번째 리뷰의 survey_data: {survey_data}")
-                    
-                    # review_id 생성
-                    review_id = f"coupang_{product_info['rank']:03d}_{page:03d}_{idx+1:03d}"
-                    
-                    # 리뷰 데이터 구성 (표준 컬럼명 사용 + survey_data 포함)
-                    review_data = {
-                        'review_id': review_id,
-                        'captured_at': collection_date,
-                        'channel': 'Coupang',
-                        'product_url': product_info['url'],
-                        'product_name': product_info['name'],
-                        'brand': brand_name,
-                        'category': product_info['category'],
-                        'category_use': category_use,
-                        'product_price_sale': product_info.get('sale_price', ''),
-                        'product_price_origin': product_info.get('original_price', ''),
-                        'sort_type': product_info['sort_type'],
-                        'ranking': product_info['rank'],
-                        'reviewer_name': reviewer_name,
-                        'rating': rating,
-                        'review_date': review_date,
-                        'selected_option': selected_option,
-                        'helpful_count': helpful_count,
-                        'review_text': review_text
-                    }
-                    
-                    # survey_data 추가 (향 만족도, 발색 등)
-                    review_data.update(survey_data)
-                    
-                    if debug_mode and page == 1 and idx == 0:
-                        print(f"  💾 첫 번째 리뷰 전체 데이터 키: {list(review_data.keys())}")
-                    
-                    all_reviews.append(review_data)
-                    page_reviews += 1
-                    
-                except Exception as e:
-                    if debug_mode:
-                        print(f"\n  ⚠️ 리뷰 파싱 오류 (idx={idx}): {e}")
-                    continue
+            all_reviews.extend(page_review_list)
+            page_reviews = len(page_review_list)
             
             print(f"✓ {page_reviews}개 리뷰")
             
@@ -311,7 +391,7 @@ def collect_product_reviews(driver, product_info, max_pages_per_product, collect
     
     # 제품별 즉시 저장
     if all_reviews:
-        reviews_dir = os.path.join("data", "data_coupang", "raw_data", "reviews_coupang")
+        reviews_dir = REVIEWS_DIR
         os.makedirs(reviews_dir, exist_ok=True)
         
         safe_name = product_info['name'].replace('/', '_').replace('\\', '_')[:50]
@@ -366,10 +446,63 @@ def load_products_from_csv():
     print(f"\n✓ 총 제품 수: {len(all_products)}개")
     return all_products
 
+#//==============================================================================//#
+# 제품 1개 리뷰 수집 (워커 작업 단위)
+#//==============================================================================//#
+def collect_one_product(driver, product, max_pages_per_product, collection_date, debug_mode=False, recorder=None):
+    """
+    제품 페이지 열기 → 리뷰 컨테이너 대기 → 리뷰 수집/저장
+
+    Returns:
+        리뷰 리스트 (페이지는 열렸지만 리뷰가 없는 제품은 빈 리스트)
+    
+    Raises:
+        TimeoutException: 리뷰 컨테이너가 나타나지 않음 (페이지 로딩 실패 → 풀에서 재시도 후 실패 처리)
+    """
+    print(f"\n{'='*60}")
+    print(f"[rank {product['rank']}] {product['name'][:50]}...")
+    print(f"{'='*60}")
+    
+    driver.get(product['url'])
+    print(f"📍 URL: {product['url']}")
+    
+    # 페이지 로딩 대기 (리뷰 컨테이너가 나타날 때까지)
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, PARSE_REVIEW_ARTICLE))
+        )
+        print("✓ 페이지 로딩 완료")
+        time.sleep(2)
+    except TimeoutException:
+        print("⚠️ 페이지 로딩 타임아웃 (리뷰가 없을 수 있음)")
+        
+        if debug_mode:
+            debug_page_structure(driver, product['name'])
+        
+        # 완료로 기록되면 다음 실행에서 건너뛰므로 실패로 올림
+        raise
+    
+    reviews = collect_product_reviews(
+        driver, 
+        product, 
+        max_pages_per_product, 
+        collection_date,
+        debug_mode=debug_mode,
+        recorder=recorder
+    )
+    
+    if reviews:
+        print(f"✅ 완료: {len(reviews)}개 리뷰")
+    else:
+        print(f"⚠️ 완료: 리뷰 없음")
+    
+    return reviews
+
 #//==============================================================================//#
 # 리뷰 수집 메인 함수
 #//==============================================================================//#
-def crawl_reviews_only(max_pages_per_product=None, start_from=0, debug_mode=False):
+def crawl_reviews_only(max_pages_per_product=None, start_from=0, debug_mode=False, snapshot_dir=None,
+                       num_workers=1, driver_factory=make_driver):
     """
     기존 제품 CSV에서 읽어온 제품들의 리뷰만 수집
     
@@ -377,6 +510,11 @@ def crawl_reviews_only(max_pages_per_product=None, start_from=0, debug_mode=Fals
         max_pages_per_product: 제품당 최대 페이지 수 (None = 무제한)
         start_from: 몇 번째 제품부터 시작할지 (0부터 시작)
         debug_mode: 디버그 모드 활성화 (True/False)
+        snapshot_dir: 리뷰 페이지 HTML 스냅샷 저장 폴더 (None이면 COLLECTOR_SNAPSHOT_DIR 환경변수, 둘 다 없으면 저장 안 함)
+        num_workers: 동시에 띄울 브라우저 수 (제품 단위로 나눠서 수집)
+        driver_factory: 드라이버 생성 함수 (테스트 시 가짜 드라이버)
+    
+    중단 후 다시 실행하면 완료된 제품은 체크포인트(reviews_coupang/_pool/progress.jsonl) 기준으로 건너뜁니다.
     """
     print("\n" + "="*60)
     print("🛒 쿠팡 리뷰 수집 시작 (제품 CSV 읽기)")
@@ -386,6 +524,12 @@ def crawl_reviews_only(max_pages_per_product=None, start_from=0, debug_mode=Fals
     collection_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"⏰ 수집 시작 시간: {collection_date}")
     print(f"🔧 디버그 모드: {'ON' if debug_mode else 'OFF'}")
+    print(f"🧵 브라우저 수: {num_workers}개")
+    
+    # 스냅샷 모드 (replay_snapshots.py로 오프라인 재생)
+    recorder = SnapshotRecorder(snapshot_dir, "coupang") if snapshot_dir else SnapshotRecorder.from_env("coupang")
+    if recorder:
+        print(f"📸 스냅샷 저장: {recorder.dir}")
     
     # CSV에서 제품 정보 로드
     products = load_products_from_csv()
@@ -399,83 +543,41 @@ def crawl_reviews_only(max_pages_per_product=None, start_from=0, debug_mode=Fals
         products = products[start_from:]
         print(f"\n▶️ {start_from+1}번째 제품부터 시작 (남은 제품: {len(products)}개)")
     
-    driver = make_driver()
+    # 리뷰 없는 제품 (완료로 기록되지만 성공 개수에서는 제외)
+    empty_products = []
+    
+    def task(driver, product):
+        reviews = collect_one_product(
+            driver, product, max_pages_per_product, collection_date, debug_mode=debug_mode, recorder=recorder
+        )
+        if not reviews:
+            empty_products.append(product['url'])
+        return reviews
+    
+    # 제품별 작업 큐 (워커마다 드라이버 1개, 제품 사이 2~4초 대기)
+    pool = CrawlerWorkerPool(
+        driver_factory=driver_factory,
+        task=task,
+        num_workers=num_workers,
+        state_dir=os.path.join(REVIEWS_DIR, "_pool"),
+        # 같은 제품이 여러 정렬 목록에 있으면 목록별로 따로 수집/저장 (리뷰 파일명과 같은 기준)
+        key=lambda product: f"{product['category']}:{product['sort_type']}:{product['url']}",
+        delay=(2, 4)
+    )
+    summary = pool.run(products)
+    
+    # 이전 실행분까지 합친 통합 파일
+    pool.write_csv(os.path.join(REVIEWS_DIR, "coupang_all_reviews.csv"))
     
-    try:
-        success_count = 0
-        fail_count = 0
-        total_reviews = 0
-        
-        for i, product in enumerate(products, start=start_from+1):
-            print(f"\n{'='*60}")
-            print(f"[{i}/{start_from+len(products)}] {product['name'][:50]}...")
-            print(f"{'='*60}")
-            
-            try:
-                driver.get(product['url'])
-                print(f"📍 URL: {product['url']}")
-                
-                # 페이지 로딩 대기 (리뷰 컨테이너가 나타날 때까지)
-                try:
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "article.sdp-review__article__list"))
-                    )
-                    print("✓ 페이지 로딩 완료")
-                    time.sleep(2)
-                except:
-                    print("⚠️ 페이지 로딩 타임아웃 (리뷰가 없을 수 있음)")
-                    fail_count += 1
-                    
-                    if debug_mode:
-                        debug_page_structure(driver, product['name'])
-                    
-                    time.sleep(2)
-                    continue
-                
-                reviews = collect_product_reviews(
-                    driver, 
-                    product, 
-                    max_pages_per_product, 
-                    collection_date,
-                    debug_mode=debug_mode
-                )
-                
-                if reviews:
-                    print(f"✅ 완료: {len(reviews)}개 리뷰")
-                    success_count += 1
-                    total_reviews += len(reviews)
-                else:
-                    print(f"⚠️ 완료: 리뷰 없음")
-                    fail_count += 1
-                
-                time.sleep(randint(2, 4))
-                
-            except Exception as e:
-                print(f"❌ 오류: {e}")
-                fail_count += 1
-                if debug_mode:
-                    import traceback
-                    traceback.print_exc()
-                continue
-        
-        print("\n" + "="*60)
-        print("🎉 리뷰 수집 완료!")
-        print("="*60)
-        print(f"✅ 성공: {success_count}개 제품")
-        print(f"❌ 실패: {fail_count}개 제품")
-        print(f"📊 총 리뷰: {total_reviews}개")
-        print("="*60)
-        
-    except KeyboardInterrupt:
-        print(f"\n\n⚠️ 사용자에 의해 중단됨 (마지막 처리: {i}번째 제품)")
-        print(f"💡 다음 실행 시 start_from={i}로 시작하면 이어서 진행 가능")
-    except Exception as e:
-        print(f"\n❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-    finally:
-        driver.quit()
-        print("\n🔒 브라우저 종료")
+    print("\n" + "="*60)
+    print("🎉 리뷰 수집 완료!")
+    print("="*60)
+    print(f"✅ 성공: {summary['done'] - len(empty_products)}개 제품")
+    print(f"⚠️ 리뷰 없음: {len(empty_products)}개 제품")
+    print(f"❌ 실패: {summary['failed']}개 제품")
+    print(f"⏭️ 이전 실행에서 완료: {summary['skipped']}개 제품")
+    print(f"📊 총 리뷰: {summary['records']}개")
+    print("="*60)
 
 #//==============================================================================//#
 # 메인 실행
@@ -485,9 +587,13 @@ if __name__ == "__main__":
     MAX_PAGES_PER_PRODUCT = None  # None = 모든 페이지, 숫자 = 제한
     START_FROM = 0  # 몇 번째 제품부터 시작할지 (0부터 시작)
     DEBUG_MODE = True  # 첫 제품에서 구조 확인 후 진행
+    SNAPSHOT_DIR = None  # 예: "snapshots" → 리뷰 페이지 HTML 저장 (replay_snapshots.py로 재생)
+    NUM_WORKERS = 1  # 동시에 띄울 브라우저 수
     
     crawl_reviews_only(
         max_pages_per_product=MAX_PAGES_PER_PRODUCT,
         start_from=START_FROM,
-        debug_mode=DEBUG_MODE
+        debug_mode=DEBUG_MODE,
+        snapshot_dir=SNAPSHOT_DIR,
+        num_workers=NUM_WORKERS
     )
\ No newline at end of file
@@ -6,7 +6,7 @@
 - 필터링 키워드
 - 정렬 옵션 매핑
 
-last_updated : 2025.09.10
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 
@@ -129,3 +129,38 @@ REVIEW_SURVEY_ANSWER = ".sdp-review__article__list__survey_row__answer"
 REVIEW_PAGE_NUMBERS = ".js_reviewArticlePageBtn"  # 페이지 번호 버튼들
 REVIEW_NEXT_BUTTON = ".js_reviewArticlePageNextBtn"  # 다음 페이지 버튼
 REVIEW_CURRENT_PAGE = ".sdp-review__article__page__num--active"  # 현재 활성 페이지
+
+#//==============================================================================//#
+# 10. HTML 파서 셀렉터 (page_source 파싱 - html_backend에서 한 번만 컴파일)
+#//==============================================================================//#
+# 제품 상세 페이지 (crawler_coupang.parse_product_info)
+DETAIL_PRODUCT_NAME = "span.twc-font-bold"
+DETAIL_BRAND_LINK = "a.brand-info"
+# class 값 전체 일치 (기존 find(class_="twc-text-sm twc-text-blue-600")와 동일, 클래스가 더 붙은 div는 제외)
+DETAIL_BRAND_TEXT = 'div[class="twc-text-sm twc-text-blue-600"]'   # collect_reviews_only 브랜드명
+DETAIL_PRICE_SALE = "div.price-amount.final-price-amount"
+DETAIL_PRICE_ORIGIN = "div.price-amount.original-price-amount"
+
+# 리뷰 article
+PARSE_REVIEW_ARTICLE = "article.sdp-review__article__list"
+PARSE_REVIEWER_NAME = "span.sdp-review__article__list__info__user__name"
+PARSE_REVIEW_RATING = "[data-rating]"                     # data-rating 속성이 있는 첫 요소
+PARSE_REVIEW_RATING_STAR = "div.sdp-review__article__list__info__product-info__star-orange"
+PARSE_REVIEW_DATE = ".sdp-review__article__list__info__product-info__reg-date"
+PARSE_REVIEW_DATE_DIV = "div.sdp-review__article__list__info__product-info__reg-date"
+PARSE_REVIEW_TEXT = ".sdp-review__article__list__review__content"
+PARSE_REVIEW_TEXT_DIV = "div.sdp-review__article__list__review__content"
+PARSE_REVIEW_OPTION = "div.sdp-review__article__list__info__product-info__name"
+PARSE_REVIEW_HELP = ".sdp-review__article__list__help"    # data-count 속성
+PARSE_REVIEW_HELP_BUTTON = "button.twc-inline-flex.twc-items-center"
+
+# 평가 항목 (향 만족도, 발색 등)
+PARSE_SURVEY = "div.sdp-review__article__list__survey"
+PARSE_SURVEY_ROW = "div.sdp-review__article__list__survey__row"
+PARSE_SURVEY_LABEL = "span.sdp-review__article__list__survey__row__label"
+PARSE_SURVEY_VALUE = "span.sdp-review__article__list__survey__row__value"
+PARSE_SURVEY_QUESTION = "span.sdp-review__article__list__survey__row__question"
+PARSE_SURVEY_ANSWER = "span.sdp-review__article__list__survey__row__answer"
+
+# 제품 목록 카드 (parser_coupang.parse_product_cards)
+CARD_LINK = "a"
@@ -12,6 +12,7 @@ import time
 import random
 import pandas as pd
 import os
+import sys
 from datetime import datetime
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
@@ -20,7 +21,49 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from config_coupang import (
+    DETAIL_PRODUCT_NAME,
+    DETAIL_BRAND_LINK,
+    CATEGORY_USE_BREADCRUMB,
+    DETAIL_PRICE_SALE,
+    DETAIL_PRICE_ORIGIN,
+    PARSE_REVIEW_ARTICLE,
+    PARSE_REVIEWER_NAME,
+    PARSE_REVIEW_RATING_STAR,
+    PARSE_REVIEW_DATE_DIV,
+    PARSE_REVIEW_TEXT_DIV,
+    PARSE_REVIEW_OPTION,
+    PARSE_REVIEW_HELP_BUTTON,
+    PARSE_SURVEY,
+    PARSE_SURVEY_ROW,
+    PARSE_SURVEY_QUESTION,
+    PARSE_SURVEY_ANSWER
+)
+
+# collector 공통 모듈 (스냅샷, HTML 파서 백엔드, 워커 풀)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from snapshot import SnapshotRecorder
+from html_backend import Selector, parse_html
+from worker_pool import CrawlerWorkerPool
+from navigator_coupang import collect_product_cards
+
+# 파싱 셀렉터 (모듈 로드 시 한 번만 컴파일)
+SEL_PRODUCT_NAME = Selector(DETAIL_PRODUCT_NAME)
+SEL_BRAND = Selector(DETAIL_BRAND_LINK)
+SEL_BREADCRUMB = Selector(CATEGORY_USE_BREADCRUMB)
+SEL_PRICE_SALE = Selector(DETAIL_PRICE_SALE)
+SEL_PRICE_ORIGIN = Selector(DETAIL_PRICE_ORIGIN)
+SEL_ARTICLE = Selector(PARSE_REVIEW_ARTICLE)
+SEL_CONTENT = Selector(PARSE_REVIEW_TEXT_DIV)
+SEL_REVIEWER_NAME = Selector(PARSE_REVIEWER_NAME)
+SEL_RATING = Selector(PARSE_REVIEW_RATING_STAR)
+SEL_DATE = Selector(PARSE_REVIEW_DATE_DIV)
+SEL_OPTION = Selector(PARSE_REVIEW_OPTION)
+SEL_HELPFUL = Selector(PARSE_REVIEW_HELP_BUTTON)
+SEL_SURVEY = Selector(PARSE_SURVEY)
+SEL_SURVEY_ROW = Selector(PARSE_SURVEY_ROW)
+SEL_SURVEY_QUESTION = Selector(PARSE_SURVEY_QUESTION)
+SEL_SURVEY_ANSWER = Selector(PARSE_SURVEY_ANSWER)
 
 
 # 카테고리 URL
@@ -50,25 +93,35 @@ def make_driver():
     return driver
 
 
-def collect_product_info(driver):
+def collect_product_info(driver, recorder=None):
     """제품 정보 수집"""
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    html = driver.page_source
     product_url = driver.current_url
     
-    tag = soup.select_one('span.twc-font-bold')
+    if recorder:
+        recorder.save("coupang_product_page", html, product_url=product_url)
+    
+    return parse_product_info(html, product_url)
+
+
+def parse_product_info(html, product_url):
+    """제품 상세 페이지 HTML → 제품 정보 (스냅샷 재생에서도 사용)"""
+    soup = parse_html(html)
+    
+    tag = soup.select_one(SEL_PRODUCT_NAME)
     product_name = tag.text.strip() if tag else ''
     
-    tag = soup.select_one('a.brand-info')
+    tag = soup.select_one(SEL_BRAND)
     brand = tag.text.strip() if tag else ''
     
-    tags = soup.select('ul.breadcrumb li a')
+    tags = soup.select(SEL_BREADCRUMB)
     category = tags[-2].text.strip() if len(tags) >= 2 else ''
     category_use = tags[-1].text.strip() if len(tags) >= 3 else ''
     
-    tag = soup.select_one('div.price-amount.final-price-amount')
+    tag = soup.select_one(SEL_PRICE_SALE)
     price_sale = tag.text.strip() if tag else ''
     
-    tag = soup.select_one('div.price-amount.original-price-amount')
+    tag = soup.select_one(SEL_PRICE_ORIGIN)
     price_origin = tag.text.strip() if tag else ''
     
     return {
@@ -82,7 +135,76 @@ def collect_product_info(driver):
     }
 
 
-def collect_reviews(driver, product_info, product_ranking):
+def parse_recency_review_page(html, product_info, product_ranking):
+    """
+    최신순 리뷰 페이지 HTML → 리뷰 리스트 (본문 없는 리뷰 제외, 스냅샷 재생에서도 사용)
+    
+    Returns:
+        (리뷰 리스트, 리뷰 article 수)
+    """
+    soup = parse_html(html)
+    articles = soup.select(SEL_ARTICLE)
+    
+    reviews = []
+    for idx, article in enumerate(articles):
+        # 리뷰 본문 먼저 확인
+        tag = article.select_one(SEL_CONTENT)
+        review_text = tag.text.strip() if tag else ''
+        
+        # 본문 없으면 스킵
+        if not review_text:
+            continue
+        
+        review_id = article.get('data-review-id', '')
+        
+        tag = article.select_one(SEL_REVIEWER_NAME)
+        reviewer_name = tag.text.strip() if tag else ''
+        
+        tag = article.select_one(SEL_RATING)
+        rating = tag.get('data-rating', '') if tag else ''
+        
+        tag = article.select_one(SEL_DATE)
+        review_date = tag.text.strip() if tag else ''
+        
+        tag = article.select_one(SEL_OPTION)
+        selected_option = tag.text.strip() if tag else ''
+        
+        tag = article.select_one(SEL_HELPFUL)
+        helpful_count = tag.text.strip() if tag else ''
+        
+        # survey 데이터
+        survey_data = {}
+        survey_container = article.select_one(SEL_SURVEY)
+        if survey_container:
+            rows = survey_container.select(SEL_SURVEY_ROW)
+            for row in rows:
+                label = row.select_one(SEL_SURVEY_QUESTION)
+                value = row.select_one(SEL_SURVEY_ANSWER)
+                if label and value:
+                    survey_data[label.text.strip()] = value.text.strip()
+        
+        review = {
+            'review_id': review_id,
+            'captured_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'channel': 'Coupang',
+            **product_info,
+            'sort_type': 'RECENCY',
+            'ranking': product_ranking,
+            'reviewer_name': reviewer_name,
+            'rating': rating,
+            'review_date': review_date,
+            'selected_option': selected_option,
+            'helpful_count': helpful_count,
+            'review_text': review_text,
+            **survey_data
+        }
+        
+        reviews.append(review)
+    
+    return reviews, len(articles)
+
+
+def collect_reviews(driver, product_info, product_ranking, recorder=None):
     """리뷰 수집 (본문 없는 리뷰 제외)"""
     all_reviews = []
     page = 1
@@ -92,71 +214,21 @@ def collect_reviews(driver, product_info, product_ranking):
         print(f"    페이지 {page} 수집 중...")
         time.sleep(random.uniform(4, 6))
         
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        articles = soup.select('article.sdp-review__article__list')
+        html = driver.page_source
+        if recorder:
+            recorder.save("coupang_recency_page", html,
+                          product_info=product_info, product_ranking=product_ranking)
+        
+        page_reviews, article_count = parse_recency_review_page(html, product_info, product_ranking)
         
-        if len(articles) == 0:
+        if article_count == 0:
             print(f"    더 이상 리뷰 없음")
             break
         
-        collected_count = 0
-        for idx, article in enumerate(articles):
-            # 리뷰 본문 먼저 확인
-            tag = article.select_one('div.sdp-review__article__list__review__content')
-            review_text = tag.text.strip() if tag else ''
-            
-            # 본문 없으면 스킵
-            if not review_text:
-                continue
-            
-            review_id = article.get('data-review-id', '')
-            
-            tag = article.select_one('span.sdp-review__article__list__info__user__name')
-            reviewer_name = tag.text.strip() if tag else ''
-            
-            tag = article.select_one('div.sdp-review__article__list__info__product-info__star-orange')
-            rating = tag.get('data-rating', '') if tag else ''
-            
-            tag = article.select_one('div.sdp-review__article__list__info__product-info__reg-date')
-            review_date = tag.text.strip() if tag else ''
-            
-            tag = article.select_one('div.sdp-review__article__list__info__product-info__name')
-            selected_option = tag.text.strip() if tag else ''
-            
-            tag = article.select_one('button.twc-inline-flex.twc-items-center')
-            helpful_count = tag.text.strip() if tag else ''
-            
-            # survey 데이터
-            survey_data = {}
-            survey_container = article.select_one('div.sdp-review__article__list__survey')
-            if survey_container:
-                rows = survey_container.select('div.sdp-review__article__list__survey__row')
-                for row in rows:
-                    label = row.select_one('span.sdp-review__article__list__survey__row__question')
-                    value = row.select_one('span.sdp-review__article__list__survey__row__answer')
-                    if label and value:
-                        survey_data[label.text.strip()] = value.text.strip()
-            
-            review = {
-                'review_id': review_id,
-                'captured_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'channel': 'Coupang',
-                **product_info,
-                'sort_type': 'RECENCY',
-                'ranking': product_ranking,
-                'reviewer_name': reviewer_name,
-                'rating': rating,
-                'review_date': review_date,
-                'selected_option': selected_option,
-                'helpful_count': helpful_count,
-                'review_text': review_text,
-                **survey_data
-            }
-            
-            all_reviews.append(review)
-            collected_count += 1
+        all_reviews.extend(page_reviews)
+        collected_count = len(page_reviews)
         
-        print(f"    {collected_count}개 수집 ({len(articles) - collected_count}개 본문 없음)")
+        print(f"    {collected_count}개 수집 ({article_count - collected_count}개 본문 없음)")
         
         if collected_count == 0:
             empty_count += 1
@@ -236,8 +308,82 @@ def get_collected_rankings(save_dir, category_name):
     return collected
 
 
-def crawl_category(driver, category_name, category_url, max_products=100, start_from=1):
-    """카테고리별 크롤링"""
+def open_review_tab(driver):
+    """
+    현재 열린 제품 페이지에서 리뷰 탭 클릭 후 리뷰 로딩 대기
+
+    Raises:
+        Exception: 리뷰 탭을 찾지 못한 경우
+    """
+    # 여러 방법으로 시도
+    review_clicked = False
+    
+    # 방법 1: XPath로 "상품평" 텍스트
+    try:
+        review_tab = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '상품평')]"))
+        )
+        driver.execute_script("arguments[0].click();", review_tab)
+        review_clicked = True
+        print("  리뷰 탭 클릭 성공 (방법 1)")
+    except:
+        pass
+    
+    # 방법 2: CSS Selector
+    if not review_clicked:
+        try:
+            review_tab = driver.find_element(By.CSS_SELECTOR, "a[href*='#sdp-review']")
+            driver.execute_script("arguments[0].click();", review_tab)
+            review_clicked = True
+            print("  리뷰 탭 클릭 성공 (방법 2)")
+        except:
+            pass
+    
+    if not review_clicked:
+        raise Exception("리뷰 탭을 찾을 수 없음")
+    
+    time.sleep(8)
+    
+    # 리뷰 로딩 대기
+    for attempt in range(5):  # ✅ 시도 횟수 증가
+        articles_check = parse_html(driver.page_source).select(SEL_ARTICLE)
+        if len(articles_check) > 0:
+            print(f"  리뷰 로딩 완료 ({len(articles_check)}개)")
+            break
+        print(f"  리뷰 로딩 대기 중... ({attempt+1}/5)")
+        time.sleep(3)
+
+
+def crawl_product(driver, product_url, product_ranking, recorder=None):
+    """
+    제품 1개 크롤링 (CrawlerWorkerPool 작업 단위)
+
+    제품 페이지 열기 → 제품 정보 → 리뷰 탭 → 리뷰 수집 → 제품별 CSV 저장
+    실패 시 예외를 그대로 올려 풀에서 드라이버 재생성 후 재시도
+
+    Returns:
+        list: 수집된 리뷰
+    """
+    driver.get(product_url)
+    time.sleep(4)
+    
+    product_info = collect_product_info(driver, recorder=recorder)
+    print(f"  [{product_ranking}] 제품: {product_info['product_name'][:50]}")
+    
+    open_review_tab(driver)
+    
+    reviews = collect_reviews(driver, product_info, product_ranking, recorder=recorder)
+    save_to_csv(reviews, product_info, product_ranking)
+    return reviews
+
+
+def crawl_category(driver, category_name, category_url, max_products=100, start_from=1, recorder=None):
+    """
+    카테고리별 크롤링
+
+    recorder(SnapshotRecorder)를 넘기면 제품/리뷰 페이지 HTML을 스냅샷으로 저장
+    (replay_snapshots.py로 드라이버 없이 파서 재생)
+    """
     print("\n" + "="*60)
     print(f"{category_name} 크롤링 시작 (랭킹 {start_from}번부터)")
     print("="*60)
@@ -299,50 +445,12 @@ def crawl_category(driver, category_name, category_url, max_products=100, start_
             time.sleep(4)
             
             # 제품 정보 수집
-            product_info = collect_product_info(driver)
+            product_info = collect_product_info(driver, recorder=recorder)
             print(f"  제품: {product_info['product_name'][:50]}")
             
             # ===== 수정된 리뷰 탭 클릭 로직 =====
             try:
-                # 여러 방법으로 시도
-                review_clicked = False
-                
-                # 방법 1: XPath로 "상품평" 텍스트
-                try:
-                    review_tab = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '상품평')]"))
-                    )
-                    driver.execute_script("arguments[0].click();", review_tab)
-                    review_clicked = True
-                    print("  리뷰 탭 클릭 성공 (방법 1)")
-                except:
-                    pass
-                
-                # 방법 2: CSS Selector
-                if not review_clicked:
-                    try:
-                        review_tab = driver.find_element(By.CSS_SELECTOR, "a[href*='#sdp-review']")
-                        driver.execute_script("arguments[0].click();", review_tab)
-                        review_clicked = True
-                        print("  리뷰 탭 클릭 성공 (방법 2)")
-                    except:
-                        pass
-                
-                if not review_clicked:
-                    raise Exception("리뷰 탭을 찾을 수 없음")
-                
-                time.sleep(8)
-                
-                # 리뷰 로딩 대기
-                for attempt in range(5):  # ✅ 시도 횟수 증가
-                    soup_check = BeautifulSoup(driver.page_source, 'html.parser')
-                    articles_check = soup_check.select('article.sdp-review__article__list')
-                    if len(articles_check) > 0:
-                        print(f"  리뷰 로딩 완료 ({len(articles_check)}개)")
-                        break
-                    print(f"  리뷰 로딩 대기 중... ({attempt+1}/5)")
-                    time.sleep(3)
-                
+                open_review_tab(driver)
             except Exception as e:
                 print(f"  리뷰 탭 클릭 실패: {e}")
                 driver.close()
@@ -350,7 +458,7 @@ def crawl_category(driver, category_name, category_url, max_products=100, start_
                 continue
             
             # 리뷰 수집
-            reviews = collect_reviews(driver, product_info, product_ranking)
+            reviews = collect_reviews(driver, product_info, product_ranking, recorder=recorder)
             
             # CSV 저장
             save_to_csv(reviews, product_info, product_ranking)
@@ -379,6 +487,60 @@ def crawl_category(driver, category_name, category_url, max_products=100, start_
     print(f"\n{category_name} 크롤링 완료")
 
 
+def crawl_category_parallel(category_name, category_url, max_products=100, start_from=1, num_workers=3,
+                            driver_factory=make_driver, recorder=None):
+    """
+    카테고리별 병렬 크롤링 (브라우저 num_workers개)
+
+    - 목록 페이지는 드라이버 1개로 한 번만 열어 제품 URL과 랭킹을 확정
+    - 제품은 CrawlerWorkerPool이 워커(브라우저)별로 나눠 수집
+    - 워커마다 4~6초 대기, 3개마다 5분 대기 (기존 crawl_category와 동일한 간격)
+    - 진행 상황은 data/coupang_reviews/_pool에 기록 → 중단 후 재실행 시 이어서 수집
+    """
+    print("\n" + "="*60)
+    print(f"{category_name} 병렬 크롤링 시작 (랭킹 {start_from}번부터, 워커 {num_workers}개)")
+    print("="*60)
+    
+    save_dir = "data/coupang_reviews"
+    collected_rankings = get_collected_rankings(save_dir, category_name)
+    print(f"이미 수집된 제품: {len(collected_rankings)}개")
+    
+    # 목록 페이지에서 제품 URL 확정 (page_source 1회 파싱, 랭킹 = 카드 순서)
+    driver = driver_factory()
+    try:
+        driver.get(category_url)
+        time.sleep(6)
+        cards = collect_product_cards(driver, category_name, "RECENCY", max_products=max_products,
+                                      recorder=recorder)
+    finally:
+        driver.quit()
+    
+    products = [
+        {"url": card["url"], "rank": card["rank"]}
+        for card in cards
+        if card["rank"] >= start_from and card["rank"] not in collected_rankings
+    ]
+    
+    pool = CrawlerWorkerPool(
+        driver_factory=driver_factory,
+        task=lambda driver, product: crawl_product(driver, product["url"], product["rank"], recorder=recorder),
+        num_workers=num_workers,
+        state_dir=os.path.join(save_dir, "_pool"),
+        key=lambda product: f"{category_name}:{product['rank']}",
+        delay=(4, 6),
+        long_pause_every=3,
+        long_pause=300
+    )
+    summary = pool.run(products)
+    
+    # 병렬 수집분 통합 파일 (제품별 CSV는 crawl_product에서 저장)
+    pool.write_csv(os.path.join(save_dir, f"{category_name}_RECENCY_all.csv"))
+    
+    print(f"\n{category_name} 크롤링 완료 - 완료 {summary['done']}개, 실패 {summary['failed']}개, "
+          f"건너뜀 {summary['skipped']}개")
+    return summary
+
+
 def main():
     """메인 함수"""
     print("="*60)
@@ -388,18 +550,27 @@ def main():
     print("제품 3개마다 5분 대기")
     print("="*60)
     
-    driver = make_driver()
+    # 1이면 기존 단일 브라우저 방식, 2 이상이면 브라우저 여러 개로 병렬 수집
+    NUM_WORKERS = 1
     
-    try:
-        # 메이크업만 실행
-        crawl_category(driver, "스킨케어", CATEGORY_URLS['skincare'], max_products=100, start_from=85)
-        
-        print("\n" + "="*60)
-        print("크롤링 완료!")
-        print("="*60)
-        
-    finally:
-        driver.quit()
+    # COLLECTOR_SNAPSHOT_DIR 환경변수가 있으면 페이지 HTML 스냅샷 저장
+    recorder = SnapshotRecorder.from_env("coupang")
+    
+    if NUM_WORKERS > 1:
+        crawl_category_parallel("스킨케어", CATEGORY_URLS['skincare'], max_products=100, start_from=85,
+                                num_workers=NUM_WORKERS, recorder=recorder)
+    else:
+        driver = make_driver()
+        try:
+            # 메이크업만 실행
+            crawl_category(driver, "스킨케어", CATEGORY_URLS['skincare'], max_products=100, start_from=85,
+                           recorder=recorder)
+        finally:
+            driver.quit()
+    
+    print("\n" + "="*60)
+    print("크롤링 완료!")
+    print("="*60)
 
 
 if __name__ == "__main__":
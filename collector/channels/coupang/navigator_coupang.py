@@ -2,10 +2,10 @@
 """
 쿠팡 네비게이션 모듈
 - 페이지 이동 및 대기 로직
-- 제품 카드 수집
+- 제품 카드 수집 (page_source 1회 → parser_coupang.parse_product_cards)
 - 리뷰 페이지네이션 이동 (리뷰 수집은 제외)
 
-last_updated : 2025.09.10
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 
@@ -13,8 +13,8 @@ import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from random import randint
+from parser_coupang import parse_product_cards
 from config_coupang import (
-    PRODUCT_CARD, 
     build_category_url,
     REVIEW_NEXT_BUTTON,
     REVIEW_PAGE_NUMBERS
@@ -38,15 +38,23 @@ def navigate_to_category(driver, category, sort_type, list_size=120):
         print(f"페이지 이동 실패: {e}")
         return False
 
-def collect_product_cards(driver, max_products=100):
-    """제품 카드 요소들 수집"""
+def collect_product_cards(driver, category, sort_type, max_products=100, recorder=None):
+    """
+    현재 목록 페이지의 제품 카드 수집 (카드마다 find_element 왕복 없이 page_source 1회 파싱)
+    
+    recorder(SnapshotRecorder)가 있으면 목록 페이지 HTML을 스냅샷으로 저장
+    
+    Returns:
+        parse_product_cards 결과 (제품 dict 리스트, rank는 카드 순서)
+    """
     try:
-        products = driver.find_elements(By.CSS_SELECTOR, PRODUCT_CARD)
-        print(f"발견된 제품 카드: {len(products)}개")
+        html = driver.page_source
+        if recorder:
+            recorder.save("coupang_listing_page", html, category=category, sort_type=sort_type,
+                          limit=max_products)
         
-        if len(products) > max_products:
-            products = products[:max_products]
-            print(f"최대 {max_products}개로 제한")
+        products = parse_product_cards(html, category, sort_type, limit=max_products)
+        print(f"발견된 제품 카드: {len(products)}개 (최대 {max_products}개)")
         
         return products
         
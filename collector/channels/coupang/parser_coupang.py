@@ -3,19 +3,39 @@
 쿠팡 제품 데이터 파싱 모듈
 - 제품 카드에서 정보 추출
 - 데이터 정제 및 구조화
+- 목록 페이지 HTML 한 번에 파싱 (html_backend - selectolax/lxml)
 
-last_updated : 2025.09.10
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 
+import os
+import sys
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from config_coupang import (
+    PRODUCT_CARD,
+    CARD_LINK,
     PRODUCT_NAME, 
     PRODUCT_PRICE_ORIGINAL,
     PRODUCT_PRICE_SALE,
     PRODUCT_DISCOUNT_RATE
 )
 
+# collector 공통 모듈 (HTML 파서 백엔드)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from html_backend import Selector, parse_html
+
+COUPANG_BASE_URL = "https://www.coupang.com"
+
+# 파싱 셀렉터 (모듈 로드 시 한 번만 컴파일)
+SEL_CARD = Selector(PRODUCT_CARD)
+SEL_CARD_LINK = Selector(CARD_LINK)
+SEL_CARD_NAME = Selector(PRODUCT_NAME)
+SEL_CARD_PRICE_SALE = Selector(PRODUCT_PRICE_SALE)
+SEL_CARD_PRICE_ORIGINAL = Selector(PRODUCT_PRICE_ORIGINAL)
+SEL_CARD_DISCOUNT_RATE = Selector(PRODUCT_DISCOUNT_RATE)
+
 #//==============================================================================//#
 # 제품 데이터 파싱
 #//==============================================================================//#
@@ -65,4 +85,49 @@ def parse_product_card(product, rank, category, sort_type):
         
     except Exception as e:
         print(f"제품 파싱 오류 (순위 {rank}): {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def parse_product_cards(html, category, sort_type, start_rank=1, limit=None):
+    """
+    목록 페이지 HTML에서 제품 카드 전체 파싱 (카드마다 find_element 왕복 없이 page_source 1회)
+
+    parse_product_card와 같은 형식의 리스트를 반환합니다. 필수 항목(링크, 제품명, 할인가)이
+    없는 카드는 건너뛰고 순위는 그대로 증가합니다.
+
+    Args:
+        html: driver.page_source
+        start_rank: 첫 카드 순위
+        limit: 최대 카드 수 (None = 전체)
+    """
+    products = []
+    cards = parse_html(html).select(SEL_CARD)
+    if limit is not None:
+        cards = cards[:limit]
+
+    for rank, card in enumerate(cards, start=start_rank):
+        link_elem = card.select_one(SEL_CARD_LINK)
+        name_elem = card.select_one(SEL_CARD_NAME)
+        sale_price_elem = card.select_one(SEL_CARD_PRICE_SALE)
+
+        if not (link_elem and name_elem and sale_price_elem):
+            print(f"제품 파싱 오류 (순위 {rank}): 필수 항목 없음")
+            continue
+
+        original_price_elem = card.select_one(SEL_CARD_PRICE_ORIGINAL)
+        discount_elem = card.select_one(SEL_CARD_DISCOUNT_RATE)
+
+        products.append({
+            "category": category,
+            "sort_type": sort_type,
+            "rank": rank,
+            "name": name_elem.text.strip(),
+            # get_attribute("href")처럼 절대 URL로
+            "url": urljoin(COUPANG_BASE_URL, link_elem.get("href", "")),
+            "type": "beauty",
+            "sale_price": sale_price_elem.text.strip(),
+            "original_price": original_price_elem.text.strip() if original_price_elem else "",
+            "discount_rate": discount_elem.text.strip() if discount_elem else ""
+        })
+
+    return products
@@ -7,7 +7,7 @@
 - 필터링 키워드
 - 정렬 옵션 매핑
 
-last_updated : 2025.09.14
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 
@@ -98,4 +98,12 @@ NEXT_BUTTON = "button.btn-next"
 CURRENT_PAGE = "li.number.active"
 PREV_BUTTON = "button.btn-prev"
 REVIEW_SECTION = "ul.review-list"
-REVIEW_ITEM = "div.cont"
\ No newline at end of file
+REVIEW_ITEM = "div.cont"
+#//==============================================================================//#
+# 8. 리뷰 이미지 다운로드 (downloader.ReviewImageDownloader)
+#//==============================================================================//#
+REVIEW_IMAGE_MAX = 3             # 리뷰당 최대 이미지 수
+IMAGE_DOWNLOAD_WORKERS = 4       # 동시 다운로드 수
+IMAGE_DOWNLOAD_RETRIES = 3       # 연결 오류 / 5xx / 429 재시도 횟수
+IMAGE_DOWNLOAD_BACKOFF = 0.5     # 첫 재시도 대기(초), 재시도마다 2배
+IMAGE_DOWNLOAD_TIMEOUT = 10      # 요청 타임아웃(초)
@@ -28,7 +28,11 @@ sys.path.insert(0, src_dir)
 
 # 다이소 모듈 import
 from parser import DaisoProductCollector
-from driver import DriverConfig
+from driver import make_driver, close_driver, DriverConfig
+
+# collector 공통 모듈 (워커 풀)
+sys.path.insert(0, os.path.join(current_dir, "..", ".."))
+from worker_pool import CrawlerWorkerPool
 
 #//==============================================================================//#
 # 설정
@@ -39,6 +43,9 @@ TARGET_SORTS = ["SALES", "REVIEW", "LIKE"]
 # 기본 카테고리별 목표 수집 개수
 TARGET_COUNT = 100
 
+# 리뷰 수집 시 동시에 띄울 브라우저 수 (1이면 기존처럼 순차 수집)
+REVIEW_WORKERS = 1
+
 # 드라이버 설정
 DRIVER_CONFIG = DriverConfig(
     headless=True,  # 백그라운드 실행
@@ -134,21 +141,60 @@ def print_summary(summary: Dict, start_time: datetime):
 #//==============================================================================//#
 # 리뷰 크롤링 
 #//==============================================================================//#
-def crawl_daiso_reviews():
+def crawl_product_reviews(driver, product):
+    """
+    제품 1개 리뷰 수집 (CrawlerWorkerPool 작업 단위)
+
+    실패 시 예외를 그대로 올려 풀에서 드라이버 재생성 후 재시도
+
+    Returns:
+        List[Dict]: 수집된 리뷰 리스트
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    
+    print(f"\n{product['name']} 리뷰 수집 중...")
+    
+    # 제품 페이지로 이동
+    driver.get(product['url'])
+    time.sleep(2)
+    
+    # 리뷰 버튼 클릭
+    review_button = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable((By.XPATH, "//button[contains(., '리뷰')]"))
+    )
+    review_button.click()
+    time.sleep(2)
+    
+    # 가격 정보 수집 (리뷰 페이지에서)
+    product_price = None
+    try:
+        price_elem = driver.find_element(By.CSS_SELECTOR, "span.value")
+        product_price = price_elem.text.strip()
+    except:
+        product_price = "가격 정보 없음"
+    
+    # 리뷰 데이터 수집
+    reviews = collect_product_reviews(driver, product, product_price)
+    
+    print(f"수집된 리뷰: {len(reviews)}개, 가격: {product_price}")
+    return reviews
+
+def crawl_daiso_reviews(num_workers=REVIEW_WORKERS):
     """
     수집된 제품 URL로부터 리뷰 데이터 크롤링
+    
+    Args:
+        num_workers: 동시에 띄울 브라우저 수
+    
+    진행 상황은 reviews_daiso/_pool에 기록되어 중단 후 다시 실행하면 남은 제품만 수집
     """
     print("\n=== 다이소 리뷰 크롤링 시작 ===")
     
     # CSV 파일들 읽어오기
-    import re
     import glob
     import pandas as pd
-    from bs4 import BeautifulSoup
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from random import randint
     
     products_dir = "data_daiso/products_daiso"
     csv_files = []
@@ -184,71 +230,48 @@ def crawl_daiso_reviews():
     os.makedirs(reviews_dir, exist_ok=True)
     
     try:
-        with DaisoProductCollector(DRIVER_CONFIG) as collector:
-            all_reviews = []
+        # 워커마다 브라우저 1개, 요청 간격 1~3초 (봇 감지 방지)
+        pool = CrawlerWorkerPool(
+            driver_factory=lambda: make_driver(DRIVER_CONFIG),
+            task=crawl_product_reviews,
+            num_workers=num_workers,
+            state_dir=os.path.join(reviews_dir, "_pool"),
+            key=lambda product: f"{product['category']}:{product['sort_type']}:{product['url']}",
+            driver_closer=close_driver,
+            delay=(1, 3)
+        )
+        summary = pool.run(all_products)
+        print(f"\n완료 {summary['done']}개, 실패 {summary['failed']}개, 이전 실행분 {summary['skipped']}개")
+        
+        # 이전 실행분까지 합친 전체 리뷰
+        all_reviews = pool.all_records()
+        
+        # 리뷰 데이터 저장
+        if all_reviews:
+            reviews_df = pd.DataFrame(all_reviews)
             
-            for i, product in enumerate(all_products, 1):
-                print(f"\n[{i}/{len(all_products)}] {product['name']} 리뷰 수집 중...")
-                
-                try:
-                    # 제품 페이지로 이동
-                    collector.driver.get(product['url'])
-                    time.sleep(2)
-                    
-                    # 리뷰 버튼 클릭
-                    review_button = WebDriverWait(collector.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(., '리뷰')]"))
-                    )
-                    review_button.click()
-                    time.sleep(2)
-                    
-                    # 가격 정보 수집 (리뷰 페이지에서)
-                    product_price = None
-                    try:
-                        price_elem = collector.driver.find_element(By.CSS_SELECTOR, "span.value")
-                        product_price = price_elem.text.strip()
-                    except:
-                        product_price = "가격 정보 없음"
-                    
-                    # 리뷰 데이터 수집
-                    reviews = collect_product_reviews(collector.driver, product, product_price)
-                    all_reviews.extend(reviews)
-                    
-                    print(f"수집된 리뷰: {len(reviews)}개, 가격: {product_price}")
-                    
-                    # 요청 간격 조절 (봇 감지 방지)
-                    time.sleep(randint(1, 3))
-                    
-                except Exception as e:
-                    print(f"리뷰 수집 실패: {e}")
-                    continue
+            # 전체 리뷰 파일
+            output_file = os.path.join(reviews_dir, "daiso_all_reviews.csv")
+            reviews_df.to_csv(output_file, index=False, encoding='utf-8-sig')
             
-            # 리뷰 데이터 저장
-            if all_reviews:
-                reviews_df = pd.DataFrame(all_reviews)
-                
-                # 전체 리뷰 파일
-                output_file = os.path.join(reviews_dir, "daiso_all_reviews.csv")
-                reviews_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-                
-                # 카테고리별/정렬별 분리 저장
-                for category in reviews_df['category'].unique():
-                    for sort_type in reviews_df['sort_type'].unique():
-                        subset = reviews_df[
-                            (reviews_df['category'] == category) & 
-                            (reviews_df['sort_type'] == sort_type)
-                        ]
-                        if len(subset) > 0:
-                            filename = f"daiso_reviews_{category}_{sort_type}.csv"
-                            filepath = os.path.join(reviews_dir, filename)
-                            subset.to_csv(filepath, index=False, encoding='utf-8-sig')
-                            print(f"저장: {filepath} ({len(subset)}개 리뷰)")
-                
-                print(f"\n전체 리뷰 데이터 저장 완료: {output_file} ({len(all_reviews)}개)")
-                return True
-            else:
-                print("수집된 리뷰가 없습니다.")
-                return False
+            # 카테고리별/정렬별 분리 저장
+            for category in reviews_df['category'].unique():
+                for sort_type in reviews_df['sort_type'].unique():
+                    subset = reviews_df[
+                        (reviews_df['category'] == category) & 
+                        (reviews_df['sort_type'] == sort_type)
+                    ]
+                    if len(subset) > 0:
+                        filename = f"daiso_reviews_{category}_{sort_type}.csv"
+                        filepath = os.path.join(reviews_dir, filename)
+                        subset.to_csv(filepath, index=False, encoding='utf-8-sig')
+                        print(f"저장: {filepath} ({len(subset)}개 리뷰)")
+            
+            print(f"\n전체 리뷰 데이터 저장 완료: {output_file} ({len(all_reviews)}개)")
+            return True
+        else:
+            print("수집된 리뷰가 없습니다.")
+            return False
                 
     except Exception as e:
         print(f"리뷰 크롤링 중 오류: {e}")
@@ -0,0 +1,367 @@
+#//==============================================================================//#
+"""
+다이소 리뷰 이미지 백그라운드 다운로드 큐
+
+기능:
+- 파서가 (이미지 URL, 파일명)을 넣으면 바로 반환하고, 다운로드는 백그라운드 스레드에서 진행
+  (드라이버는 다음 페이지로 이동하는 동안 이미지 저장)
+- 동시 다운로드 수 제한 (ThreadPoolExecutor), 스레드별 requests.Session으로 연결 재사용
+- 같은 URL은 한 번만 다운로드, 내용(sha256)이 같은 이미지는 기존 파일 하드링크
+- 이미 있는 파일은 건너뛰기 (재실행 시 이어받기)
+- 연결 오류 / 5xx / 429는 지수 백오프로 재시도
+
+사용:
+    with ReviewImageDownloader(REVIEWS_IMAGE_PATH) as downloader:
+        downloader.enqueue(image_url, "1049301_review001_img1.jpg")
+        ...
+        failed = downloader.join()   # 실패한 파일명
+
+last_updated : 2025.11.02
+"""
+#//==============================================================================//#
+
+#//==============================================================================//#
+# Library import
+#//==============================================================================//#
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config_daiso import (
+    IMAGE_DOWNLOAD_WORKERS,
+    IMAGE_DOWNLOAD_RETRIES,
+    IMAGE_DOWNLOAD_BACKOFF,
+    IMAGE_DOWNLOAD_TIMEOUT
+)
+
+# 재시도할 HTTP 상태 (그 외 4xx는 바로 실패)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+#//==============================================================================//#
+# ReviewImageDownloader Class
+#//==============================================================================//#
+class ReviewImageDownloader:
+    """
+    리뷰 이미지 비동기 다운로드 큐
+
+    Args:
+        save_dir: 이미지 저장 폴더
+        max_workers: 동시 다운로드 수
+        max_retries: 실패 시 재시도 횟수
+        backoff: 첫 재시도 대기 시간(초), 재시도마다 2배
+        timeout: 요청 타임아웃(초)
+    """
+
+    def __init__(self, save_dir, max_workers: int = IMAGE_DOWNLOAD_WORKERS,
+                 max_retries: int = IMAGE_DOWNLOAD_RETRIES, backoff: float = IMAGE_DOWNLOAD_BACKOFF,
+                 timeout: float = IMAGE_DOWNLOAD_TIMEOUT):
+        self.save_dir = Path(save_dir)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self._executor: Optional[ThreadPoolExecutor] = None    # 첫 등록 시 생성 (close 후 재사용 가능)
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+
+        self._url_futures: Dict[str, Future] = {}     # URL → 다운로드 결과 (첫 저장 경로)
+        self._hash_paths: Dict[str, Path] = {}        # sha256 → 저장된 파일
+        self.failed: Set[str] = set()
+
+        self.stats = {
+            "downloaded": 0,       # 실제 다운로드
+            "skipped": 0,          # 이미 파일 있음
+            "url_dedup": 0,        # 같은 URL 재사용
+            "content_dedup": 0,    # 같은 내용 하드링크
+            "retries": 0,
+            "failed": 0
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    #//==========================================================================//#
+    # 큐 등록
+    #//==========================================================================//#
+    def enqueue(self, image_url: str, filename: str) -> str:
+        """
+        이미지 다운로드 등록 (즉시 반환)
+
+        Returns:
+            filename (레코드에 바로 기록, 실패 여부는 join()으로 확인)
+        """
+        target = self.save_dir / filename
+
+        with self._lock:
+            if target.exists():
+                self.stats["skipped"] += 1
+                return filename
+
+            self._pending += 1
+            future = self._url_futures.get(image_url)
+            first_request = future is None
+            if first_request:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="daiso-image")
+                # URL 첫 등록 → 다운로드해서 바로 target에 저장
+                future = self._url_futures[image_url] = self._executor.submit(self._download, image_url, target)
+            else:
+                self.stats["url_dedup"] += 1
+
+        # 이미 끝난 future면 콜백이 바로 실행되므로 lock 밖에서 등록
+        if first_request:
+            future.add_done_callback(lambda f: self._task_done())
+        else:
+            # 같은 URL이 이미 등록됨 → 다운로드가 끝나면 그 파일을 링크
+            future.add_done_callback(lambda f: self._link_result(f, target))
+        return filename
+
+    def join(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        지금까지 등록된 다운로드가 모두 끝날 때까지 대기
+
+        Returns:
+            실패한 파일명 (누적)
+        """
+        with self._idle:
+            self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+            return set(self.failed)
+
+    def close(self):
+        """남은 다운로드 완료 후 스레드/세션 정리"""
+        self.join()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions, self._sessions = self._sessions, []
+        if executor:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+
+    #//==========================================================================//#
+    # 다운로드 (워커 스레드)
+    #//==========================================================================//#
+    def _session(self) -> requests.Session:
+        """스레드별 세션 (keep-alive 연결 재사용)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_maxsize=self.max_workers))
+            session.mount("https://", HTTPAdapter(pool_maxsize=self.max_workers))
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _fetch(self, image_url: str) -> bytes:
+        """재시도 포함 GET (실패 시 예외)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._session().get(image_url, timeout=self.timeout)
+                if response.status_code == 200:
+                    return response.content
+                if response.status_code not in RETRY_STATUS:
+                    raise requests.HTTPError(f"HTTP {response.status_code}: {image_url}")
+                error = requests.HTTPError(f"HTTP {response.status_code}: {image_url}")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            if attempt < self.max_retries:
+                with self._lock:
+                    self.stats["retries"] += 1
+                time.sleep(self.backoff * (2 ** attempt))
+
+        raise error
+
+    def _download(self, image_url: str, target: Path) -> Optional[Path]:
+        """
+        다운로드 후 저장 (내용이 같은 파일이 이미 있으면 하드링크)
+
+        Returns:
+            저장된 경로 (실패 시 None)
+        """
+        try:
+            content = self._fetch(image_url)
+        except Exception as e:
+            print(f"리뷰 이미지 다운로드 실패 ({target.name}): {e}")
+            self._mark_failed(target)
+            return None
+
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            existing = self._hash_paths.get(digest)
+            if existing is None:
+                self._hash_paths[digest] = target
+
+        if existing is not None and self._link(existing, target):
+            with self._lock:
+                self.stats["content_dedup"] += 1
+            return target
+
+        try:
+            self._write(target, content)
+        except OSError as e:
+            # 디스크 부족/권한 오류 → 리뷰 레코드에 없는 파일명이 남지 않도록 실패 처리
+            print(f"리뷰 이미지 저장 실패 ({target.name}): {e}")
+            with self._lock:
+                if self._hash_paths.get(digest) == target:
+                    del self._hash_paths[digest]
+            self._mark_failed(target)
+            return None
+
+        with self._lock:
+            self.stats["downloaded"] += 1
+        return target
+
+    def _link_result(self, future: Future, target: Path):
+        """같은 URL의 다운로드 결과를 target에도 연결"""
+        try:
+            source = future.result()
+            if source is None:
+                self._mark_failed(target)
+            elif self._link(source, target):
+                with self._lock:
+                    self.stats["content_dedup"] += 1
+            else:
+                self._mark_failed(target)
+        finally:
+            self._task_done()
+
+    #//==========================================================================//#
+    # 파일 처리
+    #//==========================================================================//#
+    def _write(self, target: Path, content: bytes):
+        """임시 파일에 쓴 뒤 교체 (중단돼도 깨진 이미지가 남지 않도록)"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{target.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, target)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> bool:
+        """하드링크 (지원하지 않는 파일시스템이면 복사)"""
+        if source == target or target.exists():
+            return True
+        try:
+            os.link(source, target)
+        except OSError:
+            try:
+                shutil.copyfile(source, target)
+            except OSError:
+                return False
+        return True
+
+    def _mark_failed(self, target: Path):
+        with self._lock:
+            self.failed.add(target.name)
+            self.stats["failed"] += 1
+
+    def _task_done(self):
+        with self._idle:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    # 로컬 HTTP 스텁 서버로 동시성/중복 제거/재시도/건너뛰기 확인
+    import tempfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    request_counts: Dict[str, int] = {}
+    counts_lock = threading.Lock()
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive (연결 재사용 확인)
+
+        def do_GET(self):
+            with counts_lock:
+                request_counts[self.path] = request_counts.get(self.path, 0) + 1
+                count = request_counts[self.path]
+
+            if self.path == "/flaky.jpg" and count < 3:
+                status, body = 503, b""            # 두 번 실패 후 성공
+            elif self.path == "/missing.jpg":
+                status, body = 404, b""
+            elif self.path in ("/same_a.jpg", "/same_b.jpg"):
+                status, body = 200, b"same-image-bytes"
+            else:
+                status, body = 200, f"image:{self.path}".encode()
+
+            time.sleep(0.05)
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        (Path(tmp_dir) / "exists_img1.jpg").write_bytes(b"old")
+        (Path(tmp_dir) / "blocked").write_bytes(b"")   # 폴더 자리에 파일 → 저장 실패 (OSError)
+
+        start = time.perf_counter()
+        with ReviewImageDownloader(tmp_dir, max_workers=4, backoff=0.05) as downloader:
+            # 리뷰 10개가 같은 페이지 이미지 3장을 공유하는 경우 (기존 수집 방식)
+            for review_index in range(10):
+                for img_index in range(3):
+                    downloader.enqueue(f"{base_url}/page_{img_index}.jpg",
+                                       f"1049301_review{review_index+1:03d}_img{img_index+1}.jpg")
+            enqueue_seconds = time.perf_counter() - start
+
+            downloader.enqueue(f"{base_url}/same_a.jpg", "same_a.jpg")
+            downloader.enqueue(f"{base_url}/same_b.jpg", "same_b.jpg")
+            downloader.enqueue(f"{base_url}/flaky.jpg", "flaky.jpg")
+            downloader.enqueue(f"{base_url}/missing.jpg", "missing.jpg")
+            downloader.enqueue(f"{base_url}/exists.jpg", "exists_img1.jpg")
+            downloader.enqueue(f"{base_url}/blocked.jpg", "blocked/blocked_img1.jpg")
+
+            failed = downloader.join()
+            stats = dict(downloader.stats)
+        total_seconds = time.perf_counter() - start
+
+        saved = sorted(p.name for p in Path(tmp_dir).iterdir())
+        print(f"등록 소요: {enqueue_seconds * 1000:.1f}ms (드라이버 대기 없음)")
+        print(f"전체 소요: {total_seconds:.2f}s")
+        print(f"통계: {stats}")
+        print(f"서버 요청 수: {request_counts}")
+        print(f"실패: {failed}")
+        print(f"저장 파일: {len(saved)}개")
+
+        assert request_counts["/page_0.jpg"] == 1, "같은 URL은 한 번만 다운로드"
+        assert request_counts["/flaky.jpg"] == 3, "503은 재시도"
+        assert request_counts["/missing.jpg"] == 1, "404는 재시도 안 함"
+        assert "/exists.jpg" not in request_counts, "이미 있는 파일은 건너뛰기"
+        assert failed == {"missing.jpg", "blocked_img1.jpg"}, "HTTP 오류와 저장 오류 모두 실패 처리"
+        assert (Path(tmp_dir) / "exists_img1.jpg").read_bytes() == b"old"
+        assert os.path.samefile(Path(tmp_dir) / "same_a.jpg", Path(tmp_dir) / "same_b.jpg"), "같은 내용은 하드링크"
+        assert len([name for name in saved if name.startswith("1049301_")]) == 30
+        print("✅ 모든 확인 통과")
+
+    server.shutdown()
@@ -7,9 +7,10 @@
 - 악세서리 필터링
 - 박스 제품 제외
 - 제품 리뷰 데이터 수집 (쿠팡 형식)
+- 리뷰 이미지는 백그라운드 다운로드 큐로 저장 (downloader.py)
 - 데이터 구조화 및 저장
 
-last_updated : 2025.10.01
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 
@@ -19,14 +20,15 @@ last_updated : 2025.10.01
 import time
 import pandas as pd
 import os
+import sys
 import requests
 import re
 from datetime import datetime
 from typing import List, Dict, Optional
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 
 # 다이소 모듈 import
 from config_daiso import (
@@ -53,11 +55,122 @@ from config_daiso import (
     REVIEW_INFO_KEY,
     REVIEW_INFO_VALUE,
     REVIEW_IMAGES,
+    REVIEW_IMAGE_MAX,
     NEXT_BUTTON
 )
 from driver import make_driver, close_driver, DriverConfig
 from navigator import DaisoNavigator
 from scroller import DaisoScroller
+from downloader import ReviewImageDownloader
+
+# collector 공통 모듈 (스냅샷, HTML 파서 백엔드)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from snapshot import SnapshotRecorder
+from html_backend import HtmlNode, Selector, parse_html
+
+# 리뷰 파싱 셀렉터 (모듈 로드 시 한 번만 컴파일)
+SEL_REVIEWER_NAME = Selector(REVIEWER_NAME)
+SEL_REVIEW_RATING = Selector(REVIEW_RATING)
+SEL_REVIEW_DATE = Selector(REVIEW_DATE)
+SEL_REVIEW_CONTENT = Selector(REVIEW_CONTENT)
+SEL_REVIEW_HELPFUL = Selector(REVIEW_HELPFUL)
+SEL_REVIEW_INFO_KEY = Selector(REVIEW_INFO_KEY)
+SEL_REVIEW_INFO_VALUE = Selector(REVIEW_INFO_VALUE)
+SEL_REVIEW_IMAGES = Selector(REVIEW_IMAGES)
+
+#//==============================================================================//#
+# 리뷰 페이지 파싱 (드라이버 없이 HTML만 사용 - 스냅샷 재생에서도 같은 함수 사용)
+#//==============================================================================//#
+def parse_reviews_html(html: str, product_url: str, product_name: str, product_price: str,
+                       product_id: str, category: str, sort_type: str, rank: int,
+                       brand_name: str, category_use: str, collection_date: str,
+                       image_downloader: Optional[ReviewImageDownloader] = None) -> List[Dict]:
+    """
+    리뷰 페이지 HTML → 리뷰 리스트 (쿠팡 형식)
+
+    Args:
+        html: 리뷰 탭이 열린 페이지의 page_source
+        image_downloader: 리뷰 이미지 다운로드 큐 (등록만 하고 바로 반환,
+                          None이면 review_images 없음 - 스냅샷 재생)
+    """
+    doc = parse_html(html)
+    
+    reviewer_names = _stripped_texts(doc, SEL_REVIEWER_NAME)
+    review_ratings = _stripped_texts(doc, SEL_REVIEW_RATING)
+    review_dates = _stripped_texts(doc, SEL_REVIEW_DATE)
+    review_contents = _stripped_texts(doc, SEL_REVIEW_CONTENT)
+    helpful_counts = [elem.text.strip() for elem in doc.select(SEL_REVIEW_HELPFUL)]
+    
+    min_length = min(len(reviewer_names), len(review_ratings), len(review_dates), len(review_contents))
+    if min_length == 0:
+        return []
+    
+    # 리뷰 이미지 URL은 페이지에서 한 번만 추출 (리뷰마다 같은 페이지 이미지 최대 3장 - 기존 수집 방식 유지)
+    image_urls = []
+    if image_downloader:
+        image_urls = [elem.get("src") for elem in doc.select(SEL_REVIEW_IMAGES)[:REVIEW_IMAGE_MAX]]
+    
+    reviews = []
+    for i in range(min_length):
+        helpful_count = helpful_counts[i] if i < len(helpful_counts) else "0"
+        attributes = extract_review_attributes(doc, i)
+        review_images = [
+            image_downloader.enqueue(urljoin(product_url, image_url), f"{product_id}_review{i+1:03d}_img{img_index+1}.jpg")
+            for img_index, image_url in enumerate(image_urls)
+            if image_url
+        ]
+        
+        review = {
+            'review_id': None,
+            'captured_at': collection_date,
+            'channel': 'Daiso',
+            'product_url': product_url,
+            'product_name': product_name,
+            'brand': brand_name,
+            'category': category,
+            'category_use': category_use,
+            'product_price_sale': None,
+            'product_price_origin': product_price,
+            'sort_type': sort_type,
+            'ranking': rank,
+            'reviewer_name': reviewer_names[i],
+            'rating': review_ratings[i],
+            'review_date': review_dates[i],
+            'selected_option': None,
+            'review_text': review_contents[i],
+            'helpful_count': helpful_count,
+            'review_images': ','.join(review_images) if review_images else None,
+            **attributes
+        }
+        
+        reviews.append(review)
+    
+    return reviews
+
+
+def _stripped_texts(doc: HtmlNode, selector: Selector) -> List[str]:
+    """셀렉터에 맞는 요소의 공백 제거 텍스트 (빈 값 제외)"""
+    texts = (elem.text.strip() for elem in doc.select(selector))
+    return [text for text in texts if text]
+
+
+def extract_review_attributes(doc: HtmlNode, review_index: int) -> Dict[str, str]:
+    """간단평가 (보습력, 향 등) 추출"""
+    attributes = {}
+    try:
+        keys = doc.select(SEL_REVIEW_INFO_KEY)
+        values = doc.select(SEL_REVIEW_INFO_VALUE)
+        
+        for key_elem, value_elem in zip(keys, values):
+            if key_elem and value_elem:
+                key = key_elem.text.strip()
+                value = value_elem.text.strip()
+                if key and value:
+                    attributes[key] = value
+    except Exception as e:
+        print(f"간단평가 추출 오류: {e}")
+    
+    return attributes
 
 #//==============================================================================//#
 # DaisoProductCollector Class
@@ -65,9 +178,15 @@ from scroller import DaisoScroller
 class DaisoProductCollector:
     """다이소 제품 수집 메인 클래스"""
     
-    def __init__(self, driver_config: Optional[DriverConfig] = None):
+    def __init__(self, driver_config: Optional[DriverConfig] = None, snapshot_dir: Optional[str] = None):
         self.driver_config = driver_config or DriverConfig()
         self.driver = None
+        
+        # 리뷰 페이지 HTML 스냅샷 (None이면 COLLECTOR_SNAPSHOT_DIR 환경변수, 둘 다 없으면 저장 안 함)
+        self.recorder = SnapshotRecorder(snapshot_dir, "daiso") if snapshot_dir else SnapshotRecorder.from_env("daiso")
+        
+        # 리뷰 이미지 다운로드 큐 (드라이버와 별도로 백그라운드 진행)
+        self.image_downloader = ReviewImageDownloader(REVIEWS_IMAGE_PATH)
         self.navigator = None
         self.scroller = None
         
@@ -96,6 +215,11 @@ class DaisoProductCollector:
             close_driver(self.driver)
             self.driver = None
             print("드라이버 종료")
+        
+        # 남은 리뷰 이미지 다운로드 완료 대기
+        self.image_downloader.close()
+        if any(self.image_downloader.stats.values()):
+            print(f"리뷰 이미지 다운로드 종료: {self.image_downloader.stats}")
 
     def download_image(self, image_url: str, filename: str) -> bool:
         try:
@@ -327,104 +451,40 @@ class DaisoProductCollector:
             except Exception:
                 break
         
+        # 이미지 다운로드는 페이지 이동 중에 진행됨 → 제품 마지막에 남은 것만 기다린 뒤 실패한 파일명 제외
+        failed_images = self.image_downloader.join()
+        if failed_images:
+            for review in all_reviews:
+                if review['review_images']:
+                    kept = [name for name in review['review_images'].split(',') if name not in failed_images]
+                    review['review_images'] = ','.join(kept) if kept else None
+        
         return all_reviews
     
     def parse_reviews_page(self, product_url: str, product_name: str, product_price: str, 
                           product_id: str, category: str, sort_type: str, rank: int,
                           brand_name: str, category_use: str, collection_date: str) -> List[Dict]:
         """현재 페이지의 리뷰들 파싱 (쿠팡 형식)"""
-        doc = BeautifulSoup(self.driver.page_source, "html.parser")
-        
-        reviewer_names = [elem.text.strip() for elem in doc.select(REVIEWER_NAME) if elem.text.strip()]
-        review_ratings = [elem.text.strip() for elem in doc.select(REVIEW_RATING) if elem.text.strip()]
-        review_dates = [elem.text.strip() for elem in doc.select(REVIEW_DATE) if elem.text.strip()]
-        review_contents = [elem.text.strip() for elem in doc.select(REVIEW_CONTENT) if elem.text.strip()]
-        helpful_counts = [elem.text.strip() for elem in doc.select(REVIEW_HELPFUL)]
-        
-        min_length = min(len(reviewer_names), len(review_ratings), len(review_dates), len(review_contents))
-        if min_length == 0:
-            return []
+        html = self.driver.page_source
         
-        reviews = []
-        for i in range(min_length):
-            helpful_count = helpful_counts[i] if i < len(helpful_counts) else "0"
-            attributes = self.extract_review_attributes(doc, i)
-            review_images = self.collect_review_images(product_id, i)
-            
-            review = {
-                'review_id': None,
-                'captured_at': collection_date,
-                'channel': 'Daiso',
-                'product_url': product_url,
-                'product_name': product_name,
-                'brand': brand_name,
-                'category': category,
-                'category_use': category_use,
-                'product_price_sale': None,
-                'product_price_origin': product_price,
-                'sort_type': sort_type,
-                'ranking': rank,
-                'reviewer_name': reviewer_names[i],
-                'rating': review_ratings[i],
-                'review_date': review_dates[i],
-                'selected_option': None,
-                'review_text': review_contents[i],
-                'helpful_count': helpful_count,
-                'review_images': ','.join(review_images) if review_images else None,
-                **attributes
-            }
-            
-            reviews.append(review)
+        if self.recorder:
+            self.recorder.save(
+                "daiso_review_page", html,
+                product_url=product_url, product_name=product_name, product_price=product_price,
+                product_id=product_id, category=category, sort_type=sort_type, rank=rank,
+                brand_name=brand_name, category_use=category_use, collection_date=collection_date
+            )
         
-        return reviews
+        return parse_reviews_html(
+            html, product_url, product_name, product_price, product_id,
+            category, sort_type, rank, brand_name, category_use, collection_date,
+            image_downloader=self.image_downloader
+        )
     
-    def extract_review_attributes(self, doc: BeautifulSoup, review_index: int) -> Dict[str, str]:
+    def extract_review_attributes(self, doc: HtmlNode, review_index: int) -> Dict[str, str]:
         """간단평가 (보습력, 향 등) 추출"""
-        attributes = {}
-        try:
-            keys = doc.select(REVIEW_INFO_KEY)
-            values = doc.select(REVIEW_INFO_VALUE)
-            
-            for key_elem, value_elem in zip(keys, values):
-                if key_elem and value_elem:
-                    key = key_elem.text.strip()
-                    value = value_elem.text.strip()
-                    if key and value:
-                        attributes[key] = value
-        except Exception as e:
-            print(f"간단평가 추출 오류: {e}")
-        
-        return attributes
+        return extract_review_attributes(doc, review_index)
     
-    def collect_review_images(self, product_id: str, review_index: int) -> List[str]:
-        """리뷰 이미지 수집 및 다운로드"""
-        try:
-            os.makedirs(REVIEWS_IMAGE_PATH, exist_ok=True)
-            
-            image_elements = self.driver.find_elements(By.CSS_SELECTOR, REVIEW_IMAGES)
-            downloaded_files = []
-            
-            for img_index, img_elem in enumerate(image_elements[:3]):
-                try:
-                    image_url = img_elem.get_attribute("src")
-                    if not image_url:
-                        continue
-                    
-                    filename = f"{product_id}_review{review_index+1:03d}_img{img_index+1}.jpg"
-                    
-                    response = requests.get(image_url, timeout=10)
-                    if response.status_code == 200:
-                        filepath = REVIEWS_IMAGE_PATH / filename
-                        with open(filepath, 'wb') as f:
-                            f.write(response.content)
-                        downloaded_files.append(filename)
-                except Exception:
-                    continue
-            
-            return downloaded_files
-        except Exception:
-            return []
-
     def save_reviews_csv(self, reviews: List[Dict], category: str, sort_type: str, product_name: str) -> None:
         """리뷰 데이터를 CSV로 저장"""
         if not reviews:
@@ -0,0 +1,245 @@
+#//==============================================================================//#
+"""
+수집 파서 공통 HTML 백엔드 (selectolax / lxml / BeautifulSoup)
+
+- 채널 파서는 parse_html()로 문서를 만들고 select / select_one / text / get만 사용
+- CSS 셀렉터는 Selector로 한 번만 컴파일 (config_coupang / config_daiso 상수를 모듈 로드 시 컴파일)
+- 설치된 백엔드 중 가장 빠른 것을 자동 선택 (selectolax > lxml > bs4)
+- COLLECTOR_HTML_BACKEND 환경변수 또는 set_backend()로 고정 가능 (replay_snapshots.py --backend 비교용)
+
+선택 규칙은 BeautifulSoup 기준에 맞춤:
+    - select는 자기 자신을 제외한 하위 요소만 검색 (find/select와 동일)
+    - text는 하위 텍스트 전체를 이어붙인 문자열 (bs4 .text와 동일)
+
+사용:
+    REVIEW_ITEM = Selector("article.sdp-review__article__list")
+    doc = parse_html(driver.page_source)
+    for article in doc.select(REVIEW_ITEM):
+        name = article.select_one(REVIEWER_NAME)
+
+last_updated : 2025.11.02
+"""
+#//==============================================================================//#
+
+#//==============================================================================//#
+# Library import
+#//==============================================================================//#
+import os
+import threading
+from typing import Dict, List, Optional, Union
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    from cssselect import GenericTranslator
+except ImportError:
+    lxml_html = None
+
+from bs4 import BeautifulSoup
+
+HTML_BACKEND_ENV = "COLLECTOR_HTML_BACKEND"
+
+# 빠른 순서
+BACKEND_PRIORITY = ("selectolax", "lxml", "bs4")
+
+#//==============================================================================//#
+# 셀렉터
+#//==============================================================================//#
+class Selector:
+    """
+    백엔드별로 한 번만 컴파일되는 CSS 셀렉터
+
+    - lxml: CSS → XPath 변환 결과 (XPath 객체는 스레드별로 생성)
+    - selectolax / bs4: CSS 문자열 그대로 (bs4는 soupsieve 캐시 사용)
+    """
+
+    __slots__ = ("css", "_xpath", "_local")
+
+    def __init__(self, css: str):
+        self.css = css
+        self._xpath = None
+        self._local = threading.local()
+
+    def xpath(self):
+        """lxml용 컴파일된 XPath (현재 스레드 전용)"""
+        compiled = getattr(self._local, "xpath", None)
+        if compiled is None:
+            if self._xpath is None:
+                # descendant:: → 자기 자신 제외 (bs4 select와 동일)
+                self._xpath = GenericTranslator().css_to_xpath(self.css, prefix="descendant::")
+            compiled = self._local.xpath = etree.XPath(self._xpath)
+        return compiled
+
+    def __repr__(self):
+        return f"Selector({self.css!r})"
+
+
+SelectorLike = Union[Selector, str]
+
+_selector_cache: Dict[str, Selector] = {}
+
+
+def compile_selector(selector: SelectorLike) -> Selector:
+    """문자열 셀렉터도 한 번만 컴파일되도록 캐시"""
+    if isinstance(selector, Selector):
+        return selector
+    compiled = _selector_cache.get(selector)
+    if compiled is None:
+        compiled = _selector_cache[selector] = Selector(selector)
+    return compiled
+
+#//==============================================================================//#
+# 노드 (백엔드 공통 인터페이스)
+#//==============================================================================//#
+class HtmlNode:
+    """백엔드 노드 래퍼 - select / select_one / text / get"""
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, selector: SelectorLike) -> List["HtmlNode"]:
+        raise NotImplementedError
+
+    def select_one(self, selector: SelectorLike) -> Optional["HtmlNode"]:
+        raise NotImplementedError
+
+    @property
+    def text(self) -> str:
+        raise NotImplementedError
+
+    def get(self, name: str, default=None):
+        raise NotImplementedError
+
+    def has_attr(self, name: str) -> bool:
+        return self.get(name) is not None
+
+
+class SelectolaxNode(HtmlNode):
+    __slots__ = ()
+
+    def select(self, selector):
+        node = self.node
+        results = node.css(compile_selector(selector).css)
+        # lexbor는 자기 자신도 매칭하므로 제외 (문서 순서상 항상 첫 번째)
+        if results and results[0].mem_id == node.mem_id:
+            results = results[1:]
+        return [SelectolaxNode(n) for n in results]
+
+    def select_one(self, selector):
+        results = self.select(selector)
+        return results[0] if results else None
+
+    @property
+    def text(self):
+        return self.node.text(deep=True)
+
+    def get(self, name, default=None):
+        value = self.node.attributes.get(name, default)
+        # 값 없는 속성(<div data-rating>)은 None으로 오므로 bs4처럼 빈 문자열
+        if value is None and name in self.node.attributes:
+            return ""
+        return value
+
+
+class LxmlNode(HtmlNode):
+    __slots__ = ()
+
+    def select(self, selector):
+        return [LxmlNode(n) for n in compile_selector(selector).xpath()(self.node)]
+
+    def select_one(self, selector):
+        results = compile_selector(selector).xpath()(self.node)
+        return LxmlNode(results[0]) if results else None
+
+    @property
+    def text(self):
+        return self.node.text_content()
+
+    def get(self, name, default=None):
+        return self.node.get(name, default)
+
+
+class SoupNode(HtmlNode):
+    __slots__ = ()
+
+    def select(self, selector):
+        return [SoupNode(n) for n in self.node.select(compile_selector(selector).css)]
+
+    def select_one(self, selector):
+        result = self.node.select_one(compile_selector(selector).css)
+        return SoupNode(result) if result is not None else None
+
+    @property
+    def text(self):
+        return self.node.text
+
+    def get(self, name, default=None):
+        value = self.node.get(name, default)
+        # class 등 다중값 속성은 bs4만 리스트로 돌려주므로 문자열로 통일
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+
+#//==============================================================================//#
+# 백엔드 선택 및 파싱
+#//==============================================================================//#
+_backend_override: Optional[str] = None
+
+
+def available_backends() -> List[str]:
+    """설치된 백엔드 (빠른 순)"""
+    installed = {
+        "selectolax": LexborHTMLParser is not None,
+        "lxml": lxml_html is not None,
+        "bs4": True
+    }
+    return [name for name in BACKEND_PRIORITY if installed[name]]
+
+
+def set_backend(name: Optional[str]):
+    """백엔드 고정 (None이면 자동 선택으로 되돌림)"""
+    global _backend_override
+    if name is not None and name not in available_backends():
+        raise ValueError(f"사용할 수 없는 HTML 백엔드: {name} (설치됨: {available_backends()})")
+    _backend_override = name
+
+
+def get_backend() -> str:
+    """현재 백엔드 (set_backend → 환경변수 → 설치된 것 중 가장 빠른 것)"""
+    if _backend_override:
+        return _backend_override
+
+    name = os.environ.get(HTML_BACKEND_ENV)
+    if name and name in available_backends():
+        return name
+    return available_backends()[0]
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> HtmlNode:
+    """
+    page_source → 문서 노드
+
+    Args:
+        html: HTML 문자열
+        backend: "selectolax" / "lxml" / "bs4" (None이면 get_backend())
+    """
+    backend = backend or get_backend()
+
+    if backend == "selectolax":
+        return SelectolaxNode(LexborHTMLParser(html).root)
+    if backend == "lxml":
+        if not html.strip():
+            return LxmlNode(lxml_html.Element("html"))
+        try:
+            return LxmlNode(lxml_html.document_fromstring(html))
+        except ValueError:
+            # <?xml encoding=...?> 선언이 있는 문자열은 bytes로만 파싱 가능
+            return LxmlNode(lxml_html.document_fromstring(html.encode("utf-8")))
+    return SoupNode(BeautifulSoup(html, "html.parser"))
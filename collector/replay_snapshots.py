@@ -0,0 +1,392 @@
+#//==============================================================================//#
+"""
+저장된 HTML 스냅샷을 수집 파서에 다시 넣어서 파싱 처리량 측정 (네트워크/브라우저 없음)
+
+- 크롤링 시 snapshot_dir 또는 COLLECTOR_SNAPSHOT_DIR 환경변수로 스냅샷 저장
+- 페이지 종류(kind)별로 크롤러와 같은 파싱 함수 호출
+- 종류별 pages/s, records/s, MB/s 출력 (파서 교체 전후 비교용)
+- --compare: 설치된 HTML 백엔드(selectolax / lxml / bs4)별 처리량 비교 + bs4와 레코드 일치 검증
+             + 셀렉터 변환 전 BeautifulSoup 파서(find/class_)와 결과 일치 검증
+
+사용:
+    python collector/replay_snapshots.py snapshots
+    python collector/replay_snapshots.py snapshots --channel coupang --repeat 5
+    python collector/replay_snapshots.py snapshots --backend bs4
+    python collector/replay_snapshots.py snapshots --compare
+    python collector/replay_snapshots.py --synthetic 50 --compare   # 스냅샷 없이 합성 페이지로 측정
+
+last_updated : 2025.11.02
+"""
+#//==============================================================================//#
+
+#//==============================================================================//#
+# Library import
+#//==============================================================================//#
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+COLLECTOR_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, COLLECTOR_DIR)
+sys.path.insert(0, os.path.join(COLLECTOR_DIR, "channels", "daiso"))
+sys.path.insert(0, os.path.join(COLLECTOR_DIR, "channels", "coupang"))
+
+from snapshot import SnapshotRecorder, iter_snapshots
+from html_backend import available_backends, get_backend, set_backend
+
+#//==============================================================================//#
+# 페이지 종류별 파싱 함수 (채널 모듈은 필요할 때만 import)
+#//==============================================================================//#
+def replay_coupang_review_page(html, context):
+    from collect_reviews_only import parse_product_meta, parse_review_page
+
+    brand_name, category_use = context.get("brand_name", ""), context.get("category_use", "")
+    if context["page"] == 1:
+        # 첫 페이지는 제품 상세 페이지이기도 하므로 브랜드/세부카테고리도 다시 파싱
+        brand_name, category_use = parse_product_meta(html)
+
+    reviews, _ = parse_review_page(
+        html, context["product_info"], context["page"], context["collection_date"],
+        brand_name, category_use
+    )
+    return reviews
+
+
+def replay_coupang_product_page(html, context):
+    from crawler_coupang import parse_product_info
+
+    return [parse_product_info(html, context["product_url"])]
+
+
+def replay_coupang_listing_page(html, context):
+    from parser_coupang import parse_product_cards
+
+    return parse_product_cards(html, context["category"], context["sort_type"], limit=context.get("limit"))
+
+
+def replay_coupang_recency_page(html, context):
+    from crawler_coupang import parse_recency_review_page
+
+    reviews, _ = parse_recency_review_page(html, context["product_info"], context["product_ranking"])
+    return reviews
+
+
+def replay_daiso_review_page(html, context):
+    from parser import parse_reviews_html
+
+    return parse_reviews_html(html, **context)
+
+
+#//==============================================================================//#
+# 셀렉터 변환 전 파서 (BeautifulSoup find 그대로 - 새 셀렉터가 같은 요소를 고르는지 확인)
+#//==============================================================================//#
+def legacy_coupang_product_meta(html):
+    """html_backend 전환 전 collect_reviews_only의 브랜드/세부카테고리 추출"""
+    from bs4 import BeautifulSoup
+
+    doc_initial = BeautifulSoup(html, "html.parser")
+
+    brand_name = ""
+    brand_elem = doc_initial.find("div", class_="twc-text-sm twc-text-blue-600")
+    if brand_elem:
+        brand_name = brand_elem.text.strip()
+
+    category_use = ""
+    breadcrumb_items = doc_initial.select("ul.breadcrumb li a")
+    if breadcrumb_items:
+        if len(breadcrumb_items) >= 2:
+            category_use = f"{breadcrumb_items[-2].text.strip()} > {breadcrumb_items[-1].text.strip()}"
+        else:
+            category_use = breadcrumb_items[-1].text.strip()
+    return brand_name, category_use
+
+
+def current_coupang_product_meta(html):
+    from collect_reviews_only import parse_product_meta
+
+    return parse_product_meta(html)
+
+
+# kind → (확인 대상 페이지 조건, 이전 파서, 현재 파서)
+LEGACY_CHECKS = {
+    "coupang_review_page": (lambda context: context["page"] == 1,
+                            legacy_coupang_product_meta, current_coupang_product_meta),
+}
+
+
+REPLAYERS = {
+    "coupang_review_page": replay_coupang_review_page,
+    "coupang_product_page": replay_coupang_product_page,
+    "coupang_listing_page": replay_coupang_listing_page,
+    "coupang_recency_page": replay_coupang_recency_page,
+    "daiso_review_page": replay_daiso_review_page,
+}
+
+#//==============================================================================//#
+# 재생 및 처리량 측정
+#//==============================================================================//#
+def load_snapshots(snapshot_dir, channel=None):
+    """재생 가능한 스냅샷 전체를 메모리로 (HTML 읽기/압축 해제 시간은 측정에서 제외)"""
+    return [(entry, html) for entry, html in iter_snapshots(snapshot_dir, channel)
+            if entry["kind"] in REPLAYERS]
+
+
+def replay(snapshots, repeat=1, backend=None):
+    """
+    스냅샷 재생 후 종류별 처리량 반환
+
+    Args:
+        snapshots: load_snapshots 결과
+        backend: HTML 백엔드 (None이면 자동 선택)
+
+    Returns:
+        {kind: {"pages", "records", "bytes", "seconds"}}
+    """
+    stats = defaultdict(lambda: {"pages": 0, "records": 0, "bytes": 0, "seconds": 0.0})
+
+    # 파서의 진행 로그는 측정에 방해되므로 버림
+    set_backend(backend)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            # 채널 모듈 import / 셀렉터 컴파일은 측정에서 제외 (종류별 첫 페이지 1회)
+            warmed_up = set()
+            for entry, html in snapshots:
+                if entry["kind"] not in warmed_up:
+                    REPLAYERS[entry["kind"]](html, entry["context"])
+                    warmed_up.add(entry["kind"])
+
+            for _ in range(repeat):
+                for entry, html in snapshots:
+                    kind = entry["kind"]
+                    start = time.perf_counter()
+                    records = REPLAYERS[kind](html, entry["context"])
+                    elapsed = time.perf_counter() - start
+
+                    kind_stats = stats[kind]
+                    kind_stats["pages"] += 1
+                    kind_stats["records"] += len(records)
+                    kind_stats["bytes"] += entry["bytes"]
+                    kind_stats["seconds"] += elapsed
+    finally:
+        set_backend(None)
+
+    return dict(stats)
+
+
+def verify_backends(snapshots, backends):
+    """
+    백엔드별 파싱 레코드가 bs4(html.parser)와 같은지 확인
+
+    Returns:
+        {backend: 다른 페이지 수}
+    """
+    # captured_at은 crawler_coupang에서 파싱 시각이므로 비교 제외
+    def normalize(records):
+        return [{k: v for k, v in record.items() if k != "captured_at"} for record in records]
+
+    def parse_all(backend):
+        set_backend(backend)
+        try:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                return [normalize(REPLAYERS[entry["kind"]](html, entry["context"])) for entry, html in snapshots]
+        finally:
+            set_backend(None)
+
+    expected = parse_all("bs4")
+    mismatches = {}
+    for backend in backends:
+        actual = parse_all(backend)
+        mismatches[backend] = sum(1 for a, b in zip(expected, actual) if a != b)
+        for (entry, _), a, b in zip(snapshots, expected, actual):
+            if a != b:
+                print(f"  ⚠️ [{backend}] 레코드 불일치: {entry['channel']}/{entry['file']}")
+    return mismatches
+
+
+def verify_legacy(snapshots, backends):
+    """
+    백엔드별 현재 파서 결과가 셀렉터 변환 전 파서와 같은지 확인
+
+    Returns:
+        {backend: 다른 페이지 수}
+    """
+    targets = [(entry, html) for entry, html in snapshots
+               if entry["kind"] in LEGACY_CHECKS and LEGACY_CHECKS[entry["kind"]][0](entry["context"])]
+    expected = [LEGACY_CHECKS[entry["kind"]][1](html) for entry, html in targets]
+
+    mismatches = {}
+    for backend in backends:
+        set_backend(backend)
+        try:
+            actual = [LEGACY_CHECKS[entry["kind"]][2](html) for entry, html in targets]
+        finally:
+            set_backend(None)
+        mismatches[backend] = 0
+        for (entry, _), a, b in zip(targets, expected, actual):
+            if a != b:
+                mismatches[backend] += 1
+                print(f"  ⚠️ [{backend}] 이전 파서와 불일치: {entry['channel']}/{entry['file']} {a!r} != {b!r}")
+    return mismatches
+
+
+def print_stats(stats, title=None):
+    if title:
+        print(f"\n[{title}]")
+    print(f"{'kind':<24}{'pages':>8}{'records':>10}{'sec':>9}{'pages/s':>10}{'records/s':>11}{'MB/s':>8}")
+    print("-" * 80)
+    for kind, s in sorted(stats.items()):
+        seconds = s["seconds"] or 1e-9
+        print(f"{kind:<24}{s['pages']:>8}{s['records']:>10}{s['seconds']:>9.2f}"
+              f"{s['pages'] / seconds:>10.1f}{s['records'] / seconds:>11.1f}"
+              f"{s['bytes'] / 1024 / 1024 / seconds:>8.2f}")
+
+
+def run(snapshot_dir, channel=None, repeat=1, backend=None, compare=False):
+    """스냅샷 로드 → 백엔드 하나 또는 전체 비교 실행"""
+    snapshots = load_snapshots(snapshot_dir, channel)
+    if not snapshots:
+        print(f"재생할 스냅샷이 없습니다: {snapshot_dir}")
+        return
+
+    if not compare:
+        print_stats(replay(snapshots, repeat, backend), title=backend or get_backend())
+        return
+
+    backends = available_backends()
+    totals = {}
+    for name in backends:
+        stats = replay(snapshots, repeat, name)
+        print_stats(stats, title=name)
+        totals[name] = sum(s["seconds"] for s in stats.values())
+
+    print("\n[백엔드 비교 - 전체 파싱 시간]")
+    for name in backends:
+        print(f"  {name:<12}{totals[name]:>8.2f}s  (bs4 대비 {totals['bs4'] / (totals[name] or 1e-9):.1f}x)")
+
+    print("\n[레코드 일치 검증 - bs4 기준]")
+    for name, count in verify_backends(snapshots, [b for b in backends if b != "bs4"]).items():
+        print(f"  {name:<12}{'✓ 동일' if count == 0 else f'✗ {count}페이지 다름'}")
+
+    print("\n[이전 파서 일치 검증 - BeautifulSoup find 기준]")
+    for name, count in verify_legacy(snapshots, backends).items():
+        print(f"  {name:<12}{'✓ 동일' if count == 0 else f'✗ {count}페이지 다름'}")
+
+#//==============================================================================//#
+# 합성 페이지 (스냅샷이 없을 때 파서 처리량 확인용)
+#//==============================================================================//#
+def _coupang_page(page, reviews_per_page=10):
+    articles = []
+    for i in range(reviews_per_page):
+        articles.append(f"""
+        <article class="sdp-review__article__list" data-review-id="{page}{i:03d}">
+          <span class="sdp-review__article__list__info__user__name">리뷰어{i}</span>
+          <div class="sdp-review__article__list__info__product-info__star-orange" data-rating="{i % 5 + 1}"></div>
+          <div class="sdp-review__article__list__info__product-info__reg-date">2025.10.{i % 28 + 1:02d}</div>
+          <div class="sdp-review__article__list__info__product-info__name">옵션 {i % 3}</div>
+          <div class="sdp-review__article__list__review__content">촉촉하고 흡수가 빨라요 {page}-{i}</div>
+          <div class="sdp-review__article__list__survey">
+            <div class="sdp-review__article__list__survey__row">
+              <span class="sdp-review__article__list__survey__row__label">보습력</span>
+              <span class="sdp-review__article__list__survey__row__value">촉촉해요</span>
+              <span class="sdp-review__article__list__survey__row__question">향</span>
+              <span class="sdp-review__article__list__survey__row__answer">은은해요</span>
+            </div>
+          </div>
+          <div class="sdp-review__article__list__help" data-count="{i}"></div>
+          <button class="twc-inline-flex twc-items-center">{i}</button>
+        </article>""")
+    return f"""<html><body>
+      <span class="twc-font-bold">합성 제품</span>
+      <a class="brand-info">합성브랜드</a>
+      <div class="twc-text-sm twc-text-blue-600 twc-mt-1">브랜드샵 바로가기</div>
+      <div class="twc-text-sm twc-text-blue-600">합성브랜드</div>
+      <ul class="breadcrumb"><li><a>뷰티</a></li><li><a>스킨케어</a></li><li><a>에센스</a></li></ul>
+      <div class="price-amount final-price-amount">12,900원</div>
+      <div class="price-amount original-price-amount">15,000원</div>
+      {''.join(articles)}
+    </body></html>"""
+
+
+def _coupang_listing_page(cards=60):
+    units = []
+    for i in range(cards):
+        # 일부 카드는 원가/할인율 없음 (할인 없는 제품)
+        discount = "" if i % 4 else f"""
+            <del class="PriceInfo_basePrice__8BQ32">15,000원</del>
+            <span class="PriceInfo_discountRate__EsQ8I">14%</span>"""
+        units.append(f"""
+        <li class="ProductUnit_productUnit__Qd6sv">
+          <a href="/vp/products/{i + 1}?itemId={i + 1}">
+            <div class="ProductUnit_productInfo__1l0il">
+              <div class="ProductUnit_productName__gre7e">합성 제품 {i + 1}</div>
+              {discount}
+              <strong class="Price_priceValue__A4KOr">12,900원</strong>
+            </div>
+          </a>
+        </li>""")
+    return f"<html><body><ul id='product-list'>{''.join(units)}</ul></body></html>"
+
+
+def _daiso_page(page, reviews_per_page=10):
+    items = []
+    for i in range(reviews_per_page):
+        items.append(f"""
+        <li>
+          <span class="name">리뷰어{i}</span><span class="score">{i % 5 + 1}</span>
+          <div class="review-date">2025.10.{i % 28 + 1:02d}</div>
+          <div class="item">보습력</div><div class="val">좋아요</div>
+          <div class="cont">가성비 좋아요 {page}-{i}</div>
+          <span class="num">{i}</span>
+        </li>""")
+    return f"<html><body><ul class='review-list'>{''.join(items)}</ul></body></html>"
+
+
+def write_synthetic_snapshots(root, pages):
+    """합성 HTML로 채널별 스냅샷 생성 (크롤러와 같은 kind/context)"""
+    coupang = SnapshotRecorder(root, "coupang")
+    daiso = SnapshotRecorder(root, "daiso")
+    collection_date = "2025-11-02 00:00:00"
+    product_info = {"rank": 1, "url": "https://www.coupang.com/vp/products/1", "name": "합성 제품",
+                    "category": "skincare", "sort_type": "RECENCY", "sale_price": "12,900원",
+                    "original_price": "15,000원"}
+
+    for page in range(1, pages + 1):
+        html = _coupang_page(page)
+        coupang.save("coupang_review_page", html, product_info=product_info, page=page,
+                     collection_date=collection_date, brand_name="합성브랜드", category_use="스킨케어 > 에센스")
+        coupang.save("coupang_recency_page", html, product_info={"product_name": "합성 제품"}, product_ranking=1)
+        if page == 1:
+            coupang.save("coupang_product_page", html, product_url=product_info["url"])
+            coupang.save("coupang_listing_page", _coupang_listing_page(), category="skincare",
+                         sort_type="RECENCY", limit=100)
+
+        daiso.save("daiso_review_page", _daiso_page(page),
+                   product_url="https://www.daisomall.co.kr/pd/pdr/SCR_PDR_0001?pdNo=1", product_name="합성 제품",
+                   product_price="3,000", product_id="1", category="skincare", sort_type="SALES", rank=1,
+                   brand_name="합성브랜드", category_use="스킨케어", collection_date=collection_date)
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="수집 HTML 스냅샷 재생 (파싱 처리량 측정)")
+    arg_parser.add_argument("snapshot_dir", nargs="?", help="스냅샷 폴더 (crawl 시 snapshot_dir)")
+    arg_parser.add_argument("--channel", help="특정 채널만 (coupang / daiso)")
+    arg_parser.add_argument("--repeat", type=int, default=1, help="반복 횟수")
+    arg_parser.add_argument("--synthetic", type=int, metavar="PAGES",
+                            help="스냅샷 대신 합성 페이지 PAGES개로 측정")
+    arg_parser.add_argument("--backend", choices=available_backends(), help="HTML 백엔드 고정")
+    arg_parser.add_argument("--compare", action="store_true", help="설치된 백엔드 전체 비교 + 레코드 검증")
+    args = arg_parser.parse_args()
+
+    options = dict(channel=args.channel, repeat=args.repeat, backend=args.backend, compare=args.compare)
+    if args.synthetic:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_synthetic_snapshots(tmp_dir, args.synthetic)
+            run(tmp_dir, **options)
+    elif args.snapshot_dir:
+        run(args.snapshot_dir, **options)
+    else:
+        arg_parser.error("snapshot_dir 또는 --synthetic 필요")
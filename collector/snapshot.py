@@ -0,0 +1,148 @@
+#//==============================================================================//#
+"""
+수집 페이지 HTML 스냅샷 저장/재생
+
+- 크롤링 중 파싱 직전의 page_source를 gzip으로 저장 (SnapshotRecorder)
+- manifest.jsonl에 페이지 종류(kind)와 파싱에 필요한 컨텍스트(제품 정보, 페이지 번호 등) 기록
+- iter_snapshots로 저장된 페이지를 저장 순서대로 읽어서 같은 파싱 함수에 전달
+  (replay_snapshots.py - 네트워크/드라이버 없이 파서 검증, 처리량 측정)
+
+저장 구조:
+    {snapshot_dir}/{channel}/manifest.jsonl
+    {snapshot_dir}/{channel}/000001_coupang_review_page.html.gz
+
+사용:
+    recorder = SnapshotRecorder("snapshots", "coupang")
+    recorder.save("coupang_review_page", driver.page_source, product_info=product_info, page=page)
+
+last_updated : 2025.11.02
+"""
+#//==============================================================================//#
+
+#//==============================================================================//#
+# Library import
+#//==============================================================================//#
+import gzip
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+MANIFEST_NAME = "manifest.jsonl"
+
+# 크롤링 스크립트 공통 스냅샷 경로 (환경변수로 켜기)
+SNAPSHOT_DIR_ENV = "COLLECTOR_SNAPSHOT_DIR"
+
+#//==============================================================================//#
+# 스냅샷 저장
+#//==============================================================================//#
+class SnapshotRecorder:
+    """
+    채널별 페이지 HTML 스냅샷 저장 (여러 스레드에서 같이 사용 가능)
+
+    Args:
+        root: 스냅샷 최상위 폴더
+        channel: 채널 이름 (하위 폴더)
+        compresslevel: gzip 압축 수준 (1~9)
+    """
+
+    def __init__(self, root, channel: str, compresslevel: int = 6):
+        self.dir = Path(root) / channel
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.channel = channel
+        self.compresslevel = compresslevel
+        self.manifest_path = self.dir / MANIFEST_NAME
+
+        self._lock = threading.Lock()
+        self._seq = _count_lines(self.manifest_path)
+
+    @classmethod
+    def from_env(cls, channel: str) -> Optional["SnapshotRecorder"]:
+        """COLLECTOR_SNAPSHOT_DIR이 설정되어 있으면 recorder 생성 (없으면 None)"""
+        root = os.environ.get(SNAPSHOT_DIR_ENV)
+        return cls(root, channel) if root else None
+
+    def save(self, kind: str, html: str, **context) -> Path:
+        """
+        페이지 HTML 저장
+
+        Args:
+            kind: 페이지 종류 (재생 시 파싱 함수 선택 기준)
+            html: driver.page_source
+            **context: 파싱 함수에 넘길 값 (JSON으로 저장)
+
+        Returns:
+            저장된 .html.gz 경로
+        """
+        data = html.encode("utf-8")
+
+        with self._lock:
+            self._seq += 1
+            path = self.dir / f"{self._seq:06d}_{kind}.html.gz"
+            with gzip.open(path, "wb", compresslevel=self.compresslevel) as f:
+                f.write(data)
+
+            entry = {
+                "file": path.name,
+                "kind": kind,
+                "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "bytes": len(data),
+                "context": context
+            }
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=_to_builtin) + "\n")
+
+        return path
+
+#//==============================================================================//#
+# 스냅샷 읽기
+#//==============================================================================//#
+def iter_snapshots(root, channel: Optional[str] = None,
+                   kinds: Optional[Iterable[str]] = None) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """
+    저장된 스냅샷을 저장 순서대로 읽기
+
+    Args:
+        root: 스냅샷 최상위 폴더
+        channel: 특정 채널만 (None이면 전체)
+        kinds: 특정 페이지 종류만
+
+    Yields:
+        (manifest 항목, HTML 문자열)
+    """
+    root = Path(root)
+    channel_dirs = [root / channel] if channel else sorted(p for p in root.iterdir() if p.is_dir())
+    kinds = set(kinds) if kinds else None
+
+    for channel_dir in channel_dirs:
+        manifest_path = channel_dir / MANIFEST_NAME
+        if not manifest_path.exists():
+            continue
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if kinds and entry["kind"] not in kinds:
+                    continue
+
+                entry["channel"] = channel_dir.name
+                with gzip.open(channel_dir / entry["file"], "rb") as page:
+                    yield entry, page.read().decode("utf-8")
+
+
+def _count_lines(path: Path) -> int:
+    if not path.exists():
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def _to_builtin(value):
+    """CSV에서 읽은 numpy 값 등을 JSON 기본 타입으로"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
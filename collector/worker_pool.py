@@ -0,0 +1,411 @@
+#//==============================================================================//#
+"""
+여러 브라우저로 제품을 병렬 크롤링하는 작업 큐 스케줄러
+
+- 워커 N개가 각자 드라이버를 하나씩 만들어 공유 작업 큐에서 제품을 가져감
+- 워커별 요청 간격 (랜덤 지연 + N개마다 긴 휴식, 시작 시각 분산)
+- 진행 상황 체크포인트 (progress.jsonl) → 중단 후 다시 실행하면 완료된 제품은 건너뜀
+- 제품별 결과를 results.jsonl에 모은 뒤 하나의 CSV로 통합 저장
+- 실패 시 드라이버를 다시 만들고 재시도
+
+드라이버 생성 함수와 작업 함수만 넘기면 되므로 가짜 드라이버로 확인 가능 (테스트 코드 참고)
+
+사용:
+    pool = CrawlerWorkerPool(
+        driver_factory=make_driver,
+        task=lambda driver, product: collect_reviews(driver, product),
+        num_workers=3,
+        state_dir="data/coupang_reviews/_pool",
+        key=lambda product: product["url"]
+    )
+    summary = pool.run(products)
+    pool.write_csv("data/coupang_reviews/coupang_all_reviews.csv")
+
+last_updated : 2025.11.02
+"""
+#//==============================================================================//#
+
+#//==============================================================================//#
+# Library import
+#//==============================================================================//#
+import json
+import os
+import queue
+import random
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+PROGRESS_NAME = "progress.jsonl"
+RESULTS_NAME = "results.jsonl"
+
+#//==============================================================================//#
+# 체크포인트 (공유 진행 상황)
+#//==============================================================================//#
+class CheckpointStore:
+    """
+    작업 키별 완료/실패 기록 (append-only JSONL, 마지막 기록이 최종 상태)
+
+    Args:
+        path: progress.jsonl 경로
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._status: Dict[str, str] = {}
+
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._status[entry["key"]] = entry["status"]
+
+    def is_done(self, key: str) -> bool:
+        with self._lock:
+            return self._status.get(key) == "done"
+
+    def done_keys(self) -> Set[str]:
+        with self._lock:
+            return {key for key, status in self._status.items() if status == "done"}
+
+    def mark(self, key: str, status: str, **info):
+        """상태 기록 (done / failed)"""
+        entry = {"key": key, "status": status, "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), **info}
+        with self._lock:
+            self._status[key] = status
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+#//==============================================================================//#
+# 통합 결과 저장
+#//==============================================================================//#
+class ResultStore:
+    """
+    작업별 레코드 저장 (작업 1개 = JSONL 1줄, 같은 키가 여러 번 있으면 마지막 것 사용)
+
+    Args:
+        path: results.jsonl 경로
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def add(self, key: str, records: List[Dict]):
+        line = json.dumps({"key": key, "records": records}, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def load(self, keys: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        저장된 레코드 전체 (이전 실행 포함)
+
+        Args:
+            keys: 이 키들의 결과만 (완료된 작업만 통합할 때 사용)
+        """
+        if not self.path.exists():
+            return []
+
+        latest: Dict[str, List[Dict]] = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    latest[entry["key"]] = entry["records"]
+
+        return [record for key, records in latest.items()
+                if keys is None or key in keys
+                for record in records]
+
+#//==============================================================================//#
+# 워커별 요청 간격
+#//==============================================================================//#
+class Politeness:
+    """
+    작업 사이 대기 (워커마다 따로 적용)
+
+    Args:
+        delay: 작업 사이 랜덤 대기 범위(초)
+        long_pause_every: N개 작업마다 긴 휴식 (0이면 없음)
+        long_pause: 긴 휴식 시간(초)
+        sleep: 대기 함수 (테스트에서 교체)
+    """
+
+    def __init__(self, delay: Tuple[float, float] = (2.0, 4.0), long_pause_every: int = 0,
+                 long_pause: float = 0.0, sleep: Callable[[float], None] = time.sleep):
+        self.delay = delay
+        self.long_pause_every = long_pause_every
+        self.long_pause = long_pause
+        self.sleep = sleep
+        self.completed = 0
+
+    def wait(self, stop_event: threading.Event):
+        """작업 하나가 끝난 뒤 호출"""
+        self.completed += 1
+        if self.long_pause_every and self.completed % self.long_pause_every == 0:
+            seconds = self.long_pause
+        else:
+            seconds = random.uniform(*self.delay)
+
+        if seconds > 0 and not stop_event.is_set():
+            self.sleep(seconds)
+
+#//==============================================================================//#
+# 워커 풀
+#//==============================================================================//#
+class CrawlerWorkerPool:
+    """
+    드라이버 N개로 제품 목록을 나눠서 크롤링
+
+    Args:
+        driver_factory: 드라이버 생성 함수 (워커 스레드 안에서 호출)
+        task: (driver, item) → 레코드 리스트
+        num_workers: 동시에 띄울 브라우저 수
+        state_dir: progress.jsonl / results.jsonl 저장 폴더 (None이면 이어하기/통합 저장 없음)
+        key: item → 작업 키 (체크포인트/결과 저장 기준, 기본: item["url"])
+             같은 URL이 여러 목록(카테고리/정렬)에 있고 목록별로 따로 저장한다면 목록 정보까지 포함할 것
+             (키가 같으면 결과는 마지막 것만 남음)
+        driver_closer: 드라이버 종료 함수 (기본: driver.quit())
+        max_attempts: 작업당 최대 시도 횟수 (실패하면 드라이버를 다시 만들고 재시도)
+        delay, long_pause_every, long_pause: 워커별 요청 간격 (Politeness)
+        sleep: 대기 함수 (테스트에서 교체)
+    """
+
+    def __init__(self, driver_factory: Callable[[], Any], task: Callable[[Any, Dict], List[Dict]],
+                 num_workers: int = 2, state_dir=None, key: Callable[[Dict], str] = lambda item: item["url"],
+                 driver_closer: Optional[Callable[[Any], None]] = None, max_attempts: int = 2,
+                 delay: Tuple[float, float] = (2.0, 4.0), long_pause_every: int = 0, long_pause: float = 0.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.driver_factory = driver_factory
+        self.task = task
+        self.num_workers = num_workers
+        self.key = key
+        self.driver_closer = driver_closer or (lambda driver: driver.quit())
+        self.max_attempts = max_attempts
+        self.politeness_options = dict(delay=delay, long_pause_every=long_pause_every,
+                                       long_pause=long_pause, sleep=sleep)
+        self.sleep = sleep
+
+        self.checkpoint = CheckpointStore(Path(state_dir) / PROGRESS_NAME) if state_dir else None
+        self.results = ResultStore(Path(state_dir) / RESULTS_NAME) if state_dir else None
+
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._records: List[Dict] = []
+        self._summary: Dict[str, int] = {}
+
+    #//==========================================================================//#
+    # 실행
+    #//==========================================================================//#
+    def run(self, items: Iterable[Dict]) -> Dict[str, int]:
+        """
+        전체 작업 실행 (모든 워커가 끝날 때까지 대기, Ctrl+C 시 진행 중인 작업까지만 하고 종료)
+
+        Returns:
+            {"total", "skipped", "done", "failed", "records"}
+        """
+        items = list(items)
+
+        # 같은 키는 한 번만 (키가 겹치면 결과가 서로 덮어쓰므로 경고)
+        unique: Dict[str, Dict] = {}
+        for item in items:
+            unique.setdefault(self.key(item), item)
+        if len(unique) < len(items):
+            print(f"⚠️ 작업 키 중복 {len(items) - len(unique)}개 제외 (key 함수 확인 필요)")
+        items = list(unique.values())
+
+        pending = [item for item in items if not (self.checkpoint and self.checkpoint.is_done(self.key(item)))]
+
+        self._stop.clear()
+        self._records = []
+        self._summary = {"total": len(items), "skipped": len(items) - len(pending),
+                         "done": 0, "failed": 0, "records": 0}
+
+        print(f"🧵 워커 {self.num_workers}개 시작 - 작업 {len(pending)}개 (완료되어 건너뜀: {self._summary['skipped']}개)")
+
+        work_queue: "queue.Queue[Dict]" = queue.Queue()
+        for item in pending:
+            work_queue.put(item)
+
+        workers = [
+            threading.Thread(target=self._worker, args=(worker_id, work_queue), name=f"crawler-{worker_id}", daemon=True)
+            for worker_id in range(min(self.num_workers, len(pending)))
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for worker in workers:
+                while worker.is_alive():
+                    worker.join(timeout=0.5)
+        except KeyboardInterrupt:
+            print("\n⚠️ 중단 요청 - 진행 중인 작업이 끝나면 종료합니다 (다시 실행하면 이어서 진행)")
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+
+        print(f"🧵 워커 종료 - 완료 {self._summary['done']}개, 실패 {self._summary['failed']}개, "
+              f"레코드 {self._summary['records']}개")
+        return dict(self._summary)
+
+    def _worker(self, worker_id: int, work_queue: "queue.Queue[Dict]"):
+        politeness = Politeness(**self.politeness_options)
+        driver = None
+
+        # 워커들이 같은 순간에 요청하지 않도록 시작 시각 분산
+        if worker_id:
+            self.sleep(worker_id * self.politeness_options["delay"][0])
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    item = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                key = self.key(item)
+                for attempt in range(1, self.max_attempts + 1):
+                    try:
+                        if driver is None:
+                            driver = self.driver_factory()
+                        records = self.task(driver, item) or []
+                        self._complete(worker_id, key, records)
+                        break
+                    except Exception as e:
+                        print(f"  [워커 {worker_id}] 작업 실패 ({attempt}/{self.max_attempts}) {key}: {e}")
+                        if attempt == self.max_attempts:
+                            traceback.print_exc()
+                            self._fail(worker_id, key, e)
+                        # 브라우저 상태를 알 수 없으므로 새로 만들어서 재시도
+                        driver = self._close_driver(driver)
+
+                politeness.wait(self._stop)
+        finally:
+            self._close_driver(driver)
+
+    def _complete(self, worker_id: int, key: str, records: List[Dict]):
+        # 결과를 먼저 저장한 뒤 완료 표시 (중간에 죽으면 다음 실행에서 다시 수집)
+        if self.results:
+            self.results.add(key, records)
+        if self.checkpoint:
+            self.checkpoint.mark(key, "done", worker=worker_id, records=len(records))
+
+        with self._lock:
+            self._records.extend(records)
+            self._summary["done"] += 1
+            self._summary["records"] += len(records)
+
+    def _fail(self, worker_id: int, key: str, error: Exception):
+        if self.checkpoint:
+            self.checkpoint.mark(key, "failed", worker=worker_id, error=str(error))
+        with self._lock:
+            self._summary["failed"] += 1
+
+    def _close_driver(self, driver):
+        if driver is not None:
+            try:
+                self.driver_closer(driver)
+            except Exception as e:
+                print(f"  드라이버 종료 실패: {e}")
+        return None
+
+    #//==========================================================================//#
+    # 통합 결과
+    #//==========================================================================//#
+    def all_records(self) -> List[Dict]:
+        """완료된 작업 전체 레코드 (state_dir가 있으면 이전 실행분 포함)"""
+        if self.results:
+            return self.results.load(self.checkpoint.done_keys())
+        with self._lock:
+            return list(self._records)
+
+    def write_csv(self, csv_path, records: Optional[List[Dict]] = None) -> int:
+        """
+        통합 CSV 저장 (컬럼은 전체 레코드의 합집합, 처음 나온 순서)
+
+        Returns:
+            저장한 레코드 수
+        """
+        import pandas as pd
+
+        records = self.all_records() if records is None else records
+        if not records:
+            return 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(csv_path)), exist_ok=True)
+        pd.DataFrame(records).to_csv(csv_path, index=False, encoding="utf-8-sig")
+        print(f"💾 통합 저장: {csv_path} ({len(records)}개)")
+        return len(records)
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    # 가짜 드라이버로 병렬 처리 / 재시도 / 체크포인트 이어하기 확인
+    import tempfile
+
+    class FakeDriver:
+        created = 0
+
+        def __init__(self):
+            FakeDriver.created += 1
+            self.closed = False
+            self.visited = []
+
+        def get(self, url):
+            time.sleep(0.05)   # 페이지 로딩 흉내
+            self.visited.append(url)
+
+        def quit(self):
+            self.closed = True
+
+    failures = {"https://example.com/p/3": 1}   # 3번 제품은 첫 시도에 실패
+    crashed = {"https://example.com/p/7"}       # 7번 제품은 계속 실패
+
+    def fake_task(driver, product):
+        driver.get(product["url"])
+        if product["url"] in crashed:
+            raise RuntimeError("페이지 로딩 실패")
+        if failures.get(product["url"]):
+            failures[product["url"]] -= 1
+            raise RuntimeError("일시적 오류")
+        return [{"product_url": product["url"], "sort_type": product["sort_type"], "review_text": f"리뷰 {i}"}
+                for i in range(product["rank"] % 3 + 1)]
+
+    products = [{"url": f"https://example.com/p/{rank}", "sort_type": "SALES", "rank": rank} for rank in range(1, 13)]
+    # 정렬 목록이 달라도 같은 제품(URL)이 겹침 → 정렬별로 따로 수집/저장되어야 함
+    products += [{"url": f"https://example.com/p/{rank}", "sort_type": "RANKED", "rank": rank} for rank in (1, 2)]
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        def make_pool(num_workers):
+            return CrawlerWorkerPool(FakeDriver, fake_task, num_workers=num_workers, state_dir=state_dir,
+                                     key=lambda product: f"{product['sort_type']}:{product['url']}",
+                                     delay=(0.0, 0.01), max_attempts=2)
+
+        start = time.perf_counter()
+        summary = make_pool(4).run(products)
+        elapsed = time.perf_counter() - start
+        print(f"1차 실행: {summary} ({elapsed:.2f}s, 드라이버 생성 {FakeDriver.created}회)")
+        assert summary["done"] == 13 and summary["failed"] == 1
+
+        # 7번 복구 후 재실행 → 완료된 13개는 건너뛰고 7번만 수집
+        crashed.clear()
+        summary = make_pool(2).run(products)
+        print(f"2차 실행: {summary}")
+        assert summary["skipped"] == 13 and summary["done"] == 1
+
+        pool = make_pool(1)
+        records = pool.all_records()
+        expected = sum(product["rank"] % 3 + 1 for product in products)
+        print(f"통합 레코드: {len(records)}개 (예상 {expected}개)")
+        assert len(records) == expected
+        duplicated = {r["sort_type"] for r in records if r["product_url"] == "https://example.com/p/1"}
+        assert duplicated == {"SALES", "RANKED"}, "URL이 같아도 정렬별 리뷰가 모두 남아야 함"
+        pool.write_csv(os.path.join(state_dir, "all_reviews.csv"))
+        print("✅ 모든 확인 통과")
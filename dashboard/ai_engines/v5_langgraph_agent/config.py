@@ -97,6 +97,23 @@ MIN_REVIEW_COUNT = 1
 # 데이터베이스 테이블명
 PREPROCESSED_TABLE = "preprocessed_reviews"
 
+# Tool 결과 캐시 설정 (utils/tool_cache.py)
+# 키: (Tool 이름, brands, products, channels, 데이터 버전)
+TOOL_CACHE_CONFIG = {
+    "enabled": True,
+    "max_entries": 256,            # LRU 최대 항목 수
+    "ttl_seconds": 3600,           # 항목 유효 시간 (1시간)
+    "version_check_interval": 30   # 데이터 버전 재조회 간격 (초)
+}
+
+# 리뷰 카탈로그 설정 (utils/review_catalog.py)
+# ValidationNode의 리뷰 수 확인/드롭다운 목록을 메모리에서 처리
+CATALOG_CONFIG = {
+    "version_check_interval": 30,  # 데이터 버전 재조회 간격 (초) → 바뀌면 카탈로그 다시 로드
+    "suggestion_limit": 5,         # 제품명 유사 후보 최대 개수
+    "min_similarity": 0.2          # 제품명 유사도 하한 (트라이그램 자카드 유사도)
+}
+
 # 채널명 한글 → 영문 매핑 (DB에 영문으로 저장되어 있음)
 CHANNEL_MAPPING = {
     "올리브영": "OliveYoung",
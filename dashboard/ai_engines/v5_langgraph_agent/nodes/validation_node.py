@@ -9,13 +9,16 @@ Fallback 모드:
 - 데이터가 부족하여 통계적 신뢰도가 낮다는 경고
 - 사용자에게 데이터 부족 안내
 - 대안 제시 (필터 완화, 다른 제품 추천 등)
+
+리뷰 수 확인과 드롭다운 목록은 DB 대신 메모리 카탈로그(utils/review_catalog.py)에서
+조회합니다. 카탈로그는 업로드로 데이터 버전이 바뀌면 자동으로 다시 로드됩니다.
 """
 
 from typing import Dict, Optional, List
 
 from ..state import AgentState
-from ..config import MIN_REVIEW_COUNT
-from ..utils.db_connector import DBConnector
+from ..config import MIN_REVIEW_COUNT, CATALOG_CONFIG
+from ..utils.review_catalog import get_review_catalog
 
 
 class ValidationNode:
@@ -66,13 +69,20 @@ class ValidationNode:
 
             # 데이터 0개인 경우 재질문 처리 (드롭다운 선택)
             if review_count == 0:
-                # DB에서 사용 가능한 채널/브랜드/제품 리스트 가져오기
+                # 사용 가능한 채널/브랜드/제품 리스트 (카탈로그에서)
                 available_channels = self._get_all_channels()
                 available_brands = self._get_all_brands()
                 available_products = self._get_all_products()
 
+                # 제품명이 조금 달라서 못 찾은 경우 유사 제품 후보
+                suggestions = self._suggest_products(brands, products)
+
                 # 재질문 메시지
                 clarification_msg = "데이터를 찾을 수 없습니다.\n"
+                if suggestions:
+                    clarification_msg += "혹시 다음 제품을 찾으셨나요?\n"
+                    for suggestion in suggestions:
+                        clarification_msg += f"- {suggestion['product_name']} ({suggestion['review_count']}개 리뷰)\n"
                 clarification_msg += "채널, 브랜드, 제품을 선택해주세요."
 
                 messages.append({
@@ -90,7 +100,7 @@ class ValidationNode:
                     "is_fallback": False,  # Fallback이 아닌 재질문
                     "fallback_reason": "",
                     "needs_clarification": True,
-                    "suggestions": None,
+                    "suggestions": suggestions or None,
                     "clarification_type": "dropdown",
                     "available_channels": available_channels,
                     "available_brands": available_brands,
@@ -163,7 +173,7 @@ class ValidationNode:
         channels: list
     ) -> int:
         """
-        DB에서 필터 조건에 맞는 리뷰 개수 확인
+        필터 조건에 맞는 리뷰 개수 확인 (카탈로그 메모리 조회)
 
         Args:
             brands: 브랜드 리스트
@@ -173,13 +183,46 @@ class ValidationNode:
         Returns:
             리뷰 개수
         """
-        with DBConnector() as db:
-            count = db.count_reviews(
+        return get_review_catalog().count(
+            brands=brands if brands else None,
+            products=products if products else None,
+            channels=channels if channels else None
+        )
+
+    def _suggest_products(
+        self,
+        brands: list,
+        products: list
+    ) -> List[Dict]:
+        """
+        입력한 제품명과 비슷한 제품 후보 (트라이그램 유사도)
+
+        Args:
+            brands: 브랜드 리스트 (있으면 해당 브랜드 제품 중에서만)
+            products: 사용자가 입력한 제품명 리스트
+
+        Returns:
+            [{"product_name": ..., "similarity": ..., "review_count": ...}, ...]
+        """
+        if not products:
+            return []
+
+        catalog = get_review_catalog()
+        limit = CATALOG_CONFIG["suggestion_limit"]
+
+        suggestions = {}
+        for product in products:
+            for suggestion in catalog.suggest_products(
+                product,
                 brands=brands if brands else None,
-                products=products if products else None,
-                channels=channels if channels else None
-            )
-        return count
+                limit=limit,
+                min_similarity=CATALOG_CONFIG["min_similarity"]
+            ):
+                name = suggestion["product_name"]
+                if name not in suggestions or suggestion["similarity"] > suggestions[name]["similarity"]:
+                    suggestions[name] = suggestion
+
+        return sorted(suggestions.values(), key=lambda s: s["similarity"], reverse=True)[:limit]
 
     def _find_similar_products(
         self,
@@ -205,79 +248,34 @@ class ValidationNode:
                 ...
             ]
         """
-        with DBConnector() as db:
-            # 브랜드로만 검색 쿼리 구성
-            query = """
-                SELECT product_name, brand, channel, COUNT(*) as review_count
-                FROM preprocessed_reviews
-                WHERE brand = ANY(%s)
-            """
-            params = [brands]
-
-            # 채널 필터 추가 (있는 경우)
-            if channels:
-                query += " AND channel = ANY(%s)"
-                params.append(channels)
-
-            # 그룹화 및 정렬
-            query += """
-                GROUP BY product_name, brand, channel
-                ORDER BY review_count DESC
-                LIMIT 5
-            """
-
-            results = db.execute_query(query, tuple(params))
-
-            # Dict 리스트로 변환
-            return [dict(row) for row in results]
+        return get_review_catalog().find_similar_products(brands, channels, limit=5)
 
     def _get_all_channels(self) -> List[str]:
         """
-        DB에 있는 모든 채널 리스트 가져오기
+        DB에 있는 모든 채널 리스트 가져오기 (카탈로그)
 
         Returns:
             채널명 리스트
         """
-        with DBConnector() as db:
-            query = """
-                SELECT DISTINCT channel
-                FROM preprocessed_reviews
-                ORDER BY channel
-            """
-            results = db.execute_query(query)
-            return [row['channel'] for row in results]
+        return list(get_review_catalog().channels)
 
     def _get_all_brands(self) -> List[str]:
         """
-        DB에 있는 모든 브랜드 리스트 가져오기
+        DB에 있는 모든 브랜드 리스트 가져오기 (카탈로그)
 
         Returns:
             브랜드명 리스트
         """
-        with DBConnector() as db:
-            query = """
-                SELECT DISTINCT brand
-                FROM preprocessed_reviews
-                ORDER BY brand
-            """
-            results = db.execute_query(query)
-            return [row['brand'] for row in results]
+        return list(get_review_catalog().brands)
 
     def _get_all_products(self) -> List[str]:
         """
-        DB에 있는 모든 제품 리스트 가져오기
+        DB에 있는 모든 제품 리스트 가져오기 (카탈로그)
 
         Returns:
             제품명 리스트
         """
-        with DBConnector() as db:
-            query = """
-                SELECT DISTINCT product_name
-                FROM preprocessed_reviews
-                ORDER BY product_name
-            """
-            results = db.execute_query(query)
-            return [row['product_name'] for row in results]
+        return list(get_review_catalog().products)
 
     def _generate_fallback_reason(
         self,
@@ -6,9 +6,11 @@ DB 연결, 필터 조건 생성 등 공통 기능을 제공합니다.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from collections import Counter
 
 from ..utils.db_connector import DBConnector, build_filter_conditions
+from ..utils.tool_cache import get_tool_cache
 
 
 class BaseTool(ABC):
@@ -19,8 +21,15 @@ class BaseTool(ABC):
     1. 이 클래스를 상속
     2. run() 메서드만 구현
     3. DB 연결은 자동 처리
+    4. 결과 캐시는 자동 처리 (utils/tool_cache.py)
     """
 
+    # 결과 캐시 사용 여부 (DB 데이터 외의 입력에 의존하는 Tool은 False로 설정)
+    CACHEABLE = True
+
+    # 필터 순서가 결과에 영향을 주는지 (True면 캐시 키에서 정렬하지 않음)
+    ORDER_SENSITIVE = False
+
     def __init__(self):
         """Tool 초기화"""
         self.name = self.__class__.__name__  # AttributeTool, SentimentTool 등
@@ -47,13 +56,31 @@ class BaseTool(ABC):
                 "summary": 요약 텍스트 (선택)
             }
         """
+        # 캐시 조회 (같은 필터 + 같은 데이터 버전이면 재사용)
+        cache = get_tool_cache() if self.CACHEABLE else None
+        cache_key = None
+        if cache:
+            cache_key = cache.make_key(
+                self.name, brands, products, channels,
+                order_sensitive=self.ORDER_SENSITIVE
+            )
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
         # DB 연결
         with DBConnector() as db:
             self.db = db
             # 실제 Tool 로직 실행 (자식 클래스가 구현)
             result = self._execute(brands, products, channels)
             self.db = None
-            return result
+
+        # 캐시 저장
+        if cache_key is not None:
+            cache.set(cache_key, result)
+
+        return result
 
     @abstractmethod
     def _execute(
@@ -103,6 +130,62 @@ class BaseTool(ABC):
         """
         return self.db.count_reviews(brands, products, channels)
 
+    def _use_rollups(self) -> bool:
+        """
+        롤업 테이블(utils/review_rollups.py)을 사용할 수 있는지
+
+        롤업이 현재 데이터 버전과 일치할 때만 True (조회 실패 시 원본 집계로 대체)
+        """
+        try:
+            return self.db.rollups_fresh()
+        except Exception as e:
+            print(f"⚠️ 롤업 상태 확인 실패 (원본 리뷰로 집계): {e}")
+            self.db.conn.rollback()
+            return False
+
+    def _collect_list_field(
+        self,
+        field: str,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> Tuple[int, int, Counter]:
+        """
+        analysis 리스트 필드(장점, 단점, 키워드, 불만사항, 구매동기) 집계
+
+        롤업이 최신이면 롤업 테이블 몇백 행만 읽고, 아니면 원본 리뷰를 읽어 계산합니다.
+        두 경로 모두 비어 있지 않은 문자열 항목만 셉니다.
+
+        Args:
+            field: analysis 필드명
+
+        Returns:
+            (전체 리뷰 수, 항목이 있는 리뷰 수, 항목별 언급 횟수 Counter)
+        """
+        if self._use_rollups():
+            total_count = self.db.fetch_rollup_count(brands, products, channels)
+            field_count, terms = self.db.fetch_rollup_field(field, brands, products, channels)
+            return total_count, field_count, Counter(dict(terms))
+
+        reviews = self._fetch_reviews(brands, products, channels)
+
+        counter = Counter()
+        field_count = 0
+
+        for review in reviews:
+            analysis = review.get('analysis', {})
+            values = analysis.get(field, [])
+
+            if not isinstance(values, list):
+                continue
+
+            valid_values = [v for v in values if v and isinstance(v, str)]
+            if valid_values:
+                field_count += 1
+                counter.update(valid_values)
+
+        return len(reviews), field_count, counter
+
     def _extract_field_from_analysis(
         self,
         reviews: List[Dict],
@@ -24,6 +24,9 @@ class ProductComparisonTool(BaseTool):
     사용자는 2개의 제품명을 제공해야 합니다.
     """
 
+    # products[0]이 제품 A, products[1]이 제품 B이므로 캐시 키에서 순서 유지
+    ORDER_SENSITIVE = True
+
     # 긍정/부정 키워드
     POSITIVE_KEYWORDS = [
         "좋", "훌륭", "완벽", "만족", "추천", "최고", "베스트",
@@ -57,42 +57,28 @@ class ComplaintTool(BaseTool):
             }
         """
 
-        # 1. 리뷰 가져오기
-        reviews = self._fetch_reviews(brands, products, channels)
+        # 1. 불만사항 집계 (롤업이 최신이면 롤업 테이블에서)
+        total_count, complaint_reviews_count, complaint_counter = self._collect_list_field(
+            '불만사항', brands, products, channels
+        )
 
-        if not reviews:
+        if total_count == 0:
             return {
                 "count": 0,
                 "complaint_count": 0,
                 "message": "분석할 리뷰가 없습니다."
             }
 
-        # 2. 불만사항 추출
-        all_complaints = []
-        complaint_reviews_count = 0
-
-        for review in reviews:
-            analysis = review.get('analysis', {})
-            불만사항 = analysis.get('불만사항', [])
-
-            if not isinstance(불만사항, list):
-                continue
-
-            if 불만사항:
-                complaint_reviews_count += 1
-                all_complaints.extend(불만사항)
-
-        # 3. 불만사항 빈도 통계
-        complaint_counter = Counter(all_complaints)
+        # 2. 불만사항 빈도 통계
         불만사항_순위 = [
             {"불만사항": 불만, "언급_횟수": 횟수}
             for 불만, 횟수 in complaint_counter.most_common(20)
         ]
 
-        # 4. 유형별 분류
-        유형별_불만사항 = self._categorize_complaints(all_complaints)
+        # 3. 유형별 분류
+        유형별_불만사항 = self._categorize_complaints(list(complaint_counter.elements()))
 
-        # 5. 주요 불만사항 Top 5
+        # 4. 주요 불만사항 Top 5
         주요_불만사항_Top5 = [
             {
                 "불만사항": item["불만사항"],
@@ -102,18 +88,18 @@ class ComplaintTool(BaseTool):
             for item in 불만사항_순위[:5]
         ]
 
-        # 6. 요약 생성
+        # 5. 요약 생성
         summary = self._generate_summary(
-            len(reviews),
+            total_count,
             complaint_reviews_count,
             주요_불만사항_Top5,
             유형별_불만사항
         )
 
         return {
-            "count": len(reviews),
+            "count": total_count,
             "complaint_count": complaint_reviews_count,
-            "complaint_ratio": f"{self._calculate_percentage(complaint_reviews_count, len(reviews)):.1f}%",
+            "complaint_ratio": f"{self._calculate_percentage(complaint_reviews_count, total_count):.1f}%",
             "불만사항_순위": 불만사항_순위,
             "유형별_불만사항": 유형별_불만사항,
             "주요_불만사항_Top5": 주요_불만사항_Top5,
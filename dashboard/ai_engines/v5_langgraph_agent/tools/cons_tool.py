@@ -57,42 +57,28 @@ class ConsTool(BaseTool):
             }
         """
 
-        # 1. 리뷰 가져오기
-        reviews = self._fetch_reviews(brands, products, channels)
+        # 1. 단점 집계 (롤업이 최신이면 롤업 테이블에서)
+        total_count, cons_reviews_count, cons_counter = self._collect_list_field(
+            '단점', brands, products, channels
+        )
 
-        if not reviews:
+        if total_count == 0:
             return {
                 "count": 0,
                 "cons_count": 0,
                 "message": "분석할 리뷰가 없습니다."
             }
 
-        # 2. 단점 추출
-        all_cons = []
-        cons_reviews_count = 0
-
-        for review in reviews:
-            analysis = review.get('analysis', {})
-            단점 = analysis.get('단점', [])
-
-            if not isinstance(단점, list):
-                continue
-
-            if 단점:
-                cons_reviews_count += 1
-                all_cons.extend(단점)
-
-        # 3. 단점 빈도 통계
-        cons_counter = Counter(all_cons)
+        # 2. 단점 빈도 통계
         단점_순위 = [
             {"단점": 단점, "언급_횟수": 횟수}
             for 단점, 횟수 in cons_counter.most_common(20)
         ]
 
-        # 4. 카테고리별 분류
-        카테고리별_단점 = self._categorize_cons(all_cons)
+        # 3. 카테고리별 분류
+        카테고리별_단점 = self._categorize_cons(list(cons_counter.elements()))
 
-        # 5. 주요 단점 Top 5
+        # 4. 주요 단점 Top 5
         주요_단점_Top5 = [
             {
                 "단점": item["단점"],
@@ -102,18 +88,18 @@ class ConsTool(BaseTool):
             for item in 단점_순위[:5]
         ]
 
-        # 6. 요약 생성
+        # 5. 요약 생성
         summary = self._generate_summary(
-            len(reviews),
+            total_count,
             cons_reviews_count,
             주요_단점_Top5,
             카테고리별_단점
         )
 
         return {
-            "count": len(reviews),
+            "count": total_count,
             "cons_count": cons_reviews_count,
-            "cons_ratio": f"{self._calculate_percentage(cons_reviews_count, len(reviews)):.1f}%",
+            "cons_ratio": f"{self._calculate_percentage(cons_reviews_count, total_count):.1f}%",
             "단점_순위": 단점_순위,
             "카테고리별_단점": 카테고리별_단점,
             "주요_단점_Top5": 주요_단점_Top5,
@@ -8,7 +8,6 @@ KeywordTool - 키워드 추출 및 빈도 분석 툴
 """
 
 from typing import List, Dict, Optional
-from collections import Counter
 import itertools
 
 from .base_tool import BaseTool
@@ -51,10 +50,12 @@ class KeywordTool(BaseTool):
             }
         """
 
-        # 1. 리뷰 가져오기
-        reviews = self._fetch_reviews(brands, products, channels)
+        # 1. 키워드 집계 (롤업이 최신이면 롤업 테이블에서)
+        total_count, reviews_with_keywords, keyword_counter = self._collect_list_field(
+            '키워드', brands, products, channels
+        )
 
-        if not reviews:
+        if total_count == 0:
             return {
                 "count": 0,
                 "total_keywords": 0,
@@ -63,30 +64,11 @@ class KeywordTool(BaseTool):
                 "message": "분석할 리뷰가 없습니다."
             }
 
-        # 2. 키워드 추출
-        all_keywords = []
-        reviews_with_keywords = 0
-
-        for review in reviews:
-            analysis = review.get('analysis', {})
-            키워드 = analysis.get('키워드', [])
-
-            if not 키워드 or not isinstance(키워드, list):
-                continue
-
-            # 빈 문자열이나 None 제거
-            valid_keywords = [k for k in 키워드 if k and isinstance(k, str)]
-
-            if valid_keywords:
-                all_keywords.extend(valid_keywords)
-                reviews_with_keywords += 1
-
-        # 3. 키워드 빈도 계산
-        keyword_counter = Counter(all_keywords)
-        total_keywords = len(all_keywords)
+        # 2. 키워드 빈도 계산
+        total_keywords = sum(keyword_counter.values())
         unique_keywords = len(keyword_counter)
 
-        # 4. 키워드별 통계 (상위 50개)
+        # 3. 키워드별 통계 (상위 50개)
         keyword_frequency = {}
 
         for rank, (keyword, count) in enumerate(keyword_counter.most_common(50), 1):
@@ -99,15 +81,15 @@ class KeywordTool(BaseTool):
                 "rank": rank
             }
 
-        # 5. 상위 키워드 리스트 (Top 20)
+        # 4. 상위 키워드 리스트 (Top 20)
         top_keywords = [kw for kw, _ in keyword_counter.most_common(20)]
 
-        # 6. 키워드 카테고리 분류 (선택)
+        # 5. 키워드 카테고리 분류 (선택)
         keyword_categories = self._categorize_keywords(keyword_frequency)
 
-        # 7. 요약 생성
+        # 6. 요약 생성
         summary = self._generate_summary(
-            len(reviews),
+            total_count,
             reviews_with_keywords,
             total_keywords,
             unique_keywords,
@@ -115,7 +97,7 @@ class KeywordTool(BaseTool):
         )
 
         return {
-            "count": len(reviews),
+            "count": total_count,
             "reviews_with_keywords": reviews_with_keywords,
             "total_keywords": total_keywords,
             "unique_keywords": unique_keywords,
@@ -57,42 +57,28 @@ class ProsTool(BaseTool):
             }
         """
 
-        # 1. 리뷰 가져오기
-        reviews = self._fetch_reviews(brands, products, channels)
+        # 1. 장점 집계 (롤업이 최신이면 롤업 테이블에서)
+        total_count, pros_reviews_count, pros_counter = self._collect_list_field(
+            '장점', brands, products, channels
+        )
 
-        if not reviews:
+        if total_count == 0:
             return {
                 "count": 0,
                 "pros_count": 0,
                 "message": "분석할 리뷰가 없습니다."
             }
 
-        # 2. 장점 추출
-        all_pros = []
-        pros_reviews_count = 0
-
-        for review in reviews:
-            analysis = review.get('analysis', {})
-            장점 = analysis.get('장점', [])
-
-            if not isinstance(장점, list):
-                continue
-
-            if 장점:
-                pros_reviews_count += 1
-                all_pros.extend(장점)
-
-        # 3. 장점 빈도 통계
-        pros_counter = Counter(all_pros)
+        # 2. 장점 빈도 통계
         장점_순위 = [
             {"장점": 장점, "언급_횟수": 횟수}
             for 장점, 횟수 in pros_counter.most_common(20)
         ]
 
-        # 4. 카테고리별 분류
-        카테고리별_장점 = self._categorize_pros(all_pros)
+        # 3. 카테고리별 분류
+        카테고리별_장점 = self._categorize_pros(list(pros_counter.elements()))
 
-        # 5. 대표 장점 Top 5
+        # 4. 대표 장점 Top 5
         대표_장점_Top5 = [
             {
                 "장점": item["장점"],
@@ -102,18 +88,18 @@ class ProsTool(BaseTool):
             for item in 장점_순위[:5]
         ]
 
-        # 6. 요약 생성
+        # 5. 요약 생성
         summary = self._generate_summary(
-            len(reviews),
+            total_count,
             pros_reviews_count,
             대표_장점_Top5,
             카테고리별_장점
         )
 
         return {
-            "count": len(reviews),
+            "count": total_count,
             "pros_count": pros_reviews_count,
-            "pros_ratio": f"{self._calculate_percentage(pros_reviews_count, len(reviews)):.1f}%",
+            "pros_ratio": f"{self._calculate_percentage(pros_reviews_count, total_count):.1f}%",
             "장점_순위": 장점_순위,
             "카테고리별_장점": 카테고리별_장점,
             "대표_장점_Top5": 대표_장점_Top5,
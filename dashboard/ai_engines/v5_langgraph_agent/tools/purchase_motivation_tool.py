@@ -59,42 +59,28 @@ class PurchaseMotivationTool(BaseTool):
             }
         """
 
-        # 1. 리뷰 가져오기
-        reviews = self._fetch_reviews(brands, products, channels)
+        # 1. 구매동기 집계 (롤업이 최신이면 롤업 테이블에서)
+        total_count, motivation_reviews_count, motivation_counter = self._collect_list_field(
+            '구매동기', brands, products, channels
+        )
 
-        if not reviews:
+        if total_count == 0:
             return {
                 "count": 0,
                 "motivation_count": 0,
                 "message": "분석할 리뷰가 없습니다."
             }
 
-        # 2. 구매동기 추출
-        all_motivations = []
-        motivation_reviews_count = 0
-
-        for review in reviews:
-            analysis = review.get('analysis', {})
-            구매동기 = analysis.get('구매동기', [])
-
-            if not isinstance(구매동기, list):
-                continue
-
-            if 구매동기:
-                motivation_reviews_count += 1
-                all_motivations.extend(구매동기)
-
-        # 3. 구매동기 빈도 통계
-        motivation_counter = Counter(all_motivations)
+        # 2. 구매동기 빈도 통계
         구매동기_순위 = [
             {"구매동기": 동기, "언급_횟수": 횟수}
             for 동기, 횟수 in motivation_counter.most_common(20)
         ]
 
-        # 4. 유형별 분류
-        유형별_구매동기 = self._categorize_motivations(all_motivations)
+        # 3. 유형별 분류
+        유형별_구매동기 = self._categorize_motivations(list(motivation_counter.elements()))
 
-        # 5. 주요 구매동기 Top 5
+        # 4. 주요 구매동기 Top 5
         주요_구매동기_Top5 = [
             {
                 "구매동기": item["구매동기"],
@@ -104,18 +90,18 @@ class PurchaseMotivationTool(BaseTool):
             for item in 구매동기_순위[:5]
         ]
 
-        # 6. 요약 생성
+        # 5. 요약 생성
         summary = self._generate_summary(
-            len(reviews),
+            total_count,
             motivation_reviews_count,
             주요_구매동기_Top5,
             유형별_구매동기
         )
 
         return {
-            "count": len(reviews),
+            "count": total_count,
             "motivation_count": motivation_reviews_count,
-            "motivation_ratio": f"{self._calculate_percentage(motivation_reviews_count, len(reviews)):.1f}%",
+            "motivation_ratio": f"{self._calculate_percentage(motivation_reviews_count, total_count):.1f}%",
             "구매동기_순위": 구매동기_순위,
             "유형별_구매동기": 유형별_구매동기,
             "주요_구매동기_Top5": 주요_구매동기_Top5,
@@ -7,7 +7,7 @@ SentimentTool - 감정 요약 분석 툴
 - 전체 감성 비율
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from collections import Counter, defaultdict
 
 from .base_tool import BaseTool
@@ -58,66 +58,44 @@ class SentimentTool(BaseTool):
             }
         """
 
-        # 1. 리뷰 가져오기
-        reviews = self._fetch_reviews(brands, products, channels)
+        # 1. 감정요약 집계 (롤업이 최신이면 롤업 테이블에서)
+        total_count, 감정_카운터, 핵심표현_카운터 = self._collect_sentiment(brands, products, channels)
 
-        if not reviews:
+        if total_count == 0:
             return {
                 "count": 0,
                 "sentiment_distribution": {},
                 "message": "분석할 리뷰가 없습니다."
             }
 
-        # 2. 감정요약 추출
-        감정평가_리스트 = []
-        핵심표현_전체 = []
-
-        for review in reviews:
-            analysis = review.get('analysis', {})
-            감정요약 = analysis.get('감정요약', {})
-
-            if not 감정요약:
-                continue
-
-            # 전반적평가 추출
-            전반적평가 = 감정요약.get('전반적평가')
-            if 전반적평가:
-                감정평가_리스트.append(전반적평가)
-
-            # 핵심표현 추출
-            핵심표현 = 감정요약.get('핵심표현', [])
-            if isinstance(핵심표현, list):
-                핵심표현_전체.extend(핵심표현)
-
-        # 3. 감정 분포 계산
-        감정_카운터 = Counter(감정평가_리스트)
+        # 2. 감정 분포 계산
+        analyzed_count = sum(감정_카운터.values())
         sentiment_distribution = {}
 
         for 감정 in self.SENTIMENT_ORDER:
             count = 감정_카운터.get(감정, 0)
-            percentage = self._calculate_percentage(count, len(감정평가_리스트))
+            percentage = self._calculate_percentage(count, analyzed_count)
 
             sentiment_distribution[감정] = {
                 "count": count,
                 "percentage": f"{percentage:.1f}%"
             }
 
-        # 4. 전체 긍정/부정 비율 계산
+        # 3. 전체 긍정/부정 비율 계산
         긍정_count = 감정_카운터.get("매우 긍정적", 0) + 감정_카운터.get("긍정적", 0)
         부정_count = 감정_카운터.get("부정적", 0) + 감정_카운터.get("매우 부정적", 0)
         중립_count = 감정_카운터.get("중립", 0)
 
-        overall_positive_ratio = self._calculate_percentage(긍정_count, len(감정평가_리스트))
-        overall_negative_ratio = self._calculate_percentage(부정_count, len(감정평가_리스트))
-        overall_neutral_ratio = self._calculate_percentage(중립_count, len(감정평가_리스트))
+        overall_positive_ratio = self._calculate_percentage(긍정_count, analyzed_count)
+        overall_negative_ratio = self._calculate_percentage(부정_count, analyzed_count)
+        overall_neutral_ratio = self._calculate_percentage(중립_count, analyzed_count)
 
-        # 5. 핵심표현 빈도 (상위 20개)
-        핵심표현_카운터 = Counter(핵심표현_전체)
+        # 4. 핵심표현 빈도 (상위 20개)
         핵심표현_빈도 = dict(핵심표현_카운터.most_common(20))
 
-        # 6. 요약 생성
+        # 5. 요약 생성
         summary = self._generate_summary(
-            len(reviews),
+            total_count,
             overall_positive_ratio,
             overall_negative_ratio,
             overall_neutral_ratio,
@@ -125,8 +103,8 @@ class SentimentTool(BaseTool):
         )
 
         return {
-            "count": len(reviews),
-            "analyzed_sentiment_count": len(감정평가_리스트),
+            "count": total_count,
+            "analyzed_sentiment_count": analyzed_count,
             "sentiment_distribution": sentiment_distribution,
             "overall_positive_ratio": f"{overall_positive_ratio:.1f}%",
             "overall_negative_ratio": f"{overall_negative_ratio:.1f}%",
@@ -138,6 +116,48 @@ class SentimentTool(BaseTool):
             "summary": summary
         }
 
+    def _collect_sentiment(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> Tuple[int, Counter, Counter]:
+        """
+        감정요약 집계
+
+        Returns:
+            (전체 리뷰 수, 전반적평가 Counter, 핵심표현 Counter)
+        """
+        if self._use_rollups():
+            total_count = self.db.fetch_rollup_count(brands, products, channels)
+            감정_카운터 = Counter(self.db.fetch_rollup_sentiment(brands, products, channels))
+            _, 핵심표현 = self.db.fetch_rollup_field('핵심표현', brands, products, channels)
+            return total_count, 감정_카운터, Counter(dict(핵심표현))
+
+        reviews = self._fetch_reviews(brands, products, channels)
+
+        감정_카운터 = Counter()
+        핵심표현_카운터 = Counter()
+
+        for review in reviews:
+            analysis = review.get('analysis', {})
+            감정요약 = analysis.get('감정요약', {})
+
+            if not 감정요약:
+                continue
+
+            # 전반적평가 추출
+            전반적평가 = 감정요약.get('전반적평가')
+            if 전반적평가:
+                감정_카운터[전반적평가] += 1
+
+            # 핵심표현 추출
+            핵심표현 = 감정요약.get('핵심표현', [])
+            if isinstance(핵심표현, list):
+                핵심표현_카운터.update(v for v in 핵심표현 if v and isinstance(v, str))
+
+        return len(reviews), 감정_카운터, 핵심표현_카운터
+
     def _generate_summary(
         self,
         total_reviews: int,
@@ -0,0 +1,561 @@
+#//==============================================================================//#
+"""
+batch_analyze_reviews.py
+reviews 테이블의 미분석 리뷰를 GPT로 일괄 분석해 preprocessed_reviews에 저장
+
+V5/V6가 사용하는 analysis JSONB는 314,285건 중 5,000건에만 있습니다.
+나머지 리뷰를 같은 형식으로 분석하기 위한 배치 파이프라인입니다.
+
+처리 흐름 (select_batch_size 단위로 반복):
+1. 미분석 리뷰 조회 (reviews LEFT JOIN preprocessed_reviews, review_id 순 keyset 페이지)
+2. 텍스트 정규화 후 해시 → 같은 텍스트는 한 번만 분석 ("좋아요" 같은 중복 리뷰)
+3. review_analysis_cache에서 해시로 조회 → 이미 분석한 텍스트는 LLM 호출 생략
+4. 남은 텍스트를 reviews_per_prompt개씩 묶어 한 프롬프트로 요청
+   (ThreadPoolExecutor로 동시 요청 수 제한, 실패 시 지수 백오프 재시도)
+5. 응답 JSON 스키마 검증 → 실패한 리뷰는 1개씩 다시 요청
+6. 캐시 + preprocessed_reviews에 execute_values로 일괄 저장, 데이터 버전/롤업 갱신 후 commit
+
+- 재개: 배치마다 commit하므로 중단 후 다시 실행하면 남은 리뷰부터 이어서 처리
+- 브랜드/제품/카테고리: 리뷰 텍스트 분석과 무관하므로 LLM에 맡기지 않고
+  reviews 행에서 채움 (그래서 텍스트 해시 캐시를 제품이 달라도 재사용 가능)
+- 테스트: mock_llm_server.py로 로컬 가짜 엔드포인트를 띄워 base_url만 바꿔 실행
+"""
+#//==============================================================================//#
+
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2.extras import Json, RealDictCursor, execute_values
+from openai import OpenAI
+
+# 스크립트로 직접 실행해도 같은 폴더의 모듈을 찾을 수 있도록 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from data_version import bump_data_version
+from review_rollups import refresh_rollups
+from review_typed_columns import ensure_typed_columns
+from upload_preprocessed_data import DB_CONFIG
+
+# 배치 분석 설정
+ANALYSIS_CONFIG = {
+    "model": "gpt-4o-mini",
+    "temperature": 0.0,
+    "reviews_per_prompt": 10,      # 한 프롬프트에 묶는 리뷰 수
+    "max_workers": 8,              # 동시 LLM 요청 수
+    "max_retries": 3,              # 요청 실패 시 재시도 횟수
+    "retry_backoff": 2.0,          # 재시도 대기 (초, 2배씩 증가)
+    "request_timeout": 60,         # 요청 타임아웃 (초)
+    "select_batch_size": 2000,     # DB에서 한 번에 가져오는 리뷰 수
+    "min_text_length": 10,         # 이보다 짧은 리뷰는 분석 안 함
+    "max_text_chars": 1500         # 긴 리뷰는 잘라서 전송
+}
+
+SOURCE_TABLE = "reviews"
+TARGET_TABLE = "preprocessed_reviews"
+CACHE_TABLE = "review_analysis_cache"
+
+CACHE_DDL = f"""
+    CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+        text_hash TEXT NOT NULL,
+        model TEXT NOT NULL,
+        analysis JSONB NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (text_hash, model)
+    )
+"""
+
+# SentimentTool.SENTIMENT_ORDER와 동일
+SENTIMENT_VALUES = ["매우 긍정적", "긍정적", "중립", "부정적", "매우 부정적"]
+
+# LLM이 채우는 필드 (V5 Tool들이 읽는 키) → 기대 타입
+ANALYSIS_SCHEMA = {
+    "제품특성": dict,
+    "감정요약": dict,
+    "장점": list,
+    "단점": list,
+    "불만사항": list,
+    "구매동기": list,
+    "키워드": list,
+    "기획여부": bool,
+    "기획정보": dict,
+    "타제품비교": dict
+}
+
+SYSTEM_PROMPT = f"""당신은 화장품 리뷰 분석가입니다.
+여러 개의 리뷰가 JSON 배열로 주어지면 각 리뷰를 독립적으로 분석해서 아래 형식으로만 답하세요.
+
+{{"results": [{{"id": "<리뷰 id>", "analysis": {{...}}}}, ...]}}
+
+analysis 형식 (모든 키 필수):
+{{
+  "제품특성": {{"보습력": "촉촉함", "발림성": "부드러움", ...}},   // 언급된 속성만, 값은 짧은 평가
+  "감정요약": {{"전반적평가": "{'|'.join(SENTIMENT_VALUES)} 중 하나", "핵심표현": ["...", ...]}},
+  "장점": ["...", ...],
+  "단점": ["...", ...],
+  "불만사항": ["...", ...],
+  "구매동기": ["...", ...],
+  "키워드": ["...", ...],
+  "기획여부": true/false,   // 기획세트/증정/1+1 등 프로모션 상품 여부
+  "기획정보": {{"언급여부": true/false, "구성만족도": "...", "가성비평가": "...", "특이사항": "..."}},
+  "타제품비교": {{"언급여부": true/false, "제품": "...", "내용": "..."}}
+}}
+
+- 언급이 없으면 빈 배열/빈 객체/false를 사용하세요.
+- 입력의 모든 id에 대해 결과를 하나씩 반환하세요."""
+
+
+#//==============================================================================//#
+# 텍스트 정규화 / 해시 / 스키마 검증
+#//==============================================================================//#
+
+def normalize_text(text: str) -> str:
+    """공백 정리 (같은 내용의 리뷰가 같은 해시를 갖도록)"""
+    return re.sub(r"\s+", " ", str(text or "")).strip()
+
+
+def text_hash(text: str) -> str:
+    """정규화된 텍스트의 SHA-256 해시"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def validate_analysis(analysis) -> List[str]:
+    """
+    LLM 분석 결과 스키마 검증
+
+    Args:
+        analysis: LLM이 반환한 analysis 객체
+
+    Returns:
+        오류 메시지 리스트 (비어 있으면 통과)
+    """
+    if not isinstance(analysis, dict):
+        return [f"analysis가 객체가 아님: {type(analysis).__name__}"]
+
+    errors = []
+    for key, expected_type in ANALYSIS_SCHEMA.items():
+        if key not in analysis:
+            errors.append(f"필수 키 누락: {key}")
+        elif not isinstance(analysis[key], expected_type):
+            errors.append(f"{key} 타입 오류: {type(analysis[key]).__name__} (기대: {expected_type.__name__})")
+
+    감정요약 = analysis.get("감정요약")
+    if isinstance(감정요약, dict):
+        if 감정요약.get("전반적평가") not in SENTIMENT_VALUES:
+            errors.append(f"전반적평가 값 오류: {감정요약.get('전반적평가')}")
+        if not isinstance(감정요약.get("핵심표현", []), list):
+            errors.append("핵심표현은 배열이어야 함")
+
+    return errors
+
+
+def _load_brand_mapping() -> Dict[str, str]:
+    """브랜드 매핑 로드 (preprocessor2/brand_mapping.txt, 영문 → 한글)"""
+    try:
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+        mapping_file = os.path.join(base_dir, "preprocessor2", "brand_mapping.txt")
+
+        mapping = {}
+        with open(mapping_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and '→' in line:
+                    eng, kor = line.split('→')
+                    mapping[eng.strip()] = kor.strip()
+        return mapping
+    except Exception as e:
+        print(f"Warning: Failed to load brand_mapping.txt: {e}")
+        return {}
+
+
+#//==============================================================================//#
+# LLM 배치 분석
+#//==============================================================================//#
+
+class BatchAnalyzer:
+    """
+    리뷰 텍스트 묶음 분석기 (DB와 무관하게 텍스트 → analysis만 담당)
+
+    사용 예:
+        analyzer = BatchAnalyzer(base_url="http://127.0.0.1:8001/v1")  # mock 서버
+        results, failed = analyzer.analyze_texts({"h1": "촉촉하고 좋아요", ...})
+    """
+
+    def __init__(self, config: Optional[Dict] = None, client=None, base_url: Optional[str] = None):
+        """
+        Args:
+            config: ANALYSIS_CONFIG 덮어쓸 값
+            client: OpenAI 호환 클라이언트 (없으면 생성)
+            base_url: OpenAI 호환 엔드포인트 (mock 서버 테스트용, 없으면 OPENAI_BASE_URL/기본값)
+        """
+        self.config = {**ANALYSIS_CONFIG, **(config or {})}
+
+        if client is None:
+            client_kwargs = {"timeout": self.config["request_timeout"], "max_retries": 0}
+            if base_url:
+                client_kwargs["base_url"] = base_url
+                client_kwargs["api_key"] = os.getenv("OPENAI_API_KEY", "mock-key")
+            client = OpenAI(**client_kwargs)
+        self.client = client
+
+        # 통계 (여러 스레드에서 갱신)
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "invalid": 0, "failed": 0}
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self.stats[key] += n
+
+    def analyze_texts(self, texts: Dict[str, str]) -> Tuple[Dict[str, Dict], List[str]]:
+        """
+        텍스트 묶음 분석
+
+        1차: reviews_per_prompt개씩 묶어서 동시 요청
+        2차: 1차에서 누락/스키마 오류/요청 실패한 텍스트만 1개씩 다시 요청
+
+        Args:
+            texts: {텍스트 해시: 리뷰 텍스트}
+
+        Returns:
+            ({텍스트 해시: analysis}, 최종 실패한 해시 리스트)
+        """
+        results: Dict[str, Dict] = {}
+        keys = list(texts.keys())
+
+        size = max(1, self.config["reviews_per_prompt"])
+        packs = [keys[i:i + size] for i in range(0, len(keys), size)]
+        retry_keys = self._run_packs(packs, texts, results)
+
+        failed: List[str] = []
+        if retry_keys and size > 1:
+            failed = self._run_packs([[k] for k in retry_keys], texts, results)
+        else:
+            failed = retry_keys
+
+        self._count("failed", len(failed))
+        return results, failed
+
+    def _run_packs(self, packs: List[List[str]], texts: Dict[str, str], results: Dict[str, Dict]) -> List[str]:
+        """묶음들을 동시에 요청하고 성공 결과를 results에 채움 (실패한 해시 반환)"""
+        unresolved: List[str] = []
+
+        with ThreadPoolExecutor(max_workers=self.config["max_workers"]) as pool:
+            futures = {pool.submit(self._analyze_pack, pack, texts): pack for pack in packs}
+
+            for future in as_completed(futures):
+                pack = futures[future]
+                try:
+                    pack_results = future.result()
+                except Exception as e:
+                    print(f"⚠️ 요청 실패 ({len(pack)}개 리뷰): {type(e).__name__} - {e}")
+                    unresolved.extend(pack)
+                    continue
+
+                for key in pack:
+                    analysis = pack_results.get(key)
+                    if analysis is None:
+                        unresolved.append(key)
+                        continue
+
+                    errors = validate_analysis(analysis)
+                    if errors:
+                        self._count("invalid")
+                        unresolved.append(key)
+                        continue
+
+                    results[key] = analysis
+
+        return unresolved
+
+    def _analyze_pack(self, pack: List[str], texts: Dict[str, str]) -> Dict[str, Dict]:
+        """
+        리뷰 묶음 1개 요청 (재시도 포함)
+
+        프롬프트에는 해시 대신 짧은 id(r0, r1, ...)를 사용해 토큰을 아낍니다.
+
+        Returns:
+            {텍스트 해시: analysis} (응답에 없는 리뷰는 빠짐)
+        """
+        max_chars = self.config["max_text_chars"]
+        id_to_key = {f"r{i}": key for i, key in enumerate(pack)}
+        payload = [
+            {"id": rid, "text": normalize_text(texts[key])[:max_chars]}
+            for rid, key in id_to_key.items()
+        ]
+
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"다음 리뷰 {len(payload)}개를 각각 분석하세요.\n\n리뷰 목록:\n"
+                                        + json.dumps(payload, ensure_ascii=False)}
+        ]
+
+        last_error = None
+        for attempt in range(self.config["max_retries"] + 1):
+            if attempt > 0:
+                self._count("retries")
+                # 지수 백오프 + 지터 (동시 요청들이 같은 시점에 재시도하지 않도록)
+                delay = self.config["retry_backoff"] * (2 ** (attempt - 1))
+                time.sleep(delay * (0.5 + random.random()))
+
+            try:
+                self._count("requests")
+                response = self.client.chat.completions.create(
+                    model=self.config["model"],
+                    messages=messages,
+                    temperature=self.config["temperature"],
+                    response_format={"type": "json_object"}
+                )
+                content = response.choices[0].message.content
+                parsed = json.loads(content)
+
+                return {
+                    id_to_key[item["id"]]: item.get("analysis")
+                    for item in parsed.get("results", [])
+                    if isinstance(item, dict) and item.get("id") in id_to_key
+                }
+
+            except Exception as e:
+                last_error = e
+
+        raise last_error
+
+
+#//==============================================================================//#
+# DB 입출력
+#//==============================================================================//#
+
+def ensure_tables(cur):
+    """캐시 테이블 + 평점/날짜 타입 컬럼 생성 (없으면)"""
+    cur.execute(CACHE_DDL)
+    ensure_typed_columns(cur)
+
+
+def fetch_unanalyzed(cur, after_id=None, limit: int = 2000, min_length: int = 10) -> List[Dict]:
+    """
+    preprocessed_reviews에 없는 리뷰 조회 (review_id 순 keyset 페이지)
+
+    Args:
+        cur: RealDictCursor
+        after_id: 이전 페이지의 마지막 review_id (None이면 처음부터)
+        limit: 최대 개수
+        min_length: 최소 리뷰 길이
+
+    Returns:
+        리뷰 리스트
+    """
+    query = f"""
+        SELECT
+            r.review_id, r.review_text, r.brand, r.product_name,
+            r.channel, r.category,
+            r.rating::text AS rating, r.review_date::text AS review_date
+        FROM {SOURCE_TABLE} r
+        LEFT JOIN {TARGET_TABLE} p ON p.review_id = r.review_id
+        WHERE p.review_id IS NULL
+          AND LENGTH(r.review_text) > %s
+    """
+    params = [min_length]
+
+    if after_id is not None:
+        query += " AND r.review_id > %s"
+        params.append(after_id)
+
+    query += " ORDER BY r.review_id LIMIT %s"
+    params.append(limit)
+
+    cur.execute(query, params)
+    return cur.fetchall()
+
+
+def load_cached(cur, hashes: List[str], model: str) -> Dict[str, Dict]:
+    """텍스트 해시로 캐시 조회"""
+    if not hashes:
+        return {}
+
+    cur.execute(
+        f"SELECT text_hash, analysis FROM {CACHE_TABLE} WHERE model = %s AND text_hash = ANY(%s)",
+        (model, hashes)
+    )
+    return {row["text_hash"]: row["analysis"] for row in cur.fetchall()}
+
+
+def save_cache(cur, analyses: Dict[str, Dict], model: str):
+    """새로 분석한 결과를 캐시에 저장"""
+    if not analyses:
+        return
+
+    execute_values(
+        cur,
+        f"""
+        INSERT INTO {CACHE_TABLE} (text_hash, model, analysis)
+        VALUES %s
+        ON CONFLICT (text_hash, model) DO NOTHING
+        """,
+        [(h, model, Json(a)) for h, a in analyses.items()]
+    )
+
+
+def write_results(cur, rows: List[Tuple]):
+    """분석 결과를 preprocessed_reviews에 일괄 UPSERT"""
+    if not rows:
+        return
+
+    execute_values(
+        cur,
+        f"""
+        INSERT INTO {TARGET_TABLE}
+            (review_id, analysis, brand, product_name, channel, category,
+             rating, review_date, review_clean)
+        VALUES %s
+        ON CONFLICT (review_id)
+        DO UPDATE SET
+            analysis = EXCLUDED.analysis,
+            brand = EXCLUDED.brand,
+            product_name = EXCLUDED.product_name,
+            channel = EXCLUDED.channel,
+            category = EXCLUDED.category,
+            rating = EXCLUDED.rating,
+            review_date = EXCLUDED.review_date
+        """,
+        rows,
+        page_size=500
+    )
+
+
+def _build_analysis(content: Dict, review: Dict, brand_mapping: Dict[str, str]) -> Dict:
+    """텍스트 분석 결과 + 리뷰 메타데이터 → 기존 업로드 데이터와 같은 형식의 analysis"""
+    brand = brand_mapping.get(review.get("brand"), review.get("brand"))
+    return {
+        "표준_브랜드": brand,
+        "원본_제품명": review.get("product_name"),
+        "표준_제품명": review.get("product_name"),
+        "제품_카테고리": review.get("category"),
+        **content
+    }
+
+
+#//==============================================================================//#
+# 파이프라인
+#//==============================================================================//#
+
+def run_pipeline(limit: Optional[int] = None, config: Optional[Dict] = None, base_url: Optional[str] = None) -> Dict:
+    """
+    미분석 리뷰 배치 분석 실행
+
+    Args:
+        limit: 이번 실행에서 처리할 최대 리뷰 수 (None이면 전부)
+        config: ANALYSIS_CONFIG 덮어쓸 값
+        base_url: OpenAI 호환 엔드포인트 (mock 서버 테스트용)
+
+    Returns:
+        실행 통계
+    """
+    analyzer = BatchAnalyzer(config=config, base_url=base_url)
+    cfg = analyzer.config
+    model = cfg["model"]
+    brand_mapping = _load_brand_mapping()
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    ensure_tables(cur)
+    conn.commit()
+
+    totals = {"reviews": 0, "written": 0, "unique_texts": 0, "cache_hits": 0, "llm_analyzed": 0, "failed": 0}
+    start_time = time.perf_counter()
+    after_id = None
+
+    try:
+        while limit is None or totals["reviews"] < limit:
+            batch_limit = cfg["select_batch_size"]
+            if limit is not None:
+                batch_limit = min(batch_limit, limit - totals["reviews"])
+
+            reviews = fetch_unanalyzed(cur, after_id, batch_limit, cfg["min_text_length"])
+            if not reviews:
+                break
+            after_id = reviews[-1]["review_id"]
+
+            # 1. 텍스트 중복 제거
+            texts: Dict[str, str] = {}
+            review_hashes = []
+            for review in reviews:
+                h = text_hash(review["review_text"])
+                review_hashes.append(h)
+                texts.setdefault(h, review["review_text"])
+
+            # 2. 캐시 조회
+            analyses = load_cached(cur, list(texts.keys()), model)
+            to_analyze = {h: t for h, t in texts.items() if h not in analyses}
+
+            # 3. LLM 분석
+            new_analyses, failed = analyzer.analyze_texts(to_analyze) if to_analyze else ({}, [])
+            analyses.update(new_analyses)
+
+            # 4. 일괄 저장 (실패한 리뷰는 저장하지 않음 → 다음 실행에서 다시 시도)
+            rows = []
+            for review, h in zip(reviews, review_hashes):
+                content = analyses.get(h)
+                if content is None:
+                    continue
+                analysis = _build_analysis(content, review, brand_mapping)
+                rows.append((
+                    review["review_id"],
+                    Json(analysis),
+                    analysis["표준_브랜드"],
+                    review["product_name"],
+                    review["channel"],
+                    review["category"],
+                    review["rating"],
+                    review["review_date"],
+                    review["review_text"]
+                ))
+
+            save_cache(cur, new_analyses, model)
+            write_results(cur, rows)
+
+            if rows:
+                # 데이터 버전 증가 → V5 Tool 결과 캐시 무효화 + 새 리뷰가 들어간 그룹 롤업 갱신
+                data_version = bump_data_version(cur, TARGET_TABLE)
+                refresh_rollups(cur, {(row[2], row[3], row[4]) for row in rows})
+            conn.commit()
+
+            totals["reviews"] += len(reviews)
+            totals["written"] += len(rows)
+            totals["unique_texts"] += len(texts)
+            totals["cache_hits"] += len(texts) - len(to_analyze)
+            totals["llm_analyzed"] += len(new_analyses)
+            totals["failed"] += len(failed)
+
+            elapsed = time.perf_counter() - start_time
+            print(f"Progress: {totals['reviews']} reviews "
+                  f"(written {totals['written']}, cache hits {totals['cache_hits']}, "
+                  f"failed {totals['failed']}) - {totals['reviews'] / elapsed:,.1f} reviews/sec")
+
+        if totals["written"] > 0:
+            print(f"Data version: {data_version}")
+
+    finally:
+        cur.close()
+        conn.close()
+
+    elapsed = time.perf_counter() - start_time
+    totals["elapsed_sec"] = round(elapsed, 1)
+    totals.update({f"llm_{k}": v for k, v in analyzer.stats.items()})
+
+    print(f"\n=== Batch Analysis Complete ===")
+    for key, value in totals.items():
+        print(f"{key}: {value}")
+
+    return totals
+
+
+if __name__ == "__main__":
+    # 로컬 mock 서버로 시험: python mock_llm_server.py 실행 후
+    #   run_pipeline(limit=100, base_url="http://127.0.0.1:8001/v1")
+    run_pipeline()
@@ -0,0 +1,86 @@
+"""
+데이터 버전 스탬프 헬퍼
+
+preprocessed_reviews 테이블은 업로드(upload_preprocessed_data.py) 때만 바뀝니다.
+업로드할 때마다 data_versions 테이블의 버전 번호를 1씩 올려두면,
+캐시(tool_cache 등)는 이 번호만 비교해서 오래된 결과를 버릴 수 있습니다.
+
+모든 함수는 커서를 인자로 받습니다 (DBConnector / psycopg2 커서 모두 사용 가능).
+업로드 스크립트처럼 패키지 밖에서 직접 실행되는 코드에서도 import할 수 있도록
+다른 모듈에 의존하지 않습니다.
+"""
+
+from typing import Optional
+
+# 버전 관리 테이블
+DATA_VERSION_TABLE = "data_versions"
+
+DATA_VERSION_DDL = f"""
+    CREATE TABLE IF NOT EXISTS {DATA_VERSION_TABLE} (
+        table_name TEXT PRIMARY KEY,
+        version BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+"""
+
+
+def ensure_data_version_table(cur) -> None:
+    """
+    data_versions 테이블 생성 (없으면)
+
+    Args:
+        cur: DB 커서 (호출한 쪽에서 commit 필요)
+    """
+    cur.execute(DATA_VERSION_DDL)
+
+
+def fetch_data_version(cur, table_name: str = "preprocessed_reviews") -> int:
+    """
+    테이블의 현재 데이터 버전 조회
+
+    Args:
+        cur: DB 커서
+        table_name: 버전을 조회할 테이블명
+
+    Returns:
+        버전 번호 (한 번도 업로드되지 않았으면 0)
+    """
+    cur.execute(
+        f"SELECT version FROM {DATA_VERSION_TABLE} WHERE table_name = %s",
+        (table_name,)
+    )
+    row = cur.fetchone()
+    return _first_value(row) or 0
+
+
+def bump_data_version(cur, table_name: str = "preprocessed_reviews") -> int:
+    """
+    테이블의 데이터 버전을 1 증가 (업로드 완료 후 호출)
+
+    Args:
+        cur: DB 커서 (호출한 쪽에서 commit 필요)
+        table_name: 버전을 올릴 테이블명
+
+    Returns:
+        증가된 버전 번호
+    """
+    ensure_data_version_table(cur)
+    cur.execute(f"""
+        INSERT INTO {DATA_VERSION_TABLE} (table_name, version, updated_at)
+        VALUES (%s, 1, NOW())
+        ON CONFLICT (table_name)
+        DO UPDATE SET
+            version = {DATA_VERSION_TABLE}.version + 1,
+            updated_at = NOW()
+        RETURNING version
+    """, (table_name,))
+    return _first_value(cur.fetchone()) or 0
+
+
+def _first_value(row) -> Optional[int]:
+    """RealDictCursor(dict)와 기본 커서(tuple) 결과 모두에서 첫 값 추출"""
+    if not row:
+        return None
+    if isinstance(row, dict):
+        return next(iter(row.values()))
+    return row[0]
@@ -14,6 +14,16 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 from dashboard_config import DB_CONFIG
 
+try:
+    from .review_rollups import (
+        rollups_fresh, TOTALS_TABLE, SENTIMENT_TABLE, FIELDS_TABLE, TERMS_TABLE, ATTRIBUTES_TABLE
+    )
+except ImportError:
+    # 이 파일을 직접 실행한 경우
+    from review_rollups import (
+        rollups_fresh, TOTALS_TABLE, SENTIMENT_TABLE, FIELDS_TABLE, TERMS_TABLE, ATTRIBUTES_TABLE
+    )
+
 
 class DBConnector:
     """
@@ -135,6 +145,114 @@ class DBConnector:
 
         return self.execute_query(query, tuple(params))
 
+    # ===== 롤업 조회 (utils/review_rollups.py) =====
+    # 롤업 테이블도 brand/product_name/channel 컬럼을 가지므로 같은 필터 조건을 사용합니다.
+    # 호출 전에 rollups_fresh()로 롤업이 최신인지 확인하세요.
+
+    def rollups_fresh(self) -> bool:
+        """롤업 테이블이 현재 데이터 버전과 일치하는지"""
+        return rollups_fresh(self.cur)
+
+    def fetch_rollup_count(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> int:
+        """롤업 기준 리뷰 수 (count_reviews와 같은 값)"""
+        where_clause, params = build_filter_conditions(brands, products, channels)
+
+        query = f"""
+        SELECT COALESCE(SUM(review_count), 0)::bigint as count
+        FROM {TOTALS_TABLE}
+        WHERE {where_clause}
+        """
+
+        result = self.execute_query(query, tuple(params))
+        return result[0]['count'] if result else 0
+
+    def fetch_rollup_field(
+        self,
+        field: str,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[int, List[Tuple[str, int]]]:
+        """
+        리스트 필드 집계 (장점, 단점, 키워드, 불만사항, 구매동기, 핵심표현)
+
+        Args:
+            field: 필드명 (review_rollups.LIST_FIELDS 키)
+            limit: 상위 N개 항목만 (None이면 전부)
+
+        Returns:
+            (항목이 있는 리뷰 수, [(항목, 언급 횟수), ...] 많은 순)
+        """
+        where_clause, params = build_filter_conditions(brands, products, channels)
+
+        count_query = f"""
+        SELECT COALESCE(SUM(review_count), 0)::bigint as count
+        FROM {FIELDS_TABLE}
+        WHERE field = %s AND {where_clause}
+        """
+        result = self.execute_query(count_query, tuple([field] + params))
+        review_count = result[0]['count'] if result else 0
+
+        terms_query = f"""
+        SELECT term, SUM(mention_count)::bigint as count
+        FROM {TERMS_TABLE}
+        WHERE field = %s AND {where_clause}
+        GROUP BY term
+        ORDER BY count DESC, term
+        """
+        if limit:
+            terms_query += f" LIMIT {int(limit)}"
+
+        rows = self.execute_query(terms_query, tuple([field] + params))
+        return review_count, [(row['term'], row['count']) for row in rows]
+
+    def fetch_rollup_sentiment(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> Dict[str, int]:
+        """감정요약.전반적평가별 리뷰 수 (예: {"긍정적": 120, "중립": 8, ...})"""
+        where_clause, params = build_filter_conditions(brands, products, channels)
+
+        query = f"""
+        SELECT sentiment, SUM(review_count)::bigint as count
+        FROM {SENTIMENT_TABLE}
+        WHERE {where_clause}
+        GROUP BY sentiment
+        """
+
+        rows = self.execute_query(query, tuple(params))
+        return {row['sentiment']: row['count'] for row in rows}
+
+    def fetch_rollup_attributes(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """제품특성 속성별 평가 분포 (예: {"보습력": {"촉촉함": 40, ...}, ...})"""
+        where_clause, params = build_filter_conditions(brands, products, channels)
+
+        query = f"""
+        SELECT attribute, evaluation, SUM(review_count)::bigint as count
+        FROM {ATTRIBUTES_TABLE}
+        WHERE {where_clause}
+        GROUP BY attribute, evaluation
+        ORDER BY attribute, count DESC
+        """
+
+        result: Dict[str, Dict[str, int]] = {}
+        for row in self.execute_query(query, tuple(params)):
+            result.setdefault(row['attribute'], {})[row['evaluation']] = row['count']
+        return result
+
 
 # ===== 헬퍼 함수 =====
 
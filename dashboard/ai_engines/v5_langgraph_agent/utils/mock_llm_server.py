@@ -0,0 +1,207 @@
+#//==============================================================================//#
+"""
+mock_llm_server.py
+batch_analyze_reviews.py 테스트용 로컬 가짜 LLM 엔드포인트
+
+OpenAI Chat Completions 형식(POST /v1/chat/completions)을 흉내 내서
+실제 API 비용 없이 배치 분석 파이프라인을 끝까지 돌려볼 수 있습니다.
+
+- 프롬프트의 "리뷰 목록:" 뒤 JSON 배열을 읽어 리뷰마다 간단한 키워드 규칙으로
+  analysis를 만들어 {"results": [...]} 형식으로 응답
+- 장애 주입: fail_rate (429 응답), invalid_rate (스키마 오류 결과), latency (응답 지연)
+
+사용법:
+    python mock_llm_server.py        # http://127.0.0.1:8001/v1 에서 대기
+    run_pipeline(limit=100, base_url="http://127.0.0.1:8001/v1")
+"""
+#//==============================================================================//#
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+# 간단한 감성/속성 판단용 키워드
+POSITIVE_WORDS = ["좋", "촉촉", "만족", "최고", "추천", "부드럽", "재구매"]
+NEGATIVE_WORDS = ["별로", "건조", "트러블", "실망", "끈적", "비싸", "따가"]
+ATTRIBUTE_WORDS = {
+    "보습력": ["촉촉", "보습", "건조"],
+    "발림성": ["발림", "부드럽", "끈적"],
+    "향": ["향", "냄새"],
+    "가격": ["가격", "저렴", "비싸"]
+}
+PROMOTION_WORDS = ["기획", "증정", "1+1", "세트"]
+
+
+def mock_analysis(text: str) -> Dict:
+    """리뷰 텍스트 → 키워드 규칙 기반 analysis (batch_analyze_reviews 스키마와 동일)"""
+    positives = [w for w in POSITIVE_WORDS if w in text]
+    negatives = [w for w in NEGATIVE_WORDS if w in text]
+
+    if len(positives) > len(negatives):
+        sentiment = "매우 긍정적" if len(positives) >= 3 else "긍정적"
+    elif len(negatives) > len(positives):
+        sentiment = "매우 부정적" if len(negatives) >= 3 else "부정적"
+    else:
+        sentiment = "중립"
+
+    features = {
+        attr: ("부정적" if any(n in text for n in negatives) else "긍정적")
+        for attr, words in ATTRIBUTE_WORDS.items()
+        if any(w in text for w in words)
+    }
+    promotion = any(w in text for w in PROMOTION_WORDS)
+
+    return {
+        "제품특성": features,
+        "감정요약": {"전반적평가": sentiment, "핵심표현": positives + negatives},
+        "장점": positives,
+        "단점": negatives,
+        "불만사항": negatives,
+        "구매동기": ["재구매"] if "재구매" in text else [],
+        "키워드": list(features.keys()),
+        "기획여부": promotion,
+        "기획정보": {"언급여부": promotion, "구성만족도": "", "가성비평가": "", "특이사항": ""},
+        "타제품비교": {"언급여부": False, "제품": "", "내용": ""}
+    }
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """POST /v1/chat/completions 처리 (설정값은 server 속성에서 읽음)"""
+
+    def do_POST(self):
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        server = self.server
+        server.request_count += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if random.random() < server.fail_rate:
+            self._send_json(429, {"error": {"message": "mock rate limit", "type": "rate_limit_error"}})
+            return
+
+        # 마지막 user 메시지의 "리뷰 목록:" 뒤 JSON 배열 파싱
+        content = ""
+        for message in body.get("messages", []):
+            if message.get("role") == "user":
+                content = message.get("content", "")
+        payload = json.loads(content.split("리뷰 목록:", 1)[-1].strip() or "[]")
+
+        results = []
+        for item in payload:
+            analysis = mock_analysis(item.get("text", ""))
+            if random.random() < server.invalid_rate:
+                # 스키마 오류 주입 (필수 키 누락)
+                analysis.pop("감정요약", None)
+            results.append({"id": item.get("id"), "analysis": analysis})
+
+        self._send_json(200, {
+            "id": f"chatcmpl-mock-{server.request_count}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps({"results": results}, ensure_ascii=False)},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": len(content), "completion_tokens": 0, "total_tokens": len(content)}
+        })
+
+    def _send_json(self, status: int, data: Dict):
+        encoded = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        # 요청마다 콘솔 출력하지 않음
+        pass
+
+
+def start_mock_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    fail_rate: float = 0.0,
+    invalid_rate: float = 0.0,
+    latency: float = 0.0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    백그라운드 스레드로 mock 서버 시작
+
+    Args:
+        host: 바인드 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        fail_rate: 429 응답 비율 (재시도 테스트)
+        invalid_rate: 리뷰별 스키마 오류 비율 (검증/재요청 테스트)
+        latency: 요청당 지연 (초, 동시성 테스트)
+
+    Returns:
+        (서버, base_url) - 사용 후 server.shutdown() 호출
+    """
+    server = ThreadingHTTPServer((host, port), MockLLMHandler)
+    server.daemon_threads = True
+    server.fail_rate = fail_rate
+    server.invalid_rate = invalid_rate
+    server.latency = latency
+    server.request_count = 0
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base_url = f"http://{host}:{server.server_address[1]}/v1"
+    return server, base_url
+
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from batch_analyze_reviews import BatchAnalyzer, text_hash
+
+    print("=== Mock LLM 배치 분석 테스트 ===\n")
+
+    server, base_url = start_mock_server(fail_rate=0.2, invalid_rate=0.1, latency=0.05)
+    print(f"Mock server: {base_url}")
+
+    samples = [
+        "촉촉하고 발림성 좋아요 재구매 의사 있어요",
+        "건조하고 트러블 나서 실망",
+        "향이 좋아요",
+        "기획세트로 샀는데 증정품까지 만족",
+        "그냥 그래요"
+    ] * 20
+    texts = {text_hash(t): t for t in samples}
+    print(f"리뷰 {len(samples)}개 → 중복 제거 후 {len(texts)}개")
+
+    analyzer = BatchAnalyzer(
+        config={"reviews_per_prompt": 2, "max_workers": 4, "retry_backoff": 0.05},
+        base_url=base_url
+    )
+    start = time.perf_counter()
+    results, failed = analyzer.analyze_texts(texts)
+
+    print(f"성공: {len(results)}, 실패: {len(failed)}, {time.perf_counter() - start:.2f}s")
+    print(f"통계: {analyzer.stats}")
+    print(f"서버 요청 수: {server.request_count}")
+
+    # 실제 서버처럼 계속 띄워두기 (Ctrl+C로 종료)
+    server.shutdown()
+    print("\nhttp://127.0.0.1:8001/v1 에서 대기 중... (Ctrl+C 종료)")
+    server, base_url = start_mock_server(port=8001)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
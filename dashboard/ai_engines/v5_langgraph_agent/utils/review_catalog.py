@@ -0,0 +1,280 @@
+"""
+리뷰 카탈로그 (채널/브랜드/제품 목록 + 조합별 리뷰 수)
+
+ValidationNode는 질문마다 COUNT(*) ... LIKE '%제품%'를 실행하고, 결과가 0건이면
+드롭다운용 채널/브랜드/제품 목록을 위해 테이블을 세 번 더 스캔했습니다.
+(brand, product_name, channel) 조합은 수천 개 이하이므로 조합별 리뷰 수를
+메모리에 올려두고 검증/재질문을 메모리 조회로 처리합니다.
+
+- 로드: 롤업이 최신이면 review_rollup_totals, 아니면 preprocessed_reviews GROUP BY 한 번
+- 갱신: 업로드 때 데이터 버전이 올라가면 다음 조회 시 자동으로 다시 로드
+- 제품명 유사 검색: 메모리 트라이그램 인덱스 (오타/띄어쓰기 차이 후보 제안)
+  DB 쪽 LIKE 검색은 review_rollups.ensure_product_trgm_index()의 pg_trgm 인덱스 사용
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config import CATALOG_CONFIG, PREPROCESSED_TABLE
+from .db_connector import DBConnector
+from .data_version import fetch_data_version
+from .review_rollups import rollups_fresh, TOTALS_TABLE
+
+
+class ReviewCatalog:
+    """
+    (brand, product_name, channel) 조합별 리뷰 수 카탈로그
+
+    필터 의미는 build_filter_conditions()와 같습니다:
+    - brands, channels: 정확히 일치
+    - products: 부분 일치 (LIKE '%제품%', 대소문자 구분)
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str, str, int]], data_version: Optional[int] = None):
+        """
+        Args:
+            rows: (brand, product_name, channel, review_count) 목록
+            data_version: 카탈로그를 만든 데이터 버전
+        """
+        self.rows: List[Tuple[str, str, str, int]] = [tuple(row) for row in rows]
+        self.data_version = data_version
+
+        self.channels = sorted({r[2] for r in self.rows if r[2] is not None})
+        self.brands = sorted({r[0] for r in self.rows if r[0] is not None})
+        self.products = sorted({r[1] for r in self.rows if r[1] is not None})
+
+        # 제품명 트라이그램 → 제품명 집합 (유사 후보 검색용)
+        self._product_trigrams: Dict[str, Set[str]] = {
+            product: _trigrams(product) for product in self.products
+        }
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        for product, grams in self._product_trigrams.items():
+            for gram in grams:
+                self._trigram_index[gram].add(product)
+
+    def _matching_rows(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> List[Tuple[str, str, str, int]]:
+        """필터 조건에 맞는 조합 목록"""
+        brand_set = set(brands) if brands else None
+        channel_set = set(channels) if channels else None
+
+        matched = []
+        for row in self.rows:
+            brand, product_name, channel, _ = row
+            if brand_set is not None and brand not in brand_set:
+                continue
+            if channel_set is not None and channel not in channel_set:
+                continue
+            if products and (product_name is None or not any(p in product_name for p in products)):
+                continue
+            matched.append(row)
+        return matched
+
+    def count(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None
+    ) -> int:
+        """
+        필터 조건에 맞는 리뷰 수 (DBConnector.count_reviews와 같은 값)
+        """
+        return sum(row[3] for row in self._matching_rows(brands, products, channels))
+
+    def find_similar_products(
+        self,
+        brands: List[str],
+        channels: Optional[List[str]] = None,
+        limit: int = 5
+    ) -> List[Dict]:
+        """
+        브랜드(+채널)의 리뷰 많은 제품 목록
+
+        Returns:
+            [{"product_name": ..., "brand": ..., "channel": ..., "review_count": ...}, ...]
+        """
+        rows = self._matching_rows(brands=brands, channels=channels)
+        rows.sort(key=lambda r: r[3], reverse=True)
+        return [
+            {"product_name": r[1], "brand": r[0], "channel": r[2], "review_count": r[3]}
+            for r in rows[:limit]
+        ]
+
+    def suggest_products(
+        self,
+        name: str,
+        brands: Optional[List[str]] = None,
+        limit: int = 5,
+        min_similarity: float = 0.2
+    ) -> List[Dict]:
+        """
+        제품명 유사 후보 (트라이그램 유사도)
+
+        "모이스춰 라이징밤"처럼 띄어쓰기/오타로 LIKE 매칭에 실패한 제품명을 찾습니다.
+
+        Args:
+            name: 사용자가 입력한 제품명
+            brands: 지정하면 해당 브랜드 제품만
+            limit: 최대 후보 수
+            min_similarity: 유사도 하한 (0~1)
+
+        Returns:
+            [{"product_name": ..., "similarity": 0.63, "review_count": ...}, ...] (유사도 순)
+        """
+        query_grams = _trigrams(name)
+        if not query_grams:
+            return []
+
+        # 트라이그램이 하나라도 겹치는 제품만 후보로
+        shared = Counter()
+        for gram in query_grams:
+            for product in self._trigram_index.get(gram, ()):
+                shared[product] += 1
+
+        allowed = None
+        if brands:
+            allowed = {r[1] for r in self._matching_rows(brands=brands)}
+
+        review_counts = Counter()
+        for r in self.rows:
+            review_counts[r[1]] += r[3]
+
+        suggestions = []
+        for product, overlap in shared.items():
+            if allowed is not None and product not in allowed:
+                continue
+            union = len(query_grams) + len(self._product_trigrams[product]) - overlap
+            similarity = overlap / union if union else 0.0
+            if similarity >= min_similarity:
+                suggestions.append({
+                    "product_name": product,
+                    "similarity": round(similarity, 2),
+                    "review_count": review_counts[product]
+                })
+
+        suggestions.sort(key=lambda s: (s["similarity"], s["review_count"]), reverse=True)
+        return suggestions[:limit]
+
+
+# ===== 헬퍼 함수 =====
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    트라이그램 집합 (소문자, 공백 제거 후 양끝 패딩)
+
+    한글 제품명은 띄어쓰기가 제각각이라 공백을 지우고 비교합니다.
+
+    Example:
+        >>> sorted(_trigrams("밤"))
+        ['  밤', ' 밤 ']
+    """
+    if not text:
+        return set()
+    normalized = "".join(str(text).lower().split())
+    if not normalized:
+        return set()
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def load_catalog(db: DBConnector, data_version: Optional[int] = None) -> ReviewCatalog:
+    """
+    DB에서 카탈로그 로드
+
+    Args:
+        db: 연결된 DBConnector
+        data_version: 현재 데이터 버전 (카탈로그에 기록)
+
+    Returns:
+        ReviewCatalog
+    """
+    if rollups_fresh(db.cur):
+        query = f"""
+            SELECT brand, product_name, channel, SUM(review_count)::bigint as review_count
+            FROM {TOTALS_TABLE}
+            GROUP BY brand, product_name, channel
+        """
+    else:
+        query = f"""
+            SELECT brand, product_name, channel, COUNT(*) as review_count
+            FROM {PREPROCESSED_TABLE}
+            GROUP BY brand, product_name, channel
+        """
+
+    rows = db.execute_query(query)
+    return ReviewCatalog(
+        [(r['brand'], r['product_name'], r['channel'], r['review_count']) for r in rows],
+        data_version=data_version
+    )
+
+
+def _current_data_version(db: DBConnector) -> Optional[int]:
+    """현재 데이터 버전 (data_versions 테이블이 없으면 None)"""
+    result = db.execute_query("SELECT to_regclass('data_versions') IS NOT NULL as exists")
+    if not (result and result[0]['exists']):
+        return None
+    return fetch_data_version(db.cur, PREPROCESSED_TABLE)
+
+
+# 프로세스 전역 카탈로그
+_catalog: Optional[ReviewCatalog] = None
+_catalog_checked_at = 0.0
+_catalog_lock = threading.Lock()
+
+
+def get_review_catalog() -> ReviewCatalog:
+    """
+    프로세스 전역 카탈로그 반환
+
+    version_check_interval마다 데이터 버전만 확인하고,
+    버전이 바뀌었을 때(업로드 후)만 카탈로그를 다시 로드합니다.
+    """
+    global _catalog, _catalog_checked_at
+
+    with _catalog_lock:
+        now = time.time()
+        if _catalog is not None and now - _catalog_checked_at < CATALOG_CONFIG["version_check_interval"]:
+            return _catalog
+
+        with DBConnector() as db:
+            version = _current_data_version(db)
+
+            # 버전 정보가 없으면 (업로드 기록 없음) 확인 간격마다 다시 로드
+            if _catalog is None or version is None or version != _catalog.data_version:
+                _catalog = load_catalog(db, version)
+
+        _catalog_checked_at = now
+        return _catalog
+
+
+def invalidate_review_catalog():
+    """현재 프로세스의 카탈로그 무효화 (다음 조회 때 다시 로드)"""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+
+
+# ===== 사용 예시 =====
+if __name__ == "__main__":
+    print("=== ReviewCatalog 테스트 ===\n")
+
+    catalog = ReviewCatalog([
+        ("빌리프", "빌리프 더 트루 크림 모이스춰라이징 밤", "OliveYoung", 120),
+        ("빌리프", "빌리프 더 트루 크림 아쿠아 밤", "OliveYoung", 80),
+        ("빌리프", "빌리프 더 트루 크림 모이스춰라이징 밤", "Coupang", 30),
+        ("VT", "VT 시카 크림", "Daiso", 50),
+    ])
+
+    print(f"채널: {catalog.channels}")
+    print(f"브랜드: {catalog.brands}")
+    print(f"빌리프 리뷰 수: {catalog.count(brands=['빌리프'])}")
+    print(f"빌리프 '모이스춰라이징' 리뷰 수: {catalog.count(brands=['빌리프'], products=['모이스춰라이징'])}")
+    print(f"'모이스춰라이징밤' (띄어쓰기 다름) 리뷰 수: {catalog.count(products=['모이스춰라이징밤'])}")
+    print(f"유사 후보: {catalog.suggest_products('모이스춰라이징밤', brands=['빌리프'])}")
+    print(f"빌리프 인기 제품: {catalog.find_similar_products(['빌리프'], limit=2)}")
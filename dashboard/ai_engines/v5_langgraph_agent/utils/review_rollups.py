@@ -0,0 +1,343 @@
+"""
+리뷰 분석 롤업(요약) 테이블
+
+V5 Tool과 V6 생성 SQL은 채팅 턴마다 preprocessed_reviews의 analysis JSONB를
+전부 읽어서 같은 집계(감성 분포, 키워드/장점/단점 빈도, 속성 평가)를 다시 계산합니다.
+이 모듈은 그 집계를 (brand, product_name, channel) 단위로 미리 계산해 둡니다.
+
+롤업 테이블 (모두 brand, product_name, channel 컬럼 포함 → 기존 필터 조건 그대로 사용 가능):
+- review_rollup_totals: 리뷰 수
+- review_rollup_sentiment: 감정요약.전반적평가별 리뷰 수
+- review_rollup_fields: 리스트 필드(장점/단점/...)에 유효한 항목이 있는 리뷰 수
+- review_rollup_terms: 리스트 필드 항목별 언급 횟수
+- review_rollup_attributes: 제품특성 속성/평가별 리뷰 수
+
+갱신:
+- rebuild_rollups(cur): 전체 재생성
+- refresh_rollups(cur, keys): 업로드로 바뀐 (brand, product_name, channel) 그룹만 다시 계산
+- 전체 재생성 시 제품명 트라이그램 인덱스(pg_trgm)도 함께 생성
+- 갱신이 끝나면 data_versions의 review_rollups 버전을 preprocessed_reviews 버전과 맞춤
+  → rollups_fresh()가 두 버전을 비교해서 롤업을 써도 되는지 판단
+
+업로드 스크립트에서도 import할 수 있도록 data_version 외의 모듈에 의존하지 않습니다.
+조회 API는 DBConnector(fetch_rollup_*)에 있습니다.
+"""
+
+from typing import Iterable, List, Optional, Set, Tuple
+
+from psycopg2.extras import execute_values
+
+try:
+    from .data_version import DATA_VERSION_TABLE, fetch_data_version, ensure_data_version_table, _first_value
+except ImportError:
+    # 스크립트(upload_preprocessed_data.py 등)에서 직접 import한 경우
+    from data_version import DATA_VERSION_TABLE, fetch_data_version, ensure_data_version_table, _first_value
+
+SOURCE_TABLE = "preprocessed_reviews"
+
+# data_versions에 기록하는 롤업 버전 키
+ROLLUP_VERSION_KEY = "review_rollups"
+
+TOTALS_TABLE = "review_rollup_totals"
+SENTIMENT_TABLE = "review_rollup_sentiment"
+FIELDS_TABLE = "review_rollup_fields"
+TERMS_TABLE = "review_rollup_terms"
+ATTRIBUTES_TABLE = "review_rollup_attributes"
+
+ROLLUP_TABLES = [TOTALS_TABLE, SENTIMENT_TABLE, FIELDS_TABLE, TERMS_TABLE, ATTRIBUTES_TABLE]
+
+# 리스트 필드 → analysis 내 JSON 경로
+LIST_FIELDS = {
+    "장점": "p.analysis->'장점'",
+    "단점": "p.analysis->'단점'",
+    "키워드": "p.analysis->'키워드'",
+    "불만사항": "p.analysis->'불만사항'",
+    "구매동기": "p.analysis->'구매동기'",
+    "핵심표현": "p.analysis->'감정요약'->'핵심표현'"
+}
+
+_GROUP_COLUMNS = "brand TEXT, product_name TEXT, channel TEXT"
+
+ROLLUP_DDL = [
+    f"CREATE TABLE IF NOT EXISTS {TOTALS_TABLE} ({_GROUP_COLUMNS}, review_count BIGINT NOT NULL)",
+    f"CREATE TABLE IF NOT EXISTS {SENTIMENT_TABLE} ({_GROUP_COLUMNS}, sentiment TEXT NOT NULL, review_count BIGINT NOT NULL)",
+    f"CREATE TABLE IF NOT EXISTS {FIELDS_TABLE} ({_GROUP_COLUMNS}, field TEXT NOT NULL, review_count BIGINT NOT NULL)",
+    f"CREATE TABLE IF NOT EXISTS {TERMS_TABLE} ({_GROUP_COLUMNS}, field TEXT NOT NULL, term TEXT NOT NULL, mention_count BIGINT NOT NULL)",
+    f"CREATE TABLE IF NOT EXISTS {ATTRIBUTES_TABLE} ({_GROUP_COLUMNS}, attribute TEXT NOT NULL, evaluation TEXT NOT NULL, review_count BIGINT NOT NULL)",
+] + [
+    f"CREATE INDEX IF NOT EXISTS {table}_group_idx ON {table} (brand, product_name, channel)"
+    for table in ROLLUP_TABLES
+] + [
+    f"CREATE INDEX IF NOT EXISTS {TERMS_TABLE}_field_idx ON {TERMS_TABLE} (field, brand)"
+]
+
+# 제품명 부분 매칭(LIKE '%...%')용 트라이그램 인덱스 (pg_trgm 확장 필요)
+PRODUCT_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS {SOURCE_TABLE}_product_trgm_idx "
+    f"ON {SOURCE_TABLE} USING gin (product_name gin_trgm_ops)"
+]
+
+# 증분 갱신 대상 그룹 (트랜잭션 끝나면 자동 삭제)
+_KEYS_TABLE = "_rollup_keys"
+
+
+def _safe_array(path: str) -> str:
+    """배열이 아니면 빈 배열로 (jsonb_array_elements 오류 방지)"""
+    return f"CASE WHEN jsonb_typeof({path}) = 'array' THEN {path} ELSE '[]'::jsonb END"
+
+
+def _aggregate_statements(key_join: str) -> List[Tuple[str, tuple]]:
+    """
+    롤업 INSERT ... SELECT 문 목록
+
+    Args:
+        key_join: 증분 갱신 시 대상 그룹으로 제한하는 JOIN 절 (전체 재생성이면 빈 문자열)
+    """
+    statements = [
+        (f"""
+            INSERT INTO {TOTALS_TABLE} (brand, product_name, channel, review_count)
+            SELECT p.brand, p.product_name, p.channel, COUNT(*)
+            FROM {SOURCE_TABLE} p {key_join}
+            GROUP BY p.brand, p.product_name, p.channel
+        """, ()),
+        (f"""
+            INSERT INTO {SENTIMENT_TABLE} (brand, product_name, channel, sentiment, review_count)
+            SELECT p.brand, p.product_name, p.channel, p.analysis->'감정요약'->>'전반적평가', COUNT(*)
+            FROM {SOURCE_TABLE} p {key_join}
+            WHERE COALESCE(p.analysis->'감정요약'->>'전반적평가', '') <> ''
+            GROUP BY p.brand, p.product_name, p.channel, p.analysis->'감정요약'->>'전반적평가'
+        """, ()),
+        (f"""
+            INSERT INTO {ATTRIBUTES_TABLE} (brand, product_name, channel, attribute, evaluation, review_count)
+            SELECT p.brand, p.product_name, p.channel, a.key, a.value #>> '{{}}', COUNT(*)
+            FROM {SOURCE_TABLE} p {key_join}
+            CROSS JOIN LATERAL jsonb_each(
+                CASE WHEN jsonb_typeof(p.analysis->'제품특성') = 'object'
+                     THEN p.analysis->'제품특성' ELSE '{{}}'::jsonb END
+            ) AS a
+            WHERE COALESCE(a.value #>> '{{}}', '') <> ''
+            GROUP BY p.brand, p.product_name, p.channel, a.key, a.value #>> '{{}}'
+        """, ()),
+    ]
+
+    for field, path in LIST_FIELDS.items():
+        # 유효한 항목 = 비어 있지 않은 문자열
+        items = f"""
+            FROM {SOURCE_TABLE} p {key_join}
+            CROSS JOIN LATERAL jsonb_array_elements({_safe_array(path)}) AS e(elem)
+            WHERE jsonb_typeof(e.elem) = 'string' AND e.elem #>> '{{}}' <> ''
+        """
+        statements.append((f"""
+            INSERT INTO {FIELDS_TABLE} (brand, product_name, channel, field, review_count)
+            SELECT p.brand, p.product_name, p.channel, %s, COUNT(DISTINCT p.review_id)
+            {items}
+            GROUP BY p.brand, p.product_name, p.channel
+        """, (field,)))
+        statements.append((f"""
+            INSERT INTO {TERMS_TABLE} (brand, product_name, channel, field, term, mention_count)
+            SELECT p.brand, p.product_name, p.channel, %s, e.elem #>> '{{}}', COUNT(*)
+            {items}
+            GROUP BY p.brand, p.product_name, p.channel, e.elem #>> '{{}}'
+        """, (field,)))
+
+    return statements
+
+
+def ensure_rollup_tables(cur) -> None:
+    """롤업 테이블/인덱스 생성 (없으면)"""
+    for ddl in ROLLUP_DDL:
+        cur.execute(ddl)
+
+
+def ensure_product_trgm_index(cur) -> bool:
+    """
+    제품명 트라이그램 인덱스 생성 (없으면)
+
+    확장 설치 권한이 없어도 업로드가 실패하지 않도록 SAVEPOINT 안에서 실행합니다.
+
+    Returns:
+        인덱스 사용 가능 여부
+    """
+    cur.execute("SAVEPOINT product_trgm")
+    try:
+        for ddl in PRODUCT_TRGM_DDL:
+            cur.execute(ddl)
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT product_trgm")
+        print(f"⚠️ 제품명 트라이그램 인덱스 생성 실패 (LIKE 검색은 순차 스캔): {e}")
+        return False
+    cur.execute("RELEASE SAVEPOINT product_trgm")
+    return True
+
+
+def rebuild_rollups(cur) -> int:
+    """
+    롤업 전체 재생성
+
+    Args:
+        cur: DB 커서 (호출한 쪽에서 commit 필요)
+
+    Returns:
+        롤업 버전 (= 현재 preprocessed_reviews 데이터 버전)
+    """
+    ensure_rollup_tables(cur)
+    ensure_product_trgm_index(cur)
+    cur.execute(f"TRUNCATE {', '.join(ROLLUP_TABLES)}")
+
+    for sql, params in _aggregate_statements(key_join=""):
+        cur.execute(sql, params)
+
+    return _mark_fresh(cur)
+
+
+def fetch_group_keys(
+    cur,
+    review_ids: Optional[List[str]] = None,
+    review_id_subquery: Optional[str] = None
+) -> Set[Tuple]:
+    """
+    리뷰들이 속한 (brand, product_name, channel) 그룹 조회
+
+    업로드 전/후에 각각 호출해서 합치면 브랜드/제품이 바뀐 리뷰도
+    이전 그룹과 새 그룹 모두 갱신됩니다.
+
+    Args:
+        cur: DB 커서
+        review_ids: review_id 리스트
+        review_id_subquery: review_id를 반환하는 서브쿼리 (예: 스테이징 테이블)
+
+    Returns:
+        그룹 키 집합
+    """
+    if review_id_subquery:
+        condition, params = f"review_id IN ({review_id_subquery})", ()
+    elif review_ids:
+        condition, params = "review_id = ANY(%s)", (list(review_ids),)
+    else:
+        return set()
+
+    cur.execute(f"""
+        SELECT DISTINCT brand, product_name, channel
+        FROM {SOURCE_TABLE}
+        WHERE {condition}
+    """, params)
+
+    keys = set()
+    for row in cur.fetchall():
+        if isinstance(row, dict):
+            keys.add((row["brand"], row["product_name"], row["channel"]))
+        else:
+            keys.add(tuple(row))
+    return keys
+
+
+def refresh_rollups(cur, keys: Iterable[Tuple]) -> int:
+    """
+    바뀐 그룹만 롤업 재계산
+
+    롤업 테이블이 아직 없으면 전체 재생성합니다.
+
+    Args:
+        cur: DB 커서 (호출한 쪽에서 commit 필요, 업로드와 같은 트랜잭션 권장)
+        keys: (brand, product_name, channel) 그룹 키들
+
+    Returns:
+        롤업 버전
+    """
+    cur.execute(f"SELECT to_regclass('{TOTALS_TABLE}') IS NOT NULL")
+    if not _first_value(cur.fetchone()):
+        return rebuild_rollups(cur)
+
+    keys = list(set(keys))
+    if not keys:
+        return _mark_fresh(cur)
+
+    cur.execute(f"CREATE TEMP TABLE IF NOT EXISTS {_KEYS_TABLE} ({_GROUP_COLUMNS}) ON COMMIT DROP")
+    cur.execute(f"TRUNCATE {_KEYS_TABLE}")
+    execute_values(cur, f"INSERT INTO {_KEYS_TABLE} (brand, product_name, channel) VALUES %s", keys)
+
+    # NULL 브랜드/제품도 같은 그룹으로 취급
+    match = (
+        "{t}.brand IS NOT DISTINCT FROM k.brand "
+        "AND {t}.product_name IS NOT DISTINCT FROM k.product_name "
+        "AND {t}.channel IS NOT DISTINCT FROM k.channel"
+    )
+
+    for table in ROLLUP_TABLES:
+        cur.execute(f"DELETE FROM {table} USING {_KEYS_TABLE} k WHERE {match.format(t=table)}")
+
+    key_join = f"JOIN {_KEYS_TABLE} k ON {match.format(t='p')}"
+    for sql, params in _aggregate_statements(key_join):
+        cur.execute(sql, params)
+
+    return _mark_fresh(cur)
+
+
+def rollups_fresh(cur) -> bool:
+    """
+    롤업이 현재 데이터와 일치하는지 (한 번도 만들지 않았으면 False)
+
+    Args:
+        cur: DB 커서
+    """
+    cur.execute(f"SELECT to_regclass('{DATA_VERSION_TABLE}') IS NOT NULL")
+    if not _first_value(cur.fetchone()):
+        return False
+
+    cur.execute(
+        f"SELECT table_name, version FROM {DATA_VERSION_TABLE} WHERE table_name IN (%s, %s)",
+        (SOURCE_TABLE, ROLLUP_VERSION_KEY)
+    )
+    rows = cur.fetchall()
+
+    versions = {}
+    for row in rows:
+        if isinstance(row, dict):
+            versions[row["table_name"]] = row["version"]
+        else:
+            versions[row[0]] = row[1]
+
+    if ROLLUP_VERSION_KEY not in versions:
+        return False
+    return versions[ROLLUP_VERSION_KEY] == versions.get(SOURCE_TABLE, 0)
+
+
+def _mark_fresh(cur) -> int:
+    """롤업 버전을 현재 preprocessed_reviews 버전으로 기록"""
+    ensure_data_version_table(cur)
+    version = fetch_data_version(cur, SOURCE_TABLE)
+    cur.execute(f"""
+        INSERT INTO {DATA_VERSION_TABLE} (table_name, version, updated_at)
+        VALUES (%s, %s, NOW())
+        ON CONFLICT (table_name)
+        DO UPDATE SET version = EXCLUDED.version, updated_at = NOW()
+    """, (ROLLUP_VERSION_KEY, version))
+    return version
+
+
+# ===== 사용 예시 =====
+if __name__ == "__main__":
+    # 전체 재생성: python review_rollups.py
+    import sys
+    import os
+    import time
+    import psycopg2
+
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from upload_preprocessed_data import DB_CONFIG
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor()
+
+    start = time.perf_counter()
+    version = rebuild_rollups(cur)
+    conn.commit()
+
+    print(f"=== 롤업 재생성 완료 (버전 {version}, {time.perf_counter() - start:.1f}s) ===")
+    for table in ROLLUP_TABLES:
+        cur.execute(f"SELECT COUNT(*) FROM {table}")
+        print(f"{table}: {cur.fetchone()[0]} rows")
+
+    cur.close()
+    conn.close()
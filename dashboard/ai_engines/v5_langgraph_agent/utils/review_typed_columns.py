@@ -0,0 +1,150 @@
+"""
+preprocessed_reviews 평점/날짜 타입 컬럼
+
+preprocessed_reviews의 rating, review_date는 text 컬럼이라 V6 생성 SQL이
+매번 CAST(rating AS FLOAT), CAST(review_date AS DATE)를 씁니다.
+행마다 형 변환이 일어나고 기간 조건에 인덱스를 쓸 수 없습니다.
+
+이 모듈은 원본 text 컬럼에서 계산되는 STORED 생성 컬럼과 인덱스를 추가합니다.
+- rating_num (numeric): 숫자가 아니면 NULL
+- review_dt (date): 'YYYY-MM-DD...' 형식이 아니거나 없는 날짜면 NULL
+- 인덱스: (brand, review_dt), (product_name)
+
+생성 컬럼이라 업로드 스크립트는 기존처럼 rating/review_date만 쓰면 되고,
+ensure_typed_columns()만 먼저 호출합니다 (이미 있으면 아무것도 하지 않음).
+V6는 컬럼 존재 여부를 확인해서 SQL 프롬프트/템플릿을 바꿉니다 (v6 data_version.typed_columns_available).
+
+주의: 컬럼 추가는 테이블 전체를 다시 쓰므로 큰 테이블은 한가한 시간에
+python review_typed_columns.py 로 먼저 실행하세요.
+"""
+
+from typing import Set
+
+SOURCE_TABLE = "preprocessed_reviews"
+
+RATING_COLUMN = "rating_num"
+DATE_COLUMN = "review_dt"
+TYPED_COLUMNS = [RATING_COLUMN, DATE_COLUMN]
+
+# 생성 컬럼 식은 IMMUTABLE이어야 함
+# - text::date는 DateStyle에 따라 달라져 STABLE → make_date로 직접 계산
+# - 잘못된 값(2025-02-30, '5점' 등)은 INSERT 실패 대신 NULL
+TYPED_COLUMN_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION review_rating_num(value TEXT) RETURNS NUMERIC
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    BEGIN
+        IF value IS NULL OR btrim(value) !~ '^[0-9]+(\\.[0-9]+)?$' THEN
+            RETURN NULL;
+        END IF;
+        RETURN btrim(value)::NUMERIC;
+    EXCEPTION WHEN OTHERS THEN
+        RETURN NULL;
+    END;
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION review_date_value(value TEXT) RETURNS DATE
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    BEGIN
+        IF value IS NULL OR value !~ '^\\s*[0-9]{4}[-./][0-9]{1,2}[-./][0-9]{1,2}' THEN
+            RETURN NULL;
+        END IF;
+        RETURN make_date(
+            substring(value FROM '^\\s*([0-9]{4})')::INT,
+            substring(value FROM '^\\s*[0-9]{4}[-./]([0-9]{1,2})')::INT,
+            substring(value FROM '^\\s*[0-9]{4}[-./][0-9]{1,2}[-./]([0-9]{1,2})')::INT
+        );
+    EXCEPTION WHEN OTHERS THEN
+        RETURN NULL;
+    END;
+    $$
+    """,
+    f"""
+    ALTER TABLE {SOURCE_TABLE}
+        ADD COLUMN IF NOT EXISTS {RATING_COLUMN} NUMERIC
+            GENERATED ALWAYS AS (review_rating_num(rating::TEXT)) STORED,
+        ADD COLUMN IF NOT EXISTS {DATE_COLUMN} DATE
+            GENERATED ALWAYS AS (review_date_value(review_date::TEXT)) STORED
+    """,
+    f"CREATE INDEX IF NOT EXISTS {SOURCE_TABLE}_brand_date_idx ON {SOURCE_TABLE} (brand, {DATE_COLUMN})",
+    f"CREATE INDEX IF NOT EXISTS {SOURCE_TABLE}_product_name_idx ON {SOURCE_TABLE} (product_name)"
+]
+
+
+def existing_typed_columns(cur) -> Set[str]:
+    """이미 있는 타입 컬럼 이름"""
+    cur.execute("""
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_name = %s AND column_name = ANY(%s)
+    """, (SOURCE_TABLE, TYPED_COLUMNS))
+
+    names = set()
+    for row in cur.fetchall():
+        names.add(row["column_name"] if isinstance(row, dict) else row[0])
+    return names
+
+
+def ensure_typed_columns(cur) -> bool:
+    """
+    타입 컬럼/인덱스 생성 (없으면)
+
+    권한 문제 등으로 실패해도 업로드는 계속되도록 SAVEPOINT 안에서 실행합니다.
+
+    Args:
+        cur: DB 커서 (호출한 쪽에서 commit 필요)
+
+    Returns:
+        타입 컬럼 사용 가능 여부
+    """
+    if existing_typed_columns(cur) == set(TYPED_COLUMNS):
+        return True
+
+    cur.execute("SAVEPOINT typed_columns")
+    try:
+        for ddl in TYPED_COLUMN_DDL:
+            cur.execute(ddl)
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT typed_columns")
+        print(f"⚠️ 평점/날짜 타입 컬럼 생성 실패 (V6는 CAST 방식 유지): {e}")
+        return False
+    cur.execute("RELEASE SAVEPOINT typed_columns")
+    return True
+
+
+# ===== 사용 예시 =====
+if __name__ == "__main__":
+    # 마이그레이션: python review_typed_columns.py
+    import sys
+    import os
+    import time
+    import psycopg2
+
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from upload_preprocessed_data import DB_CONFIG
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor()
+
+    start = time.perf_counter()
+    ok = ensure_typed_columns(cur)
+    conn.commit()
+
+    if ok:
+        # 새 인덱스/컬럼 통계 반영
+        cur.execute(f"ANALYZE {SOURCE_TABLE}")
+        conn.commit()
+
+        cur.execute(f"""
+            SELECT COUNT(*), COUNT({RATING_COLUMN}), COUNT({DATE_COLUMN}),
+                   MIN({DATE_COLUMN}), MAX({DATE_COLUMN})
+            FROM {SOURCE_TABLE}
+        """)
+        total, ratings, dates, min_date, max_date = cur.fetchone()
+        print(f"=== 타입 컬럼 준비 완료 ({time.perf_counter() - start:.1f}s) ===")
+        print(f"{RATING_COLUMN}: {ratings}/{total} rows")
+        print(f"{DATE_COLUMN}: {dates}/{total} rows ({min_date} ~ {max_date})")
+
+    cur.close()
+    conn.close()
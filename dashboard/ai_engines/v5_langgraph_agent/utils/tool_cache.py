@@ -0,0 +1,308 @@
+"""
+Tool 결과 캐시
+
+같은 브랜드에 대해 비슷한 질문("빌리프 장점", "빌리프 단점은?")이 반복되면
+매번 같은 Tool이 같은 필터로 다시 실행됩니다. preprocessed_reviews는 업로드 때만
+바뀌므로, Tool 결과를 다음 키로 캐시합니다:
+
+    (Tool 이름, 정규화된 brands, products, channels, 데이터 버전)
+
+- LRU: 최대 개수를 넘으면 가장 오래 안 쓴 결과부터 제거
+- TTL: 저장 후 ttl_seconds가 지나면 만료
+- 무효화: upload_preprocessed_data.py가 업로드 후 데이터 버전을 올리면
+  키가 달라지므로 이전 결과는 더 이상 조회되지 않음
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..config import TOOL_CACHE_CONFIG, PREPROCESSED_TABLE
+from .db_connector import DBConnector
+from .data_version import ensure_data_version_table, fetch_data_version
+
+
+class ToolResultCache:
+    """
+    Tool 결과 LRU + TTL 캐시 (스레드 안전)
+
+    Streamlit은 세션마다 스레드를 쓰므로 모든 접근은 lock으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600,
+        version_check_interval: float = 30
+    ):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수
+            ttl_seconds: 항목 유효 시간 (초)
+            version_check_interval: 데이터 버전 재조회 간격 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version_check_interval = version_check_interval
+
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 데이터 버전 (DB 조회 결과를 잠깐 보관)
+        self._data_version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self._version_table_ready = False
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    # ===== 키 생성 =====
+
+    def make_key(
+        self,
+        tool_name: str,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        channels: Optional[List[str]] = None,
+        order_sensitive: bool = False
+    ) -> Optional[Tuple]:
+        """
+        캐시 키 생성
+
+        Args:
+            tool_name: Tool 이름
+            brands: 브랜드 필터
+            products: 제품명 필터
+            channels: 채널 필터
+            order_sensitive: 필터 순서가 결과에 영향을 주는 Tool인지
+                (예: ProductComparisonTool은 products[0]이 제품 A)
+
+        Returns:
+            캐시 키 (데이터 버전 조회 실패 시 None → 캐시 사용 안 함)
+        """
+        data_version = self.current_data_version()
+        if data_version is None:
+            return None
+
+        return (
+            tool_name,
+            _normalize_filter(brands, order_sensitive),
+            _normalize_filter(products, order_sensitive),
+            _normalize_filter(channels, order_sensitive),
+            data_version
+        )
+
+    def current_data_version(self) -> Optional[int]:
+        """
+        preprocessed_reviews 데이터 버전 조회
+
+        매 Tool 실행마다 DB를 조회하지 않도록 version_check_interval 동안은
+        마지막으로 읽은 값을 재사용합니다.
+
+        Returns:
+            데이터 버전 (조회 실패 시 None)
+        """
+        now = time.time()
+        with self._lock:
+            if (
+                self._data_version is not None
+                and now - self._version_checked_at < self.version_check_interval
+            ):
+                return self._data_version
+
+        try:
+            with DBConnector() as db:
+                if not self._version_table_ready:
+                    ensure_data_version_table(db.cur)
+                    db.conn.commit()
+                    self._version_table_ready = True
+                version = fetch_data_version(db.cur, PREPROCESSED_TABLE)
+        except Exception as e:
+            print(f"⚠️ 데이터 버전 조회 실패 (캐시 사용 안 함): {e}")
+            return None
+
+        with self._lock:
+            if self._data_version is not None and version != self._data_version:
+                # 새 업로드 감지 → 이전 버전 결과는 어차피 조회되지 않으므로 바로 비움
+                self._entries.clear()
+            self._data_version = version
+            self._version_checked_at = now
+
+        return version
+
+    # ===== 조회/저장 =====
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key()로 만든 키
+
+        Returns:
+            캐시된 Tool 결과 사본 (없거나 만료되면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, result = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            # 최근 사용으로 이동 (LRU)
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # 호출한 쪽에서 결과를 수정해도 캐시가 오염되지 않도록 사본 반환
+        return copy.deepcopy(result)
+
+    def set(self, key: Tuple, result: Dict):
+        """
+        캐시 저장
+
+        Args:
+            key: make_key()로 만든 키
+            result: Tool 실행 결과
+        """
+        with self._lock:
+            self._entries[key] = (time.time(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tool_name: Optional[str] = None):
+        """
+        캐시 무효화
+
+        Args:
+            tool_name: 지정하면 해당 Tool 결과만, 없으면 전체 삭제
+        """
+        with self._lock:
+            if tool_name is None:
+                self._entries.clear()
+                # 다음 조회 때 데이터 버전을 즉시 다시 읽음
+                self._version_checked_at = 0.0
+            else:
+                for key in [k for k in self._entries if k[0] == tool_name]:
+                    del self._entries[key]
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계
+
+        Returns:
+            {"entries": ..., "hits": ..., "misses": ..., "hit_rate": ..., "data_version": ...}
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total * 100, 1) if total else 0.0,
+                "data_version": self._data_version
+            }
+
+
+# ===== 헬퍼 함수 =====
+
+def _normalize_filter(values: Optional[List[str]], order_sensitive: bool = False) -> Tuple[str, ...]:
+    """
+    필터 리스트 정규화 (공백 제거, 빈 값/중복 제거, 순서 무관하면 정렬)
+
+    Example:
+        >>> _normalize_filter([" 빌리프", "VT", "빌리프", ""])
+        ('VT', '빌리프')
+    """
+    if not values:
+        return ()
+
+    normalized = []
+    for value in values:
+        if value is None:
+            continue
+        value = str(value).strip()
+        if value and value not in normalized:
+            normalized.append(value)
+
+    if not order_sensitive:
+        normalized.sort()
+
+    return tuple(normalized)
+
+
+# 프로세스 전역 캐시 (모든 Tool 인스턴스가 공유)
+_tool_cache: Optional[ToolResultCache] = None
+_tool_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> Optional[ToolResultCache]:
+    """
+    프로세스 전역 Tool 캐시 반환
+
+    Returns:
+        ToolResultCache (TOOL_CACHE_CONFIG["enabled"]가 False면 None)
+    """
+    global _tool_cache
+
+    if not TOOL_CACHE_CONFIG.get("enabled", True):
+        return None
+
+    if _tool_cache is None:
+        with _tool_cache_lock:
+            if _tool_cache is None:
+                _tool_cache = ToolResultCache(
+                    max_entries=TOOL_CACHE_CONFIG["max_entries"],
+                    ttl_seconds=TOOL_CACHE_CONFIG["ttl_seconds"],
+                    version_check_interval=TOOL_CACHE_CONFIG["version_check_interval"]
+                )
+
+    return _tool_cache
+
+
+def invalidate_tool_cache(tool_name: Optional[str] = None):
+    """
+    현재 프로세스의 Tool 캐시 무효화
+
+    다른 프로세스(업로드 스크립트)에서의 변경은 데이터 버전으로 감지되므로
+    이 함수는 같은 프로세스 안에서 데이터를 바꿨을 때만 호출하면 됩니다.
+    """
+    if _tool_cache is not None:
+        _tool_cache.invalidate(tool_name)
+
+
+# ===== 사용 예시 =====
+if __name__ == "__main__":
+    print("=== Tool 캐시 테스트 ===\n")
+
+    cache = ToolResultCache(max_entries=2, ttl_seconds=1)
+    # DB 없이 테스트하기 위해 데이터 버전을 고정
+    cache.current_data_version = lambda: 1
+
+    key_a = cache.make_key("ProsTool", brands=["빌리프 "])
+    key_b = cache.make_key("ProsTool", brands=["빌리프"])
+    print(f"정규화된 키 동일: {key_a == key_b}")
+
+    cache.set(key_a, {"count": 10})
+    print(f"조회 (hit): {cache.get(key_b)}")
+
+    # LRU 제거
+    cache.set(cache.make_key("ConsTool", brands=["빌리프"]), {"count": 3})
+    cache.set(cache.make_key("KeywordTool", brands=["빌리프"]), {"count": 5})
+    print(f"LRU 제거 후 ProsTool: {cache.get(key_a)}")
+
+    # TTL 만료
+    time.sleep(1.1)
+    print(f"TTL 만료 후 KeywordTool: {cache.get(cache.make_key('KeywordTool', brands=['빌리프']))}")
+
+    print(f"\n통계: {cache.stats()}")
@@ -6,14 +6,33 @@ upload_preprocessed_data.py
 5000개 전처리 데이터:
 - analyzed_results_5000.json
 - failed_retry_results.json
+
+업로드 방식:
+- upload_to_db: 레코드마다 INSERT ... ON CONFLICT (소량 데이터용)
+- bulk_upload_to_db: JSON 스트리밍 → 스테이징 테이블에 COPY → 한 번의 UPSERT로 병합
+  (전체 리뷰 재분석 결과처럼 대용량일 때 사용, 중단 후 이어서 업로드 가능)
 """
 #//==============================================================================//#
 
+import csv
+import io
 import json
 import psycopg2
 from psycopg2.extras import Json
 import sys
 import os
+import time
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# 스크립트로 직접 실행해도 같은 폴더의 data_version 모듈을 찾을 수 있도록 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from data_version import bump_data_version
+from review_rollups import fetch_group_keys, refresh_rollups
+from review_typed_columns import ensure_typed_columns
 
 # DB Config 직접 정의
 DB_CONFIG = {
@@ -24,6 +43,44 @@ DB_CONFIG = {
     "port": 5432
 }
 
+# Bulk 업로드 설정
+TARGET_TABLE = "preprocessed_reviews"
+STAGING_TABLE = "preprocessed_reviews_staging"
+COPY_BATCH_SIZE = 5000          # COPY 1회당 레코드 수
+READ_CHUNK_SIZE = 1024 * 1024   # JSON 스트리밍 읽기 단위 (문자 수)
+
+STAGING_COLUMNS = ["review_id", "analysis", "brand", "product_name", "channel", "category"]
+
+# 재실행 시 이어서 올릴 수 있도록 UNLOGGED 일반 테이블 사용 (임시 테이블은 연결 종료 시 사라짐)
+# seq: 같은 review_id가 여러 번 들어오면 마지막 값이 이기도록 순서 기록
+STAGING_DDL = f"""
+    CREATE UNLOGGED TABLE IF NOT EXISTS {STAGING_TABLE} (
+        seq BIGSERIAL,
+        review_id TEXT,
+        analysis JSONB,
+        brand TEXT,
+        product_name TEXT,
+        channel TEXT,
+        category TEXT
+    )
+"""
+
+MERGE_SQL = f"""
+    INSERT INTO {TARGET_TABLE}
+        (review_id, analysis, brand, product_name, channel, category)
+    SELECT DISTINCT ON (review_id)
+        review_id, analysis, brand, product_name, channel, category
+    FROM {STAGING_TABLE}
+    ORDER BY review_id, seq DESC
+    ON CONFLICT (review_id)
+    DO UPDATE SET
+        analysis = EXCLUDED.analysis,
+        brand = EXCLUDED.brand,
+        product_name = EXCLUDED.product_name,
+        channel = EXCLUDED.channel,
+        category = EXCLUDED.category
+"""
+
 def load_json_file(file_path):
     """JSON 파일 로드"""
     print(f"Loading {file_path}...")
@@ -45,10 +102,18 @@ def upload_to_db(data_list):
 
     cur = conn.cursor()
 
+    # 평점/날짜 타입 컬럼 (생성 컬럼이라 INSERT는 그대로, 없을 때만 추가)
+    ensure_typed_columns(cur)
+    conn.commit()
+
     success_count = 0
     skip_count = 0
     error_count = 0
 
+    # 업로드 전 그룹 (브랜드/제품이 바뀌는 리뷰의 이전 롤업 그룹도 갱신하기 위함)
+    review_ids = [item.get('review_id') for item in data_list if item.get('review_id')]
+    rollup_keys = fetch_group_keys(cur, review_ids=review_ids)
+
     for item in data_list:
         try:
             review_id = item.get('review_id')
@@ -93,6 +158,15 @@ def upload_to_db(data_list):
             continue
 
     conn.commit()
+
+    # 데이터 버전 증가 → V5 Tool 결과 캐시 무효화 + 바뀐 그룹 롤업 갱신
+    if success_count > 0:
+        data_version = bump_data_version(cur, "preprocessed_reviews")
+        rollup_keys |= fetch_group_keys(cur, review_ids=review_ids)
+        refresh_rollups(cur, rollup_keys)
+        conn.commit()
+        print(f"Data version: {data_version} (rollups refreshed: {len(rollup_keys)} groups)")
+
     cur.close()
     conn.close()
 
@@ -104,18 +178,262 @@ def upload_to_db(data_list):
 
     return success_count
 
+#//==============================================================================//#
+# Bulk 업로드
+#//==============================================================================//#
+
+def iter_json_records(file_path, chunk_size=READ_CHUNK_SIZE):
+    """
+    JSON 배열 파일을 레코드 단위로 스트리밍 (파일 전체를 메모리에 올리지 않음)
+
+    ijson이 설치되어 있으면 사용하고, 없으면 json.JSONDecoder.raw_decode로
+    청크를 읽어가며 배열 원소를 하나씩 디코딩합니다.
+
+    Args:
+        file_path: [{...}, {...}, ...] 형태의 JSON 파일
+        chunk_size: 한 번에 읽을 문자 수
+
+    Yields:
+        dict: 레코드 하나
+    """
+    if ijson is not None:
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+
+    decoder = json.JSONDecoder()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buf = f.read(chunk_size).lstrip('\ufeff')
+        pos = 0
+        eof = False
+
+        def skip(chars):
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos] in chars:
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+
+        skip(' \t\r\n')
+        if pos >= len(buf) or buf[pos] != '[':
+            raise ValueError(f"{file_path}: JSON 배열 형식이 아닙니다")
+        pos += 1
+
+        while True:
+            skip(' \t\r\n,')
+            if pos >= len(buf):
+                raise ValueError(f"{file_path}: JSON 배열이 닫히지 않았습니다")
+            if buf[pos] == ']':
+                return
+
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # 레코드가 청크 경계에 걸림 → 더 읽고 다시 시도
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+
+            yield obj
+            pos = end
+
+            # 처리한 앞부분은 버려서 버퍼가 계속 커지지 않도록
+            if pos > chunk_size:
+                buf, pos = buf[pos:], 0
+
+
+def _to_staging_row(item):
+    """레코드 → 스테이징 테이블 행 (review_id 없으면 None)"""
+    review_id = item.get('review_id')
+    if not review_id:
+        return None
+
+    analysis = item.get('analysis') or {}
+
+    return [
+        str(review_id),
+        json.dumps(analysis, ensure_ascii=False),
+        analysis.get('표준_브랜드'),
+        item.get('product_name'),
+        item.get('channel'),
+        analysis.get('제품_카테고리')
+    ]
+
+
+def _copy_rows(cur, rows):
+    """행 리스트를 CSV로 만들어 스테이징 테이블에 COPY"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(rows)
+    buffer.seek(0)
+
+    cur.copy_expert(
+        f"COPY {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+        buffer
+    )
+
+
+def _load_checkpoint(checkpoint_path):
+    """체크포인트 로드 ({파일 경로: 스테이징 완료된 레코드 수})"""
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_checkpoint(checkpoint_path, checkpoint):
+    """체크포인트 저장 (쓰는 도중 중단돼도 이전 파일이 남도록 교체 방식)"""
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def bulk_upload_to_db(file_paths, batch_size=COPY_BATCH_SIZE, checkpoint_path=None):
+    """
+    대용량 Bulk 업로드
+
+    1. 각 JSON 파일을 스트리밍으로 읽어 batch_size개씩 스테이징 테이블에 COPY
+       (배치마다 commit + 체크포인트 기록)
+    2. 모든 파일이 스테이징되면 한 번의 INSERT ... SELECT ... ON CONFLICT로 병합
+    3. 스테이징 비우고 데이터 버전 증가
+
+    중간에 중단되면 같은 인자로 다시 실행하면 됩니다. 체크포인트에 기록된 만큼은
+    건너뛰고 이어서 COPY합니다. (체크포인트 기록 전에 중단돼 같은 배치가 두 번
+    들어가도 병합 시 review_id별로 하나만 남으므로 결과는 같습니다.)
+
+    Args:
+        file_paths: JSON 파일 경로 리스트 (뒤 파일의 레코드가 앞 파일을 덮어씀)
+        batch_size: COPY 1회당 레코드 수
+        checkpoint_path: 체크포인트 파일 경로 (기본: 첫 파일 옆 *.upload_checkpoint.json)
+
+    Returns:
+        병합된 레코드 수
+    """
+    if checkpoint_path is None:
+        checkpoint_path = os.path.splitext(file_paths[0])[0] + ".upload_checkpoint.json"
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor()
+
+    cur.execute(STAGING_DDL)
+    ensure_typed_columns(cur)
+
+    checkpoint = _load_checkpoint(checkpoint_path)
+    if checkpoint is None:
+        # 새 업로드 → 이전 실행의 잔여 데이터 제거
+        cur.execute(f"TRUNCATE {STAGING_TABLE}")
+        checkpoint = {"files": {}, "skipped": 0}
+        print("Starting new bulk upload")
+    else:
+        print(f"Resuming bulk upload from {checkpoint_path}")
+    conn.commit()
+
+    start_time = time.perf_counter()
+    staged_count = 0
+
+    for file_path in file_paths:
+        done = checkpoint["files"].get(file_path, 0)
+        if done == -1:
+            print(f"{file_path}: already staged, skipping")
+            continue
+
+        print(f"Streaming {file_path}..." + (f" (resume after {done} records)" if done else ""))
+
+        rows = []
+        position = 0
+
+        for item in iter_json_records(file_path):
+            position += 1
+            if position <= done:
+                continue
+
+            row = _to_staging_row(item)
+            if row is None:
+                checkpoint["skipped"] += 1
+            else:
+                rows.append(row)
+
+            if len(rows) >= batch_size:
+                _copy_rows(cur, rows)
+                conn.commit()
+                staged_count += len(rows)
+                rows = []
+
+                checkpoint["files"][file_path] = position
+                _save_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed = time.perf_counter() - start_time
+                print(f"Progress: {staged_count} records staged "
+                      f"({staged_count / elapsed:,.0f} rows/sec)")
+
+        if rows:
+            _copy_rows(cur, rows)
+            conn.commit()
+            staged_count += len(rows)
+
+        # -1: 파일 전체 스테이징 완료
+        checkpoint["files"][file_path] = -1
+        _save_checkpoint(checkpoint_path, checkpoint)
+
+    # 병합 (한 번의 UPSERT) + 버전 증가 + 롤업 갱신 + 스테이징 정리를 한 트랜잭션으로
+    print("Merging staging table...")
+    merge_start = time.perf_counter()
+
+    staged_ids = f"SELECT review_id FROM {STAGING_TABLE}"
+    rollup_keys = fetch_group_keys(cur, review_id_subquery=staged_ids)
+
+    cur.execute(MERGE_SQL)
+    merged_count = cur.rowcount
+
+    data_version = None
+    if merged_count > 0:
+        # 데이터 버전 증가 → V5 Tool 결과 캐시 무효화 + 바뀐 그룹 롤업 갱신
+        data_version = bump_data_version(cur, TARGET_TABLE)
+        rollup_keys |= fetch_group_keys(cur, review_id_subquery=staged_ids)
+        refresh_rollups(cur, rollup_keys)
+
+    cur.execute(f"TRUNCATE {STAGING_TABLE}")
+
+    conn.commit()
+    merge_elapsed = time.perf_counter() - merge_start
+
+    cur.close()
+    conn.close()
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    total_elapsed = time.perf_counter() - start_time
+
+    print(f"\n=== Bulk Upload Complete ===")
+    print(f"Staged (this run): {staged_count}")
+    print(f"Merged: {merged_count} ({merge_elapsed:.1f}s)")
+    print(f"Skipped (no review_id): {checkpoint['skipped']}")
+    if data_version is not None:
+        print(f"Data version: {data_version} (rollups refreshed: {len(rollup_keys)} groups)")
+    print(f"Elapsed: {total_elapsed:.1f}s")
+    if total_elapsed > 0:
+        print(f"Throughput: {merged_count / total_elapsed:,.0f} rows/sec")
+
+    return merged_count
+
 if __name__ == "__main__":
-    # 파일 경로
+    # 파일 경로 (뒤 파일이 앞 파일을 덮어씀: 재시도 결과가 우선)
     file1 = r"C:\ReviewFW_LG_hnh\analyzed_results_5000.json"
     file2 = r"C:\ReviewFW_LG_hnh\failed_retry_results.json"
 
-    # 데이터 로드
-    data1 = load_json_file(file1)
-    data2 = load_json_file(file2)
-
-    # 합치기
-    all_data = data1 + data2
-    print(f"\nTotal records to upload: {len(all_data)}")
+    # 대용량: 스트리밍 + COPY + 단일 UPSERT
+    bulk_upload_to_db([file1, file2])
 
-    # 업로드
-    upload_to_db(all_data)
+    # 소량 데이터는 기존 방식도 사용 가능
+    # all_data = load_json_file(file1) + load_json_file(file2)
+    # upload_to_db(all_data)
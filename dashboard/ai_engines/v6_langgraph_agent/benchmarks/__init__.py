@@ -0,0 +1,12 @@
+#//==============================================================================//#
+"""
+benchmarks
+V6 성능 측정 스크립트 (dashboard/ai_engines에서 python -m으로 실행)
+
+- frontend_calls: 질문 분석 3단계(LLM 2회) vs QueryAnalyzer 통합 호출(LLM 1회)
+- typed_columns: 평점/날짜 text CAST vs 타입 컬럼(rating_num, review_dt) 조회 지연
+- image_generation: 패키징 옵션 이미지 순차 vs 병렬 생성 (가짜 Gemini 클라이언트)
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
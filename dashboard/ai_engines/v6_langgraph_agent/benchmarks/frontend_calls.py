@@ -0,0 +1,215 @@
+#//==============================================================================//#
+"""
+frontend_calls.py
+질문 분석 단계 벤치마크: 3단계 경로 vs QueryAnalyzer 통합 호출
+
+- 3단계: EntityParser(LLM) → CapabilityDetector(LLM) → ComplexityClassifier(규칙)
+- 통합: QueryAnalyzer (structured output LLM 1회 + 같은 규칙 점수)
+
+질문마다 두 경로를 번갈아 실행해 지연 시간, 토큰 사용량, 예상 비용,
+결과 일치율(브랜드/속성/분석 전략/복잡도)을 비교합니다. OPENAI_API_KEY 필요.
+
+Usage (dashboard/ai_engines에서):
+    python -m v6_langgraph_agent.benchmarks.frontend_calls --repeat 3
+    python -m v6_langgraph_agent.benchmarks.frontend_calls --queries my_queries.txt
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Dict, Any, List
+
+from ..clients import get_openai_client
+from ..nodes.entity_parser import EntityParser
+from ..nodes.capability_detector import CapabilityDetector
+from ..nodes.complexity_classifier import ComplexityClassifier, complexity_for_score
+from ..nodes.query_analyzer import QueryAnalyzer
+
+
+# gpt-4o-mini 단가 (USD / 1M tokens)
+PRICE_PER_MILLION = {"input": 0.15, "output": 0.60}
+
+# 기본 측정 질문 (FastPath에 걸리지 않는 형태 위주)
+DEFAULT_QUERIES = [
+    "빌리프 보습력 어때?",
+    "VT랑 라로슈포제 최근 3개월 평점 비교",
+    "올리브영에서 라운드랩 장점이랑 단점 같이 보여줘",
+    "바이오더티디 스팟카밍젤 평점분포",
+    "최근 6개월 쿠팡 토너 카테고리 브랜드별 감정 분포",
+    "에스트라 아토베리어 크림 재구매 이유랑 불만사항 정리해줘"
+]
+
+
+class UsageRecorder:
+    """
+    OpenAI 클라이언트 래퍼 (chat.completions.create 호출마다 지연/토큰 기록)
+
+    노드 인스턴스의 client 속성에 할당해서 사용합니다.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.calls: List[Dict[str, Any]] = []
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        start = time.perf_counter()
+        response = self._client.chat.completions.create(**kwargs)
+        usage = getattr(response, "usage", None)
+        self.calls.append({
+            "latency": time.perf_counter() - start,
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0
+        })
+        return response
+
+    def reset(self):
+        self.calls = []
+
+
+def _cost(prompt_tokens: int, completion_tokens: int) -> float:
+    return (
+        prompt_tokens * PRICE_PER_MILLION["input"]
+        + completion_tokens * PRICE_PER_MILLION["output"]
+    ) / 1_000_000
+
+
+def _summarize_calls(calls: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    prompt_tokens = sum(c["prompt_tokens"] for c in calls)
+    completion_tokens = sum(c["completion_tokens"] for c in calls)
+    return {
+        "latency": elapsed,
+        "llm_calls": len(calls),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cost": _cost(prompt_tokens, completion_tokens)
+    }
+
+
+def run_three_call(query: str, recorder: UsageRecorder) -> Dict[str, Any]:
+    """기존 경로: EntityParser → CapabilityDetector → ComplexityClassifier"""
+    parser = EntityParser()
+    detector = CapabilityDetector()
+    classifier = ComplexityClassifier()
+    parser.client = recorder
+    detector.client = recorder
+
+    recorder.reset()
+    start = time.perf_counter()
+    entities = parser.build_entities(parser.extract_entities(query))
+    capabilities = detector._detect_capabilities(query, entities)
+    complexity = complexity_for_score(
+        classifier.calculate_complexity_score(query, entities, capabilities)
+    )
+    elapsed = time.perf_counter() - start
+
+    result = _summarize_calls(recorder.calls, elapsed)
+    result["output"] = {"entities": entities, "capabilities": capabilities, "complexity": complexity}
+    return result
+
+
+def run_merged(query: str, recorder: UsageRecorder) -> Dict[str, Any]:
+    """통합 경로: QueryAnalyzer.analyze (UI 콜백 없이)"""
+    analyzer = QueryAnalyzer()
+    analyzer.client = recorder
+
+    recorder.reset()
+    start = time.perf_counter()
+    state = analyzer.analyze({"user_query": query, "conversation_history": []})
+    elapsed = time.perf_counter() - start
+
+    result = _summarize_calls(recorder.calls, elapsed)
+    result["output"] = {
+        "entities": state.get("parsed_entities"),
+        "capabilities": state.get("capabilities"),
+        "complexity": state.get("complexity"),
+        "error": state.get("error")
+    }
+    return result
+
+
+def _agreement(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, bool]:
+    """두 경로 결과 비교 (브랜드/속성은 순서 무시)"""
+    ea, eb = a.get("entities") or {}, b.get("entities") or {}
+    return {
+        "brands": sorted(ea.get("brands", [])) == sorted(eb.get("brands", [])),
+        "attributes": sorted(ea.get("attributes", [])) == sorted(eb.get("attributes", [])),
+        "capabilities": a.get("capabilities") == b.get("capabilities"),
+        "complexity": (a.get("complexity") or {}).get("level") == (b.get("complexity") or {}).get("level")
+    }
+
+
+def _print_summary(name: str, runs: List[Dict[str, Any]]):
+    latencies = [r["latency"] for r in runs]
+    print(
+        f"{name:<10} "
+        f"latency p50={statistics.median(latencies):.2f}s mean={statistics.mean(latencies):.2f}s | "
+        f"LLM calls={statistics.mean(r['llm_calls'] for r in runs):.1f} | "
+        f"tokens in={statistics.mean(r['prompt_tokens'] for r in runs):.0f} "
+        f"out={statistics.mean(r['completion_tokens'] for r in runs):.0f} | "
+        f"cost=${statistics.mean(r['cost'] for r in runs):.6f}/query"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="질문 분석 단계 벤치마크 (3단계 vs 통합)")
+    arg_parser.add_argument("--repeat", type=int, default=1, help="질문별 반복 횟수")
+    arg_parser.add_argument("--queries", type=str, default=None, help="질문 파일 (한 줄에 하나)")
+    arg_parser.add_argument("--json", type=str, default=None, help="질문별 상세 결과 저장 경로")
+    args = arg_parser.parse_args()
+
+    if not os.getenv("OPENAI_API_KEY"):
+        print("OPENAI_API_KEY가 설정되어 있지 않습니다.")
+        return
+
+    queries = DEFAULT_QUERIES
+    if args.queries:
+        with open(args.queries, "r", encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+
+    recorder = UsageRecorder(get_openai_client())
+    three_runs, merged_runs, details = [], [], []
+
+    for query in queries:
+        for i in range(args.repeat):
+            # 순서 효과(연결 재사용 등)를 줄이기 위해 번갈아 먼저 실행
+            if i % 2 == 0:
+                three = run_three_call(query, recorder)
+                merged = run_merged(query, recorder)
+            else:
+                merged = run_merged(query, recorder)
+                three = run_three_call(query, recorder)
+
+            three_runs.append(three)
+            merged_runs.append(merged)
+            agreement = _agreement(three["output"], merged["output"])
+            details.append({"query": query, "three_call": three, "merged": merged, "agreement": agreement})
+
+            print(
+                f"[{query}] 3단계 {three['latency']:.2f}s / 통합 {merged['latency']:.2f}s "
+                f"| 일치: {', '.join(k for k, v in agreement.items() if v) or '-'}"
+            )
+
+    print("\n=== 요약 ===")
+    _print_summary("3단계", three_runs)
+    _print_summary("통합", merged_runs)
+
+    total = len(details)
+    for key in ("brands", "attributes", "capabilities", "complexity"):
+        matched = sum(1 for d in details if d["agreement"][key])
+        print(f"일치율 {key:<12} {matched}/{total}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(details, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\n상세 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#//==============================================================================//#
+"""
+image_generation.py
+ImageGenerator 패키징 옵션 생성 벤치마크 (가짜 Gemini 클라이언트, API 키 불필요)
+
+FakeImageClient는 generate_content 호출마다 지정한 지연 후 단색 PNG를 돌려줍니다.
+max_workers=1(기존 순차 방식과 동일)과 병렬 실행을 비교하고, ui_callback으로
+이미지가 완성 순서대로 전달되는지, 느린 옵션이 request_timeout에서 잘리는지 확인합니다.
+마지막으로 같은 요청을 한 번 더 실행해 디자인 캐시 재사용(API 호출 0회)을 확인합니다.
+생성 이미지와 캐시는 임시 폴더에 저장 후 삭제합니다.
+
+벤치마크 전에 check_behavior()가 같은 가짜 클라이언트로 동작을 assert로 확인합니다:
+- 결과 이미지는 완성 순서와 관계없이 패키징 옵션 순서
+- ui_callback: running → 옵션별 image_ready (완성 순서) → completed
+- request_timeout을 넘긴 옵션만 제외, 모든 옵션이 넘으면 오류
+- max_workers=1이면 동시 요청 1개, 캐시 재요청은 API 호출 0회
+
+Usage (dashboard/ai_engines에서):
+    python -m v6_langgraph_agent.benchmarks.image_generation
+    python -m v6_langgraph_agent.benchmarks.image_generation --latency 1.5 --slow 5 --timeout 3
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import argparse
+import shutil
+import tempfile
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Any, List
+
+from PIL import Image
+
+from ..design_cache import DesignCache
+from ..nodes.image_generator import ImageGenerator
+
+
+class FakeImageClient:
+    """
+    Gemini 클라이언트 대체 (client.models.generate_content만 구현)
+
+    Args:
+        latency: 기본 응답 지연 (초)
+        slow: {패키징 타입 일부 문자열: 지연} - 특정 옵션만 느리게
+    """
+
+    def __init__(self, latency: float = 1.0, slow: Dict[str, float] = None):
+        self.latency = latency
+        self.slow = slow or {}
+        self.models = self
+        self.calls = 0
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, model: str, contents: List[Any], config: Any = None):
+        prompt = contents[-1]
+        delay = next((d for key, d in self.slow.items() if key in prompt), self.latency)
+
+        with self._lock:
+            self.calls += 1
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+        try:
+            time.sleep(delay)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+        buffer = BytesIO()
+        Image.new("RGB", (64, 64), (255, 200, 210)).save(buffer, format="PNG")
+        part = SimpleNamespace(inline_data=SimpleNamespace(data=buffer.getvalue()))
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+def run(generator: ImageGenerator, source_path: Path) -> Dict[str, Any]:
+    """ImageGenerator.generate 한 번 실행 (ui_callback 이벤트 기록)"""
+    events = []
+    start = time.perf_counter()
+
+    def ui_callback(progress):
+        events.append((time.perf_counter() - start, progress))
+
+    state = {
+        "user_query": "빌리프 수분크림 다이소 버전 디자인 만들어줘",
+        "design_prompt": "Daiso packaging redesign.\nTRANSFORMATION REQUIREMENTS:\n- keep brand colors",
+        "source_product_image": str(source_path),
+        "ui_callback": ui_callback,
+        "error": None
+    }
+    state = generator.generate(state)
+
+    return {
+        "elapsed": time.perf_counter() - start,
+        "images": state.get("generated_images") or [],
+        "error": state.get("error"),
+        "events": events
+    }
+
+
+def _new_generator(cache_dir: Path, client: FakeImageClient, max_workers: int = None,
+                   request_timeout: float = None) -> ImageGenerator:
+    """가짜 클라이언트 + 임시 캐시 폴더를 쓰는 ImageGenerator"""
+    generator = ImageGenerator()
+    generator.design_cache = DesignCache(cache_dir, enabled=True)
+    generator.client = client
+    if max_workers:
+        generator.max_workers = max_workers
+    if request_timeout:
+        generator.request_timeout = request_timeout
+    return generator
+
+
+def _ready_events(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """image_ready 이벤트 (도착 순서)"""
+    return [p for _, p in result["events"] if isinstance(p, dict) and p.get("status") == "image_ready"]
+
+
+def _statuses(result: Dict[str, Any]) -> List[str]:
+    return [p.get("status") for _, p in result["events"] if isinstance(p, dict)]
+
+
+def check_behavior(work_dir: Path, source_path: Path):
+    """옵션 순서 / ui_callback 이벤트 / 타임아웃 / 캐시 재사용 확인 (실패 시 AssertionError)"""
+    option_types = [p["type"] for p in ImageGenerator().packaging_options]
+
+    # 1. 첫 번째 옵션(샤쉐)이 가장 늦게 완성돼도 결과는 옵션 순서, UI는 완성 순서
+    client = FakeImageClient(latency=0.1, slow={"7 individual sachets": 0.5})
+    generator = _new_generator(work_dir / "check_order", client)
+    result = run(generator, source_path)
+    assert result["error"] is None, result["error"]
+    assert [image["packaging_type"] for image in result["images"]] == option_types
+    ready = _ready_events(result)
+    assert len(ready) == len(option_types)
+    assert ready[-1]["image"]["packaging_type"] == option_types[0], "가장 늦은 옵션이 마지막에 표시되어야 함"
+    statuses = _statuses(result)
+    assert statuses[0] == "running" and statuses[-1] == "completed", statuses
+    assert client.max_concurrent == len(option_types), client.max_concurrent
+
+    # 2. 같은 요청 재실행 → 디자인 캐시에서 전부 재사용 (API 호출 0회, 생성 단계 없음)
+    generator.client = FakeImageClient(latency=0.1)
+    cached = run(generator, source_path)
+    assert generator.client.calls == 0
+    assert [image["packaging_type"] for image in cached["images"]] == option_types
+    assert all(image.get("cache_hit") for image in cached["images"])
+    assert all("이전 결과 재사용" in p["message"] for p in _ready_events(cached))
+    assert "running" not in _statuses(cached)
+
+    # 3. max_workers=1 → 기존 순차 방식과 동일하게 한 번에 하나씩
+    client = FakeImageClient(latency=0.05)
+    result = run(_new_generator(work_dir / "check_sequential", client, max_workers=1), source_path)
+    assert client.max_concurrent == 1 and client.calls == len(option_types)
+    assert [image["packaging_type"] for image in result["images"]] == option_types
+
+    # 4. 미니 보틀만 request_timeout 초과 → 나머지 두 옵션만, 오류 없이 마감 시각에 반환
+    client = FakeImageClient(latency=0.1, slow={"Mini version": 1.5})
+    result = run(_new_generator(work_dir / "check_timeout", client, request_timeout=0.5), source_path)
+    assert result["error"] is None, result["error"]
+    assert [image["packaging_type"] for image in result["images"]] == option_types[:2]
+    assert all(p["image"]["packaging_type"] != "mini_bottle" for p in _ready_events(result))
+    assert result["elapsed"] < 1.5, f"느린 옵션을 기다림 ({result['elapsed']:.2f}s)"
+
+    # 5. 모든 옵션 시간 초과 → 오류 상태, 이미지 없음
+    client = FakeImageClient(latency=1.0)
+    result = run(_new_generator(work_dir / "check_all_timeout", client, request_timeout=0.2), source_path)
+    assert result["error"] is not None and not result["images"]
+    assert not _ready_events(result)
+
+    print("✅ 동작 확인 통과 (옵션 순서, ui_callback 이벤트, 타임아웃, 캐시 재사용)\n")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="ImageGenerator 병렬 생성 벤치마크 (가짜 클라이언트)")
+    arg_parser.add_argument("--latency", type=float, default=1.0, help="옵션별 응답 지연 (초)")
+    arg_parser.add_argument("--slow", type=float, default=None, help="미니 보틀 옵션만 이 지연으로 (타임아웃 확인용)")
+    arg_parser.add_argument("--timeout", type=float, default=None, help="request_timeout 덮어쓰기 (초)")
+    args = arg_parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="v6_image_bench_"))
+    try:
+        source_path = work_dir / "source.png"
+        Image.new("RGB", (64, 64), (240, 240, 240)).save(source_path)
+
+        check_behavior(work_dir, source_path)
+
+        slow = {"Mini version": args.slow} if args.slow else {}
+
+        generator = None
+        for name, workers in (("순차 (max_workers=1)", 1), ("병렬", None), ("병렬 재요청 (캐시)", None)):
+            if generator is None or "캐시" not in name:
+                generator = ImageGenerator()
+                generator.design_cache = DesignCache(work_dir / name.split()[0], enabled=True)
+            generator.client = FakeImageClient(latency=args.latency, slow=slow)
+            if workers:
+                generator.max_workers = workers
+            if args.timeout:
+                generator.request_timeout = args.timeout
+
+            result = run(generator, source_path)
+            ready = [(t, p["message"]) for t, p in result["events"] if isinstance(p, dict) and p.get("status") == "image_ready"]
+
+            print(f"=== {name} ===")
+            print(
+                f"총 {result['elapsed']:.2f}s | 이미지 {len(result['images'])}장 | "
+                f"API 호출 {generator.client.calls}회 (최대 동시 {generator.client.max_concurrent})"
+            )
+            for t, message in ready:
+                print(f"  +{t:.2f}s {message}")
+            if result["error"]:
+                print(f"  오류: {result['error'].get('message')}")
+            print()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#//==============================================================================//#
+"""
+typed_columns.py
+평점/날짜 조회 벤치마크: text CAST vs 타입 컬럼(rating_num, review_dt)
+
+V6가 자주 만드는 쿼리 형태(기간 조건 평균 평점, 월별 추이, 최근 리뷰 정렬,
+제품명 조회)를 CAST 버전과 타입 컬럼 버전으로 번갈아 실행해
+지연 시간(p50/p95)을 비교합니다. --explain이면 EXPLAIN ANALYZE 계획도 출력합니다.
+
+타입 컬럼이 없으면 먼저 마이그레이션을 실행하세요:
+    python dashboard/ai_engines/v5_langgraph_agent/utils/review_typed_columns.py
+
+Usage (dashboard/ai_engines에서):
+    python -m v6_langgraph_agent.benchmarks.typed_columns --repeat 20
+    python -m v6_langgraph_agent.benchmarks.typed_columns --brand 라운드랩 --explain
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import argparse
+import statistics
+import time
+from typing import Dict, Any, List
+
+import psycopg2
+
+from ..config import DB_CONFIG
+from ..data_version import typed_columns_available, review_column_exprs
+
+
+# {name: (SQL 템플릿, 파라미터 키)} - {rating}/{date}를 CAST 식 또는 타입 컬럼으로 치환
+QUERIES = {
+    "avg_rating_period": (
+        """SELECT COUNT(*), ROUND(AVG({rating})::numeric, 2)
+FROM preprocessed_reviews
+WHERE brand = %(brand)s AND {date} >= %(start)s AND {date} <= %(end)s""",
+        ["brand", "start", "end"]
+    ),
+    "monthly_trend": (
+        """SELECT DATE_TRUNC('month', {date}) AS month, ROUND(AVG({rating})::numeric, 2), COUNT(*)
+FROM preprocessed_reviews
+WHERE brand = %(brand)s AND {date} IS NOT NULL
+GROUP BY 1
+ORDER BY 1""",
+        ["brand"]
+    ),
+    "recent_samples": (
+        """SELECT review_clean, rating, review_date
+FROM preprocessed_reviews
+WHERE brand = %(brand)s
+ORDER BY {date} DESC NULLS LAST
+LIMIT 10""",
+        ["brand"]
+    ),
+    "product_lookup": (
+        """SELECT COUNT(*), ROUND(AVG({rating})::numeric, 2)
+FROM preprocessed_reviews
+WHERE product_name = %(product)s""",
+        ["product"]
+    )
+}
+
+
+def _pick_params(cur, brand: str = None) -> Dict[str, Any]:
+    """측정용 파라미터 (기본: 리뷰가 가장 많은 브랜드/제품, 최근 3개월)"""
+    if brand is None:
+        cur.execute("""
+            SELECT brand FROM preprocessed_reviews
+            WHERE brand IS NOT NULL
+            GROUP BY brand ORDER BY COUNT(*) DESC LIMIT 1
+        """)
+        brand = cur.fetchone()[0]
+
+    cur.execute("""
+        SELECT product_name FROM preprocessed_reviews
+        WHERE brand = %s AND product_name IS NOT NULL
+        GROUP BY product_name ORDER BY COUNT(*) DESC LIMIT 1
+    """, (brand,))
+    row = cur.fetchone()
+
+    cur.execute("SELECT MAX(review_dt) FROM preprocessed_reviews")
+    end = cur.fetchone()[0]
+    cur.execute("SELECT (%s::date - INTERVAL '3 months')::date", (end,))
+    start = cur.fetchone()[0]
+
+    return {"brand": brand, "product": row[0] if row else "", "start": start, "end": end}
+
+
+def _render(template: str, typed: bool) -> str:
+    columns = review_column_exprs(typed)
+    return template.format(rating=columns["rating"], date=columns["date"])
+
+
+def _timed(cur, sql: str, params: Dict[str, Any]) -> float:
+    start = time.perf_counter()
+    cur.execute(sql, params)
+    cur.fetchall()
+    return time.perf_counter() - start
+
+
+def _explain(cur, sql: str, params: Dict[str, Any]) -> str:
+    cur.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params)
+    return "\n".join(row[0] for row in cur.fetchall())
+
+
+def _p95(values: List[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="평점/날짜 조회 벤치마크 (CAST vs 타입 컬럼)")
+    arg_parser.add_argument("--repeat", type=int, default=10, help="쿼리별 반복 횟수")
+    arg_parser.add_argument("--brand", type=str, default=None, help="측정할 브랜드 (기본: 리뷰 최다 브랜드)")
+    arg_parser.add_argument("--explain", action="store_true", help="EXPLAIN ANALYZE 계획 출력")
+    args = arg_parser.parse_args()
+
+    if not typed_columns_available():
+        print("preprocessed_reviews에 rating_num/review_dt 컬럼이 없습니다.")
+        print("먼저 실행: python dashboard/ai_engines/v5_langgraph_agent/utils/review_typed_columns.py")
+        return
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        with conn.cursor() as cur:
+            params = _pick_params(cur, args.brand)
+            print(f"파라미터: {params}\n")
+
+            for name, (template, keys) in QUERIES.items():
+                query_params = {k: params[k] for k in keys}
+                variants = {"cast": _render(template, False), "typed": _render(template, True)}
+
+                # 워밍업 (캐시/계획 준비)
+                for sql in variants.values():
+                    _timed(cur, sql, query_params)
+
+                timings = {"cast": [], "typed": []}
+                for i in range(args.repeat):
+                    # 순서 효과를 줄이기 위해 번갈아 먼저 실행
+                    order = ["cast", "typed"] if i % 2 == 0 else ["typed", "cast"]
+                    for variant in order:
+                        timings[variant].append(_timed(cur, variants[variant], query_params))
+
+                cast_p50 = statistics.median(timings["cast"])
+                typed_p50 = statistics.median(timings["typed"])
+                print(
+                    f"{name:<18} "
+                    f"cast p50={cast_p50 * 1000:.1f}ms p95={_p95(timings['cast']) * 1000:.1f}ms | "
+                    f"typed p50={typed_p50 * 1000:.1f}ms p95={_p95(timings['typed']) * 1000:.1f}ms | "
+                    f"x{cast_p50 / typed_p50 if typed_p50 else 0:.1f}"
+                )
+
+                if args.explain:
+                    for variant, sql in variants.items():
+                        print(f"\n--- {name} ({variant}) ---")
+                        print(_explain(cur, sql, query_params))
+                    print()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#//==============================================================================//#
+"""
+clients.py
+프로세스 공유 LLM 클라이언트 (OpenAI, Gemini)
+
+- 노드마다 OpenAI()를 만들면 질문마다 새 HTTP 연결(TLS 핸드셰이크)부터 시작함
+- 프로세스 전체에서 httpx 연결 풀 하나를 공유하고, 클라이언트는 API 키별로 1개만 생성
+- API 키는 호출 시점의 환경변수에서 읽음 (페이지에서 세션마다 OPENAI_API_KEY를 설정)
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import os
+import logging
+import threading
+from typing import Dict, Optional
+
+import httpx
+from openai import OpenAI
+
+from .config import HTTP_CLIENT_CONFIG
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.clients")
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_openai_clients: Dict[str, OpenAI] = {}
+_gemini_clients: Dict[str, object] = {}
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 공유 httpx 클라이언트 (keep-alive 연결 풀)"""
+    global _http_client
+
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=HTTP_CLIENT_CONFIG["max_connections"],
+                    max_keepalive_connections=HTTP_CLIENT_CONFIG["max_keepalive_connections"],
+                    keepalive_expiry=HTTP_CLIENT_CONFIG["keepalive_expiry"]
+                ),
+                timeout=HTTP_CLIENT_CONFIG["timeout"]
+            )
+        return _http_client
+
+
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    API 키별 공유 OpenAI 클라이언트
+
+    Args:
+        api_key: None이면 OPENAI_API_KEY 환경변수 사용
+
+    Returns:
+        OpenAI 클라이언트 (모든 키가 같은 HTTP 연결 풀 사용)
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY") or ""
+
+    client = _openai_clients.get(api_key)
+    if client is not None:
+        return client
+
+    http_client = get_http_client()
+    with _lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            # 키가 비어 있으면 OpenAI()가 인증 에러를 내도록 그대로 전달
+            client = OpenAI(api_key=api_key or None, http_client=http_client)
+            _openai_clients[api_key] = client
+            logger.debug(f"OpenAI 클라이언트 생성 (총 {len(_openai_clients)}개)")
+        return client
+
+
+def _resolve_gemini_api_key() -> Optional[str]:
+    """Gemini API 키 조회 (환경변수 → Streamlit secrets)"""
+    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+
+    if not api_key:
+        try:
+            import streamlit as st
+            api_key = st.secrets.get("GEMINI_API_KEY") or st.secrets.get("GOOGLE_API_KEY")
+        except Exception:
+            pass
+
+    return api_key
+
+
+def get_gemini_client():
+    """
+    API 키별 공유 Gemini 클라이언트
+
+    Raises:
+        ValueError: API 키를 찾을 수 없음
+    """
+    api_key = _resolve_gemini_api_key()
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY not found in environment variables or Streamlit secrets")
+
+    client = _gemini_clients.get(api_key)
+    if client is not None:
+        return client
+
+    from google import genai
+
+    with _lock:
+        client = _gemini_clients.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            _gemini_clients[api_key] = client
+        return client
+
+
+class SharedOpenAIClient:
+    """
+    노드 클래스 속성용 디스크립터 (self.client 접근 시 공유 OpenAI 클라이언트 반환)
+
+    Example:
+        class EntityParser:
+            client = SharedOpenAIClient()
+    """
+
+    def __get__(self, obj, objtype=None) -> OpenAI:
+        return get_openai_client()
+
+
+class SharedGeminiClient:
+    """노드 클래스 속성용 디스크립터 (self.client 접근 시 공유 Gemini 클라이언트 반환)"""
+
+    def __get__(self, obj, objtype=None):
+        return get_gemini_client()
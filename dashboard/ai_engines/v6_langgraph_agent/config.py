@@ -71,11 +71,13 @@ LLM_CONFIG = {
     "provider": "openai",
     "model": "gpt-4o-mini",
     "max_tokens": 16384,  # 4096 → 16384 (gpt-4o-mini 최대 출력)
+    "max_concurrent_requests": 4,  # 노드 안에서 동시에 보낼 LLM 요청 수 (SQL 생성 등)
 
     # 노드별 temperature 설정
     "temperature": {
         "entity_parser": 0.0,        # 정확한 엔티티 추출
         "capability_detector": 0.0,  # 정확한 capability 판단
+        "query_analyzer": 0.0,       # 엔티티 + capability 통합 판단
         "sql_generator": 0.0,        # 정확한 SQL 생성
         "response_planner": 0.0,     # 정확한 시각화 판단
         "output_generator": 0.3,     # 자연스러운 텍스트 생성
@@ -83,6 +85,14 @@ LLM_CONFIG = {
     }
 }
 
+# LLM HTTP 연결 설정 (프로세스 공유 클라이언트, clients.py)
+HTTP_CLIENT_CONFIG = {
+    "max_connections": 20,            # 동시 연결 최대 수
+    "max_keepalive_connections": 10,  # keep-alive로 유지할 연결 수
+    "keepalive_expiry": 60.0,         # 유휴 연결 유지 시간 (초)
+    "timeout": 120.0                  # 요청 타임아웃 (초)
+}
+
 
 # 3. JSONB 필드 매핑
 # preprocessed_reviews 테이블의 analysis JSONB 구조
@@ -145,8 +155,10 @@ VISUALIZATION_CONFIG = {
     # 스트리밍 설정
     "streaming": {
         "text_first": True,   # 텍스트 먼저 스트리밍
-        "chart_async": True   # 차트 비동기 로딩
-    }
+        "chart_async": True   # 차트를 요약 LLM 호출과 동시에 생성 (OutputGenerator 스레드 풀)
+    },
+
+    "render_workers": 4  # 차트/워드클라우드 동시 생성 스레드 수
 }
 
 
@@ -180,7 +192,9 @@ PROGRESS_CONFIG = {
 
 # 6. 노드별 아이콘
 NODE_ICONS = {
+    "FastPath": "🚀",
     "EntityParser": "🔍",
+    "QueryAnalyzer": "🧭",
     "CapabilityDetector": "📊",
     "SQLGenerator": "💾",
     "Executor": "⚡",
@@ -342,3 +356,93 @@ DEBUG_CONFIG = {
     "max_prompt_length": 1000,  # 프롬프트 표시 최대 길이 (너무 길면 잘라냄)
     "max_response_length": 1000,  # 응답 표시 최대 길이
 }
+
+
+# 13. 쿼리 실행 설정 (Executor)
+EXECUTOR_CONFIG = {
+    "max_workers": 4,          # 동시에 실행할 쿼리 수
+    "deadline_seconds": 30,    # 모든 쿼리가 공유하는 실행 마감 시간 (초)
+    "pool_min_connections": 1, # 프로세스 공유 커넥션 풀 최소 연결 수
+    "pool_max_connections": 8  # 최대 연결 수 (여러 세션이 함께 사용)
+}
+
+
+# 14. 쿼리 캐시 설정 (query_cache.py)
+CACHE_CONFIG = {
+    "enabled": True,
+    "sql_cache_max_entries": 256,      # 질문+엔티티 → SQL 캐시 항목 수
+    "result_cache_max_entries": 128,   # SQL+데이터 버전 → 결과 캐시 항목 수
+    "result_cache_max_rows": 200000    # 결과 캐시 전체 행 수 상한
+}
+
+
+# 15. 템플릿 질문 Fast Path 설정 (nodes/fast_path.py)
+FAST_PATH_CONFIG = {
+    "enabled": True,
+    "min_confidence": 0.8  # 이 값 미만이면 LLM 체인(EntityParser~SQLGenerator)으로 처리
+}
+
+
+# 16. 통합 질문 분석 설정 (nodes/query_analyzer.py)
+QUERY_ANALYZER_CONFIG = {
+    "enabled": False,   # True면 EntityParser/CapabilityDetector/ComplexityClassifier 대신 LLM 1회로 분석
+    "max_tokens": 1024  # 엔티티 + 전략 JSON만 받으므로 짧게
+}
+
+
+# 17. 사용 기록 로깅 설정 (query_logger.py 백그라운드 저장)
+LOGGER_CONFIG = {
+    "queue_max_size": 1000,   # 대기 로그 최대 수 (넘으면 버림, 응답은 기다리지 않음)
+    "batch_size": 50,         # 한 번에 INSERT할 최대 로그 수
+    "flush_interval": 0.2,    # 배치를 모으는 최대 시간 (초)
+    "db_timeout": 10.0,       # DB 연결 대기 최대 시간 (초)
+    "resolve_timeout": 2.0,   # 피드백용 log_id를 기다리는 최대 시간 (초)
+    "flush_timeout": 5.0      # 프로세스 종료 시 남은 로그 저장 대기 (초)
+}
+
+
+# 18. SQL 실행 전 비용 검사 (sql_guard.py, Executor/SQLRefiner)
+SQL_GUARD_CONFIG = {
+    "enabled": True,
+    "max_rows": 5000,                 # 예상 행 수가 넘으면 바깥에 LIMIT 추가
+    "auto_limit": 1000,               # 추가하는 LIMIT
+    "max_cost": 2000000,              # LIMIT 추가 후에도 예상 cost가 넘으면 실행 거부
+    "statement_timeout_seconds": 15,  # 쿼리별 최대 실행 시간 (공유 마감 시간이 더 짧으면 그쪽)
+    "stats_file": "logs/v6_chatbot/sql_guard_stats.jsonl"  # 예상 vs 실제 기록 (None이면 로그만)
+}
+
+
+# 19. 요약 프롬프트 결과 압축 (result_compactor.py, OutputGenerator)
+RESULT_COMPACTOR_CONFIG = {
+    "token_budget": 6000,      # SQL 결과 부분 최대 토큰 (넘으면 결과별 프로필 + 대표 행)
+    "encoding": "o200k_base",  # gpt-4o 계열 tiktoken 인코딩
+    "text_max_chars": 200,     # 프로필 대표 행의 긴 텍스트 자르기
+    "max_strata": 8            # 층화 샘플 기준 컬럼의 최대 값 종류 수
+}
+
+
+# 20. 디자인 이미지 생성 설정 (nodes/image_generator.py)
+IMAGE_GENERATION_CONFIG = {
+    "model": "gemini-2.5-flash-image",
+    "max_workers": 3,         # 패키징 옵션 동시 생성 수
+    "request_timeout": 120    # 옵션별 최대 대기 시간 (초, 모든 요청이 동시에 시작)
+}
+
+
+# 21. 디자인 프롬프트/이미지 디스크 캐시 (design_cache.py, ImagePromptGenerator/ImageGenerator)
+DESIGN_CACHE_CONFIG = {
+    "enabled": True,
+    "cache_dir": None,                # None이면 dashboard/generated_images/daiso/design_cache (캐시 전용 폴더)
+    "max_bytes": 500 * 1024 * 1024,   # PNG + 인덱스 최대 용량 (넘으면 오래 사용하지 않은 파일부터 삭제)
+    "prompt_version": "2025.11.02"    # 디자인/패키징 프롬프트를 바꾸면 올림 (예전 캐시 무효화)
+}
+
+
+# 22. 디자인 프롬프트 입력 조회 (nodes/image_prompt_generator.py)
+DESIGN_INPUT_CONFIG = {
+    "oy_review_limit": 200,            # 올리브영 제품 키워드 집계 대상 리뷰 수
+    "oy_top_keywords": 10,             # 올리브영 제품 상위 키워드 수
+    "daiso_review_limit": 100,         # Daiso 채널 키워드 집계 대상 리뷰 수
+    "daiso_top_keywords": 15,          # Daiso 채널 상위 키워드 수
+    "precompute_daiso_summary": True   # 노드 생성 시 Daiso 채널 요약을 백그라운드로 미리 계산
+}
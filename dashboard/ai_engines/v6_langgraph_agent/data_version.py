@@ -0,0 +1,134 @@
+#//==============================================================================//#
+"""
+data_version.py
+preprocessed_reviews 데이터 버전 / 롤업 상태 / 타입 컬럼 조회
+
+- 업로드 스크립트(v5 utils/upload_preprocessed_data.py 등)가 업로드할 때마다
+  data_versions 테이블의 버전을 올리고, 롤업 테이블을 갱신한 뒤 review_rollups 버전을 맞춤
+- 평점/날짜 타입 컬럼(rating_num, review_dt)은 v5 utils/review_typed_columns.py가 추가
+- V6는 이 값을 읽기만 함 (매 질문마다 DB를 조회하지 않도록 check_interval 동안 재사용)
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Set
+
+import psycopg2
+
+from .config import DB_CONFIG
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.data_version")
+
+DATA_VERSION_TABLE = "data_versions"
+SOURCE_TABLE = "preprocessed_reviews"
+ROLLUP_VERSION_KEY = "review_rollups"
+
+# 타입 컬럼 (v5 utils/review_typed_columns.py와 동일)
+RATING_COLUMN = "rating_num"
+DATE_COLUMN = "review_dt"
+
+# 버전 재조회 간격 (초)
+CHECK_INTERVAL = 30
+
+_lock = threading.Lock()
+_cached_versions: Optional[Dict[str, int]] = None
+_cached_columns: Set[str] = set()
+_checked_at = 0.0
+
+
+def get_versions(force: bool = False) -> Dict[str, int]:
+    """
+    data_versions 전체 조회 (check_interval 동안 캐시)
+
+    Args:
+        force: True면 캐시 무시하고 다시 조회
+
+    Returns:
+        {table_name: version} (테이블이 없거나 조회 실패 시 빈 dict)
+    """
+    global _cached_versions, _cached_columns, _checked_at
+
+    now = time.time()
+    with _lock:
+        if not force and _cached_versions is not None and now - _checked_at < CHECK_INTERVAL:
+            return _cached_versions
+
+    versions: Dict[str, int] = {}
+    columns: Set[str] = set()
+    conn = None
+    try:
+        conn = psycopg2.connect(**DB_CONFIG)
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT to_regclass('{DATA_VERSION_TABLE}') IS NOT NULL")
+            if cur.fetchone()[0]:
+                cur.execute(f"SELECT table_name, version FROM {DATA_VERSION_TABLE}")
+                versions = {name: version for name, version in cur.fetchall()}
+
+            # 같은 연결에서 타입 컬럼 존재 여부도 확인
+            cur.execute("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = %s AND column_name = ANY(%s)
+            """, (SOURCE_TABLE, [RATING_COLUMN, DATE_COLUMN]))
+            columns = {row[0] for row in cur.fetchall()}
+    except Exception as e:
+        logger.warning(f"데이터 버전 조회 실패: {e}")
+    finally:
+        if conn is not None:
+            conn.close()
+
+    with _lock:
+        _cached_versions = versions
+        _cached_columns = columns
+        _checked_at = now
+
+    return versions
+
+
+def get_data_version(table_name: str = SOURCE_TABLE) -> Optional[int]:
+    """
+    테이블 데이터 버전
+
+    Returns:
+        버전 (data_versions에 없으면 0, 테이블이 없거나 조회 실패 시 None)
+    """
+    versions = get_versions()
+    if not versions:
+        return None
+    return versions.get(table_name, 0)
+
+
+def rollups_available() -> bool:
+    """롤업 테이블(review_rollup_*)이 현재 preprocessed_reviews와 일치하는지"""
+    versions = get_versions()
+    if ROLLUP_VERSION_KEY not in versions:
+        return False
+    return versions[ROLLUP_VERSION_KEY] == versions.get(SOURCE_TABLE, 0)
+
+
+def typed_columns_available() -> bool:
+    """preprocessed_reviews에 rating_num/review_dt 타입 컬럼이 있는지"""
+    get_versions()
+    return _cached_columns == {RATING_COLUMN, DATE_COLUMN}
+
+
+def review_column_exprs(typed: Optional[bool] = None) -> Dict[str, str]:
+    """
+    평점/날짜 SQL 식 (타입 컬럼이 있으면 컬럼 그대로, 없으면 CAST)
+
+    Args:
+        typed: 타입 컬럼 사용 여부 (None이면 조회)
+
+    Returns:
+        {"rating": 평점 숫자 식, "date": 날짜 식}
+    """
+    if typed is None:
+        typed = typed_columns_available()
+    if typed:
+        return {"rating": RATING_COLUMN, "date": DATE_COLUMN}
+    return {"rating": "CAST(rating AS FLOAT)", "date": "CAST(review_date AS DATE)"}
@@ -0,0 +1,101 @@
+#//==============================================================================//#
+"""
+db_pool.py
+프로세스 공유 PostgreSQL 커넥션 풀
+
+- 질문마다 psycopg2.connect()를 새로 하지 않고 연결을 재사용
+- 풀이 가득 차면 PoolError 대신 빈 연결이 생길 때까지 대기 (timeout 지정 가능)
+- 연결 오류가 난 커넥션은 풀에 돌려놓지 않고 닫음
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+from .config import DB_CONFIG, EXECUTOR_CONFIG
+from .errors import TimeoutError
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.db_pool")
+
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(EXECUTOR_CONFIG["pool_max_connections"])
+
+
+def get_pool() -> ThreadedConnectionPool:
+    """프로세스 공유 커넥션 풀 (첫 호출 때 생성)"""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    EXECUTOR_CONFIG["pool_min_connections"],
+                    EXECUTOR_CONFIG["pool_max_connections"],
+                    **DB_CONFIG
+                )
+                logger.info(f"커넥션 풀 생성 (최대 {EXECUTOR_CONFIG['pool_max_connections']}개)")
+    return _pool
+
+
+@contextmanager
+def pooled_connection(timeout: Optional[float] = None):
+    """
+    풀에서 연결 하나를 빌려 쓰고 반납
+
+    블록이 끝나면 rollback 후 반납하므로 SET LOCAL 설정이나 실패한 트랜잭션이
+    다음 사용자에게 넘어가지 않습니다.
+
+    Args:
+        timeout: 빈 연결을 기다릴 최대 시간 (초, None이면 무한 대기)
+
+    Raises:
+        TimeoutError: timeout 안에 연결을 얻지 못함
+
+    Example:
+        with pooled_connection(timeout=5) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+    """
+    if not _slots.acquire(timeout=timeout):
+        raise TimeoutError("Executor", "DB 연결 대기 시간 초과")
+
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+    except Exception:
+        _slots.release()
+        raise
+
+    broken = False
+    try:
+        yield conn
+    except (psycopg2.InterfaceError, psycopg2.OperationalError) as e:
+        # 타임아웃(QueryCanceled)은 연결 자체는 정상
+        broken = not isinstance(e, psycopg2.extensions.QueryCanceledError)
+        raise
+    finally:
+        try:
+            if not conn.closed:
+                conn.rollback()
+        except psycopg2.Error:
+            broken = True
+        pool.putconn(conn, close=broken or bool(conn.closed))
+        _slots.release()
+
+
+def close_pool():
+    """풀의 모든 연결 종료 (테스트/프로세스 종료 시)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
@@ -0,0 +1,438 @@
+#//==============================================================================//#
+"""
+design_cache.py
+다이소 패키징 디자인 캐시 (디스크, 프로세스 간 공유)
+
+같은 제품 디자인을 다시 요청하면 ImagePromptGenerator(LLM 2회 + DB 조회)와
+ImageGenerator(이미지 3장)를 처음부터 다시 실행하던 것을 캐시합니다.
+
+키: 원본 제품 이미지 내용 해시 + 브랜드 + 제품 + 프롬프트 버전 (+ 패키징 타입)
+- 프롬프트 항목: design_prompt, design_keywords, daiso_channel_summary
+- 이미지 항목: 패키징 옵션별 생성 이미지 정보 (local_path는 root 폴더의 PNG)
+- root는 캐시 전용 폴더 (기본: generated_images/daiso/design_cache, 다른 생성 이미지와 분리)
+- 채널 요약 항목: Daiso 채널 키워드 요약 (제품과 무관, 데이터 버전별)
+- 키워드 번역 사전: root/keyword_translations.json (한글 → 영어, 용량 정리 대상 아님)
+
+PNG는 내용 해시로 파일명을 정하므로 같은 이미지를 두 번 쓰지 않습니다.
+캐시가 만든 PNG + 인덱스 합계가 max_bytes를 넘으면 오래 사용하지 않은 파일부터
+삭제합니다 (적중 시 mtime 갱신). 파일 크기/사용 시각은 메모리 목록으로 관리하므로
+저장할 때마다 폴더를 다시 훑지 않고, 캐시를 끄면 삭제도 하지 않습니다.
+PNG가 지워진 이미지 항목은 미스로 처리합니다.
+
+프롬프트나 패키징 옵션을 바꾸면 DESIGN_CACHE_CONFIG["prompt_version"]을 올리세요.
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import DESIGN_CACHE_CONFIG
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.design_cache")
+
+# 기본 저장 경로 (ImageGenerator 이미지 저장 경로 아래 캐시 전용 폴더)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[3] / "dashboard" / "generated_images" / "daiso" / "design_cache"
+
+INDEX_DIR_NAME = "_index"
+PROMPT_ENTRY = "prompt"
+TRANSLATION_FILE_NAME = "keyword_translations.json"
+
+
+class DesignCache:
+    """
+    디자인 프롬프트 + 생성 이미지 디스크 캐시 (스레드 안전)
+
+    Example:
+        >>> cache = get_design_cache()
+        >>> key = cache.design_key(image_path, "빌리프", "수분크림")
+        >>> cache.get_prompt(key)  # 없으면 None
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        prompt_version: Optional[str] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.root = Path(root or DESIGN_CACHE_CONFIG.get("cache_dir") or DEFAULT_CACHE_DIR)
+        self.index_dir = self.root / INDEX_DIR_NAME
+        self.max_bytes = max_bytes if max_bytes is not None else DESIGN_CACHE_CONFIG["max_bytes"]
+        self.prompt_version = prompt_version or DESIGN_CACHE_CONFIG["prompt_version"]
+        self.enabled = DESIGN_CACHE_CONFIG["enabled"] if enabled is None else enabled
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._source_hashes: Dict[Tuple[str, int, int], str] = {}
+        self._translations: Optional[Dict[str, str]] = None
+        # 캐시가 관리하는 파일 {경로: (사용 시각, 크기)} (처음 정리할 때 한 번만 폴더 조회)
+        self._files: Optional[Dict[Path, Tuple[float, int]]] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ===== 키 =====
+
+    def source_hash(self, image_path: str) -> str:
+        """원본 이미지 내용 해시 (경로+크기+수정 시각이 같으면 다시 읽지 않음)"""
+        stat = os.stat(image_path)
+        memo_key = (str(image_path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._source_hashes.get(memo_key)
+        if cached:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        with self._lock:
+            self._source_hashes[memo_key] = digest.hexdigest()
+        return digest.hexdigest()
+
+    def design_key(self, image_path: str, brand: str, product: str) -> str:
+        """
+        디자인 키 (원본 이미지 해시 + 브랜드 + 제품 + 프롬프트 버전)
+
+        Args:
+            image_path: 올리브영 원본 제품 이미지 경로
+            brand: 브랜드 (공백으로 이어 붙인 엔티티)
+            product: 제품명
+
+        Returns:
+            sha256 hex
+        """
+        payload = json.dumps(
+            [
+                self.prompt_version,
+                self.source_hash(image_path),
+                " ".join((brand or "").lower().split()),
+                " ".join((product or "").lower().split())
+            ],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, design_key: str, entry: str) -> Path:
+        name = hashlib.sha256(f"{design_key}:{entry}".encode("utf-8")).hexdigest()
+        return self.index_dir / f"{name}.json"
+
+    # ===== 프롬프트 =====
+
+    def get_prompt(self, design_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 프롬프트 항목 (design_prompt, design_keywords, daiso_channel_summary)"""
+        return self._read_entry(self._entry_path(design_key, PROMPT_ENTRY))
+
+    def put_prompt(self, design_key: str, payload: Dict[str, Any]):
+        """프롬프트 항목 저장"""
+        self._write_entry(self._entry_path(design_key, PROMPT_ENTRY), payload)
+
+    # ===== 채널 요약 (제품과 무관, 데이터 버전별) =====
+
+    def get_channel_summary(self, channel: str, data_version: Optional[int]) -> Optional[Dict[str, Any]]:
+        """캐시된 채널 특성 요약 (summary, keywords)"""
+        return self._read_entry(self._entry_path(f"channel:{channel}:{data_version}", self.prompt_version))
+
+    def put_channel_summary(self, channel: str, data_version: Optional[int], payload: Dict[str, Any]):
+        """채널 특성 요약 저장"""
+        self._write_entry(self._entry_path(f"channel:{channel}:{data_version}", self.prompt_version), payload)
+
+    # ===== 키워드 번역 사전 (한글 → 영어, 삭제 대상 아님) =====
+
+    def get_translations(self, keywords: List[str]) -> Dict[str, str]:
+        """
+        저장된 번역 조회
+
+        Args:
+            keywords: 한글 키워드
+
+        Returns:
+            {한글: 영어} (사전에 있는 키워드만)
+        """
+        with self._lock:
+            translations = self._load_translations()
+            return {kw: translations[kw] for kw in keywords if kw in translations}
+
+    def put_translations(self, mapping: Dict[str, str]):
+        """새 번역 추가 (파일에 바로 저장)"""
+        mapping = {k: v for k, v in mapping.items() if k and v}
+        if not mapping:
+            return
+
+        with self._lock:
+            translations = self._load_translations()
+            translations.update(mapping)
+            try:
+                _atomic_write(
+                    self.root / TRANSLATION_FILE_NAME,
+                    json.dumps(translations, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+                )
+            except OSError as e:
+                logger.warning(f"키워드 번역 사전 저장 실패: {e}")
+
+    def _load_translations(self) -> Dict[str, str]:
+        """번역 사전 (처음 한 번만 파일에서 읽음, self._lock 안에서 호출)"""
+        if self._translations is None:
+            try:
+                with open(self.root / TRANSLATION_FILE_NAME, "r", encoding="utf-8") as f:
+                    self._translations = json.load(f)
+            except FileNotFoundError:
+                self._translations = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"키워드 번역 사전 읽기 실패: {e}")
+                self._translations = {}
+        return self._translations
+
+    # ===== 이미지 =====
+
+    def get_images(self, design_key: str, packaging_type: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 패키징 옵션 이미지 정보 (PNG가 하나라도 지워졌으면 None)
+        """
+        path = self._entry_path(design_key, packaging_type)
+        entry = self._read_entry(path, count=False)
+        if entry is None:
+            self._count(False)
+            return None
+
+        images = entry.get("images") or []
+        files = [Path(image["local_path"]) for image in images]
+        if not images or not all(f.is_file() for f in files):
+            self._count(False)
+            path.unlink(missing_ok=True)
+            return None
+
+        for f in files:
+            self._touch(f)
+        self._count(True)
+        return [dict(image, cache_hit=True) for image in images]
+
+    def put_images(self, design_key: str, packaging_type: str, images: List[Dict[str, Any]]):
+        """패키징 옵션 이미지 정보 저장 (PNG는 store_png로 먼저 저장)"""
+        if not images:
+            return
+        self._write_entry(self._entry_path(design_key, packaging_type), {"images": images})
+
+    def store_png(self, image_bytes: bytes, prefix: str) -> Path:
+        """
+        생성 이미지를 내용 해시 파일명으로 저장 (이미 있으면 쓰지 않음)
+
+        Args:
+            image_bytes: API가 돌려준 이미지 bytes (PNG가 아니면 변환)
+            prefix: 파일명 앞부분 (예: daiso_mini_bottle)
+
+        Returns:
+            PNG 경로 (root/{prefix}_{해시 16자}.png)
+        """
+        digest = hashlib.sha256(image_bytes).hexdigest()[:16]
+        path = self.root / f"{prefix}_{digest}.png"
+
+        if path.is_file():
+            self._touch(path)
+            return path
+
+        data = image_bytes
+        if not image_bytes.startswith(b"\x89PNG"):
+            from PIL import Image
+
+            buffer = BytesIO()
+            Image.open(BytesIO(image_bytes)).save(buffer, format="PNG")
+            data = buffer.getvalue()
+
+        _atomic_write(path, data)
+        self._track(path, len(data))
+        self.evict()
+        return path
+
+    # ===== 저장/삭제 =====
+
+    def _read_entry(self, path: Path, count: bool = True) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            entry = None
+        except (OSError, ValueError) as e:
+            logger.warning(f"디자인 캐시 항목 읽기 실패 ({path.name}): {e}")
+            entry = None
+
+        if entry is not None:
+            self._touch(path)
+        if count:
+            self._count(entry is not None)
+        return entry
+
+    def _write_entry(self, path: Path, payload: Dict[str, Any]):
+        if not self.enabled:
+            return
+
+        data = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        try:
+            _atomic_write(path, data)
+        except OSError as e:
+            logger.warning(f"디자인 캐시 저장 실패 ({path.name}): {e}")
+            return
+        self._track(path, len(data))
+        self.evict()
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _load_files(self) -> Dict[Path, Tuple[float, int]]:
+        """캐시 파일 목록 (처음 한 번만 root의 PNG + 인덱스 조회, self._lock 안에서 호출)"""
+        if self._files is None:
+            self._files = {}
+            for path in list(self.root.glob("*.png")) + list(self.index_dir.glob("*.json")):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                self._files[path] = (stat.st_mtime, stat.st_size)
+        return self._files
+
+    def _track(self, path: Path, size: int):
+        """새로 쓴 캐시 파일 등록"""
+        with self._lock:
+            if self._files is not None:
+                self._files[path] = (time.time(), size)
+
+    def _touch(self, path: Path):
+        """최근 사용 표시 (삭제 순서 기준)"""
+        _touch(path)
+        with self._lock:
+            if self._files is not None and path in self._files:
+                self._files[path] = (time.time(), self._files[path][1])
+
+    def evict(self):
+        """캐시 파일 합계가 max_bytes를 넘으면 오래 사용하지 않은 파일부터 삭제 (캐시가 꺼져 있으면 삭제 안 함)"""
+        if not self.enabled or not self.max_bytes:
+            return
+
+        with self._lock:
+            files = self._load_files()
+            total = sum(size for _, size in files.values())
+            if total <= self.max_bytes:
+                return
+
+            for path, (_, size) in sorted(files.items(), key=lambda f: f[1][0]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                del files[path]
+                total -= size
+                self.evictions += 1
+
+        logger.info(f"디자인 캐시 정리: {total:,} bytes 남음 (누적 삭제 {self.evictions}개)")
+
+    def stats(self) -> Dict[str, Any]:
+        """통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
+
+
+def _touch(path: Path):
+    """최근 사용 표시 (삭제 순서 기준)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _atomic_write(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 교체 (동시에 읽는 쪽이 반쪽 파일을 보지 않도록)"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+_design_cache: Optional[DesignCache] = None
+_design_cache_lock = threading.Lock()
+
+
+def get_design_cache() -> DesignCache:
+    """프로세스 공유 디자인 캐시"""
+    global _design_cache
+    with _design_cache_lock:
+        if _design_cache is None:
+            _design_cache = DesignCache()
+        return _design_cache
+
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    work_dir = Path(tempfile.mkdtemp(prefix="v6_design_cache_"))
+    try:
+        source = work_dir / "source.jpg"
+        source.write_bytes(b"fake image bytes")
+
+        # 캐시 폴더 바깥(공용 이미지 폴더)의 기존 이미지는 삭제 대상이 아님
+        shared_image = work_dir / "daiso_20251102_120000.png"
+        shared_image.write_bytes(b"\x89PNG" + b"1" * 5000)
+
+        cache = DesignCache(work_dir / "cache", max_bytes=4096, prompt_version="test", enabled=True)
+        key = cache.design_key(str(source), "빌리프", "수분크림")
+
+        assert cache.get_prompt(key) is None
+        cache.put_prompt(key, {"design_prompt": "Transform...", "design_keywords": ["보습"]})
+        assert cache.get_prompt(key)["design_keywords"] == ["보습"]
+
+        png = b"\x89PNG" + b"0" * 1000
+        first = cache.store_png(png, "daiso_mini_bottle")
+        second = cache.store_png(png, "daiso_mini_bottle")
+        assert first == second
+        print(f"같은 PNG 저장 경로 동일: {first.name}")
+
+        cache.put_images(key, "mini_bottle", [{"local_path": str(first), "packaging_type": "mini_bottle"}])
+        assert cache.get_images(key, "mini_bottle") is not None
+
+        for i in range(5):
+            cache.store_png(b"\x89PNG" + bytes([i]) * 1000, "daiso_mini_bottle")
+        assert cache.get_images(key, "mini_bottle") is None, "가장 오래된 PNG가 삭제되어야 함"
+        assert cache.evictions > 0
+        assert shared_image.is_file(), "캐시가 만들지 않은 파일은 삭제하지 않음"
+        cache_bytes = sum(f.stat().st_size for f in (work_dir / "cache").rglob("*") if f.is_file())
+        print(f"정리 후 캐시 용량: {cache_bytes:,} bytes / 통계: {cache.stats()}")
+
+        # 캐시를 끄면 이미지는 저장하지만 정리는 하지 않음
+        disabled = DesignCache(work_dir / "disabled", max_bytes=1, prompt_version="test", enabled=False)
+        saved = [disabled.store_png(b"\x89PNG" + bytes([i]) * 100, "daiso_box") for i in range(3)]
+        assert all(path.is_file() for path in saved) and disabled.evictions == 0
+
+        print("\n✅ 모든 확인 통과")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
@@ -3,15 +3,24 @@
 graph.py
 LangGraph 워크플로우 정의
 
-last_updated: 2025.10.29
+- create_graph(): 노드 인스턴스 생성 + 컴파일 (매번 새로 만듦)
+- get_graph(): 프로세스당 한 번만 컴파일한 그래프 재사용 (챗봇 페이지에서 사용)
+  노드는 요청별 상태를 인스턴스에 저장하지 않으므로 (모든 요청 데이터는 AgentState)
+  여러 세션이 같은 그래프를 동시에 invoke해도 안전함
+
+last_updated: 2025.11.02
 """
 #//==============================================================================//#
 
+import threading
 from langgraph.graph import StateGraph, END
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .state import AgentState
+from .config import QUERY_ANALYZER_CONFIG
+from .nodes.fast_path import FastPath
 from .nodes.entity_parser import EntityParser
+from .nodes.query_analyzer import QueryAnalyzer
 from .nodes.capability_detector import CapabilityDetector
 from .nodes.complexity_classifier import ComplexityClassifier
 from .nodes.question_decomposer import QuestionDecomposer
@@ -32,7 +41,11 @@ def create_graph() -> StateGraph:
     Returns:
         StateGraph: 실행 가능한 그래프
     """
+    # 통합 분석 모드: EntityParser/CapabilityDetector/ComplexityClassifier 대신 QueryAnalyzer (LLM 1회)
+    use_query_analyzer = QUERY_ANALYZER_CONFIG["enabled"]
+
     # 1. 노드 인스턴스 생성
+    fast_path = FastPath()
     entity_parser = EntityParser()
     capability_detector = CapabilityDetector()
     complexity_classifier = ComplexityClassifier()
@@ -50,6 +63,9 @@ def create_graph() -> StateGraph:
     workflow = StateGraph(AgentState)
 
     # 3. 노드 추가
+    workflow.add_node("fast_path", fast_path.route)
+    if use_query_analyzer:
+        workflow.add_node("query_analyzer", QueryAnalyzer().analyze)
     workflow.add_node("entity_parser", entity_parser.parse)
     workflow.add_node("capability_detector", capability_detector.detect)
     workflow.add_node("complexity_classifier", complexity_classifier.classify)
@@ -65,8 +81,31 @@ def create_graph() -> StateGraph:
     workflow.add_node("image_generator", image_generator.generate)
 
     # 4. 엣지 정의
-    # 시작 → EntityParser
-    workflow.set_entry_point("entity_parser")
+    # 시작 → FastPath (템플릿 질문 판별)
+    workflow.set_entry_point("fast_path")
+
+    # FastPath → Executor (템플릿 질문) / EntityParser 또는 QueryAnalyzer (그 외)
+    workflow.add_conditional_edges(
+        "fast_path",
+        route_fast_path,
+        {
+            "executor": "executor",
+            "entity_parser": "query_analyzer" if use_query_analyzer else "entity_parser"
+        }
+    )
+
+    # QueryAnalyzer → 이미지 생성 / QuestionDecomposer / SQLGenerator
+    if use_query_analyzer:
+        workflow.add_conditional_edges(
+            "query_analyzer",
+            route_after_analysis,
+            {
+                "image_generation": "image_prompt_generator",
+                "decompose": "question_decomposer",
+                "sql_generator": "sql_generator",
+                "error": END
+            }
+        )
 
     # EntityParser → 워크플로우 라우팅 (이미지 생성 vs SQL)
     workflow.add_conditional_edges(
@@ -131,6 +170,53 @@ def create_graph() -> StateGraph:
     return workflow.compile()
 
 
+# 프로세스 전역 컴파일 그래프
+_compiled_graph: Optional[Any] = None
+_graph_lock = threading.Lock()
+
+
+def get_graph():
+    """
+    프로세스 전역 컴파일 그래프 반환 (첫 호출 때만 create_graph 실행)
+
+    노드 생성(브랜드 시그니처 로드 등)과 StateGraph 컴파일은 프로세스당 한 번만 하고,
+    LLM 클라이언트는 clients.py의 공유 클라이언트를 사용하므로
+    질문마다 드는 고정 비용이 없고 HTTP keep-alive 연결도 재사용됨
+
+    Returns:
+        컴파일된 그래프 (invoke 가능)
+    """
+    global _compiled_graph
+
+    if _compiled_graph is None:
+        with _graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = create_graph()
+    return _compiled_graph
+
+
+def reset_graph():
+    """전역 그래프 폐기 (노드 코드/설정 변경 후 다시 컴파일할 때)"""
+    global _compiled_graph
+    with _graph_lock:
+        _compiled_graph = None
+
+
+def route_fast_path(state: AgentState) -> str:
+    """
+    템플릿 질문이면 LLM 분석 단계를 건너뛰고 Executor로
+
+    Args:
+        state: 현재 상태
+
+    Returns:
+        다음 노드 이름
+    """
+    if state.get("fast_path", {}).get("matched"):
+        return "executor"
+    return "entity_parser"
+
+
 def route_workflow_type(state: AgentState) -> str:
     """
     워크플로우 타입 라우팅 (이미지 생성 vs SQL)
@@ -157,6 +243,22 @@ def route_workflow_type(state: AgentState) -> str:
         return "sql"
 
 
+def route_after_analysis(state: AgentState) -> str:
+    """
+    QueryAnalyzer 이후 라우팅 (워크플로우 타입 → 복잡도)
+
+    Args:
+        state: 현재 상태
+
+    Returns:
+        다음 노드 이름
+    """
+    workflow_type = route_workflow_type(state)
+    if workflow_type != "sql":
+        return workflow_type
+    return route_by_complexity(state)
+
+
 def route_by_complexity(state: AgentState) -> str:
     """
     복잡도에 따라 라우팅
@@ -10,9 +10,9 @@ last_updated: 2025.11.02
 import json
 import logging
 from typing import Dict, Any
-from openai import OpenAI
 
 from ..state import AgentState
+from ..clients import SharedOpenAIClient
 from ..progress_tracker import ProgressTracker
 from ..config import LLM_CONFIG
 from ..errors import handle_exception, LLMError
@@ -22,11 +22,98 @@ from ..state_validator import validate_state
 logger = logging.getLogger("v6_agent.capability_detector")
 
 
+# 분석 전략 판단 기준 (QueryAnalyzer 통합 호출에서도 사용)
+CAPABILITY_GUIDE = """**판단 항목:**
+
+1. data_scope: 사용할 데이터 소스 (매우 중요!)
+
+   **"reviews" 테이블 (314,285건)을 사용해야 하는 경우:**
+   - 평점 조회 (평균 평점, 평점 분포, 평점 트렌드 등)
+   - 리뷰 수 집계
+   - 날짜별 트렌드 분석
+   - 원문 리뷰 샘플
+   - 키워드: "평점", "평균", "분포", "트렌드", "리뷰수", "개수", "몇 개"
+
+   **"preprocessed_reviews" 테이블 (5,000건)을 사용해야 하는 경우:**
+   - 속성별 분석 (보습력, 발림성, 향, 지속력 등)
+   - 장점/단점 분석
+   - 감정 요약 (긍정/부정)
+   - 키워드 추출
+   - 주의: rating 칼럼 없음! 평점 조회 불가
+
+   **"join" (두 테이블 조인)을 사용해야 하는 경우:**
+   - 평점 + 텍스트 분석 둘 다 필요
+   - 예: "평점 높은 제품의 장점 분석"
+
+2. aggregation_type: 집계 방식
+   - "time_series": 시간별 트렌드 (월별, 일별 변화)
+   - "comparison": 여러 대상 비교 (브랜드, 제품 간 비교)
+   - "distribution": 분포 분석 (평점 분포, 카테고리 분포)
+   - "keyword_frequency": 키워드 빈도 분석
+   - "simple": 단순 조회 (특정 정보만 가져오기)
+
+3. group_by: 그룹화 기준
+   - "brand": 브랜드별
+   - "product": 제품별
+   - "channel": 채널별
+   - "period": 기간별 (시계열)
+   - "none": 그룹화 없음
+
+4. analysis_depth: 분석 깊이
+   - "overview": 전반적 요약 (평점, 리뷰 수 등) → reviews 테이블
+   - "attribute": 속성별 분석 (보습력, 발림성 등) → preprocessed_reviews 테이블
+   - "sentiment": 감정 분석 (긍정/부정) → preprocessed_reviews 테이블
+   - "keyword": 키워드 분석 → preprocessed_reviews 테이블
+   - "pros_cons": 장단점 분석 → preprocessed_reviews 테이블
+
+5. metric: 측정 지표
+   - "rating": 평점 → 반드시 reviews 또는 join 사용!
+   - "count": 개수
+   - "percentage": 비율
+
+**예시:**
+
+질문: "빌리프 보습력 어때?"
+엔티티: {"brands": ["빌리프"], "attributes": ["보습력"]}
+→ {"data_scope": "preprocessed_reviews", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "attribute", "metric": "count"}
+
+질문: "빌리프 평점 어때?"
+엔티티: {"brands": ["빌리프"], "attributes": ["평점"]}
+→ {"data_scope": "reviews", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "overview", "metric": "rating"}
+(이유: "평점" 키워드 → reviews 테이블 사용)
+
+질문: "빌리프 평점 분포"
+엔티티: {"brands": ["빌리프"], "attributes": ["평점분포"]}
+→ {"data_scope": "reviews", "aggregation_type": "distribution", "group_by": "none", "analysis_depth": "overview", "metric": "rating"}
+(이유: "평점분포" → reviews 테이블 사용)
+
+질문: "VT랑 라로슈포제 평점 비교"
+엔티티: {"brands": ["VT", "라로슈포제"]}
+→ {"data_scope": "reviews", "aggregation_type": "comparison", "group_by": "brand", "analysis_depth": "overview", "metric": "rating"}
+(이유: "평점 비교" → reviews 테이블 사용)
+
+질문: "최근 3개월 CNP 평점 트렌드"
+엔티티: {"brands": ["CNP"], "period": {"type": "recent_months", "value": 3}}
+→ {"data_scope": "reviews", "aggregation_type": "time_series", "group_by": "period", "analysis_depth": "overview", "metric": "rating"}
+(이유: "평점 트렌드" → reviews 테이블 사용)
+
+질문: "빌리프 샘플 리뷰 보여줘"
+엔티티: {"brands": ["빌리프"]}
+→ {"data_scope": "reviews", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "overview", "metric": "count"}
+
+질문: "빌리프 장점이랑 실제 리뷰 같이 보여줘"
+엔티티: {"brands": ["빌리프"], "attributes": ["장점"]}
+→ {"data_scope": "join", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "pros_cons", "metric": "count"}
+"""
+
+
 class CapabilityDetector:
     """분석 전략 결정"""
 
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
     def __init__(self):
-        self.client = OpenAI()
         self.model = LLM_CONFIG["model"]
         self.temperature = LLM_CONFIG["temperature"]["capability_detector"]
         self.max_tokens = LLM_CONFIG["max_tokens"]
@@ -155,88 +242,7 @@ class CapabilityDetector:
         prompt = f"""당신은 데이터 분석 전략을 결정하는 시스템입니다.
 사용자 질문과 추출된 엔티티를 바탕으로 최적의 분석 방법을 JSON으로 반환하세요:
 
-**판단 항목:**
-
-1. data_scope: 사용할 데이터 소스 (매우 중요!)
-
-   **"reviews" 테이블 (314,285건)을 사용해야 하는 경우:**
-   - 평점 조회 (평균 평점, 평점 분포, 평점 트렌드 등)
-   - 리뷰 수 집계
-   - 날짜별 트렌드 분석
-   - 원문 리뷰 샘플
-   - 키워드: "평점", "평균", "분포", "트렌드", "리뷰수", "개수", "몇 개"
-
-   **"preprocessed_reviews" 테이블 (5,000건)을 사용해야 하는 경우:**
-   - 속성별 분석 (보습력, 발림성, 향, 지속력 등)
-   - 장점/단점 분석
-   - 감정 요약 (긍정/부정)
-   - 키워드 추출
-   - 주의: rating 칼럼 없음! 평점 조회 불가
-
-   **"join" (두 테이블 조인)을 사용해야 하는 경우:**
-   - 평점 + 텍스트 분석 둘 다 필요
-   - 예: "평점 높은 제품의 장점 분석"
-
-2. aggregation_type: 집계 방식
-   - "time_series": 시간별 트렌드 (월별, 일별 변화)
-   - "comparison": 여러 대상 비교 (브랜드, 제품 간 비교)
-   - "distribution": 분포 분석 (평점 분포, 카테고리 분포)
-   - "keyword_frequency": 키워드 빈도 분석
-   - "simple": 단순 조회 (특정 정보만 가져오기)
-
-3. group_by: 그룹화 기준
-   - "brand": 브랜드별
-   - "product": 제품별
-   - "channel": 채널별
-   - "period": 기간별 (시계열)
-   - "none": 그룹화 없음
-
-4. analysis_depth: 분석 깊이
-   - "overview": 전반적 요약 (평점, 리뷰 수 등) → reviews 테이블
-   - "attribute": 속성별 분석 (보습력, 발림성 등) → preprocessed_reviews 테이블
-   - "sentiment": 감정 분석 (긍정/부정) → preprocessed_reviews 테이블
-   - "keyword": 키워드 분석 → preprocessed_reviews 테이블
-   - "pros_cons": 장단점 분석 → preprocessed_reviews 테이블
-
-5. metric: 측정 지표
-   - "rating": 평점 → 반드시 reviews 또는 join 사용!
-   - "count": 개수
-   - "percentage": 비율
-
-**예시:**
-
-질문: "빌리프 보습력 어때?"
-엔티티: {{"brands": ["빌리프"], "attributes": ["보습력"]}}
-→ {{"data_scope": "preprocessed_reviews", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "attribute", "metric": "count"}}
-
-질문: "빌리프 평점 어때?"
-엔티티: {{"brands": ["빌리프"], "attributes": ["평점"]}}
-→ {{"data_scope": "reviews", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "overview", "metric": "rating"}}
-(이유: "평점" 키워드 → reviews 테이블 사용)
-
-질문: "빌리프 평점 분포"
-엔티티: {{"brands": ["빌리프"], "attributes": ["평점분포"]}}
-→ {{"data_scope": "reviews", "aggregation_type": "distribution", "group_by": "none", "analysis_depth": "overview", "metric": "rating"}}
-(이유: "평점분포" → reviews 테이블 사용)
-
-질문: "VT랑 라로슈포제 평점 비교"
-엔티티: {{"brands": ["VT", "라로슈포제"]}}
-→ {{"data_scope": "reviews", "aggregation_type": "comparison", "group_by": "brand", "analysis_depth": "overview", "metric": "rating"}}
-(이유: "평점 비교" → reviews 테이블 사용)
-
-질문: "최근 3개월 CNP 평점 트렌드"
-엔티티: {{"brands": ["CNP"], "period": {{"type": "recent_months", "value": 3}}}}
-→ {{"data_scope": "reviews", "aggregation_type": "time_series", "group_by": "period", "analysis_depth": "overview", "metric": "rating"}}
-(이유: "평점 트렌드" → reviews 테이블 사용)
-
-질문: "빌리프 샘플 리뷰 보여줘"
-엔티티: {{"brands": ["빌리프"]}}
-→ {{"data_scope": "reviews", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "overview", "metric": "count"}}
-
-질문: "빌리프 장점이랑 실제 리뷰 같이 보여줘"
-엔티티: {{"brands": ["빌리프"], "attributes": ["장점"]}}
-→ {{"data_scope": "join", "aggregation_type": "simple", "group_by": "none", "analysis_depth": "pros_cons", "metric": "count"}}
-
+{CAPABILITY_GUIDE}
 **사용자 질문:**
 {query}
 
@@ -47,7 +47,7 @@ class ComplexityClassifier:
             )
 
             # 2. 복잡도 점수 계산
-            score = self._calculate_complexity_score(
+            score = self.calculate_complexity_score(
                 state["user_query"],
                 state["parsed_entities"],
                 state["capabilities"]
@@ -56,18 +56,10 @@ class ComplexityClassifier:
             logger.debug(f"복잡도 점수: {score}")
 
             # 3. 복잡도 레벨 결정
-            if score <= 2:
-                complexity = "simple"
-                estimated_time = 2.5
-                path = "Fast Path (Selector → SQL)"
-            elif score <= 5:
-                complexity = "medium"
-                estimated_time = 5.0
-                path = "Medium Path (Selector → Decomposer → SQL)"
-            else:
-                complexity = "complex"
-                estimated_time = 12.0
-                path = "Full Path (Selector → Decomposer → SQL → Refiner)"
+            level_info = complexity_for_score(score)
+            complexity = level_info["level"]
+            estimated_time = level_info["estimated_time"]
+            path = level_info["path"]
 
             tracker.update_substep(f"복잡도: {complexity} (점수: {score})")
             tracker.update_substep(f"처리 경로: {path}")
@@ -77,12 +69,7 @@ class ComplexityClassifier:
             tracker.complete_step(summary=f"{complexity} 질문 (예상 {estimated_time}초)")
 
             # State 업데이트
-            state["complexity"] = {
-                "level": complexity,
-                "score": score,
-                "estimated_time": estimated_time,
-                "path": path
-            }
+            state["complexity"] = level_info
             state["messages"] = tracker.get_state_messages()
 
             # State 검증
@@ -115,14 +102,14 @@ class ComplexityClassifier:
 
         return state
 
-    def _calculate_complexity_score(
+    def calculate_complexity_score(
         self,
         query: str,
         entities: Dict[str, Any],
         capabilities: Dict[str, Any]
     ) -> int:
         """
-        복잡도 점수 계산
+        복잡도 점수 계산 (QueryAnalyzer와 공용)
 
         Args:
             query: 사용자 질문
@@ -194,3 +181,28 @@ class ComplexityClassifier:
             score += 1
 
         return score
+
+
+def complexity_for_score(score: int) -> Dict[str, Any]:
+    """
+    복잡도 점수 → 레벨/예상 시간/처리 경로
+
+    Args:
+        score: 복잡도 점수 (ComplexityClassifier.calculate_complexity_score)
+
+    Returns:
+        state["complexity"] 형식의 dict
+    """
+    if score <= 2:
+        level, estimated_time, path = "simple", 2.5, "Fast Path (Selector → SQL)"
+    elif score <= 5:
+        level, estimated_time, path = "medium", 5.0, "Medium Path (Selector → Decomposer → SQL)"
+    else:
+        level, estimated_time, path = "complex", 12.0, "Full Path (Selector → Decomposer → SQL → Refiner)"
+
+    return {
+        "level": level,
+        "score": score,
+        "estimated_time": estimated_time,
+        "path": path
+    }
@@ -12,9 +12,9 @@ import re
 import logging
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
-from openai import OpenAI
 
 from ..state import AgentState
+from ..clients import SharedOpenAIClient
 from ..progress_tracker import ProgressTracker
 from ..config import (
     LLM_CONFIG,
@@ -34,8 +34,10 @@ logger = logging.getLogger("v6_agent.entity_parser")
 class EntityParser:
     """사용자 질문에서 엔티티 추출"""
 
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
     def __init__(self):
-        self.client = OpenAI()
         self.model = LLM_CONFIG["model"]
         self.temperature = LLM_CONFIG["temperature"]["entity_parser"]
         self.max_tokens = LLM_CONFIG["max_tokens"]
@@ -76,7 +78,7 @@ class EntityParser:
             if conversation_history:
                 logger.info(f"대화 맥락 유지 모드: 이전 {len(conversation_history)}개 메시지 참조")
 
-            raw_entities = self._extract_entities(
+            raw_entities = self.extract_entities(
                 state["user_query"],
                 conversation_history=conversation_history
             )
@@ -84,24 +86,12 @@ class EntityParser:
 
             tracker.update_substep("엔티티 추출 완료")
 
-            # 3. 기간 정보 변환
-            period_info = self._parse_period(raw_entities.get("period", {"type": "all"}))
-            tracker.update_substep(f"기간: {period_info['display']}")
-
-            # 4. 채널 매핑 (한글 → 영문)
-            channels = self._map_channels(raw_entities.get("channels", []))
-
-            # 5. 최종 엔티티 구성
-            entities = {
-                "brands": raw_entities.get("brands", []),
-                "products": raw_entities.get("products", []),
-                "attributes": raw_entities.get("attributes", []),
-                "period": period_info,
-                "channels": channels
-            }
+            # 3~5. 기간 변환, 채널 매핑, 최종 엔티티 구성
+            entities = self.build_entities(raw_entities)
+            tracker.update_substep(f"기간: {entities['period']['display']}")
 
             # 6. 검증
-            validation = self._validate(entities)
+            validation = self.validate(entities)
             logger.debug(f"검증 결과: {validation}")
 
             if validation["valid"]:
@@ -175,7 +165,7 @@ class EntityParser:
 
         return state
 
-    def _extract_entities(
+    def extract_entities(
         self,
         query: str,
         conversation_history: List[Dict[str, str]] = None
@@ -190,6 +180,34 @@ class EntityParser:
         Returns:
             추출된 엔티티
         """
+        prompt = self.build_prompt(query, conversation_history)
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+
+        return self._parse_json(response.choices[0].message.content.strip())
+
+    def build_prompt(
+        self,
+        query: str,
+        conversation_history: List[Dict[str, str]] = None,
+        extra_sections: str = ""
+    ) -> str:
+        """
+        엔티티 추출 프롬프트 생성
+
+        Args:
+            query: 사용자 질문
+            conversation_history: 이전 대화 히스토리 (옵션)
+            extra_sections: 사용자 질문 앞에 덧붙일 지시문 (QueryAnalyzer 통합 호출용)
+
+        Returns:
+            프롬프트
+        """
         # 브랜드 리스트 문자열 생성 (처음 100개 + 랜덤 50개)
         brand_sample = BRAND_LIST[:100] if len(BRAND_LIST) > 100 else BRAND_LIST
         brand_list_str = ", ".join(brand_sample)
@@ -281,20 +299,23 @@ class EntityParser:
 질문: "바이오더티디 스팟카밍젤 평점분포"
 → {{"brands": ["바이오더티디"], "products": ["스팟카밍젤"], "attributes": ["평점분포"], "period": {{"type": "all"}}, "channels": []}}
 
-**사용자 질문:**
+{extra_sections}**사용자 질문:**
 {query}
 
 **JSON만 반환하세요 (다른 설명 없이):**"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=self.temperature,
-            max_tokens=self.max_tokens
-        )
+        return prompt
 
-        result_text = response.choices[0].message.content.strip()
+    def _parse_json(self, result_text: str) -> Dict[str, Any]:
+        """
+        LLM 응답에서 JSON 추출
 
+        Args:
+            result_text: LLM 응답 텍스트
+
+        Returns:
+            파싱된 dict
+        """
         # JSON 파싱 (정규표현식 사용 - 더 견고하게)
         try:
             # 1. 마크다운 코드 블록에서 JSON 추출
@@ -321,56 +342,31 @@ class EntityParser:
                 f"에러: {str(e)}"
             )
 
-    def _parse_period(self, period: Dict[str, Any]) -> Dict[str, Any]:
+    def build_entities(self, raw_entities: Dict[str, Any]) -> Dict[str, Any]:
         """
-        기간 정보를 실제 날짜로 변환
+        LLM 추출 결과를 최종 엔티티 형식으로 변환 (기간 → 날짜, 채널 → 영문)
+
+        QueryAnalyzer도 같은 변환을 사용합니다.
 
         Args:
-            period: 기간 정보 {"type": "recent_months", "value": 3}
+            raw_entities: LLM이 추출한 엔티티
 
         Returns:
-            변환된 기간 정보
+            parsed_entities 형식의 엔티티
         """
-        today = datetime.now()
-        period_type = period.get("type", "all")
-
-        if period_type == "recent_months":
-            months = period.get("value", 1)
-            start_date = today - timedelta(days=months * 30)
-            return {
-                "type": "recent_months",
-                "value": months,
-                "start": start_date.strftime("%Y-%m-%d"),
-                "end": today.strftime("%Y-%m-%d"),
-                "display": f"최근 {months}개월"
-            }
+        return {
+            "brands": raw_entities.get("brands", []),
+            "products": raw_entities.get("products", []),
+            "attributes": raw_entities.get("attributes", []),
+            "period": self._parse_period(raw_entities.get("period") or {"type": "all"}),
+            "channels": self._map_channels(raw_entities.get("channels", []))
+        }
 
-        elif period_type == "recent_days":
-            days = period.get("value", 7)
-            start_date = today - timedelta(days=days)
-            return {
-                "type": "recent_days",
-                "value": days,
-                "start": start_date.strftime("%Y-%m-%d"),
-                "end": today.strftime("%Y-%m-%d"),
-                "display": f"최근 {days}일"
-            }
-
-        elif period_type == "date_range":
-            return {
-                "type": "date_range",
-                "start": period.get("start"),
-                "end": period.get("end"),
-                "display": f"{period.get('start')} ~ {period.get('end')}"
-            }
-
-        else:  # "all"
-            return {
-                "type": "all",
-                "start": None,
-                "end": None,
-                "display": "전체 기간"
-            }
+    def _parse_period(self, period: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        기간 정보를 실제 날짜로 변환 (parse_period 참고)
+        """
+        return parse_period(period)
 
     def _map_channels(self, channels: List[str]) -> List[str]:
         """
@@ -384,9 +380,9 @@ class EntityParser:
         """
         return [CHANNEL_MAPPING.get(ch, ch) for ch in channels]
 
-    def _validate(self, entities: Dict[str, Any]) -> Dict[str, Any]:
+    def validate(self, entities: Dict[str, Any]) -> Dict[str, Any]:
         """
-        추출된 엔티티 검증
+        추출된 엔티티 검증 (QueryAnalyzer와 공용)
 
         Args:
             entities: 추출된 엔티티
@@ -409,3 +405,55 @@ class EntityParser:
             }
 
         return {"valid": True}
+
+
+def parse_period(period: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    기간 정보를 실제 날짜로 변환
+
+    Args:
+        period: 기간 정보 {"type": "recent_months", "value": 3}
+
+    Returns:
+        변환된 기간 정보
+    """
+    today = datetime.now()
+    period_type = period.get("type", "all")
+
+    if period_type == "recent_months":
+        months = period.get("value", 1)
+        start_date = today - timedelta(days=months * 30)
+        return {
+            "type": "recent_months",
+            "value": months,
+            "start": start_date.strftime("%Y-%m-%d"),
+            "end": today.strftime("%Y-%m-%d"),
+            "display": f"최근 {months}개월"
+        }
+
+    elif period_type == "recent_days":
+        days = period.get("value", 7)
+        start_date = today - timedelta(days=days)
+        return {
+            "type": "recent_days",
+            "value": days,
+            "start": start_date.strftime("%Y-%m-%d"),
+            "end": today.strftime("%Y-%m-%d"),
+            "display": f"최근 {days}일"
+        }
+
+    elif period_type == "date_range":
+        return {
+            "type": "date_range",
+            "start": period.get("start"),
+            "end": period.get("end"),
+            "display": f"{period.get('start')} ~ {period.get('end')}"
+        }
+
+    else:  # "all"
+        return {
+            "type": "all",
+            "start": None,
+            "end": None,
+            "display": "전체 기간"
+        }
@@ -3,6 +3,9 @@
 executor.py
 SQL 쿼리 실행
 
+- 실행 전 EXPLAIN 비용 검사 (sql_guard.py): 큰 결과는 LIMIT 추가, 너무 비싸면 거부
+- 쿼리별 statement_timeout = min(공유 마감까지 남은 시간, statement_timeout_seconds)
+
 last_updated: 2025.11.02
 """
 #//==============================================================================//#
@@ -10,31 +13,44 @@ last_updated: 2025.11.02
 import psycopg2
 import psycopg2.errors
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List
 import time
 
 from ..state import AgentState
 from ..progress_tracker import ProgressTracker
-from ..config import DB_CONFIG, ERROR_MESSAGES
+from ..config import DB_CONFIG, ERROR_MESSAGES, EXECUTOR_CONFIG, SQL_GUARD_CONFIG
 from ..errors import handle_exception, DatabaseError, TimeoutError
 from ..state_validator import validate_state
+from ..db_pool import pooled_connection
+from ..result_set import ResultRows
+from ..data_version import get_data_version
+from ..query_cache import get_cached_result, put_cached_result, add_cache_trace
+from ..sql_guard import check_sql, record_actual
 
 # 로거 설정
 logger = logging.getLogger("v6_agent.executor")
 
 
 class Executor:
-    """SQL 실행"""
+    """SQL 실행 (독립 쿼리는 풀 커넥션으로 병렬 실행)"""
 
     def __init__(self):
         self.db_config = DB_CONFIG
         self.max_retries = 3  # 재시도 횟수
         self.retry_delay = 1.0  # 재시도 대기 시간 (초)
+        self.max_workers = EXECUTOR_CONFIG["max_workers"]
+        self.deadline_seconds = EXECUTOR_CONFIG["deadline_seconds"]
+        self.statement_timeout_seconds = SQL_GUARD_CONFIG["statement_timeout_seconds"]
 
     def execute(self, state: AgentState) -> AgentState:
         """
         SQL 실행
 
+        모든 쿼리를 동시에 시작하고 하나의 마감 시간(deadline_seconds)을 공유합니다.
+        각 쿼리는 남은 시간만큼만 statement_timeout을 받으므로 전체 실행 시간은
+        가장 느린 쿼리 시간(최대 마감 시간)이 됩니다.
+
         Args:
             state: 현재 상태
 
@@ -54,35 +70,73 @@ class Executor:
                 substeps=[f"Q{q.get('question_id', i)} 실행" for i, q in enumerate(sql_queries, 1)]
             )
 
-            # 2. DB 연결
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-
-            # 3. 각 SQL 실행
-            query_results = []
+            # 2. 결과 캐시 확인 (같은 SQL + 같은 데이터 버전이면 DB 조회 생략)
+            results_by_index = {}
             total_start_time = time.time()
+            deadline = total_start_time + self.deadline_seconds
+            data_version = get_data_version()
 
             for i, sql_info in enumerate(sql_queries, 1):
-                sql_preview = sql_info.get('sql', '')[:100]
-                logger.debug(f"쿼리 {i} 실행 중: {sql_preview}...")
-
-                result = self._execute_single_query_with_retry(
-                    cursor,
-                    sql_info,
-                    tracker,
-                    query_index=i
-                )
-
-                logger.info(f"쿼리 {i} 완료: {result.get('row_count', 0)} rows, success={result.get('success')}")
-                query_results.append(result)
-
+                cached = get_cached_result(sql_info["sql"], data_version, sql_info.get("params"))
+                if cached is not None:
+                    results_by_index[i] = self._cached_result(sql_info, cached, total_start_time)
+                    tracker.update_substep(f"Q{sql_info['question_id']} 캐시 사용: {len(cached['rows'])}건")
+
+            cache_hits = len(results_by_index)
+
+            # 3. 나머지 SQL 병렬 실행 (진행상황은 메인 스레드에서 갱신)
+            pending = [(i, sql_info) for i, sql_info in enumerate(sql_queries, 1) if i not in results_by_index]
+
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending)))) as pool:
+                futures = {
+                    pool.submit(
+                        self._execute_single_query_with_retry,
+                        sql_info,
+                        deadline,
+                        total_start_time,
+                        i
+                    ): i
+                    for i, sql_info in pending
+                }
+
+                for future in as_completed(futures):
+                    i = futures[future]
+                    result = future.result()
+                    results_by_index[i] = result
+
+                    question_id = result["question_id"]
+                    if result["success"]:
+                        put_cached_result(
+                            result["sql"], data_version, result["data"], result.get("params"),
+                            truncated=result.get("truncated", False), guard=result.get("guard")
+                        )
+                        tracker.update_substep(
+                            f"Q{question_id} 완료: {result['row_count']}건 ({result['duration']:.2f}초)"
+                        )
+                    else:
+                        tracker.update_substep(
+                            f"Q{question_id} 오류: {str(result['error'])[:50]}..."
+                        )
+                    logger.info(
+                        f"쿼리 {i} 완료: {result.get('row_count', 0)} rows, success={result.get('success')}, "
+                        f"실행 {result['duration']:.2f}s / 대기 {result['wait_time']:.2f}s / 총 {result['latency']:.2f}s"
+                    )
+
+            add_cache_trace(state, "result_cache", {
+                "hits": cache_hits,
+                "misses": len(sql_queries) - cache_hits,
+                "data_version": data_version
+            })
+            self._add_guard_trace(state, [results_by_index[i] for i, _ in pending])
+
+            query_results = [results_by_index[i] for i in range(1, len(sql_queries) + 1)]
             total_duration = time.time() - total_start_time
 
-            # 4. 연결 종료
-            cursor.close()
-            conn.close()
+            # 모든 쿼리가 시간 초과면 노드 에러 (일부만이면 나머지 결과로 진행)
+            if query_results and all(r.get("timed_out") for r in query_results):
+                raise TimeoutError("Executor", f"쿼리 실행 시간 초과 ({self.deadline_seconds}초)")
 
-            # 5. 데이터 특성 분석
+            # 4. 데이터 특성 분석
             data_characteristics = self._analyze_data_characteristics(query_results)
 
             tracker.complete_step(
@@ -108,16 +162,16 @@ class Executor:
             except Exception as validation_error:
                 logger.warning(f"검증 중 예외: {validation_error}")
 
-        except psycopg2.errors.QueryCanceled as e:
-            # 타임아웃 에러 (재시도 가능)
-            logger.error(f"쿼리 타임아웃: {e}", exc_info=True)
+        except TimeoutError as e:
+            # 공유 마감 시간 초과 (재시도 가능)
+            logger.error(f"쿼리 타임아웃: {e.message}")
 
             tracker.error_step(
-                error_msg="쿼리 실행 시간 초과 (30초)",
+                error_msg=f"쿼리 실행 시간 초과 ({self.deadline_seconds}초)",
                 suggestion="기간을 좁히거나 브랜드를 구체적으로 지정해보세요"
             )
 
-            state["error"] = TimeoutError("Executor", "쿼리 실행 시간 초과 (30초)", e).to_dict()
+            state["error"] = e.to_dict()
             state["messages"] = tracker.get_state_messages()
 
         except psycopg2.OperationalError as e:
@@ -160,45 +214,59 @@ class Executor:
 
     def _execute_single_query_with_retry(
         self,
-        cursor,
         sql_info: Dict[str, Any],
-        tracker: ProgressTracker,
+        deadline: float,
+        started_at: float,
         query_index: int
     ) -> Dict[str, Any]:
         """
-        단일 쿼리 실행 (재시도 포함)
+        단일 쿼리 실행 (재시도 포함, 워커 스레드에서 실행)
 
         Args:
-            cursor: DB cursor
             sql_info: SQL 정보
-            tracker: Progress tracker
+            deadline: 공유 마감 시각 (time.time() 기준)
+            started_at: 노드 시작 시각 (latency 계산용)
             query_index: 쿼리 인덱스
 
         Returns:
-            실행 결과
+            실행 결과 (duration: 실행 시간, wait_time: 연결 대기 시간, latency: 노드 시작부터 완료까지)
         """
+        result = None
+
         for attempt in range(1, self.max_retries + 1):
-            try:
-                result = self._execute_single_query(cursor, sql_info, tracker)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                result = self._failed_result(sql_info, "쿼리 실행 시간 초과 (마감 시간 경과)", 0.0, timed_out=True)
+                break
 
-                if result.get('success'):
-                    return result
+            try:
+                wait_start = time.time()
+                with pooled_connection(timeout=remaining) as conn:
+                    wait_time = time.time() - wait_start
+                    with conn.cursor() as cursor:
+                        result = self._execute_single_query(cursor, sql_info, deadline)
+                result["wait_time"] = wait_time
+
+                if result.get('success') or result.get('timed_out'):
+                    # 성공 또는 시간 초과 (시간 초과는 재시도해도 소용없음)
+                    break
+
+                # 실패했지만 재시도 가능한 경우
+                if attempt < self.max_retries and deadline - time.time() > self.retry_delay:
+                    logger.warning(f"쿼리 {query_index} 실패 (시도 {attempt}/{self.max_retries}), 재시도 중...")
+                    time.sleep(self.retry_delay)
                 else:
-                    # 실패했지만 재시도 가능한 경우
-                    if attempt < self.max_retries:
-                        logger.warning(f"쿼리 {query_index} 실패 (시도 {attempt}/{self.max_retries}), 재시도 중...")
-                        time.sleep(self.retry_delay)
-                    else:
-                        logger.error(f"쿼리 {query_index} 최종 실패 (시도 {attempt}/{self.max_retries})")
-                        return result
+                    logger.error(f"쿼리 {query_index} 최종 실패 (시도 {attempt}/{self.max_retries})")
+                    break
 
-            except psycopg2.errors.QueryCanceled:
-                # 타임아웃은 재시도해도 소용없음
-                raise
+            except TimeoutError as e:
+                # 마감 시간 안에 풀 연결을 얻지 못함
+                result = self._failed_result(sql_info, e.message, 0.0, timed_out=True)
+                break
 
-            except psycopg2.OperationalError as e:
-                # 연결 오류는 재시도
-                if attempt < self.max_retries:
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                # 연결 오류는 새 연결로 재시도
+                if attempt < self.max_retries and deadline - time.time() > self.retry_delay * attempt:
                     logger.warning(f"연결 오류 발생 (시도 {attempt}/{self.max_retries}), 재시도 중...")
                     time.sleep(self.retry_delay * attempt)  # 점진적 대기
                 else:
@@ -209,13 +277,19 @@ class Executor:
                 logger.error(f"쿼리 {query_index} 실행 중 예외: {e}")
                 raise
 
-        return {"success": False, "error": "최대 재시도 횟수 초과"}
+        if result is None:
+            result = self._failed_result(sql_info, "최대 재시도 횟수 초과", 0.0)
+
+        result.setdefault("wait_time", 0.0)
+        result["attempts"] = attempt
+        result["latency"] = time.time() - started_at
+        return result
 
     def _execute_single_query(
         self,
         cursor,
         sql_info: Dict[str, Any],
-        tracker: ProgressTracker
+        deadline: float
     ) -> Dict[str, Any]:
         """
         단일 SQL 실행
@@ -223,61 +297,128 @@ class Executor:
         Args:
             cursor: DB 커서
             sql_info: SQL 정보
-            tracker: 진행상황 추적
+            deadline: 공유 마감 시각 (남은 시간을 statement_timeout으로 설정)
 
         Returns:
-            쿼리 결과
+            쿼리 결과 (data: ResultRows - 컬럼 배열 기반, 행 dict 시퀀스로도 사용 가능,
+            guard: 비용 검사 판단과 예상/실제 기록)
         """
-        question_id = sql_info["question_id"]
         sql = sql_info["sql"]
+        params = sql_info.get("params")
+        decision = None
 
         start_time = time.time()
 
         try:
-            # SQL 실행
-            cursor.execute(sql)
-            rows = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            # 남은 시간과 쿼리별 상한 중 짧은 쪽만큼 실행 (트랜잭션 범위, 반납 시 rollback으로 해제)
+            timeout_ms = max(1, int(min(deadline - start_time, self.statement_timeout_seconds) * 1000))
+            cursor.execute("SET LOCAL statement_timeout = %s", (timeout_ms,))
+
+            # 실행 전 비용 검사 (LIMIT 추가 또는 거부)
+            decision = check_sql(cursor, sql, params)
+            if decision["action"] == "reject":
+                logger.warning(f"Q{sql_info['question_id']} 실행 거부: {decision['reason']}")
+                result = self._failed_result(sql_info, decision["reason"], time.time() - start_time)
+                result["guard"] = record_actual(decision, sql_info["question_id"], None, 0.0, decision["reason"])
+                return result
+
+            # SQL 실행 (FastPath 템플릿 SQL은 파라미터 바인딩)
+            cursor.execute(decision["sql"], params)
+            data = ResultRows.from_cursor(cursor)
 
             duration = time.time() - start_time
 
-            # 딕셔너리 리스트로 변환
-            data = [dict(zip(columns, row)) for row in rows]
-
-            tracker.update_substep(
-                f"Q{question_id} 완료: {len(data)}건 ({duration:.2f}초)"
-            )
-
             return {
-                "question_id": question_id,
+                "question_id": sql_info["question_id"],
                 "sub_question": sql_info["sub_question"],
                 "sql": sql,
+                "params": params,
                 "data": data,
-                "columns": columns,
+                "columns": data.columns,
                 "row_count": len(data),
                 "duration": duration,
                 "success": True,
+                "truncated": decision["action"] == "limit",
+                "guard": record_actual(decision, sql_info["question_id"], len(data), duration),
                 "error": None
             }
 
-        except psycopg2.Error as e:
-            duration = time.time() - start_time
+        except psycopg2.errors.QueryCanceled as e:
+            cursor.connection.rollback()
+            result = self._failed_result(sql_info, str(e), time.time() - start_time, timed_out=True)
+            if decision is not None:
+                result["guard"] = record_actual(decision, sql_info["question_id"], None, result["duration"], str(e))
+            return result
 
-            tracker.update_substep(
-                f"Q{question_id} 오류: {str(e)[:50]}..."
-            )
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # 연결 오류는 상위에서 재시도
+            raise
 
-            return {
-                "question_id": question_id,
-                "sub_question": sql_info["sub_question"],
-                "sql": sql,
-                "data": [],
-                "columns": [],
-                "row_count": 0,
-                "duration": duration,
-                "success": False,
-                "error": str(e)
-            }
+        except psycopg2.Error as e:
+            cursor.connection.rollback()
+            return self._failed_result(sql_info, str(e), time.time() - start_time)
+
+    def _add_guard_trace(self, state: AgentState, results: List[Dict[str, Any]]):
+        """Debug 모드일 때 비용 검사 결과(예상 vs 실제) 저장"""
+        if not state.get("debug_mode", False):
+            return
+
+        guards = [r["guard"] for r in results if r.get("guard") and r["guard"]["action"] != "skip"]
+        if guards:
+            state.setdefault("debug_traces", []).append({
+                "node": "Executor",
+                "step": "sql_guard",
+                "parsed_result": guards
+            })
+
+    def _cached_result(
+        self,
+        sql_info: Dict[str, Any],
+        cached: Dict[str, Any],
+        started_at: float
+    ) -> Dict[str, Any]:
+        """결과 캐시 적중 시 결과 (ResultRows는 읽기 전용으로 공유, LIMIT 적용 여부도 그대로)"""
+        rows = cached["rows"]
+        return {
+            "question_id": sql_info["question_id"],
+            "sub_question": sql_info["sub_question"],
+            "sql": sql_info["sql"],
+            "params": sql_info.get("params"),
+            "data": rows,
+            "columns": rows.columns,
+            "row_count": len(rows),
+            "duration": 0.0,
+            "wait_time": 0.0,
+            "latency": time.time() - started_at,
+            "attempts": 0,
+            "success": True,
+            "truncated": cached.get("truncated", False),
+            "guard": cached.get("guard"),
+            "cache_hit": True,
+            "error": None
+        }
+
+    def _failed_result(
+        self,
+        sql_info: Dict[str, Any],
+        error: str,
+        duration: float,
+        timed_out: bool = False
+    ) -> Dict[str, Any]:
+        """실패한 쿼리 결과"""
+        return {
+            "question_id": sql_info["question_id"],
+            "sub_question": sql_info["sub_question"],
+            "sql": sql_info["sql"],
+            "params": sql_info.get("params"),
+            "data": [],
+            "columns": [],
+            "row_count": 0,
+            "duration": duration,
+            "success": False,
+            "timed_out": timed_out,
+            "error": error
+        }
 
     def _analyze_data_characteristics(
         self,
@@ -0,0 +1,742 @@
+#//==============================================================================//#
+"""
+fast_path.py
+규칙 기반 템플릿 질문 처리 (LLM 체인 우회)
+
+"빌리프 장점 알려줘", "VT 시카크림 보습력 어때?", "라네즈 최근 3개월 평점 트렌드"처럼
+자주 나오는 형태의 질문은 EntityParser → CapabilityDetector → ComplexityClassifier →
+QuestionDecomposer → SQLGenerator (LLM 4~5회)를 거치지 않고
+BRAND_LIST / BRAND_MAPPING / PRODUCT_ATTRIBUTES / ANALYSIS_KEYWORDS 규칙으로
+엔티티를 뽑아 파라미터 바인딩 SQL을 바로 만들고 Executor로 보냅니다.
+
+- 브랜드 1개 + 질문 유형 1개가 확실할 때만 사용 (confidence >= min_confidence)
+- 비교/여러 브랜드/대화 맥락 지칭어/해석 안 되는 단어가 있으면 기존 LLM 체인으로 fallback
+- 남은 단어는 해당 브랜드의 실제 제품명에 포함될 때만 제품 조건으로 사용
+- "최근 N개월/주/일" 외의 기간 표현(작년, 올해, 2023년, 3~5월 등)이 있으면 fallback
+- 롤업 테이블이 최신이고 기간 조건이 없으면 롤업 테이블 사용
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import re
+import time
+import logging
+import threading
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from ..state import AgentState
+from ..progress_tracker import ProgressTracker
+from ..config import (
+    BRAND_LIST,
+    BRAND_MAPPING,
+    CHANNEL_MAPPING,
+    PRODUCT_ATTRIBUTES,
+    CATEGORY_ATTRIBUTES,
+    ANALYSIS_KEYWORDS,
+    FAST_PATH_CONFIG
+)
+from ..data_version import get_data_version, rollups_available, typed_columns_available, review_column_exprs
+from ..db_pool import pooled_connection
+from .entity_parser import parse_period
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.fast_path")
+
+
+# 질문 유형 키워드 (긴 표현부터 매칭)
+INTENT_KEYWORDS = {
+    "pros": ["좋은 점", "좋은점", "장점"],
+    "cons": ["아쉬운 점", "아쉬운점", "안좋은점", "안 좋은 점", "나쁜점", "단점"],
+    "complaints": ["불만사항", "불만 사항", "불만"],
+    "motivation": ["구매 동기", "구매동기", "구매 이유", "구매이유"],
+    "keywords": ["키워드"],
+    "sentiment": ["전반적 평가", "전반적평가", "감정 분석", "감정분석", "감정", "긍부정", "반응"],
+    "rating_distribution": ["평점 분포", "평점분포", "별점 분포", "별점분포"],
+    "rating_trend": ["평점 트렌드", "평점트렌드", "평점 추이", "평점추이", "트렌드", "추이"],
+    "rating": ["평균 평점", "평균평점", "평점", "별점"],
+    "samples": ["샘플 리뷰", "리뷰 샘플", "예시 리뷰", "샘플", "예시", "리뷰 보여줘", "후기 보여줘"]
+}
+
+# 리스트 필드 템플릿 (analysis 키, 결과 컬럼명, 설명)
+LIST_FIELD_INTENTS = {
+    "pros": ("장점", "advantage", "장점 빈도"),
+    "cons": ("단점", "disadvantage", "단점 빈도"),
+    "complaints": ("불만사항", "complaint", "불만사항 빈도"),
+    "motivation": ("구매동기", "motivation", "구매동기 빈도"),
+    "keywords": ("키워드", "keyword", "키워드 빈도")
+}
+
+# 질문 유형별 capabilities (CapabilityDetector 출력 형식)
+INTENT_CAPABILITIES = {
+    "pros": ("keyword_frequency", "none", "pros_cons", "count"),
+    "cons": ("keyword_frequency", "none", "pros_cons", "count"),
+    "complaints": ("keyword_frequency", "none", "pros_cons", "count"),
+    "motivation": ("keyword_frequency", "none", "keyword", "count"),
+    "keywords": ("keyword_frequency", "none", "keyword", "count"),
+    "sentiment": ("distribution", "none", "sentiment", "count"),
+    "attribute": ("simple", "none", "attribute", "count"),
+    "rating": ("simple", "none", "overview", "rating"),
+    "rating_distribution": ("distribution", "none", "overview", "rating"),
+    "rating_trend": ("time_series", "period", "overview", "rating"),
+    "samples": ("simple", "none", "overview", "count")
+}
+
+# 질문에 붙어도 의미 없는 표현 (ANALYSIS_KEYWORDS와 함께 무시)
+FILLER_WORDS = {
+    "알려줘", "알려주세요", "보여줘", "보여주세요", "어때", "어때요", "어떄", "어떤가요", "어떻게",
+    "좀", "해줘", "해주세요", "분석해줘", "궁금해", "궁금해요", "뭐야", "뭐가", "있어", "있나요",
+    "제품", "상품", "정리", "정리해줘", "요약", "요약해줘", "top", "top10", "상위", "주요", "대표",
+    "많이", "언급된", "언급", "사람들", "고객", "소비자", "전체", "기간", "개월", "최근"
+}
+
+# 한국어 조사 (토큰 끝에서 제거)
+PARTICLE_PATTERN = re.compile(r"(이랑|에서|으로|까지|부터|은|는|이|가|을|를|의|에|도|로|과|와|랑|요)$")
+
+# 대화 맥락 지칭어 / 비교 표현 (LLM 체인이 처리)
+CONTEXT_WORDS = ["그럼", "그거", "그 제품", "그제품", "거기", "이거", "아까", "위에", "방금", "같은 제품"]
+COMPARISON_WORDS = ["비교", "vs", "대비", "차이", "보다", "랑", "이랑", "하고"]
+
+# 이미지 생성 키워드 (graph.route_workflow_type과 동일 → EntityParser 경로로)
+IMAGE_KEYWORDS = ["디자인", "시안", "이미지", "패키지", "생성", "만들어", "다이소", "버전"]
+
+# 기간 표현
+PERIOD_PATTERNS = [
+    (re.compile(r"최근\s*(\d+)\s*(개월|달)"), "recent_months", 1),
+    (re.compile(r"최근\s*(\d+)\s*주"), "recent_days", 7),
+    (re.compile(r"최근\s*(\d+)\s*일"), "recent_days", 1)
+]
+
+# PERIOD_PATTERNS로 해석하지 못하는 기간 표현 (남아 있으면 전체 기간으로 잘못 조회되므로 fallback)
+UNPARSED_PERIOD_PATTERN = re.compile(
+    r"재작년|작년|올해|올 해|금년|전년|내년|상반기|하반기|분기|연말|연초|월말|월초|어제|오늘|요즘|"
+    r"(지난|이번|저번|다음)\s*(해|달|주|분기|시즌)|지난|이후|이전|부터|까지|"
+    r"\d{2,4}\s*[-./]\s*\d{1,2}|\d+\s*(년|월|개월|달|주|일)|[~\-]\s*\d+\s*월"
+)
+
+# 제품명 목록 재조회 간격 (초, 데이터 버전이 바뀌면 간격과 관계없이 다시 로드)
+PRODUCT_NAMES_CHECK_INTERVAL = 300
+
+_product_names: Optional[Dict[str, List[str]]] = None
+_product_names_version: Optional[int] = None
+_product_names_checked_at = 0.0
+_product_names_lock = threading.Lock()
+
+
+def load_product_names() -> Dict[str, List[str]]:
+    """
+    브랜드별 제품명 목록 (롤업이 최신이면 review_rollup_totals, 아니면 preprocessed_reviews)
+
+    Returns:
+        {brand: [product_name, ...]} (조회 실패 시 빈 dict → 제품명 질문은 LLM 경로)
+    """
+    global _product_names, _product_names_version, _product_names_checked_at
+
+    now = time.time()
+    version = get_data_version()
+    with _product_names_lock:
+        if (_product_names is not None and version == _product_names_version
+                and now - _product_names_checked_at < PRODUCT_NAMES_CHECK_INTERVAL):
+            return _product_names
+
+    table = "review_rollup_totals" if rollups_available() else "preprocessed_reviews"
+    names: Dict[str, List[str]] = {}
+    try:
+        with pooled_connection(timeout=5) as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT DISTINCT brand, product_name
+                    FROM {table}
+                    WHERE brand IS NOT NULL AND product_name IS NOT NULL
+                """)
+                for brand, product_name in cur.fetchall():
+                    names.setdefault(brand, []).append(product_name)
+    except Exception as e:
+        logger.warning(f"제품명 목록 조회 실패: {e}")
+
+    with _product_names_lock:
+        _product_names = names
+        _product_names_version = version
+        _product_names_checked_at = now
+    return names
+
+
+def _build_brand_patterns() -> List[Tuple[re.Pattern, str]]:
+    """브랜드 매칭 패턴 (표준명 + 영문 매핑, 긴 이름부터)"""
+    names = {brand: brand for brand in BRAND_LIST if len(brand) >= 2}
+    for eng, kor in BRAND_MAPPING.items():
+        if len(eng) >= 2:
+            names.setdefault(eng, kor)
+
+    patterns = []
+    for name in sorted(names, key=len, reverse=True):
+        # 영문/숫자 이름은 단어 경계 필요 (VT가 다른 단어 안에서 매칭되지 않도록)
+        if re.search(r"[A-Za-z0-9]", name):
+            pattern = re.compile(rf"(?<![A-Za-z0-9]){re.escape(name)}(?![A-Za-z0-9])", re.IGNORECASE)
+        else:
+            pattern = re.compile(re.escape(name))
+        patterns.append((pattern, names[name]))
+    return patterns
+
+
+def _all_attributes() -> List[str]:
+    """PRODUCT_ATTRIBUTES + 카테고리 속성 (긴 이름부터)"""
+    attributes = set(PRODUCT_ATTRIBUTES)
+    for attrs in CATEGORY_ATTRIBUTES.values():
+        attributes.update(attrs)
+    return sorted(attributes, key=len, reverse=True)
+
+
+def render_sql(sql: str, params: Optional[List[Any]]) -> str:
+    """
+    UI 표시용 SQL (파라미터를 리터럴로 치환)
+
+    실행에는 사용하지 않습니다 (실행은 항상 파라미터 바인딩).
+    """
+    if not params:
+        return sql
+
+    def _literal(value: Any) -> str:
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float)):
+            return str(value)
+        if isinstance(value, (list, tuple)):
+            return "ARRAY[" + ", ".join(_literal(v) for v in value) + "]"
+        return "'" + str(value).replace("'", "''") + "'"
+
+    values = iter(params)
+    return re.sub(r"%s", lambda _: _literal(next(values)), sql)
+
+
+class FastPath:
+    """템플릿 질문 판별 + 규칙 기반 SQL 생성"""
+
+    def __init__(self, product_names: Optional[Callable[[], Dict[str, List[str]]]] = None):
+        """
+        Args:
+            product_names: 브랜드별 제품명 목록 함수 (기본: load_product_names, 테스트에서 교체)
+        """
+        self.product_names = product_names or load_product_names
+        self.brand_patterns = _build_brand_patterns()
+        self.attributes = _all_attributes()
+        self.min_confidence = FAST_PATH_CONFIG["min_confidence"]
+
+        # 질문 유형 키워드 → 유형 (긴 표현부터)
+        self.intent_keywords = sorted(
+            ((kw, intent) for intent, kws in INTENT_KEYWORDS.items() for kw in kws),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        self.ignored_words = FILLER_WORDS | set(ANALYSIS_KEYWORDS)
+
+    def route(self, state: AgentState) -> AgentState:
+        """
+        템플릿 질문이면 엔티티/전략/SQL을 채우고, 아니면 그대로 통과
+
+        Args:
+            state: 현재 상태
+
+        Returns:
+            업데이트된 상태 (state["fast_path"]["matched"]로 라우팅)
+        """
+        if not FAST_PATH_CONFIG["enabled"]:
+            state["fast_path"] = {"matched": False, "reason": "disabled"}
+            return state
+
+        try:
+            match = self.match(state["user_query"], state.get("conversation_history"))
+        except Exception as e:
+            # 규칙 매칭 실패는 LLM 체인으로 넘기면 되므로 에러로 만들지 않음
+            logger.warning(f"FastPath 매칭 중 예외, LLM 경로로 진행: {type(e).__name__} - {e}")
+            match = {"matched": False, "confidence": 0.0, "reason": f"exception: {e}"}
+
+        self._add_debug_trace(state, match)
+
+        if not match["matched"]:
+            logger.info(f"FastPath 미적용 ({match.get('reason')}) → LLM 경로")
+            state["fast_path"] = {k: v for k, v in match.items() if k in ("matched", "confidence", "reason")}
+            return state
+
+        tracker = ProgressTracker(callback=state.get("ui_callback"))
+        tracker.start_step(
+            node_name="FastPath",
+            description="질문 분석 중... (템플릿 질문)",
+            substeps=["엔티티 추출", "SQL 생성"]
+        )
+
+        entities = match["entities"]
+        intent = match["intent"]
+        brands_str = ", ".join(entities["brands"])
+        tracker.update_substep(f"브랜드: {brands_str} / 유형: {match['description']}")
+
+        sql, params = self.build_sql(intent, entities, match.get("attribute"))
+        tracker.update_substep("규칙 기반 SQL 생성 완료")
+
+        aggregation_type, group_by, analysis_depth, metric = INTENT_CAPABILITIES[intent]
+        sub_question = state["user_query"]
+
+        state["workflow_type"] = "sql"
+        state["parsed_entities"] = entities
+        state["capabilities"] = {
+            "data_scope": "preprocessed_reviews",
+            "aggregation_type": aggregation_type,
+            "group_by": group_by,
+            "analysis_depth": analysis_depth,
+            "metric": metric
+        }
+        state["complexity"] = {
+            "level": "simple",
+            "score": 0,
+            "estimated_time": 1.5,
+            "path": "Template Path (규칙 기반 SQL)"
+        }
+        state["sub_questions"] = [{
+            "sub_question": sub_question,
+            "purpose": match["description"],
+            "dependency": None
+        }]
+        state["sql_queries"] = [{
+            "question_id": 1,
+            "sub_question": sub_question,
+            "sql": sql,
+            "params": params,
+            "purpose": match["description"],
+            "explanation": "템플릿 질문으로 인식되어 규칙 기반으로 생성한 SQL",
+            "estimated_rows": 10,
+            "uses_index": True,
+            "source": "fast_path"
+        }]
+        state["sql_metadata"] = [{
+            "question_id": 1,
+            "sub_question": sub_question,
+            "sql": render_sql(sql, params),
+            "purpose": match["description"],
+            "explanation": "템플릿 질문으로 인식되어 규칙 기반으로 생성한 SQL",
+            "estimated_rows": 10
+        }]
+        state["fast_path"] = {
+            "matched": True,
+            "confidence": match["confidence"],
+            "intent": intent,
+            "reason": match["reason"]
+        }
+
+        tracker.complete_step(summary=f"템플릿 질문 ({match['description']}) - LLM 분석 단계 생략")
+        state["messages"] = tracker.get_state_messages()
+
+        logger.info(f"FastPath 적용: intent={intent}, confidence={match['confidence']:.2f}, entities={entities}")
+        return state
+
+    def match(
+        self,
+        query: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        질문을 규칙으로 해석
+
+        Args:
+            query: 사용자 질문
+            conversation_history: 대화 히스토리 (지칭어 판단용)
+
+        Returns:
+            {"matched": bool, "confidence": float, "reason": str,
+             "intent": str, "entities": {...}, "attribute": str, "description": str}
+        """
+        text = " ".join(query.split())
+        lowered = text.lower()
+
+        if any(kw in text for kw in IMAGE_KEYWORDS):
+            return self._reject("image_generation")
+        if conversation_history and any(word in text for word in CONTEXT_WORDS):
+            return self._reject("context_reference")
+
+        # 1. 브랜드 (겹치지 않게 긴 이름부터)
+        spans: List[Tuple[int, int]] = []
+        brands: List[str] = []
+        for pattern, brand in self.brand_patterns:
+            for m in pattern.finditer(text):
+                if self._overlaps(spans, m.start(), m.end()):
+                    continue
+                spans.append((m.start(), m.end()))
+                if brand not in brands:
+                    brands.append(brand)
+
+        if len(brands) != 1:
+            return self._reject("no_brand" if not brands else "multiple_brands")
+
+        # 2. 기간
+        period = {"type": "all"}
+        for pattern, period_type, multiplier in PERIOD_PATTERNS:
+            m = pattern.search(text)
+            if m and not self._overlaps(spans, m.start(), m.end()):
+                period = {"type": period_type, "value": int(m.group(1)) * multiplier}
+                spans.append((m.start(), m.end()))
+                break
+
+        unparsed_period = UNPARSED_PERIOD_PATTERN.search(self._mask(text, spans))
+        if unparsed_period:
+            return self._reject(f"unparsed_period: {unparsed_period.group(0)}")
+
+        # 3. 채널
+        channels: List[str] = []
+        for name, code in CHANNEL_MAPPING.items():
+            for alias in (name, code):
+                idx = lowered.find(alias.lower())
+                if idx >= 0 and not self._overlaps(spans, idx, idx + len(alias)):
+                    spans.append((idx, idx + len(alias)))
+                    if code not in channels:
+                        channels.append(code)
+
+        # 4. 질문 유형 키워드 / 속성
+        intents: List[str] = []
+        for keyword, intent in self.intent_keywords:
+            for m in re.finditer(re.escape(keyword), text):
+                if self._overlaps(spans, m.start(), m.end()):
+                    continue
+                spans.append((m.start(), m.end()))
+                if intent not in intents:
+                    intents.append(intent)
+
+        attributes: List[str] = []
+        for attribute in self.attributes:
+            for m in re.finditer(re.escape(attribute), text):
+                if self._overlaps(spans, m.start(), m.end()):
+                    continue
+                spans.append((m.start(), m.end()))
+                if attribute not in attributes:
+                    attributes.append(attribute)
+
+        if attributes:
+            intents.append("attribute")
+
+        # 평점 + 트렌드/분포는 하나의 유형
+        if "rating" in intents and ("rating_trend" in intents or "rating_distribution" in intents):
+            intents.remove("rating")
+
+        # 5. 비교 표현은 LLM 체인 (분해 필요)
+        leftover_tokens = self._leftover_tokens(text, spans)
+        if any(word in COMPARISON_WORDS for word in leftover_tokens) or "비교" in text:
+            return self._reject("comparison")
+
+        if len(intents) != 1 or len(attributes) > 1:
+            return self._reject("no_intent" if not intents else "multiple_intents")
+        intent = intents[0]
+
+        # 6. 남은 단어 = 제품명 후보 (브랜드의 실제 제품명에 포함될 때만)
+        remaining = [
+            token for token in leftover_tokens
+            if token.lower() not in self.ignored_words and not token.isdigit()
+        ]
+
+        confidence = 1.0
+        products: List[str] = []
+        if len(remaining) == 1 and len(remaining[0]) >= 2 and self._is_product_name(brands[0], remaining[0]):
+            products = remaining
+            confidence = 0.85  # 제품명은 LIKE 부분 일치라 브랜드만 있을 때보다 낮게
+        elif remaining:
+            confidence = 0.5  # 제품명이 아니거나 여러 단어 → 의도를 놓칠 수 있음
+
+        if confidence < self.min_confidence:
+            return self._reject(f"unparsed_tokens: {remaining}", confidence)
+
+        entities = {
+            "brands": brands,
+            "products": products,
+            "attributes": attributes if intent == "attribute" else [LIST_FIELD_INTENTS[intent][0]] if intent in LIST_FIELD_INTENTS else [],
+            "period": parse_period(period),
+            "channels": channels
+        }
+
+        if intent == "attribute":
+            description = f"{attributes[0]} 평가 분포"
+        elif intent in LIST_FIELD_INTENTS:
+            description = LIST_FIELD_INTENTS[intent][2]
+        else:
+            description = {
+                "sentiment": "전반적 평가(감정) 분포",
+                "rating": "평균 평점",
+                "rating_distribution": "평점 분포",
+                "rating_trend": "월별 평점 트렌드",
+                "samples": "최근 리뷰 샘플"
+            }[intent]
+
+        return {
+            "matched": True,
+            "confidence": confidence,
+            "reason": "template",
+            "intent": intent,
+            "entities": entities,
+            "attribute": attributes[0] if attributes else None,
+            "description": description
+        }
+
+    def build_sql(
+        self,
+        intent: str,
+        entities: Dict[str, Any],
+        attribute: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """
+        질문 유형별 파라미터 바인딩 SQL
+
+        Args:
+            intent: 질문 유형
+            entities: 엔티티 (brands, products, channels, period)
+            attribute: 속성명 (intent == "attribute")
+
+        Returns:
+            (sql, params) - sql의 %s 순서대로 params
+        """
+        period = entities.get("period", {})
+        has_period = bool(period.get("start"))
+        use_rollups = not has_period and rollups_available()
+
+        if intent in LIST_FIELD_INTENTS:
+            field, column, _ = LIST_FIELD_INTENTS[intent]
+            if use_rollups:
+                where, params = self._where(entities, with_period=False)
+                sql = f"""SELECT term AS {column}, SUM(mention_count)::bigint AS count
+FROM review_rollup_terms
+WHERE field = %s AND {where}
+GROUP BY term
+ORDER BY count DESC
+LIMIT 10"""
+                return sql, [field] + params
+
+            where, params = self._where(entities)
+            sql = f"""SELECT term AS {column}, COUNT(*) AS count
+FROM preprocessed_reviews,
+     jsonb_array_elements_text(
+         CASE WHEN jsonb_typeof(analysis->%s) = 'array' THEN analysis->%s ELSE '[]'::jsonb END
+     ) AS term
+WHERE {where}
+GROUP BY term
+ORDER BY count DESC
+LIMIT 10"""
+            return sql, [field, field] + params
+
+        if intent == "sentiment":
+            if use_rollups:
+                where, params = self._where(entities, with_period=False)
+                sql = f"""SELECT sentiment, SUM(review_count)::bigint AS count
+FROM review_rollup_sentiment
+WHERE {where}
+GROUP BY sentiment
+ORDER BY count DESC"""
+                return sql, params
+
+            where, params = self._where(entities)
+            sql = f"""SELECT analysis->'감정요약'->>'전반적평가' AS sentiment, COUNT(*) AS count
+FROM preprocessed_reviews
+WHERE {where}
+  AND analysis->'감정요약'->>'전반적평가' IS NOT NULL
+GROUP BY 1
+ORDER BY count DESC"""
+            return sql, params
+
+        if intent == "attribute":
+            # 속성명은 화이트리스트(config)에서만 오므로 컬럼 별칭에 그대로 사용
+            if use_rollups:
+                where, params = self._where(entities, with_period=False)
+                sql = f"""SELECT evaluation AS "{attribute}평가", SUM(review_count)::bigint AS count
+FROM review_rollup_attributes
+WHERE attribute = %s AND {where}
+GROUP BY evaluation
+ORDER BY count DESC
+LIMIT 20"""
+                return sql, [attribute] + params
+
+            where, params = self._where(entities)
+            sql = f"""SELECT analysis->'제품특성'->>%s AS "{attribute}평가", COUNT(*) AS count
+FROM preprocessed_reviews
+WHERE {where}
+  AND analysis->'제품특성'->%s IS NOT NULL
+GROUP BY 1
+ORDER BY count DESC
+LIMIT 20"""
+            return sql, [attribute] + params + [attribute]
+
+        where, params = self._where(entities)
+        typed_columns = typed_columns_available()
+        columns = review_column_exprs(typed_columns)
+
+        if intent == "rating":
+            # 타입 컬럼(rating_num)은 숫자가 아니면 NULL이라 AVG가 알아서 제외
+            rating_filter = (
+                f"{columns['rating']} IS NOT NULL" if typed_columns
+                else "rating ~ '^[0-9]+(\\.[0-9]+)?$'"
+            )
+            sql = f"""SELECT COUNT(*) AS review_count,
+       ROUND(AVG({columns['rating']})::numeric, 2) AS avg_rating
+FROM preprocessed_reviews
+WHERE {where}
+  AND {rating_filter}"""
+            return sql, params
+
+        if intent == "rating_distribution":
+            sql = f"""SELECT rating, COUNT(*) AS count
+FROM preprocessed_reviews
+WHERE {where}
+  AND rating IS NOT NULL
+GROUP BY rating
+ORDER BY rating DESC"""
+            return sql, params
+
+        if intent == "rating_trend":
+            sql = f"""SELECT DATE_TRUNC('month', {columns['date']}) AS month,
+       ROUND(AVG({columns['rating']})::numeric, 2) AS avg_rating,
+       COUNT(*) AS review_count
+FROM preprocessed_reviews
+WHERE {where}
+  AND {columns['date']} IS NOT NULL
+GROUP BY 1
+ORDER BY 1"""
+            return sql, params
+
+        # samples
+        sql = f"""SELECT brand, product_name, channel, rating, review_date, review_clean,
+       analysis->'감정요약'->>'전반적평가' AS sentiment
+FROM preprocessed_reviews
+WHERE {where}
+ORDER BY {columns['date']} DESC NULLS LAST
+LIMIT 10"""
+        return sql, params
+
+    def _where(self, entities: Dict[str, Any], with_period: bool = True) -> Tuple[str, List[Any]]:
+        """브랜드/제품/채널/기간 WHERE 조건 (SQLGenerator 필터링 규칙과 동일)"""
+        conditions = []
+        params: List[Any] = []
+
+        brands = entities.get("brands", [])
+        if len(brands) == 1:
+            conditions.append("brand = %s")
+            params.append(brands[0])
+        elif brands:
+            conditions.append("brand = ANY(%s)")
+            params.append(list(brands))
+
+        products = entities.get("products", [])
+        if products:
+            conditions.append("(" + " OR ".join(["product_name LIKE %s"] * len(products)) + ")")
+            params.extend(f"%{p}%" for p in products)
+
+        channels = entities.get("channels", [])
+        if len(channels) == 1:
+            conditions.append("channel = %s")
+            params.append(channels[0])
+        elif channels:
+            conditions.append("channel = ANY(%s)")
+            params.append(list(channels))
+
+        period = entities.get("period", {})
+        if with_period and period.get("start"):
+            date_column = review_column_exprs()["date"]
+            conditions.append(f"{date_column} >= %s")
+            params.append(period["start"])
+            if period.get("end"):
+                conditions.append(f"{date_column} <= %s")
+                params.append(period["end"])
+
+        return (" AND ".join(conditions) if conditions else "TRUE"), params
+
+    def _is_product_name(self, brand: str, token: str) -> bool:
+        """token이 브랜드 제품명 일부인지 (_where의 product_name LIKE '%token%'와 같은 기준)"""
+        return any(token in name for name in self.product_names().get(brand, []))
+
+    @staticmethod
+    def _mask(text: str, spans: List[Tuple[int, int]]) -> str:
+        """매칭된 구간을 공백으로 지운 문자열"""
+        chars = list(text)
+        for start, end in spans:
+            for i in range(start, end):
+                chars[i] = " "
+        return "".join(chars)
+
+    def _leftover_tokens(self, text: str, spans: List[Tuple[int, int]]) -> List[str]:
+        """매칭된 구간을 지운 나머지 단어 (조사/문장부호 제거)"""
+        remaining = re.sub(r"[?!.,~\"'()\[\]]", " ", self._mask(text, spans))
+
+        tokens = []
+        for token in remaining.split():
+            stripped = token
+            # "보습력은요" 같은 조사 연속도 제거
+            while True:
+                new = PARTICLE_PATTERN.sub("", stripped)
+                if new == stripped or not new:
+                    stripped = new
+                    break
+                stripped = new
+            if stripped:
+                tokens.append(stripped)
+        return tokens
+
+    @staticmethod
+    def _overlaps(spans: List[Tuple[int, int]], start: int, end: int) -> bool:
+        return any(start < s_end and s_start < end for s_start, s_end in spans)
+
+    @staticmethod
+    def _reject(reason: str, confidence: float = 0.0) -> Dict[str, Any]:
+        return {"matched": False, "confidence": confidence, "reason": reason}
+
+    def _add_debug_trace(self, state: Dict[str, Any], match: Dict[str, Any]):
+        """Debug 모드일 때 매칭 결과 저장"""
+        if state.get("debug_mode", False):
+            state.setdefault("debug_traces", []).append({
+                "node": "FastPath",
+                "step": "template_match",
+                "parsed_result": match
+            })
+
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    catalog = {
+        "빌리프": ["빌리프 더 트루 크림 모이스춰라이징 밤", "빌리프 더 트루 크림 아쿠아 밤"],
+        "VT": ["VT 시카크림", "VT 리들샷 100 에센스"],
+        "라네즈": ["라네즈 워터뱅크 블루 히알루로닉 크림"]
+    }
+    fast_path = FastPath(product_names=lambda: catalog)
+
+    # (질문, matched, intent 또는 reason 접두어, 제품 조건)
+    test_cases = [
+        ("빌리프 장점 알려줘", True, "pros", []),
+        ("VT 시카크림 보습력 어때?", True, "attribute", ["시카크림"]),
+        ("라네즈 최근 3개월 평점 트렌드", True, "rating_trend", []),
+        ("올리브영에서 빌리프 평점 분포", True, "rating_distribution", []),
+        ("빌리프 아쿠아 단점", True, "cons", ["아쿠아"]),
+        ("빌리프 단점 없어?", False, "unparsed_tokens", None),
+        ("라네즈 보습력 좋아?", False, "unparsed_tokens", None),
+        ("빌리프 1점 리뷰 보여줘", False, "unparsed_tokens", None),
+        ("빌리프 2023년 평점", False, "unparsed_period", None),
+        ("빌리프 작년 장점", False, "unparsed_period", None),
+        ("빌리프 올해 평점 트렌드", False, "unparsed_period", None),
+        ("빌리프 3월~5월 평점", False, "unparsed_period", None),
+        ("CNP 최근 3개월 평점 트렌드", False, "no_brand", None),
+        ("빌리프랑 VT 비교해줘", False, "multiple_brands", None),
+        ("빌리프 리뷰 종합 분석해줘 특히 여름철 사용감", False, "", None),
+        ("다이소 버전 패키지 디자인 만들어줘", False, "image_generation", None)
+    ]
+
+    for query, matched, expected, products in test_cases:
+        result = fast_path.match(query)
+        print(f"질문: {query} → matched={result['matched']} confidence={result['confidence']} "
+              f"reason={result['reason']}")
+        assert result["matched"] == matched, result
+        if matched:
+            assert result["confidence"] >= fast_path.min_confidence, result
+            assert result["intent"] == expected, result
+            assert result["entities"]["products"] == products, result
+        else:
+            assert result["reason"].startswith(expected), result
+
+    # 기간은 파라미터 바인딩으로만 SQL에 들어감
+    result = fast_path.match("라네즈 최근 3개월 평점 트렌드")
+    sql, params = fast_path.build_sql(result["intent"], result["entities"], result.get("attribute"))
+    assert result["entities"]["period"].get("start") in params
+    print("\n" + render_sql(sql, params))
+
+    print("\n✅ 모든 확인 통과")
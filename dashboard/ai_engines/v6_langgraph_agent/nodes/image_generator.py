@@ -5,22 +5,29 @@ AI Visual Agent - 이미지 생성 노드
 
 Gemini 2.5 Flash를 사용하여 Daiso 채널 최적화 디자인 이미지 생성
 
+- 패키징 옵션 3가지를 스레드 풀에서 동시에 요청 (옵션별 request_timeout)
+- 완성된 이미지는 ui_callback으로 바로 전달 (status="image_ready", 콜백은 호출 스레드에서만)
+- 같은 디자인(원본 이미지 + 브랜드 + 제품 + 프롬프트 버전)의 옵션은 디자인 캐시에서 재사용
+- PNG는 내용 해시 파일명으로 저장 (같은 이미지 중복 저장 없음, design_cache.py)
+
 last_updated: 2025.11.02
 """
 #//==============================================================================//#
 
-import os
 import logging
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, List
-from io import BytesIO
 from PIL import Image
-from google import genai
 from google.genai import types
 
 from ..state import AgentState
-from ..errors import handle_exception, LLMError
+from ..clients import SharedGeminiClient
+from ..config import IMAGE_GENERATION_CONFIG
+from ..design_cache import get_design_cache
+from ..errors import handle_exception, LLMError, TimeoutError
 from ..state_validator import validate_state
 
 # 로거 설정
@@ -29,31 +36,16 @@ logger = logging.getLogger("v6_agent.image_generator")
 class ImageGenerator:
     """이미지 생성 노드 - Gemini 2.5 Flash"""
 
-    def __init__(self):
-        # Initialize Gemini client
-        # Try multiple sources: env vars, streamlit secrets, or raise error
-        api_key = None
-
-        # 1. Try environment variables
-        api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+    # 프로세스 공유 Gemini 클라이언트 (clients.py, 사용 시점에 API 키 확인)
+    client = SharedGeminiClient()
 
-        # 2. Try Streamlit secrets
-        if not api_key:
-            try:
-                import streamlit as st
-                api_key = st.secrets.get("GEMINI_API_KEY") or st.secrets.get("GOOGLE_API_KEY")
-            except:
-                pass
-
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables or Streamlit secrets")
-
-        self.client = genai.Client(api_key=api_key)
+    def __init__(self):
+        # 디자인 캐시 (이미지 저장 경로 = 캐시 폴더, dashboard/generated_images/daiso/design_cache)
+        self.design_cache = get_design_cache()
 
-        # 이미지 저장 경로 설정
-        project_root = Path(__file__).resolve().parents[4]
-        self.output_dir = project_root / "dashboard" / "generated_images" / "daiso"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.model = IMAGE_GENERATION_CONFIG["model"]
+        self.max_workers = IMAGE_GENERATION_CONFIG["max_workers"]
+        self.request_timeout = IMAGE_GENERATION_CONFIG["request_timeout"]
 
         # 패키징 옵션 정의 (테스트베드용 3가지 버전)
         self.packaging_options = [
@@ -118,66 +110,23 @@ class ImageGenerator:
                 }
                 return state
 
-            # 이미지 로드
+            # 이미지 로드 (워커마다 복사본 사용)
             source_pil_image = Image.open(source_image)
+            source_pil_image.load()
 
-            # 생성된 이미지 정보
-            generated_images = []
-
-            # 3가지 패키징 옵션으로 각각 생성
-            for idx, packaging in enumerate(self.packaging_options):
-                logger.info(f"패키징 옵션 {idx+1}/3 생성 중: {packaging['name']}")
+            # 디자인 캐시 키 (ImagePromptGenerator와 같은 브랜드/제품 문자열)
+            entities = state.get("parsed_entities") or {}
+            design_key = self.design_cache.design_key(
+                source_image,
+                " ".join(entities.get("brands") or []),
+                " ".join(entities.get("products") or [])
+            )
 
-                # UI 업데이트
-                if state.get("ui_callback"):
-                    state["ui_callback"]({
-                        "node": "ImageGenerator",
-                        "status": "running",
-                        "message": f"옵션 {idx+1}/3 생성 중: {packaging['name']}"
-                    })
+            # 3가지 패키징 옵션 동시 생성 (캐시된 옵션 제외)
+            generated_images = self._generate_all_options(state, source_pil_image, base_prompt, design_key)
 
-                # 패키징 타입별 프롬프트 생성
-                packaging_prompt = self._create_packaging_prompt(base_prompt, packaging)
-
-                # Gemini 2.5 Flash Image (Nano Banana) API 호출
-                response = self.client.models.generate_content(
-                    model="gemini-2.5-flash-image",
-                    contents=[source_pil_image, packaging_prompt],
-                    config=types.GenerateContentConfig(
-                        response_modalities=["IMAGE"],
-                        image_config=types.ImageConfig(
-                            aspect_ratio="1:1",
-                        )
-                    )
-                )
-
-                # Extract image from response
-                for part in response.candidates[0].content.parts:
-                    if part.inline_data is not None:
-                        # Get image bytes and convert to PIL Image
-                        image_bytes = part.inline_data.data
-                        image = Image.open(BytesIO(image_bytes))
-
-                        # 로컬에 저장
-                        local_path = self._save_image(
-                            image=image,
-                            packaging_type=packaging["type"],
-                            index=idx
-                        )
-
-                        logger.info(f"이미지 저장 완료: {local_path}")
-
-                        generated_images.append({
-                            "url": None,
-                            "local_path": str(local_path),
-                            "packaging_type": packaging["type"],
-                            "packaging_name": packaging["name"],
-                            "packaging_description": packaging["description"],
-                            "packaging_size": packaging["size"],
-                            "revised_prompt": packaging_prompt,
-                            "timestamp": datetime.now().isoformat(),
-                            "model": "gemini-2.5-flash-image (Nano Banana)"
-                        })
+            if not generated_images:
+                raise LLMError("ImageGenerator", "모든 패키징 옵션 이미지 생성 실패")
 
             state["generated_images"] = generated_images
 
@@ -206,6 +155,175 @@ class ImageGenerator:
             state["error"] = handle_exception("ImageGenerator", e)
             return state
 
+    def _generate_all_options(
+        self,
+        state: AgentState,
+        source_pil_image: Image.Image,
+        base_prompt: str,
+        design_key: str
+    ) -> List[Dict[str, Any]]:
+        """
+        패키징 옵션별 이미지를 동시에 생성하고, 완성되는 대로 UI에 전달
+
+        Args:
+            state: 에이전트 상태 (ui_callback)
+            source_pil_image: 원본 제품 이미지
+            base_prompt: 디자인 프롬프트
+            design_key: 디자인 캐시 키 (옵션별 캐시 조회/저장)
+
+        Returns:
+            생성된 이미지 정보 (패키징 옵션 순서, 실패/시간 초과 옵션은 제외)
+        """
+        ui_callback = state.get("ui_callback")
+        total = len(self.packaging_options)
+        results: Dict[int, List[Dict[str, Any]]] = {}
+
+        # 캐시된 옵션은 바로 표시
+        for idx, packaging in enumerate(self.packaging_options):
+            cached = self.design_cache.get_images(design_key, packaging["type"])
+            if not cached:
+                continue
+
+            results[idx] = cached
+            logger.info(f"패키징 옵션 {idx+1}/{total} 캐시 적중: {packaging['name']}")
+            if ui_callback:
+                for image_info in cached:
+                    ui_callback({
+                        "node": "ImageGenerator",
+                        "status": "image_ready",
+                        "message": f"옵션 {idx+1}/{total} 완료: {packaging['name']} (이전 결과 재사용)",
+                        "image": image_info
+                    })
+
+        missing = [idx for idx in range(total) if idx not in results]
+        if not missing:
+            return [image for idx in sorted(results) for image in results[idx]]
+
+        if ui_callback:
+            ui_callback({
+                "node": "ImageGenerator",
+                "status": "running",
+                "message": f"{len(missing)}개 패키징 옵션 동시 생성 중..."
+            })
+
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(missing))),
+            thread_name_prefix="v6-image"
+        )
+        try:
+            futures = {
+                pool.submit(
+                    self._generate_option, source_pil_image.copy(), base_prompt, self.packaging_options[idx], idx
+                ): idx
+                for idx in missing
+            }
+            # 모든 요청이 동시에 시작하므로 옵션별 제한 시간 = 공유 마감 시각
+            deadline = time.time() + self.request_timeout
+            pending = set(futures)
+
+            while pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = futures[future]
+                    packaging = self.packaging_options[idx]
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        logger.warning(f"패키징 옵션 {idx+1}/{total} 생성 실패 ({packaging['name']}): {e}")
+                        continue
+
+                    logger.info(f"패키징 옵션 {idx+1}/{total} 완료: {packaging['name']} ({len(results[idx])}장)")
+                    self.design_cache.put_images(design_key, packaging["type"], results[idx])
+
+                    # UI 업데이트 (완성된 이미지 바로 표시)
+                    if ui_callback:
+                        for image_info in results[idx]:
+                            ui_callback({
+                                "node": "ImageGenerator",
+                                "status": "image_ready",
+                                "message": f"옵션 {idx+1}/{total} 완료: {packaging['name']}",
+                                "image": image_info
+                            })
+
+            for future in pending:
+                packaging = self.packaging_options[futures[future]]
+                logger.warning(f"패키징 옵션 생성 시간 초과 ({self.request_timeout}초): {packaging['name']}")
+
+            if pending and not results:
+                raise TimeoutError("ImageGenerator", f"이미지 생성 시간 초과 ({self.request_timeout}초)")
+
+        finally:
+            # 시간 초과된 요청은 기다리지 않음 (백그라운드에서 끝나도 결과는 사용하지 않음)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return [image for idx in sorted(results) for image in results[idx]]
+
+    def _generate_option(
+        self,
+        source_pil_image: Image.Image,
+        base_prompt: str,
+        packaging: Dict[str, str],
+        idx: int
+    ) -> List[Dict[str, Any]]:
+        """
+        패키징 옵션 하나 생성 + 저장 (워커 스레드에서 실행, UI 호출 없음)
+
+        Args:
+            source_pil_image: 원본 제품 이미지 (이 요청 전용 복사본)
+            base_prompt: 디자인 프롬프트
+            packaging: 패키징 옵션 정보
+            idx: 옵션 인덱스
+
+        Returns:
+            생성된 이미지 정보 리스트
+        """
+        # 패키징 타입별 프롬프트 생성
+        packaging_prompt = self._create_packaging_prompt(base_prompt, packaging)
+
+        # Gemini 2.5 Flash Image (Nano Banana) API 호출
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=[source_pil_image, packaging_prompt],
+            config=types.GenerateContentConfig(
+                response_modalities=["IMAGE"],
+                image_config=types.ImageConfig(
+                    aspect_ratio="1:1",
+                )
+            )
+        )
+
+        images = []
+
+        # Extract image from response
+        for part in response.candidates[0].content.parts:
+            if part.inline_data is not None:
+                # 로컬에 저장 (같은 이미지면 기존 파일 재사용)
+                local_path = self._save_image(
+                    image_bytes=part.inline_data.data,
+                    packaging_type=packaging["type"],
+                    index=idx
+                )
+
+                logger.info(f"이미지 저장 완료: {local_path}")
+
+                images.append({
+                    "url": None,
+                    "local_path": str(local_path),
+                    "packaging_type": packaging["type"],
+                    "packaging_name": packaging["name"],
+                    "packaging_description": packaging["description"],
+                    "packaging_size": packaging["size"],
+                    "revised_prompt": packaging_prompt,
+                    "timestamp": datetime.now().isoformat(),
+                    "model": f"{self.model} (Nano Banana)"
+                })
+
+        return images
+
     def _create_packaging_prompt(self, base_prompt: str, packaging: Dict[str, str]) -> str:
         """
         패키징 타입별 프롬프트 생성
@@ -236,25 +354,19 @@ PACKAGING FORMAT (IMPORTANT):
 
         return enhanced_prompt
 
-    def _save_image(self, image: Image.Image, packaging_type: str, index: int = 0) -> Path:
+    def _save_image(self, image_bytes: bytes, packaging_type: str, index: int = 0) -> Path:
         """
-        생성된 이미지를 로컬에 저장
+        생성된 이미지를 로컬에 저장 (디자인 캐시 폴더, 내용 해시 파일명)
 
         Args:
-            image: PIL Image 객체
+            image_bytes: Gemini 응답 이미지 bytes
             packaging_type: 패키징 타입 (파일명에 포함)
             index: 이미지 인덱스
 
         Returns:
-            저장된 파일 경로
+            저장된 파일 경로 (같은 이미지가 이미 있으면 그 경로)
         """
-        # 타임스탬프 기반 파일명
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"daiso_{packaging_type}_{timestamp}.png"
-        file_path = self.output_dir / filename
-
-        # 이미지 저장
-        image.save(file_path, format='PNG')
+        file_path = self.design_cache.store_png(image_bytes, prefix=f"daiso_{packaging_type}")
 
         logger.debug(f"이미지 저장: {file_path}")
         return file_path
@@ -4,11 +4,14 @@ image_prompt_generator.py
 AI Visual Agent - 이미지 프롬프트 생성 노드
 
 Daiso 채널 최적화 디자인 프롬프트 생성:
-1. 올리브영 제품 이미지 찾기 (DB 기반)
-2. 올리브영 제품 리뷰 키워드 추출 (preprocessed_reviews)
-3. Daiso 채널 리뷰 키워드 추출 (preprocessed_reviews)
-4. GPT-4o로 Daiso 채널 특성 요약
-5. Gemini (Nano Banana) 이미지 변환 프롬프트 생성
+1. 올리브영 제품 이미지 + 제품 리뷰 키워드 (+ Daiso 채널 키워드) 조회
+   - DB 왕복 1회, 키워드 빈도 집계는 SQL에서 (JSONB 배열 펼쳐서 GROUP BY)
+2. GPT-4o로 Daiso 채널 특성 요약
+   - 사용자 제품과 무관하므로 노드 생성 시 미리 계산, 데이터 버전별로 디자인 캐시에 저장
+3. 한글 키워드 영어 번역 (번역 사전에 없는 키워드만 GPT-4o)
+4. Gemini (Nano Banana) 이미지 변환 프롬프트 생성
+
+같은 원본 이미지 + 브랜드 + 제품이면 2~4단계 대신 디자인 캐시(design_cache.py) 사용
 
 Image-to-Image Transformation:
 - 올리브영 제품 이미지를 Gemini에 직접 전달
@@ -19,40 +22,62 @@ last_updated: 2025.11.02
 """
 #//==============================================================================//#
 
-import os
+import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from openai import OpenAI
 
 from ..state import AgentState
-from ..config import DB_CONFIG, LLM_CONFIG
+from ..clients import SharedOpenAIClient
+from ..config import DESIGN_INPUT_CONFIG, EXECUTOR_CONFIG
+from ..data_version import get_data_version
+from ..db_pool import pooled_connection
+from ..design_cache import get_design_cache
 from ..errors import handle_exception, DatabaseError, LLMError
 from ..state_validator import validate_state
 
 # 로거 설정
 logger = logging.getLogger("v6_agent.image_prompt_generator")
 
+# Daiso 키워드 조회/요약 실패 시 기본값
+DEFAULT_DAISO_KEYWORDS = ["가성비", "귀엽다", "미니", "휴대", "저렴"]
+DEFAULT_DAISO_SUMMARY = "Affordable, cute, portable mini-size products. Value-focused with playful, approachable design."
+
 class ImagePromptGenerator:
     """이미지 프롬프트 생성 노드"""
 
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
 
+    def __init__(self):
         # 브랜드 시그니처 디자인 파일 로드
         self.brand_signatures = self._load_brand_signatures()
 
+        # 디자인 프롬프트 디스크 캐시 (ImageGenerator와 공유)
+        self.design_cache = get_design_cache()
+
+        # Daiso 채널 요약 (data_version, {"summary", "keywords"}) - 제품과 무관하므로 미리 계산
+        self._daiso_summary: Optional[Tuple[Optional[int], Dict[str, Any]]] = None
+        self._daiso_lock = threading.Lock()
+        if DESIGN_INPUT_CONFIG["precompute_daiso_summary"]:
+            threading.Thread(
+                target=self.precompute_daiso_summary,
+                name="v6-daiso-summary",
+                daemon=True
+            ).start()
+
     def generate(self, state: AgentState) -> AgentState:
         """
         이미지 프롬프트 생성
 
         워크플로우:
-        1. 올리브영 제품 이미지 찾기
-        2. 올리브영 제품 리뷰 키워드 추출
-        3. Daiso 채널 리뷰 키워드 추출 및 특성 요약
-        4. Gemini 이미지 변환 프롬프트 생성
+        1. 올리브영 제품 이미지 + 리뷰 키워드 조회 (Daiso 요약이 없으면 Daiso 키워드도 같은 쿼리로)
+        2. 디자인 캐시 확인
+        3. Daiso 채널 특성 요약 (미리 계산된 요약 사용)
+        4. 키워드 영어 번역 (번역 사전)
+        5. Gemini 이미지 변환 프롬프트 생성
         """
         try:
             logger.info("ImagePromptGenerator 시작")
@@ -73,8 +98,11 @@ class ImagePromptGenerator:
                 }
                 return state
 
-            # 2. 올리브영 제품 이미지 찾기
-            image_path = self._find_oliveyoung_image(brands, products)
+            # 2. 올리브영 제품 + 키워드 조회 (DB 왕복 1회)
+            daiso_entry = self._cached_daiso_summary()
+            inputs = self._fetch_design_inputs(brands, products, include_daiso=daiso_entry is None)
+
+            image_path = self._product_image_path(inputs["product"])
             if not image_path:
                 error_msg = "올리브영 제품 이미지를 찾을 수 없습니다."
                 logger.error(error_msg)
@@ -87,14 +115,37 @@ class ImagePromptGenerator:
             logger.info(f"제품 이미지 발견: {image_path}")
             state["source_product_image"] = image_path
 
-            # 3. 올리브영 제품 리뷰 키워드 추출
-            oy_keywords = self._extract_keywords_from_reviews(brands, products)
+            brand_text = " ".join(brands) if brands else ""
+            product_text = " ".join(products) if products else ""
+
+            # 캐시 확인 (같은 원본 이미지 + 브랜드 + 제품 + 프롬프트 버전)
+            design_key = self.design_cache.design_key(image_path, brand_text, product_text)
+            cached = self.design_cache.get_prompt(design_key)
+            if cached:
+                logger.info("디자인 프롬프트 캐시 적중")
+                state["design_keywords"] = cached.get("design_keywords") or []
+                state["daiso_channel_summary"] = cached.get("daiso_channel_summary", "")
+                state["design_prompt"] = cached["design_prompt"]
+
+                if state.get("ui_callback"):
+                    state["ui_callback"]({
+                        "node": "ImagePromptGenerator",
+                        "status": "completed",
+                        "message": "디자인 프롬프트 생성 완료 (이전 결과 재사용)"
+                    })
+                return state
+
+            # 3. 올리브영 제품 리뷰 키워드
+            oy_keywords = inputs["oy_keywords"]
             state["design_keywords"] = oy_keywords
             logger.debug(f"OY 키워드: {oy_keywords[:5]}")
 
-            # 4. Daiso 채널 키워드 추출 및 특성 요약
-            daiso_keywords = self._extract_daiso_channel_keywords()
-            daiso_summary = self._summarize_daiso_channel(daiso_keywords)
+            # 4. Daiso 채널 특성 요약 (미리 계산되지 않았으면 지금 계산)
+            if daiso_entry is None:
+                with self._daiso_lock:
+                    daiso_entry = self._lookup_daiso_summary() or self._build_daiso_summary(inputs["daiso_keywords"])
+            daiso_keywords = daiso_entry["keywords"]
+            daiso_summary = daiso_entry["summary"]
             state["daiso_channel_summary"] = daiso_summary
             logger.debug(f"Daiso 키워드: {daiso_keywords[:5]}")
 
@@ -106,11 +157,17 @@ class ImagePromptGenerator:
             design_prompt = self._generate_gemini_prompt(
                 oy_keywords=oy_keywords_en,  # 영어 번역된 키워드 사용
                 daiso_summary=daiso_summary,
-                brand=" ".join(brands) if brands else "",
-                product=" ".join(products) if products else ""
+                brand=brand_text,
+                product=product_text
             )
             state["design_prompt"] = design_prompt
 
+            self.design_cache.put_prompt(design_key, {
+                "design_prompt": design_prompt,
+                "design_keywords": oy_keywords,
+                "daiso_channel_summary": daiso_summary
+            })
+
             logger.info(f"이미지 프롬프트 생성 완료: OY {len(oy_keywords)}개, Daiso {len(daiso_keywords)}개 키워드")
 
             # 진행상황 업데이트
@@ -141,165 +198,187 @@ class ImagePromptGenerator:
             state["error"] = handle_exception("ImagePromptGenerator", e)
             return state
 
-    def _find_oliveyoung_image(self, brands: List[str], products: List[str]) -> Optional[str]:
-        """
-        올리브영 제품 이미지 찾기
-        - DB에서 brand/product 조회
-        - ranking 기준으로 이미지 경로 매칭
+    def _fetch_design_inputs(
+        self,
+        brands: Optional[List[str]] = None,
+        products: Optional[List[str]] = None,
+        include_daiso: bool = False
+    ) -> Dict[str, Any]:
         """
-        try:
-            conn = psycopg2.connect(**DB_CONFIG)
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            # 브랜드+제품명으로 검색
-            query = """
-                SELECT product_name, category, ranking
-                FROM reviews
-                WHERE channel = 'OliveYoung'
-            """
-
-            conditions = []
-            if brands:
-                brand_conditions = " OR ".join([f"brand ILIKE '%{b}%'" for b in brands])
-                conditions.append(f"({brand_conditions})")
-            if products:
-                product_conditions = " OR ".join([f"product_name ILIKE '%{p}%'" for p in products])
-                conditions.append(f"({product_conditions})")
+        디자인 입력 데이터 한 번에 조회 (DB 왕복 1회, 키워드 집계는 SQL에서)
 
-            if conditions:
-                query += " AND (" + " AND ".join(conditions) + ")"
+        - 올리브영 제품 (ranking 최상위 category/ranking) - 브랜드/제품이 있을 때
+        - 올리브영 제품 리뷰 상위 키워드 - 브랜드/제품이 있을 때
+        - Daiso 채널 리뷰 상위 키워드 - include_daiso일 때
 
-            query += " AND ranking IS NOT NULL ORDER BY CAST(ranking AS INTEGER) LIMIT 1"
+        Args:
+            brands: 브랜드 엔티티
+            products: 제품 엔티티
+            include_daiso: Daiso 채널 키워드도 조회 (채널 요약 캐시가 없을 때만)
 
-            cur.execute(query)
-            result = cur.fetchone()
-
-            if not result:
-                return None
-
-            # 이미지 경로 생성
-            category = result['category']
-            ranking = result['ranking']
+        Returns:
+            {"product": {"category", "ranking"} 또는 None, "oy_keywords": [...], "daiso_keywords": [...]}
+        """
+        ctes, selects, params = [], [], []
+
+        if brands or products:
+            entity_sql, entity_params = self._entity_filter(brands or [], products or [])
+
+            ctes.append(f"""
+                product AS (
+                    SELECT category, ranking
+                    FROM reviews
+                    WHERE channel = 'OliveYoung' AND {entity_sql}
+                      AND ranking IS NOT NULL
+                    ORDER BY CAST(ranking AS INTEGER)
+                    LIMIT 1
+                )""")
+            params += entity_params
+            selects.append("SELECT 'product' AS kind, category AS value, NULL::bigint AS freq, ranking::text AS ranking FROM product")
+
+            ctes.append(self._keyword_cte("oy_keywords", f"channel = 'OliveYoung' AND {entity_sql}"))
+            params += entity_params + [DESIGN_INPUT_CONFIG["oy_review_limit"], DESIGN_INPUT_CONFIG["oy_top_keywords"]]
+            selects.append("SELECT 'oy', keyword, freq, NULL FROM oy_keywords")
+
+        if include_daiso:
+            ctes.append(self._keyword_cte("daiso_keywords", "channel = 'Daiso'"))
+            params += [DESIGN_INPUT_CONFIG["daiso_review_limit"], DESIGN_INPUT_CONFIG["daiso_top_keywords"]]
+            selects.append("SELECT 'daiso', keyword, freq, NULL FROM daiso_keywords")
+
+        inputs = {"product": None, "oy_keywords": [], "daiso_keywords": []}
+        if not selects:
+            return inputs
+
+        query = "WITH " + ",".join(ctes) + "\n" + "\nUNION ALL\n".join(selects)
+
+        with pooled_connection(timeout=EXECUTOR_CONFIG["deadline_seconds"]) as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                rows = cur.fetchall()
+
+        keyword_rows = {"oy": [], "daiso": []}
+        for kind, value, freq, ranking in rows:
+            if kind == "product":
+                inputs["product"] = {"category": value, "ranking": ranking}
+            else:
+                keyword_rows[kind].append((value, freq))
+
+        # UNION ALL은 순서를 보장하지 않으므로 빈도순으로 다시 정렬
+        for kind, key in (("oy", "oy_keywords"), ("daiso", "daiso_keywords")):
+            inputs[key] = [kw for kw, _ in sorted(keyword_rows[kind], key=lambda x: (-x[1], x[0]))]
+
+        return inputs
+
+    @staticmethod
+    def _entity_filter(brands: List[str], products: List[str]) -> Tuple[str, List[str]]:
+        """브랜드/제품 ILIKE 조건 (파라미터 바인딩)"""
+        conditions, params = [], []
+        if brands:
+            conditions.append("(" + " OR ".join(["brand ILIKE %s"] * len(brands)) + ")")
+            params += [f"%{b}%" for b in brands]
+        if products:
+            conditions.append("(" + " OR ".join(["product_name ILIKE %s"] * len(products)) + ")")
+            params += [f"%{p}%" for p in products]
+        return "(" + " AND ".join(conditions) + ")", params
+
+    @staticmethod
+    def _keyword_cte(name: str, where_sql: str) -> str:
+        """
+        리뷰 키워드 빈도 집계 CTE (analysis->'키워드' JSONB 배열 펼쳐서 GROUP BY)
 
-            # 프로젝트 루트 기준 경로
-            project_root = Path(__file__).resolve().parents[4]
-            image_path = project_root / "data" / "data_oliveyoung" / "raw_data" / "reviews_image_oliveyoung" / f"oliveyoung_{category}_{int(ranking):03d}_product_main.jpg"
+        파라미터: where_sql의 파라미터, 집계 대상 리뷰 수, 상위 키워드 수
+        """
+        return f"""
+                {name}_reviews AS (
+                    SELECT analysis->'키워드' AS keywords
+                    FROM preprocessed_reviews
+                    WHERE {where_sql}
+                    LIMIT %s
+                ),
+                {name} AS (
+                    SELECT kw.keyword, COUNT(*) AS freq
+                    FROM {name}_reviews r
+                    CROSS JOIN LATERAL jsonb_array_elements_text(
+                        CASE WHEN jsonb_typeof(r.keywords) = 'array' THEN r.keywords ELSE '[]'::jsonb END
+                    ) AS kw(keyword)
+                    GROUP BY kw.keyword
+                    ORDER BY freq DESC, kw.keyword
+                    LIMIT %s
+                )"""
+
+    def _product_image_path(self, product: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        올리브영 제품 이미지 경로 (category + ranking 기준 파일명)
 
-            if image_path.exists():
-                return str(image_path)
+        Args:
+            product: _fetch_design_inputs의 product
 
+        Returns:
+            이미지 경로 (파일이 없으면 None)
+        """
+        if not product:
             return None
 
-        except Exception as e:
-            logger.error(f"올리브영 이미지 검색 오류: {e}", exc_info=True)
-            return None
-        finally:
-            if 'cur' in locals():
-                cur.close()
-            if 'conn' in locals():
-                conn.close()
+        # 프로젝트 루트 기준 경로
+        project_root = Path(__file__).resolve().parents[4]
+        image_path = project_root / "data" / "data_oliveyoung" / "raw_data" / "reviews_image_oliveyoung" / f"oliveyoung_{product['category']}_{int(product['ranking']):03d}_product_main.jpg"
 
+        if image_path.exists():
+            return str(image_path)
 
-    def _extract_keywords_from_reviews(self, brands: List[str], products: List[str]) -> List[str]:
-        """
-        올리브영 제품 리뷰에서 키워드 추출 (TF-IDF 기반)
-        preprocessed_reviews의 키워드 필드 활용
-        """
-        try:
-            conn = psycopg2.connect(**DB_CONFIG)
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            # 브랜드+제품으로 리뷰 검색
-            query = """
-                SELECT analysis->'키워드' as keywords
-                FROM preprocessed_reviews
-                WHERE channel = 'OliveYoung'
-            """
-
-            conditions = []
-            if brands:
-                brand_conditions = " OR ".join([f"brand ILIKE '%{b}%'" for b in brands])
-                conditions.append(f"({brand_conditions})")
-            if products:
-                product_conditions = " OR ".join([f"product_name ILIKE '%{p}%'" for p in products])
-                conditions.append(f"({product_conditions})")
-
-            if conditions:
-                query += " AND (" + " AND ".join(conditions) + ")"
-
-            query += " LIMIT 200"  
-
-            cur.execute(query)
-            results = cur.fetchall()
-
-            # 키워드 집계
-            keyword_freq = {}
-            for row in results:
-                keywords = row.get('keywords')
-                if keywords:
-                    # JSONB array를 Python list로 변환
-                    if isinstance(keywords, list):
-                        for kw in keywords:
-                            keyword_freq[kw] = keyword_freq.get(kw, 0) + 1
-
-            # 빈도순 정렬
-            sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
-
-            # 상위 10개 키워드 반환
-            return [kw for kw, freq in sorted_keywords[:10]]
+        return None
 
-        except Exception as e:
-            logger.error(f"키워드 추출 오류: {e}", exc_info=True)
-            return None
-        finally:
-            if 'cur' in locals():
-                cur.close()
-            if 'conn' in locals():
-                conn.close()
+    def _lookup_daiso_summary(self) -> Optional[Dict[str, Any]]:
+        """
+        Daiso 채널 요약 조회 (프로세스 메모리 → 디자인 캐시, 데이터 버전별, self._daiso_lock 안에서 호출)
 
-    def _extract_daiso_channel_keywords(self) -> List[str]:
+        Returns:
+            {"summary", "keywords"} (없으면 None)
         """
-        Daiso 채널 제품 리뷰에서 키워드 추출
-        실제 Daiso 리뷰 데이터 기반으로 채널 특성 파악
+        data_version = get_data_version()
+        if self._daiso_summary and self._daiso_summary[0] == data_version:
+            return self._daiso_summary[1]
+
+        cached = self.design_cache.get_channel_summary("Daiso", data_version)
+        if cached:
+            self._daiso_summary = (data_version, cached)
+        return cached
+
+    def _cached_daiso_summary(self) -> Optional[Dict[str, Any]]:
+        """Daiso 채널 요약 (미리 계산 중이면 끝날 때까지 기다린 뒤 사용 - LLM 중복 호출 방지)"""
+        with self._daiso_lock:
+            return self._lookup_daiso_summary()
+
+    def _build_daiso_summary(self, daiso_keywords: List[str]) -> Dict[str, Any]:
+        """Daiso 키워드 → GPT-4o 요약 후 메모리/디자인 캐시에 저장 (self._daiso_lock 안에서 호출)"""
+        keywords = daiso_keywords or DEFAULT_DAISO_KEYWORDS
+        entry = {"summary": self._summarize_daiso_channel(keywords), "keywords": keywords}
+
+        # 요약 실패(기본 문구)는 저장하지 않음 - 다음 요청에서 다시 시도
+        if entry["summary"] == DEFAULT_DAISO_SUMMARY:
+            return entry
+
+        data_version = get_data_version()
+        self._daiso_summary = (data_version, entry)
+        self.design_cache.put_channel_summary("Daiso", data_version, entry)
+        return entry
+
+    def precompute_daiso_summary(self):
         """
-        try:
-            conn = psycopg2.connect(**DB_CONFIG)
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            # Daiso 채널 뷰티 제품 리뷰 조회
-            query = """
-                SELECT analysis->'키워드' as keywords
-                FROM preprocessed_reviews
-                WHERE channel = 'Daiso'
-                LIMIT 100
-            """
-
-            cur.execute(query)
-            results = cur.fetchall()
-
-            # 키워드 집계
-            keyword_freq = {}
-            for row in results:
-                keywords = row.get('keywords')
-                if keywords:
-                    if isinstance(keywords, list):
-                        for kw in keywords:
-                            keyword_freq[kw] = keyword_freq.get(kw, 0) + 1
-
-            # 빈도순 정렬
-            sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
-
-            # 상위 15개 키워드 반환
-            return [kw for kw, freq in sorted_keywords[:15]]
+        Daiso 채널 요약 미리 계산 (사용자 제품과 무관)
 
-        except Exception as e:
-            logger.error(f"Daiso 키워드 추출 오류: {e}", exc_info=True)
-            return ["가성비", "귀엽다", "미니", "휴대", "저렴"]  # 기본 키워드
-        finally:
-            if 'cur' in locals():
-                cur.close()
-            if 'conn' in locals():
-                conn.close()
+        캐시에 없을 때만 Daiso 키워드 조회 + 요약을 실행합니다. 노드 생성 시
+        백그라운드 스레드에서 호출되며, 실패하면 generate()에서 다시 계산합니다.
+        """
+        with self._daiso_lock:
+            try:
+                if self._lookup_daiso_summary():
+                    return
+                inputs = self._fetch_design_inputs(include_daiso=True)
+                self._build_daiso_summary(inputs["daiso_keywords"])
+                logger.info("Daiso 채널 요약 미리 계산 완료")
+            except Exception as e:
+                logger.warning(f"Daiso 채널 요약 미리 계산 실패: {e}")
 
     def _summarize_daiso_channel(self, daiso_keywords: List[str]) -> str:
         """
@@ -338,51 +417,67 @@ Output in English, focusing on actionable design guidance."""
 
         except Exception as e:
             logger.error(f"Daiso 채널 요약 오류: {e}", exc_info=True)
-            return "Affordable, cute, portable mini-size products. Value-focused with playful, approachable design."
+            return DEFAULT_DAISO_SUMMARY
 
     def _translate_keywords_to_english(self, keywords: List[str]) -> List[str]:
         """
         한글 키워드를 영어로 번역 (GPT-4o 사용)
         Gemini 이미지 생성 시 한글 폰트 깨짐 방지
+
+        번역 결과는 디자인 캐시의 번역 사전에 저장하고, 사전에 없는 키워드만 LLM에 요청
         """
         if not keywords:
             return []
 
-        try:
-            keywords_text = ", ".join(keywords)
+        translations = self.design_cache.get_translations(keywords)
+        missing = [kw for kw in keywords if kw not in translations]
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator specializing in cosmetics and skincare terminology."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"""Translate these Korean skincare/cosmetics keywords to English.
-Provide ONLY the translated keywords separated by commas, no explanations.
+        if missing:
+            try:
+                keywords_text = ", ".join(missing)
+
+                response = self.client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a professional translator specializing in cosmetics and skincare terminology."
+                        },
+                        {
+                            "role": "user",
+                            "content": f"""Translate these Korean skincare/cosmetics keywords to English.
+Return ONLY a JSON object mapping each Korean keyword to its English translation, no explanations.
 
 Korean keywords: {keywords_text}
 
-Format: keyword1, keyword2, keyword3"""
-                    }
-                ],
-                temperature=0.2,
-                max_tokens=100
-            )
-
-            # Parse response and return as list
-            translated_text = response.choices[0].message.content.strip()
-            translated_keywords = [kw.strip() for kw in translated_text.split(",")]
+Format: {{"키워드1": "keyword1", "키워드2": "keyword2"}}"""
+                        }
+                    ],
+                    temperature=0.2,
+                    max_tokens=300,
+                    response_format={"type": "json_object"}
+                )
+
+                # Parse response (원래 키워드에 해당하는 번역만 사용)
+                translated = json.loads(response.choices[0].message.content)
+                new_translations = {
+                    kw: str(translated[kw]).strip()
+                    for kw in missing
+                    if isinstance(translated.get(kw), str) and translated[kw].strip()
+                }
+                self.design_cache.put_translations(new_translations)
+                translations.update(new_translations)
 
-            return translated_keywords[:len(keywords)]  # Match original length
+            except Exception as e:
+                logger.error(f"키워드 번역 오류: {e}", exc_info=True)
 
-        except Exception as e:
-            logger.error(f"키워드 번역 오류: {e}", exc_info=True)
+        translated_keywords = [translations[kw] for kw in keywords if kw in translations]
+        if not translated_keywords:
             # Fallback: return generic English keywords
             return ["moisturizing", "soothing", "effective"][:len(keywords)]
 
+        return translated_keywords
+
     def _load_brand_signatures(self) -> Dict[str, Dict[str, str]]:
         """
         브랜드 시그니처 디자인 파일 로드
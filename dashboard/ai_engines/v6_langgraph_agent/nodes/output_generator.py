@@ -7,26 +7,32 @@ last_updated: 2025.11.02
 """
 #//==============================================================================//#
 
-import json
 import logging
-from typing import Dict, Any, List
-from openai import OpenAI
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import numpy as np
-import os
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
 from ..state import AgentState
+from ..clients import SharedOpenAIClient
 from ..progress_tracker import ProgressTracker
-from ..config import LLM_CONFIG, DB_CONFIG
+from ..config import LLM_CONFIG, DB_CONFIG, VISUALIZATION_CONFIG
 from ..errors import handle_exception, LLMError
 from ..state_validator import validate_state
+from ..data_version import review_column_exprs
+from ..result_compactor import ResultCompactor
+from ..result_set import ResultRows
+
+# 워드클라우드는 대시보드 공용 렌더러 사용 (dashboard/utils/wordcloud_renderer.py)
+_DASHBOARD_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if _DASHBOARD_DIR not in sys.path:
+    sys.path.append(_DASHBOARD_DIR)
+from utils.wordcloud_renderer import render_wordcloud_png
 
 # 로거 설정
 logger = logging.getLogger("v6_agent.output_generator")
@@ -35,16 +41,24 @@ logger = logging.getLogger("v6_agent.output_generator")
 class OutputGenerator:
     """출력 생성"""
 
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
     def __init__(self):
-        self.client = OpenAI()
         self.model = LLM_CONFIG["model"]
         self.temperature = LLM_CONFIG["temperature"]["output_generator"]  # 0.3
         self.max_tokens = LLM_CONFIG["max_tokens"]
+        self.chart_async = VISUALIZATION_CONFIG["streaming"]["chart_async"]
+        self.render_workers = VISUALIZATION_CONFIG["render_workers"]
 
     def generate(self, state: AgentState) -> AgentState:
         """
         출력 생성 실행
 
+        차트/워드클라우드는 요약 텍스트(LLM)와 무관하므로 chart_async면 먼저 스레드 풀에서
+        그리기 시작하고, 요약 텍스트는 호출 스레드에서 생성합니다 (스트리밍/진행상황 콜백은
+        Streamlit 스레드에서만 호출). 결과 DataFrame은 한 번만 만들어 표/차트가 공유합니다.
+
         Args:
             state: 현재 상태
 
@@ -52,6 +66,7 @@ class OutputGenerator:
             업데이트된 상태
         """
         tracker = ProgressTracker(callback=state.get("ui_callback"))
+        viz_pool = None
 
         try:
             logger.info("OutputGenerator 시작")
@@ -72,6 +87,25 @@ class OutputGenerator:
             # 2. 각 구성요소 생성
             outputs = {}
 
+            # 표/차트용 결과 DataFrame (한 번만 생성)
+            viz_components = [c for c in components if c["type"] in ["line_chart", "bar_chart", "wordcloud"]]
+            logger.debug(f"viz_components 개수: {len(viz_components)}")
+
+            needs_table = any(c["type"] in ("comparison_table", "data_table") for c in components)
+            df = self._combined_dataframe(state) if (needs_table or viz_components) else None
+
+            # 시각화는 요약 LLM 호출과 동시에 그리기 시작
+            viz_futures = []
+            if viz_components and self.chart_async and not df.empty:
+                viz_pool = ThreadPoolExecutor(
+                    max_workers=max(1, min(self.render_workers, len(viz_components))),
+                    thread_name_prefix="v6-viz"
+                )
+                viz_futures = [
+                    viz_pool.submit(self._render_visualization, df, component)
+                    for component in viz_components
+                ]
+
             # 텍스트 요약
             if any(c["type"] == "summary_text" for c in components):
                 logger.info("텍스트 요약 생성 시작")
@@ -86,22 +120,22 @@ class OutputGenerator:
 
             # 비교 테이블
             if any(c["type"] == "comparison_table" for c in components):
-                table = self._generate_comparison_table(state)
+                table = self._generate_comparison_table(state, df)
                 outputs["comparison_table"] = table
                 tracker.update_substep("비교표 생성 완료")
 
             # 데이터 테이블
             if any(c["type"] == "data_table" for c in components):
-                data_table = self._generate_data_table(state)
+                data_table = self._generate_data_table(state, df)
                 outputs["data_table"] = data_table
                 tracker.update_substep("데이터 테이블 생성 완료")
 
-            # 시각화
-            viz_components = [c for c in components if c["type"] in ["line_chart", "bar_chart", "wordcloud"]]
-            logger.debug(f"viz_components 개수: {len(viz_components)}")
-
+            # 시각화 (비동기로 시작했으면 결과만 모음)
             if viz_components:
-                visualizations = self._create_visualizations(state, viz_components)
+                if viz_futures:
+                    visualizations = [v for v in (f.result() for f in viz_futures) if v]
+                else:
+                    visualizations = self._create_visualizations(state, viz_components, df)
                 outputs["visualizations"] = visualizations
                 logger.info(f"생성된 시각화 개수: {len(visualizations)}")
                 tracker.update_substep(f"{len(visualizations)}개 시각화 생성 완료")
@@ -151,6 +185,11 @@ class OutputGenerator:
             state["error"] = handle_exception("OutputGenerator", e)
             state["messages"] = tracker.get_state_messages()
 
+        finally:
+            if viz_pool is not None:
+                # 오류로 빠져나온 경우 남은 렌더링은 기다리지 않음
+                viz_pool.shutdown(wait=False, cancel_futures=True)
+
         return state
 
     def _generate_summary_text(self, state: AgentState) -> str:
@@ -167,36 +206,28 @@ class OutputGenerator:
         entities = state.get("parsed_entities", {})
         query_results = state.get("query_results", {}).get("results", [])
 
-        # 쿼리 결과를 텍스트로 변환
-        results_summary = []
-        for i, result in enumerate(query_results, 1):
-            if result["success"]:
-                # datetime 객체를 문자열로 변환
-                # 전체 데이터 전달 (LLM이 정확한 분석을 위해 필요)
-                all_data = result['data']
-                safe_data = []
-                for row in all_data:
-                    safe_row = {}
-                    for k, v in row.items():
-                        # datetime/date 객체는 isoformat()으로 변환
-                        if hasattr(v, 'isoformat'):
-                            safe_row[k] = v.isoformat()
-                        else:
-                            safe_row[k] = v
-                    safe_data.append(safe_row)
-
-                results_summary.append(
-                    f"Q{i}: {result['sub_question']}\n"
-                    f"결과: {result['row_count']}건\n"
-                    f"전체 데이터:\n{json.dumps(safe_data, ensure_ascii=False, indent=2)}\n"
-                )
-            else:
-                results_summary.append(
-                    f"Q{i}: {result['sub_question']}\n"
-                    f"오류: {result['error']}\n"
-                )
-
-        results_text = "\n".join(results_summary)
+        # 쿼리 결과를 텍스트로 변환 (토큰 예산을 넘으면 결과별 프로필 + 대표 행으로 압축)
+        compacted = ResultCompactor().compact(query_results)
+        results_text = compacted["text"]
+        if compacted["truncated"]:
+            # 비용 검사로 LIMIT이 붙은 결과 → 행 수를 전체 건수로 쓰지 않도록 안내
+            truncated_ids = ", ".join(f"Q{qid}" for qid in compacted["truncated"])
+            results_text += (
+                f"\n※ {truncated_ids} 결과는 비용 제한으로 일부 행만 조회되었습니다. "
+                f"행 수를 전체 리뷰 건수로 표현하지 말고, 일부 결과임을 답변에 밝히세요.\n"
+            )
+        if compacted["elided"]:
+            logger.info(
+                f"요약 프롬프트 결과 압축: {compacted['full_tokens']:,} → {compacted['tokens']:,} tokens, "
+                f"생략 {compacted['elided']}"
+            )
+            self._add_debug_trace(
+                state,
+                "result_compaction",
+                prompt="",
+                llm_response="",
+                parsed_result={k: compacted[k] for k in ("tokens", "full_tokens", "elided", "truncated")}
+            )
 
         # 리뷰 샘플 자동 조회
         review_samples = self._fetch_review_samples(state, limit=5)
@@ -645,14 +676,18 @@ class OutputGenerator:
 이제 답변을 작성하세요:
 """
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=self.temperature,
-            max_tokens=self.max_tokens
-        )
-
-        result_text = response.choices[0].message.content.strip()
+        # 텍스트 우선 스트리밍: 생성되는 대로 UI에 전달 (차트/표는 그래프 종료 후 렌더링)
+        stream_callback = state.get("stream_callback")
+        if stream_callback and VISUALIZATION_CONFIG["streaming"]["text_first"]:
+            result_text = self._stream_completion(prompt, stream_callback).strip()
+        else:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens
+            )
+            result_text = response.choices[0].message.content.strip()
 
         # Debug 추적
         self._add_debug_trace(
@@ -664,34 +699,89 @@ class OutputGenerator:
 
         return result_text
 
-    def _generate_comparison_table(self, state: AgentState) -> Dict[str, Any]:
+    def _stream_completion(self, prompt: str, stream_callback) -> str:
         """
-        비교 테이블 생성
+        스트리밍 응답 생성 (토큰이 도착할 때마다 stream_callback(delta) 호출)
+
+        Args:
+            prompt: 요약 프롬프트
+            stream_callback: delta 문자열을 받는 콜백 (Streamlit placeholder 갱신)
+
+        Returns:
+            전체 응답 텍스트
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True
+        )
+
+        parts = []
+        callback_ok = True
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+
+            if callback_ok:
+                try:
+                    stream_callback(delta)
+                except Exception as e:
+                    # UI 갱신 실패는 답변 생성과 무관 (나머지는 최종 답변으로 표시)
+                    logger.warning(f"스트리밍 콜백 실패, 이후 토큰은 전달하지 않음: {e}")
+                    callback_ok = False
+
+        return "".join(parts)
+
+    def _combined_dataframe(self, state: AgentState) -> pd.DataFrame:
+        """
+        성공한 쿼리 결과를 합친 DataFrame (표/차트 공용, 읽기 전용으로 공유)
+
+        ResultRows는 컬럼 배열에서 바로 DataFrame을 만들고, 결과마다 컬럼이 다르면
+        행 dict 리스트로 만든 것과 같이 컬럼 합집합이 됩니다.
 
         Args:
             state: 현재 상태
 
         Returns:
-            테이블 데이터
+            DataFrame (결과가 없으면 빈 DataFrame)
         """
         query_results = state.get("query_results", {}).get("results", [])
 
-        # 성공한 쿼리 결과만 필터링
-        successful_results = [r for r in query_results if r["success"] and r["row_count"] > 0]
+        frames = []
+        for result in query_results:
+            if not (result["success"] and result["row_count"] > 0):
+                continue
+            data = result["data"]
+            frames.append(data.to_dataframe() if isinstance(data, ResultRows) else pd.DataFrame(list(data)))
 
-        if not successful_results:
-            return {"data": [], "columns": []}
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True, sort=False)
 
-        # 첫 번째 결과의 컬럼을 기준으로 테이블 생성
-        all_data = []
-        for result in successful_results:
-            all_data.extend(result["data"])
+    def _generate_comparison_table(self, state: AgentState, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        비교 테이블 생성
 
-        if not all_data:
-            return {"data": [], "columns": []}
+        Args:
+            state: 현재 상태
+            df: 미리 만든 결과 DataFrame (없으면 생성)
+
+        Returns:
+            테이블 데이터
+        """
+        if df is None:
+            df = self._combined_dataframe(state)
 
-        # DataFrame으로 변환
-        df = pd.DataFrame(all_data)
+        if df.empty:
+            return {"data": [], "columns": []}
 
         return {
             "data": df.to_dict("records"),
@@ -700,85 +790,92 @@ class OutputGenerator:
             "dataframe": df
         }
 
-    def _generate_data_table(self, state: AgentState) -> Dict[str, Any]:
+    def _generate_data_table(self, state: AgentState, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         데이터 테이블 생성 (전체 결과)
 
         Args:
             state: 현재 상태
+            df: 미리 만든 결과 DataFrame (없으면 생성)
 
         Returns:
             테이블 데이터
         """
-        return self._generate_comparison_table(state)
+        return self._generate_comparison_table(state, df)
 
     def _create_visualizations(
         self,
         state: AgentState,
-        viz_components: List[Dict[str, Any]]
+        viz_components: List[Dict[str, Any]],
+        df: Optional[pd.DataFrame] = None
     ) -> List[Dict[str, Any]]:
         """
-        시각화 생성
+        시각화 생성 (순차, chart_async가 꺼져 있을 때)
 
         Args:
             state: 현재 상태
             viz_components: 시각화 구성요소 리스트
+            df: 미리 만든 결과 DataFrame (없으면 생성)
 
         Returns:
             시각화 객체 리스트
         """
-        query_results = state.get("query_results", {}).get("results", [])
-        visualizations = []
+        if df is None:
+            df = self._combined_dataframe(state)
 
-        for component in viz_components:
-            viz_type = component["type"]
-            config = component.get("config", {})
+        if df.empty:
+            return []
 
-            # 관련 데이터 찾기
-            relevant_data = []
-            for result in query_results:
-                if result["success"] and result["row_count"] > 0:
-                    relevant_data.extend(result["data"])
+        visualizations = [self._render_visualization(df, component) for component in viz_components]
+        return [v for v in visualizations if v]
 
-            if not relevant_data:
-                continue
+    def _render_visualization(self, df: pd.DataFrame, component: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        시각화 하나 생성 (워커 스레드에서도 호출되므로 pyplot 전역 상태를 쓰지 않음)
 
-            df = pd.DataFrame(relevant_data)
+        Args:
+            df: 결과 DataFrame (읽기 전용)
+            component: 시각화 구성요소
 
-            # 시각화 타입별 생성
-            try:
-                if viz_type == "line_chart":
-                    fig = self._create_line_chart(df, config)
-                    if fig:
-                        visualizations.append({
-                            "type": "line_chart",
-                            "figure": fig,
-                            "title": config.get("title", "트렌드 차트")
-                        })
-
-                elif viz_type == "bar_chart":
-                    fig = self._create_bar_chart(df, config)
-                    if fig:
-                        visualizations.append({
-                            "type": "bar_chart",
-                            "figure": fig,
-                            "title": config.get("title", "비교 차트")
-                        })
-
-                elif viz_type == "wordcloud":
-                    fig = self._create_wordcloud(df, config)
-                    if fig:
-                        visualizations.append({
-                            "type": "wordcloud",
-                            "figure": fig,
-                            "title": "키워드 워드클라우드"
-                        })
-
-            except Exception as e:
-                logger.warning(f"시각화 생성 오류 ({viz_type}): {str(e)}")
-                continue
+        Returns:
+            시각화 객체 (생성 못 하면 None)
+        """
+        viz_type = component["type"]
+        config = component.get("config", {})
+
+        # 시각화 타입별 생성
+        try:
+            if viz_type == "line_chart":
+                fig = self._create_line_chart(df, config)
+                if fig:
+                    return {
+                        "type": "line_chart",
+                        "figure": fig,
+                        "title": config.get("title", "트렌드 차트")
+                    }
+
+            elif viz_type == "bar_chart":
+                fig = self._create_bar_chart(df, config)
+                if fig:
+                    return {
+                        "type": "bar_chart",
+                        "figure": fig,
+                        "title": config.get("title", "비교 차트")
+                    }
+
+            elif viz_type == "wordcloud":
+                fig = self._create_wordcloud(df, config)
+                if fig:
+                    return {
+                        "type": "wordcloud",
+                        "figure": fig,
+                        "title": "키워드 워드클라우드"
+                    }
 
-        return visualizations
+        except Exception as e:
+            logger.warning(f"시각화 생성 오류 ({viz_type}): {str(e)}")
+
+        return None
 
     def _create_line_chart(self, df: pd.DataFrame, config: Dict) -> go.Figure:
         """라인 차트 생성"""
@@ -836,8 +933,8 @@ class OutputGenerator:
 
         return fig
 
-    def _create_wordcloud(self, df: pd.DataFrame, config: Dict) -> plt.Figure:
-        """워드클라우드 생성"""
+    def _create_wordcloud(self, df: pd.DataFrame, config: Dict) -> Optional[bytes]:
+        """워드클라우드 생성 (공용 렌더러 - 폰트/마스크/인스턴스 재사용, 같은 빈도면 캐시된 PNG)"""
         if df.empty:
             return None
 
@@ -853,70 +950,7 @@ class OutputGenerator:
         else:
             word_freq = dict(zip(df[text_col], [1] * len(df)))
 
-        # 한글 폰트 경로 찾기 (크로스 플랫폼 지원)
-        import platform
-
-        font_path = None
-        system = platform.system()
-
-        if system == 'Windows':
-            font_candidates = [
-                'C:/Windows/Fonts/malgun.ttf',
-                'C:/Windows/Fonts/malgunbd.ttf',
-                'C:/Windows/Fonts/NanumGothic.ttf',
-            ]
-        elif system == 'Darwin':  # macOS
-            font_candidates = [
-                '/System/Library/Fonts/AppleGothic.ttf',
-                '/Library/Fonts/AppleGothic.ttf',
-                '/System/Library/Fonts/Supplemental/AppleGothic.ttf',
-            ]
-        else:  # Linux
-            font_candidates = [
-                '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-                '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
-                '/usr/share/fonts/nanum/NanumGothic.ttf',
-            ]
-
-        for font in font_candidates:
-            if os.path.exists(font):
-                font_path = font
-                break
-
-        # 원형 마스크
-        x, y = np.ogrid[:600, :600]
-        mask = (x - 300) ** 2 + (y - 300) ** 2 > 280 ** 2
-        mask = 255 * mask.astype(int)
-
-        # 워드클라우드 생성
-        wordcloud = WordCloud(
-            font_path=font_path,
-            width=600,
-            height=600,
-            background_color='white',
-            colormap='Set2',
-            relative_scaling=0.7,
-            min_font_size=12,
-            max_font_size=100,
-            mask=mask,
-            max_words=30,
-            random_state=42
-        ).generate_from_frequencies(word_freq)
-
-        # Figure 생성
-        fig, ax = plt.subplots(figsize=(6, 6), dpi=100)
-        fig.patch.set_facecolor('#f8f9fa')
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-
-        if font_path:
-            font_prop = fm.FontProperties(fname=font_path, size=14, weight='bold')
-            ax.set_title(config.get("title", "키워드 워드클라우드"), fontproperties=font_prop, pad=20)
-        else:
-            ax.set_title(config.get("title", "키워드 워드클라우드"), fontsize=14, pad=20, weight='bold')
-
-        plt.tight_layout()
-        return fig
+        return render_wordcloud_png(word_freq, style="chatbot")
 
     def _detect_time_column(self, df: pd.DataFrame) -> str:
         """시간 컬럼 감지"""
@@ -987,7 +1021,7 @@ class OutputGenerator:
             FROM preprocessed_reviews
             WHERE {where_sql}
               AND review_clean IS NOT NULL
-            ORDER BY CAST(review_date AS DATE) DESC
+            ORDER BY {review_column_exprs()['date']} DESC
             LIMIT {limit}
             """
 
@@ -0,0 +1,298 @@
+#//==============================================================================//#
+"""
+query_analyzer.py
+엔티티 추출 + 분석 전략 + 복잡도 통합 노드 (LLM 1회)
+
+EntityParser → CapabilityDetector → ComplexityClassifier는 같은 질문과 겹치는
+맥락(브랜드/속성 목록, 추출된 엔티티)을 gpt-4o-mini에 순차적으로 두 번 보냅니다.
+이 노드는 structured output(json_schema) 한 번으로 엔티티와 분석 전략을 함께 받고,
+복잡도는 ComplexityClassifier와 같은 규칙 점수로 계산합니다.
+
+- QUERY_ANALYZER_CONFIG["enabled"]가 True일 때만 그래프에 사용
+- state 키(parsed_entities, capabilities, complexity)와 검증은 기존 세 노드와 동일
+- 프롬프트는 EntityParser.build_prompt + CAPABILITY_GUIDE 재사용
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import json
+import logging
+from typing import Dict, Any, List
+
+from ..state import AgentState
+from ..clients import SharedOpenAIClient
+from ..progress_tracker import ProgressTracker
+from ..config import LLM_CONFIG, QUERY_ANALYZER_CONFIG
+from ..errors import handle_exception, LLMError, ValidationError
+from ..state_validator import validate_state, validate_entity_structure
+from .entity_parser import EntityParser
+from .capability_detector import CAPABILITY_GUIDE
+from .complexity_classifier import ComplexityClassifier, complexity_for_score
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.query_analyzer")
+
+
+def _nullable(json_type: str) -> Dict[str, Any]:
+    return {"type": [json_type, "null"]}
+
+
+# structured output 스키마 (strict 모드: 모든 필드 required, 추가 필드 금지)
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "entities": {
+            "type": "object",
+            "properties": {
+                "brands": {"type": "array", "items": {"type": "string"}},
+                "products": {"type": "array", "items": {"type": "string"}},
+                "attributes": {"type": "array", "items": {"type": "string"}},
+                "period": {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string", "enum": ["recent_months", "recent_days", "date_range", "all"]},
+                        "value": _nullable("integer"),
+                        "start": _nullable("string"),
+                        "end": _nullable("string")
+                    },
+                    "required": ["type", "value", "start", "end"],
+                    "additionalProperties": False
+                },
+                "channels": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["brands", "products", "attributes", "period", "channels"],
+            "additionalProperties": False
+        },
+        "capabilities": {
+            "type": "object",
+            "properties": {
+                "data_scope": {"type": "string", "enum": ["preprocessed_reviews", "reviews", "join"]},
+                "aggregation_type": {
+                    "type": "string",
+                    "enum": ["time_series", "comparison", "distribution", "keyword_frequency", "simple"]
+                },
+                "group_by": {"type": "string", "enum": ["brand", "product", "channel", "period", "none"]},
+                "analysis_depth": {
+                    "type": "string",
+                    "enum": ["overview", "attribute", "sentiment", "keyword", "pros_cons"]
+                },
+                "metric": {"type": "string", "enum": ["rating", "count", "percentage"]}
+            },
+            "required": ["data_scope", "aggregation_type", "group_by", "analysis_depth", "metric"],
+            "additionalProperties": False
+        }
+    },
+    "required": ["entities", "capabilities"],
+    "additionalProperties": False
+}
+
+
+class QueryAnalyzer:
+    """엔티티 + 분석 전략 + 복잡도 통합 분석"""
+
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
+    def __init__(self):
+        self.model = LLM_CONFIG["model"]
+        self.temperature = LLM_CONFIG["temperature"]["query_analyzer"]
+        self.max_tokens = QUERY_ANALYZER_CONFIG["max_tokens"]
+
+        # 프롬프트/후처리/점수 계산은 기존 노드 로직 재사용 (LLM 호출은 하지 않음)
+        self.entity_parser = EntityParser()
+        self.complexity_classifier = ComplexityClassifier()
+
+    def analyze(self, state: AgentState) -> AgentState:
+        """
+        통합 분석 실행
+
+        Args:
+            state: 현재 상태
+
+        Returns:
+            업데이트된 상태 (parsed_entities, capabilities, complexity)
+        """
+        tracker = ProgressTracker(callback=state.get("ui_callback"))
+
+        try:
+            logger.info("QueryAnalyzer 시작")
+            logger.info(f"사용자 질문: {state['user_query']}")
+
+            # 1. 단계 시작
+            tracker.start_step(
+                node_name="QueryAnalyzer",
+                description="질문 분석 중...",
+                substeps=[
+                    "엔티티 추출",
+                    "분석 전략 결정",
+                    "복잡도 판단"
+                ]
+            )
+
+            # 2. LLM 1회 호출 (엔티티 + 분석 전략)
+            conversation_history = state.get("conversation_history", [])
+            prompt = self._build_prompt(state["user_query"], conversation_history)
+            result_text = self._call_llm(prompt)
+            result = json.loads(result_text)
+            logger.debug(f"통합 분석 결과: {result}")
+
+            self._add_debug_trace(state, prompt, result_text, result)
+
+            # 3. 엔티티 후처리 (EntityParser와 동일)
+            raw_entities = result["entities"]
+            raw_entities["period"] = {
+                k: v for k, v in (raw_entities.get("period") or {"type": "all"}).items() if v is not None
+            }
+            entities = self.entity_parser.build_entities(raw_entities)
+
+            validation = self.entity_parser.validate(entities)
+            if not validation["valid"]:
+                logger.warning(f"엔티티 검증 실패: {validation['error']}")
+
+                tracker.error_step(
+                    error_msg=validation["error"],
+                    suggestion="질문을 더 구체적으로 입력해주세요."
+                )
+
+                state["error"] = {
+                    "node": "QueryAnalyzer",
+                    "error_type": "validation_failed",
+                    "message": validation["error"],
+                    "suggestion": "질문을 더 구체적으로 입력해주세요."
+                }
+                state["messages"] = tracker.get_state_messages()
+                return state
+
+            brands_str = ", ".join(entities["brands"]) if entities["brands"] else "전체"
+            attrs_str = ", ".join(entities["attributes"]) if entities["attributes"] else "전체"
+            tracker.update_substep(f"브랜드: {brands_str} / 속성: {attrs_str} / 기간: {entities['period']['display']}")
+
+            # 4. 분석 전략
+            capabilities = result["capabilities"]
+            tracker.update_substep(
+                f"데이터 소스: {capabilities['data_scope']} / 집계: {capabilities['aggregation_type']}"
+            )
+
+            # 5. 복잡도 (ComplexityClassifier 규칙 점수)
+            score = self.complexity_classifier.calculate_complexity_score(
+                state["user_query"], entities, capabilities
+            )
+            complexity = complexity_for_score(score)
+            tracker.update_substep(f"복잡도: {complexity['level']} (점수: {score})")
+
+            tracker.complete_step(
+                summary=f"{len(entities['brands'])}개 브랜드, {complexity['level']} 질문 (통합 분석)"
+            )
+
+            # State 업데이트
+            state["parsed_entities"] = entities
+            state["capabilities"] = capabilities
+            state["complexity"] = complexity
+            state["messages"] = tracker.get_state_messages()
+
+            # State 검증 (기존 세 노드와 동일한 기준)
+            errors: List[str] = []
+            for node_name in ("entity_parser", "capability_detector", "complexity_classifier"):
+                errors.extend(validate_state(state, node_name))
+            errors.extend(validate_entity_structure(entities))
+            if errors:
+                logger.error(f"State 검증 실패: {errors}")
+                raise ValidationError("QueryAnalyzer", "; ".join(errors))
+
+            logger.info(
+                f"통합 분석 성공: {len(entities['brands'])}개 브랜드, "
+                f"data_scope={capabilities['data_scope']}, complexity={complexity['level']}"
+            )
+
+        except json.JSONDecodeError as e:
+            logger.error(f"통합 분석 실패 - JSON 파싱 오류: {e}", exc_info=True)
+
+            tracker.error_step(
+                error_msg="질문 분석 형식 오류 (LLM 응답 파싱 실패)",
+                suggestion="질문을 다시 입력해주세요."
+            )
+
+            state["error"] = LLMError("QueryAnalyzer", f"JSON 파싱 실패: {str(e)}", original_error=e).to_dict()
+            state["messages"] = tracker.get_state_messages()
+
+        except Exception as e:
+            logger.error(f"QueryAnalyzer 실패: {type(e).__name__} - {str(e)}", exc_info=True)
+
+            tracker.error_step(
+                error_msg=f"질문 분석 오류: {str(e)}",
+                suggestion="질문을 다시 입력해주세요."
+            )
+
+            state["error"] = handle_exception("QueryAnalyzer", e)
+            state["messages"] = tracker.get_state_messages()
+
+        return state
+
+    def _build_prompt(self, query: str, conversation_history: List[Dict[str, str]] = None) -> str:
+        """
+        통합 프롬프트 (EntityParser 프롬프트 + 분석 전략 판단 기준)
+
+        Args:
+            query: 사용자 질문
+            conversation_history: 이전 대화 히스토리
+
+        Returns:
+            프롬프트
+        """
+        capability_section = f"""**추가 작업: 분석 전략 결정**
+위에서 추출한 엔티티를 바탕으로 최적의 분석 방법도 함께 결정하세요.
+
+{CAPABILITY_GUIDE}
+**출력 형식:**
+{{"entities": {{추출 항목}}, "capabilities": {{"data_scope": ..., "aggregation_type": ..., "group_by": ..., "analysis_depth": ..., "metric": ...}}}}
+
+"""
+        return self.entity_parser.build_prompt(
+            query,
+            conversation_history=conversation_history,
+            extra_sections=capability_section
+        )
+
+    def _call_llm(self, prompt: str) -> str:
+        """
+        structured output 호출
+
+        Args:
+            prompt: 통합 프롬프트
+
+        Returns:
+            JSON 문자열 (스키마 보장)
+        """
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "query_analysis",
+                    "strict": True,
+                    "schema": ANALYSIS_SCHEMA
+                }
+            }
+        )
+        return response.choices[0].message.content
+
+    def _add_debug_trace(
+        self,
+        state: Dict[str, Any],
+        prompt: str,
+        llm_response: str,
+        parsed_result: Any = None
+    ):
+        """Debug 모드일 때 LLM 추적 정보 저장"""
+        if state.get("debug_mode", False):
+            state.setdefault("debug_traces", []).append({
+                "node": "QueryAnalyzer",
+                "step": "merged_analysis",
+                "prompt": prompt[:1000] if len(prompt) > 1000 else prompt,
+                "llm_response": llm_response[:1000] if len(llm_response) > 1000 else llm_response,
+                "parsed_result": parsed_result
+            })
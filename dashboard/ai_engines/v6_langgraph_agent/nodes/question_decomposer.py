@@ -10,9 +10,9 @@ last_updated: 2025.11.02
 import json
 import logging
 from typing import Dict, Any, List
-from openai import OpenAI
 
 from ..state import AgentState
+from ..clients import SharedOpenAIClient
 from ..progress_tracker import ProgressTracker
 from ..config import LLM_CONFIG
 from ..errors import handle_exception, LLMError
@@ -25,8 +25,10 @@ logger = logging.getLogger("v6_agent.question_decomposer")
 class QuestionDecomposer:
     """질문 분해"""
 
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
     def __init__(self):
-        self.client = OpenAI()
         self.model = LLM_CONFIG["model"]
         self.temperature = LLM_CONFIG["temperature"]["capability_detector"]  # 0.0
         self.max_tokens = LLM_CONFIG["max_tokens"]
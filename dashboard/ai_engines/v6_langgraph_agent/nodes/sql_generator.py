@@ -3,33 +3,97 @@
 sql_generator.py
 동적 SQL 생성 (각 sub-question마다)
 
+- 서로 독립인 sub-question은 동시에 생성 (LLM 왕복을 겹침)
+- dependency가 있는 질문은 선행 질문 SQL이 나온 뒤 생성하고, 선행 SQL을 프롬프트에 포함
+- 결과(sql_queries, sql_metadata)는 항상 question_id 순서
+
 last_updated: 2025.11.02
 """
 #//==============================================================================//#
 
 import json
 import logging
-from typing import Dict, Any, List
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, Set
 
 from ..state import AgentState
+from ..clients import SharedOpenAIClient
 from ..progress_tracker import ProgressTracker
 from ..config import LLM_CONFIG
 from ..errors import handle_exception, SQLGenerationError, LLMError
 from ..state_validator import validate_state, validate_sql_query_structure
+from ..data_version import rollups_available, typed_columns_available
+from ..query_cache import get_cached_sql, put_cached_sql, add_cache_trace
 
 # 로거 설정
 logger = logging.getLogger("v6_agent.sql_generator")
 
+# 평점/날짜 컬럼 설명 - 타입 컬럼(rating_num, review_dt)이 없을 때 (텍스트 컬럼을 CAST)
+TEXT_COLUMN_PROMPT = {
+    "columns": """   - rating (text) - 평점 (숫자로 변환: CAST(rating AS FLOAT))
+   - review_date (text) - 리뷰 날짜 (날짜로 변환: CAST(review_date AS DATE))""",
+    "rules": """5. 날짜는 CAST(review_date AS DATE) 변환
+6. 평점은 CAST(rating AS FLOAT) 변환"""
+}
+
+# 평점/날짜 컬럼 설명 - 타입 컬럼이 있을 때 (CAST 없이 인덱스 사용, v5 utils/review_typed_columns.py가 추가)
+TYPED_COLUMN_PROMPT = {
+    "columns": """   - rating (text) - 평점 원본 문자열 (조회/표시용)
+   - rating_num (numeric) - 평점 숫자 (평균/조건에 사용, 숫자가 아니면 NULL)
+   - review_date (text) - 리뷰 날짜 원본 문자열 (조회/표시용)
+   - review_dt (date) - 리뷰 날짜 (기간 조건/정렬/DATE_TRUNC에 사용, 인덱스: brand + review_dt)""",
+    "rules": """5. 날짜 조건/정렬/그룹은 review_dt 사용 (rating/review_date 원본을 형 변환하지 말 것 - 인덱스 사용 불가)
+6. 평점 계산/조건은 rating_num 사용 (AVG(rating_num), rating_num >= 4)"""
+}
+
+# 롤업 테이블 안내 (v5 utils/review_rollups.py가 업로드 때마다 갱신)
+# 롤업이 최신일 때만 프롬프트에 포함
+ROLLUP_SCHEMA_PROMPT = """
+**롤업(요약) 테이블 - 기간 조건 없는 집계 질문은 이 테이블을 우선 사용:**
+
+preprocessed_reviews의 analysis를 (brand, product_name, channel) 단위로 미리 집계한 테이블입니다.
+수천 건 대신 수백 행만 읽으므로 훨씬 빠릅니다. 모든 롤업 테이블에 brand, product_name, channel 컬럼이 있고
+필터링 규칙(brand =, product_name LIKE, channel =)은 동일합니다. 집계할 때는 SUM(...)으로 합치세요.
+
+- review_rollup_totals (brand, product_name, channel, review_count) - 리뷰 수
+- review_rollup_sentiment (..., sentiment, review_count) - 감정요약.전반적평가별 리뷰 수
+- review_rollup_attributes (..., attribute, evaluation, review_count) - 제품특성 속성(보습력 등)/평가별 리뷰 수
+- review_rollup_terms (..., field, term, mention_count) - 리스트 항목별 언급 수
+  field: '장점', '단점', '키워드', '불만사항', '구매동기', '핵심표현'
+- review_rollup_fields (..., field, review_count) - 해당 field 항목이 있는 리뷰 수
+
+롤업 사용 불가 (preprocessed_reviews 사용):
+- 기간(review_date) / 평점(rating) 조건이나 트렌드가 필요한 경우
+- 리뷰 원문(review_clean) 샘플이 필요한 경우
+
+예시 - 장점 Top 10 (롤업):
+SELECT term as advantage, SUM(mention_count) as count
+FROM review_rollup_terms
+WHERE field = '장점' AND brand = '빌리프' AND product_name LIKE '%모이스춰라이징밤%'
+GROUP BY term
+ORDER BY count DESC
+LIMIT 10
+
+예시 - 보습력 평가 분포 (롤업):
+SELECT brand, product_name, evaluation as 보습력평가, SUM(review_count) as review_count
+FROM review_rollup_attributes
+WHERE attribute = '보습력' AND brand = '빌리프'
+GROUP BY brand, product_name, evaluation
+ORDER BY review_count DESC
+"""
+
 
 class SQLGenerator:
     """SQL 동적 생성"""
 
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
     def __init__(self):
-        self.client = OpenAI()
         self.model = LLM_CONFIG["model"]
         self.temperature = LLM_CONFIG["temperature"]["sql_generator"]  # 0.0
         self.max_tokens = LLM_CONFIG["max_tokens"]
+        self.max_workers = LLM_CONFIG["max_concurrent_requests"]
 
     def generate(self, state: AgentState) -> AgentState:
         """
@@ -64,43 +128,38 @@ class SQLGenerator:
 
             logger.info(f"최종 sub_questions 개수: {len(sub_questions)}")
 
+            # 같은 질문+엔티티로 생성한 SQL이 있으면 LLM 호출 생략
+            rollups = rollups_available()
+            typed_columns = typed_columns_available()
+            sql_queries = get_cached_sql(state["user_query"], state.get("parsed_entities"), rollups, typed_columns)
+            add_cache_trace(state, "sql_cache", {"hit": sql_queries is not None})
+
             tracker.start_step(
                 node_name="SQLGenerator",
                 description="SQL 쿼리 생성 중...",
-                substeps=[f"Q{i+1} SQL 생성" for i in range(len(sub_questions))]
+                substeps=[f"Q{i+1} SQL 생성" for i in range(len(sql_queries or sub_questions))]
             )
 
-            # 2. 각 sub-question마다 SQL 생성
-            sql_queries = []
-            sql_metadata = []  # UI 표시용 SQL 메타데이터
-
-            for i, sub_q in enumerate(sub_questions, 1):
-                logger.debug(f"Q{i} SQL 생성 시작: {sub_q['sub_question']}")
-
-                sql_info = self._generate_sql(
-                    sub_q,
-                    state["parsed_entities"],
-                    state["capabilities"],
-                    state  # Debug 추적을 위해 state 전달
-                )
-
-                sql_info["question_id"] = i
-                sql_info["sub_question"] = sub_q["sub_question"]
-                sql_queries.append(sql_info)
-
-                # SQL 메타데이터 저장 (UI 표시용)
-                sql_metadata.append({
-                    "question_id": i,
-                    "sub_question": sub_q["sub_question"],
+            # 2. 각 sub-question마다 SQL 생성 (독립 질문은 동시에)
+            if sql_queries is not None:
+                logger.info(f"SQL 캐시 적중: {len(sql_queries)}개 쿼리 재사용")
+                tracker.update_substep(f"이전에 생성한 SQL 재사용 ({len(sql_queries)}개)")
+            else:
+                sql_queries = self._generate_all(sub_questions, state, tracker)
+                put_cached_sql(state["user_query"], state.get("parsed_entities"), rollups, sql_queries, typed_columns)
+
+            # SQL 메타데이터 저장 (UI 표시용)
+            sql_metadata = [
+                {
+                    "question_id": sql_info["question_id"],
+                    "sub_question": sql_info["sub_question"],
                     "sql": sql_info["sql"],
                     "purpose": sql_info["purpose"],
                     "explanation": sql_info["explanation"],
                     "estimated_rows": sql_info["estimated_rows"]
-                })
-
-                logger.info(f"Q{i} SQL 생성 완료 (예상 {sql_info['estimated_rows']}건)")
-                logger.debug(f"Q{i} SQL: {sql_info['sql'][:150]}...")
-                tracker.update_substep(f"Q{i} SQL 생성 완료 (예상 {sql_info['estimated_rows']}건)")
+                }
+                for sql_info in sql_queries
+            ]
 
             tracker.complete_step(summary=f"{len(sql_queries)}개 SQL 생성 완료")
 
@@ -150,12 +209,113 @@ class SQLGenerator:
 
         return state
 
+    def _generate_all(
+        self,
+        sub_questions: List[Dict[str, Any]],
+        state: AgentState,
+        tracker: ProgressTracker
+    ) -> List[Dict[str, Any]]:
+        """
+        sub-question별 SQL 동시 생성 (dependency DAG 순서 준수)
+
+        선행 질문이 모두 끝난 질문부터 스레드 풀에 넣고, 하나가 끝날 때마다
+        새로 준비된 질문을 추가합니다. 진행상황(UI 콜백)은 메인 스레드에서만 갱신합니다.
+
+        Args:
+            sub_questions: 하위 질문 리스트 (dependency: None 또는 [1-based 질문 번호])
+            state: AgentState
+            tracker: 진행상황 트래커
+
+        Returns:
+            question_id 순서의 SQL 정보 리스트
+
+        Raises:
+            하위 질문 하나라도 실패하면 그 예외 (generate()에서 처리)
+        """
+        total = len(sub_questions)
+        dependencies = {
+            qid: self._parse_dependency(sub_q.get("dependency"), qid, total)
+            for qid, sub_q in enumerate(sub_questions, 1)
+        }
+
+        results: Dict[int, Dict[str, Any]] = {}
+        pending = set(dependencies)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, total))) as pool:
+            while pending or running:
+                ready = sorted(qid for qid in pending if dependencies[qid] <= results.keys())
+
+                if not ready and not running:
+                    # 순환 의존성 → 가장 앞 질문의 의존성을 무시하고 진행
+                    qid = min(pending)
+                    logger.warning(f"Q{qid} 순환 의존성 감지, 의존성 무시: {sorted(dependencies[qid])}")
+                    dependencies[qid] = set()
+                    continue
+
+                for qid in ready:
+                    pending.discard(qid)
+                    sub_q = sub_questions[qid - 1]
+                    logger.debug(f"Q{qid} SQL 생성 시작: {sub_q['sub_question']}")
+
+                    dependency_sqls = [
+                        {"question_id": dep, "sub_question": results[dep]["sub_question"], "sql": results[dep]["sql"]}
+                        for dep in sorted(dependencies[qid])
+                    ]
+                    future = pool.submit(
+                        self._generate_sql,
+                        sub_q,
+                        state["parsed_entities"],
+                        state["capabilities"],
+                        state,  # Debug 추적을 위해 state 전달
+                        dependency_sqls
+                    )
+                    running[future] = qid
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    qid = running.pop(future)
+                    sql_info = future.result()
+
+                    sql_info["question_id"] = qid
+                    sql_info["sub_question"] = sub_questions[qid - 1]["sub_question"]
+                    results[qid] = sql_info
+
+                    logger.info(f"Q{qid} SQL 생성 완료 (예상 {sql_info['estimated_rows']}건)")
+                    logger.debug(f"Q{qid} SQL: {sql_info['sql'][:150]}...")
+                    tracker.update_substep(f"Q{qid} SQL 생성 완료 (예상 {sql_info['estimated_rows']}건)")
+
+        return [results[qid] for qid in range(1, total + 1)]
+
+    def _parse_dependency(self, dependency: Any, question_id: int, total: int) -> Set[int]:
+        """
+        dependency 필드 → 선행 질문 번호 집합
+
+        None, 3, [1, 2], ["Q1"] 등을 허용하고 범위 밖/자기 자신은 무시합니다.
+        """
+        if dependency is None:
+            return set()
+        if not isinstance(dependency, (list, tuple, set)):
+            dependency = [dependency]
+
+        parsed = set()
+        for dep in dependency:
+            try:
+                dep_id = int(str(dep).strip().lstrip("Qq"))
+            except ValueError:
+                logger.warning(f"Q{question_id} 잘못된 dependency 무시: {dep}")
+                continue
+            if 1 <= dep_id <= total and dep_id != question_id:
+                parsed.add(dep_id)
+        return parsed
+
     def _generate_sql(
         self,
         sub_question: Dict[str, Any],
         entities: Dict[str, Any],
         capabilities: Dict[str, Any],
-        state: Dict[str, Any] = None
+        state: Dict[str, Any] = None,
+        dependency_sqls: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         LLM을 사용하여 SQL 생성
@@ -165,10 +325,21 @@ class SQLGenerator:
             entities: 엔티티
             capabilities: 분석 전략
             state: AgentState (디버그 추적용, 옵션)
+            dependency_sqls: 선행 질문 SQL 리스트 (dependency가 있을 때)
 
         Returns:
             SQL 정보
         """
+        rollup_section = ROLLUP_SCHEMA_PROMPT if rollups_available() else ""
+        typed_columns = typed_columns_available()
+        schema_text = TYPED_COLUMN_PROMPT if typed_columns else TEXT_COLUMN_PROMPT
+
+        dependency_section = ""
+        if dependency_sqls:
+            dependency_section = "\n**선행 질문 SQL (이 질문은 아래 결과를 이어서 분석합니다. 같은 필터 조건을 유지하세요):**\n"
+            for dep in dependency_sqls:
+                dependency_section += f"Q{dep['question_id']}. {dep['sub_question']}\n```sql\n{dep['sql']}\n```\n"
+
         prompt = f"""당신은 PostgreSQL Text-to-SQL 전문가입니다.
 하위 질문을 분석하여 필요한 데이터를 가져오는 SQL 쿼리를 생성하세요.
 
@@ -183,8 +354,7 @@ preprocessed_reviews 테이블 (5,000건 - GPT 분석 완료 + 원본 데이터)
    - channel (varchar) - 채널 (OliveYoung, Coupang, Daiso)
    - category (varchar) - 카테고리
    - review_clean (text) - 전처리된 리뷰 원문
-   - rating (text) - 평점 (숫자로 변환: CAST(rating AS FLOAT))
-   - review_date (text) - 리뷰 날짜 (날짜로 변환: CAST(review_date AS DATE))
+{schema_text['columns']}
    - ranking (text) - 제품 순위
    - product_price_sale (text) - 판매가
    - product_price_origin (text) - 정가
@@ -212,15 +382,14 @@ preprocessed_reviews 테이블 (5,000건 - GPT 분석 완료 + 원본 데이터)
 
 5. 배열에 특정 값 포함:
    WHERE analysis->'키워드' @> '["보습"]'
-
+{rollup_section}
 **SQL 작성 규칙:**
 
-1. 항상 preprocessed_reviews 테이블만 사용 (단일 테이블 구조)
+1. preprocessed_reviews 테이블 사용 (롤업 테이블이 안내된 경우 집계 질문은 롤업 사용 가능)
 2. 필요한 컬럼만 SELECT
 3. WHERE 절로 브랜드/제품/채널/기간 필터링
 4. 집계 필요 시 GROUP BY 사용
-5. 날짜는 CAST(review_date AS DATE) 변환
-6. 평점은 CAST(rating AS FLOAT) 변환
+{schema_text['rules']}
 7. LIMIT은 샘플 필요 시만 (기본 없음)
 8. 리뷰 원문 샘플 제공 시 review_clean 컬럼 사용
 
@@ -407,6 +576,7 @@ WHERE brand = '빌리프'
 ORDER BY CAST(review_date AS DATE) DESC
 LIMIT 100
 ```
+{dependency_section}
 **하위 질문:**
 {sub_question['sub_question']}
 
@@ -430,6 +600,10 @@ LIMIT 100
 
 **JSON만 반환하세요:**"""
 
+        # 예시 SQL도 타입 컬럼 기준으로 (CAST 예시를 그대로 두면 LLM이 따라 씀)
+        if typed_columns:
+            prompt = prompt.replace("CAST(review_date AS DATE)", "review_dt").replace("CAST(rating AS FLOAT)", "rating_num")
+
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
@@ -12,12 +12,15 @@ import logging
 import psycopg2
 import psycopg2.errors
 from typing import Dict, Any, List
-from openai import OpenAI
 
 from ..state import AgentState
+from ..clients import SharedOpenAIClient
 from ..progress_tracker import ProgressTracker
-from ..config import LLM_CONFIG, DB_CONFIG
+from ..config import LLM_CONFIG, DB_CONFIG, SQL_GUARD_CONFIG
 from ..errors import handle_exception, DatabaseError, SQLGenerationError
+from ..result_set import ResultRows
+from ..data_version import review_column_exprs
+from ..sql_guard import check_sql, QueryRejected
 from ..state_validator import validate_state
 
 # 로거 설정
@@ -27,8 +30,10 @@ logger = logging.getLogger("v6_agent.sql_refiner")
 class SQLRefiner:
     """SQL 자동 수정"""
 
+    # 프로세스 공유 OpenAI 클라이언트 (clients.py)
+    client = SharedOpenAIClient()
+
     def __init__(self):
-        self.client = OpenAI()
         self.model = LLM_CONFIG["model"]
         self.temperature = LLM_CONFIG["temperature"]["sql_generator"]  # 0.0
         self.max_tokens = LLM_CONFIG["max_tokens"]
@@ -75,6 +80,10 @@ class SQLRefiner:
             # 3. DB 연결
             conn = psycopg2.connect(**self.db_config)
             cursor = conn.cursor()
+            cursor.execute(
+                "SET statement_timeout = %s",
+                (int(SQL_GUARD_CONFIG["statement_timeout_seconds"] * 1000),)
+            )
 
             # 4. 각 실패한 쿼리 수정 시도
             refined_results = []
@@ -181,11 +190,15 @@ class SQLRefiner:
                     attempt
                 )
 
+                # 수정된 SQL도 실행 전 비용 검사 (거부되면 그 사유로 다시 수정)
+                decision = check_sql(cursor, refined_sql)
+                if decision["action"] == "reject":
+                    raise QueryRejected(decision["reason"])
+
                 # 수정된 SQL 실행
-                cursor.execute(refined_sql)
-                rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                data = [dict(zip(columns, row)) for row in rows]
+                cursor.execute(decision["sql"])
+                data = ResultRows.from_cursor(cursor)
+                columns = data.columns
 
                 logger.info(f"Q{question_id} 재시도 {attempt}회 성공: {len(data)}건")
                 tracker.update_substep(
@@ -201,12 +214,13 @@ class SQLRefiner:
                     "columns": columns,
                     "row_count": len(data),
                     "success": True,
+                    "truncated": decision["action"] == "limit",
                     "refined": True,
                     "attempts": attempt,
                     "error": None
                 }
 
-            except psycopg2.Error as e:
+            except (psycopg2.Error, QueryRejected) as e:
                 error_message = str(e)
                 logger.warning(f"Q{question_id} 재시도 {attempt}회 실패: {type(e).__name__}")
                 if attempt == self.max_retries:
@@ -246,6 +260,9 @@ class SQLRefiner:
         Returns:
             수정된 SQL
         """
+        # 타입 컬럼(rating_num, review_dt)이 있으면 CAST 대신 그 컬럼으로 안내
+        columns = review_column_exprs()
+
         prompt = f"""당신은 PostgreSQL 오류를 수정하는 전문가입니다.
 실패한 SQL 쿼리와 에러 메시지를 보고 수정된 SQL을 생성하세요.
 
@@ -267,11 +284,11 @@ class SQLRefiner:
 
 2. 타입 변환 오류:
    - 잘못: WHERE rating > 4
-   - 올바름: WHERE CAST(rating AS FLOAT) > 4
+   - 올바름: WHERE {columns['rating']} > 4
 
 3. 날짜 변환 오류:
    - 잘못: WHERE review_date > '2025-01-01'
-   - 올바름: WHERE CAST(review_date AS DATE) > '2025-01-01'
+   - 올바름: WHERE {columns['date']} > '2025-01-01'
 
 4. 컬럼 존재하지 않음:
    - reviews 테이블에 analysis 없음
@@ -240,6 +240,13 @@ class Synthesizer:
         # SQL 메타데이터 (UI 표시용)
         sql_metadata = state.get("sql_metadata", [])
 
+        # 비용 검사로 LIMIT이 붙어 일부 행만 조회된 쿼리
+        truncated_queries = [
+            {"question_id": r["question_id"], "row_count": r["row_count"]}
+            for r in query_results.get("results", [])
+            if r.get("success") and r.get("truncated")
+        ]
+
         return {
             "total_duration": round(total_duration, 2),
             "complexity": complexity.get("level", "unknown"),
@@ -248,5 +255,6 @@ class Synthesizer:
             "total_data_rows": total_rows,
             "visualization_confidence": state.get("response_plan", {}).get("confidence", 0),
             "processing_steps": len(messages),
-            "sql_queries": sql_metadata  # SQL 쿼리 메타데이터 추가
+            "sql_queries": sql_metadata,  # SQL 쿼리 메타데이터 추가
+            "truncated_queries": truncated_queries
         }
@@ -0,0 +1,283 @@
+#//==============================================================================//#
+"""
+query_cache.py
+V6 2단계 쿼리 캐시 (프로세스 공유)
+
+1. SQL 캐시: 정규화된 질문 + 엔티티 → 생성된 SQL 리스트
+   - 적중하면 SQLGenerator의 LLM 호출을 건너뜀
+   - 롤업/타입 컬럼 사용 여부가 바뀌면 프롬프트가 달라지므로 키에 포함
+2. 결과 캐시: 정규화된 SQL + 파라미터 + preprocessed_reviews 데이터 버전 → 결과 행 (ResultRows)
+   - 업로드로 데이터 버전이 올라가면 예전 결과는 자연히 사용되지 않음 (LRU로 밀려남)
+   - 데이터 버전을 알 수 없으면 캐시하지 않음
+
+두 캐시 모두 항목 수(결과 캐시는 행 수도) 제한 LRU이고, 적중/미스 통계를
+debug_traces(node="QueryCache")에 남깁니다.
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import CACHE_CONFIG
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.query_cache")
+
+
+class LRUCache:
+    """
+    크기 제한 LRU 캐시 (스레드 안전)
+
+    max_entries 항목 수, max_weight 가중치 합(예: 행 수)을 넘으면
+    가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int, max_weight: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self._data: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없으면 None)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: str, value: Any, weight: int = 1):
+        """값 저장 (한 항목이 max_weight보다 크면 저장하지 않음)"""
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+
+        with self._lock:
+            if key in self._data:
+                self._weight -= self._data.pop(key)[1]
+            self._data[key] = (value, weight)
+            self._weight += weight
+
+            while len(self._data) > self.max_entries or (
+                self.max_weight is not None and self._weight > self.max_weight
+            ):
+                _, (_, evicted_weight) = self._data.popitem(last=False)
+                self._weight -= evicted_weight
+                self.evictions += 1
+
+    def clear(self):
+        """전체 삭제 (통계 유지)"""
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "weight": self._weight,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
+
+
+# 프로세스 공유 캐시
+sql_cache = LRUCache(CACHE_CONFIG["sql_cache_max_entries"])
+result_cache = LRUCache(
+    CACHE_CONFIG["result_cache_max_entries"],
+    max_weight=CACHE_CONFIG["result_cache_max_rows"]
+)
+
+
+# ===== 키 정규화 =====
+
+def normalize_question(question: str) -> str:
+    """질문 정규화 (소문자, 문장부호/공백 차이 무시)"""
+    text = re.sub(r"[?!.,~]+", " ", question or "").lower()
+    return " ".join(text.split())
+
+
+def _canonical_json(value: Any) -> Any:
+    """엔티티 비교용 정규화 (dict 키 정렬, 리스트 원소 정렬)"""
+    if isinstance(value, dict):
+        return {k: _canonical_json(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple, set)):
+        items = [_canonical_json(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, ensure_ascii=False, sort_keys=True, default=str))
+    return value
+
+
+def sql_cache_key(user_query: str, entities: Dict[str, Any], rollups: bool, typed_columns: bool = False) -> str:
+    """SQL 캐시 키: 정규화 질문 + 엔티티 + 롤업/타입 컬럼 사용 여부"""
+    payload = json.dumps(
+        {
+            "question": normalize_question(user_query),
+            "entities": _canonical_json(entities or {}),
+            "rollups": rollups,
+            "typed_columns": typed_columns
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# 문자열 리터럴('...'), 따옴표 식별자("..."), 주석을 구분하는 토큰
+_SQL_TOKEN = re.compile(r"('(?:[^']|'')*')|(\"(?:[^\"]|\"\")*\")|(--[^\n]*)|(/\*.*?\*/)", re.S)
+
+
+def canonicalize_sql(sql: str) -> str:
+    """
+    SQL 정규화 (결과 캐시 키)
+
+    주석 제거, 공백 정리(기호 주변 공백 제거), 끝 세미콜론 제거,
+    따옴표 밖은 소문자로 통일합니다. 문자열 리터럴과 따옴표 식별자는 그대로 둡니다.
+
+    Example:
+        >>> canonicalize_sql("SELECT  *\\nFROM t WHERE brand = '빌리프';")
+        "select * from t where brand='빌리프'"
+    """
+    literals = []
+
+    def _stash(match):
+        if match.group(1) or match.group(2):
+            literals.append(match.group(0))
+            return f"\x00{len(literals) - 1}\x00"
+        return " "  # 주석
+
+    text = _SQL_TOKEN.sub(_stash, sql)
+    text = " ".join(text.lower().split()).rstrip(";").strip()
+    text = re.sub(r"\s*([,()=<>+*/])\s*", r"\1", text)
+    return re.sub(r"\x00(\d+)\x00", lambda m: literals[int(m.group(1))], text)
+
+
+def result_cache_key(sql: str, data_version: int, params: Optional[List[Any]] = None) -> str:
+    """결과 캐시 키: 정규화 SQL + 파라미터 + 데이터 버전"""
+    params_text = json.dumps(list(params), ensure_ascii=False, default=str) if params else ""
+    payload = f"{data_version}\n{canonicalize_sql(sql)}\n{params_text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ===== 캐시 사용 =====
+
+def get_cached_sql(
+    user_query: str,
+    entities: Dict[str, Any],
+    rollups: bool,
+    typed_columns: bool = False
+) -> Optional[List[Dict[str, Any]]]:
+    """캐시된 SQL 리스트 (복사본, 없으면 None)"""
+    if not CACHE_CONFIG["enabled"]:
+        return None
+    cached = sql_cache.get(sql_cache_key(user_query, entities, rollups, typed_columns))
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def put_cached_sql(
+    user_query: str,
+    entities: Dict[str, Any],
+    rollups: bool,
+    sql_queries: List[Dict[str, Any]],
+    typed_columns: bool = False
+):
+    """생성된 SQL 리스트 저장"""
+    if not CACHE_CONFIG["enabled"]:
+        return
+    sql_cache.put(sql_cache_key(user_query, entities, rollups, typed_columns), copy.deepcopy(sql_queries))
+
+
+def get_cached_result(sql: str, data_version: Optional[int], params: Optional[List[Any]] = None):
+    """
+    캐시된 결과 (없거나 버전 불명이면 None)
+
+    Returns:
+        {"rows": ResultRows, "truncated": LIMIT 적용 여부, "guard": 비용 검사 기록}
+    """
+    if not CACHE_CONFIG["enabled"] or data_version is None:
+        return None
+    return result_cache.get(result_cache_key(sql, data_version, params))
+
+
+def put_cached_result(
+    sql: str,
+    data_version: Optional[int],
+    rows,
+    params: Optional[List[Any]] = None,
+    truncated: bool = False,
+    guard: Optional[Dict[str, Any]] = None
+):
+    """결과 행 + LIMIT 적용 여부/비용 검사 기록 저장 (가중치 = 행 수)"""
+    if not CACHE_CONFIG["enabled"] or data_version is None:
+        return
+    entry = {"rows": rows, "truncated": truncated, "guard": guard}
+    result_cache.put(result_cache_key(sql, data_version, params), entry, weight=max(1, len(rows)))
+
+
+def cache_stats() -> Dict[str, Any]:
+    """두 캐시의 누적 통계"""
+    return {
+        "sql_cache": sql_cache.stats(),
+        "result_cache": result_cache.stats()
+    }
+
+
+def add_cache_trace(state: Dict[str, Any], step: str, detail: Dict[str, Any]):
+    """
+    캐시 적중/미스를 cache_info에 기록하고, Debug 모드면 debug_traces에도 추가
+
+    Args:
+        state: AgentState
+        step: "sql_cache" | "result_cache"
+        detail: 이번 요청의 적중/미스 정보
+    """
+    state.setdefault("cache_info", {})[step] = detail
+
+    if state.get("debug_mode", False):
+        state.setdefault("debug_traces", []).append({
+            "node": "QueryCache",
+            "step": step,
+            "parsed_result": {
+                "request": detail,
+                "totals": cache_stats()
+            }
+        })
+
+
+def clear_caches():
+    """두 캐시 비우기"""
+    sql_cache.clear()
+    result_cache.clear()
+
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    print("=== SQL 정규화 ===")
+    print(canonicalize_sql("SELECT  brand, COUNT(*)\nFROM preprocessed_reviews -- 주석\nWHERE brand = '빌리프  A' ;"))
+    print(canonicalize_sql("select brand , count(*) from PREPROCESSED_REVIEWS where brand='빌리프  A'"))
+
+    print("\n=== LRU ===")
+    cache = LRUCache(max_entries=2, max_weight=10)
+    cache.put("a", 1, weight=4)
+    cache.put("b", 2, weight=4)
+    cache.get("a")
+    cache.put("c", 3, weight=4)  # 가중치 초과 → b 제거
+    print(cache.get("b"), cache.get("a"), cache.get("c"), cache.stats())
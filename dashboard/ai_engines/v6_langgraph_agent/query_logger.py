@@ -8,17 +8,192 @@ V6 사용 기록 로깅
 - 실행 결과 기록
 - 오류 기록
 
-last_updated: 2025.10.29
+로그 저장은 백그라운드 스레드(_LogWriter)가 모아서 처리합니다.
+log_query()는 큐에 넣고 바로 Future를 반환하며, Future는 배치 INSERT의
+RETURNING log_id로 채워집니다 (채팅 응답 경로에서 DB/파일 I/O 없음).
+
+last_updated: 2025.11.02
 """
 #//==============================================================================//#
 
+import atexit
 import json
+import queue
+import threading
+import time
 import psycopg2
+from psycopg2.extras import execute_values
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
 
-from .config import DB_CONFIG
+from .config import DB_CONFIG, LOGGER_CONFIG
+from .db_pool import pooled_connection
+
+
+# 배치 INSERT 컬럼 (log_entry 키와 동일 순서)
+_INSERT_COLUMNS = [
+    "username", "timestamp", "user_query", "complexity",
+    "parsed_entities", "sql_queries",
+    "total_queries", "successful_queries", "failed_queries", "total_data_rows",
+    "visualization_strategy", "visualization_confidence",
+    "total_duration", "processing_steps",
+    "node_details", "error_info", "final_response_text"
+]
+_JSON_COLUMNS = {"parsed_entities", "sql_queries", "node_details", "error_info"}
+
+
+def _json_default(value: Any) -> str:
+    """JSON 직렬화 불가 값 (datetime, Decimal 등) 처리"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class _LogWriter:
+    """
+    로그 백그라운드 저장 스레드 (프로세스 공유)
+
+    - 크기 제한 큐: 가득 차면 기다리지 않고 해당 로그를 버림 (응답 지연 방지)
+    - batch_size개가 모이거나 flush_interval초가 지나면 한 번에 저장
+    - DB는 멀티 로우 INSERT ... RETURNING log_id 한 번, 파일은 날짜별로 한 번씩 append
+    """
+
+    def __init__(self):
+        self.batch_size = LOGGER_CONFIG["batch_size"]
+        self.flush_interval = LOGGER_CONFIG["flush_interval"]
+        self._queue: "queue.Queue[Optional[Tuple[Dict[str, Any], bool, Optional[Path], Future]]]" = queue.Queue(
+            maxsize=LOGGER_CONFIG["queue_max_size"]
+        )
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="v6-query-logger", daemon=True)
+        self._thread.start()
+
+    def submit(self, log_entry: Dict[str, Any], save_to_db: bool, log_dir: Optional[Path]) -> Future:
+        """로그 저장 요청 (즉시 반환)"""
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((log_entry, save_to_db, log_dir, future))
+        except queue.Full:
+            self.dropped += 1
+            print(f"로그 큐가 가득 차서 로그를 버립니다 (누적 {self.dropped}건)")
+            future.set_result(None)
+        return future
+
+    def flush(self, timeout: Optional[float] = None):
+        """지금까지 넣은 로그가 모두 저장될 때까지 대기"""
+        marker = self.submit({}, False, None)
+        marker.result(timeout=timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch = [item]
+
+            # 최대 flush_interval 동안 batch_size까지 모으기
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # 예상 못 한 오류로 스레드가 죽으면 이후 로그가 모두 대기 상태로 남으므로 이 배치만 포기
+                print(f"로그 배치 저장 실패 ({len(batch)}건): {type(e).__name__} - {e}")
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+    def _write_batch(self, batch: List[Tuple[Dict[str, Any], bool, Optional[Path], Future]]):
+        entries = [item for item in batch if item[0]]  # flush 마커(빈 dict) 제외
+
+        file_items = [item for item in entries if item[2] is not None]
+        if file_items:
+            self._append_files(file_items)
+
+        db_items = [item for item in entries if item[1]]
+        if db_items:
+            try:
+                log_ids = self._insert_batch([item[0] for item in db_items])
+                for (_, _, _, future), log_id in zip(db_items, log_ids):
+                    future.set_result(log_id)
+            except Exception as e:
+                print(f"DB 로그 저장 실패 ({len(db_items)}건): {e}")
+
+        # DB 저장 안 함/실패/flush 마커
+        for _, _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    def _insert_batch(self, entries: List[Dict[str, Any]]) -> List[int]:
+        """멀티 로우 INSERT (입력 순서대로 log_id 반환)"""
+        rows = []
+        for entry in entries:
+            row = []
+            for column in _INSERT_COLUMNS:
+                value = entry[column]
+                if column in _JSON_COLUMNS and value is not None:
+                    value = json.dumps(value, ensure_ascii=False, default=_json_default)
+                row.append(value)
+            rows.append(tuple(row))
+
+        with pooled_connection(timeout=LOGGER_CONFIG["db_timeout"]) as conn:
+            with conn.cursor() as cur:
+                result = execute_values(
+                    cur,
+                    f"INSERT INTO v6_chatbot_logs ({', '.join(_INSERT_COLUMNS)}) VALUES %s RETURNING log_id",
+                    rows,
+                    page_size=len(rows),
+                    fetch=True
+                )
+            conn.commit()
+
+        return [row[0] for row in result]
+
+    def _append_files(self, items: List[Tuple[Dict[str, Any], bool, Optional[Path], Future]]):
+        """날짜별 JSONL 파일에 모아서 append"""
+        lines_by_file: Dict[Path, List[str]] = {}
+        for log_entry, _, log_dir, _ in items:
+            date_str = log_entry["timestamp"].strftime("%Y%m%d")
+            log_file = log_dir / f"v6_log_{date_str}.jsonl"
+
+            # timestamp를 문자열로 변환
+            log_entry_copy = log_entry.copy()
+            log_entry_copy["timestamp"] = log_entry["timestamp"].isoformat()
+            lines_by_file.setdefault(log_file, []).append(
+                json.dumps(log_entry_copy, ensure_ascii=False, default=_json_default) + "\n"
+            )
+
+        for log_file, lines in lines_by_file.items():
+            try:
+                with open(log_file, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except Exception as e:
+                print(f"파일 로그 저장 실패: {e}")
+
+
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> _LogWriter:
+    """프로세스 공유 로그 저장 스레드 (첫 호출 때 시작)"""
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _LogWriter()
+                # 종료 시 남은 로그 저장
+                atexit.register(_writer.flush, LOGGER_CONFIG["flush_timeout"])
+    return _writer
 
 
 class QueryLogger:
@@ -122,23 +297,50 @@ class QueryLogger:
         state: Dict[str, Any],
         final_response: Dict[str, Any],
         error: Optional[Dict] = None
-    ):
+    ) -> Future:
         """
-        쿼리 실행 로그 저장
+        쿼리 실행 로그 저장 (백그라운드, 즉시 반환)
 
         Args:
             user_query: 사용자 질문
             state: AgentState (전체 실행 상태)
             final_response: 최종 응답
             error: 오류 정보 (있는 경우)
+
+        Returns:
+            log_id로 채워지는 Future (DB 저장 안 하거나 실패하면 None)
         """
         log_entry = self._create_log_entry(user_query, state, final_response, error)
 
-        if self.save_to_db:
-            self._save_to_db(log_entry)
+        return get_log_writer().submit(
+            log_entry,
+            save_to_db=self.save_to_db,
+            log_dir=self.log_dir if self.save_to_file else None
+        )
+
+    @staticmethod
+    def resolve_log_id(log_ref: Union[int, Future, None], timeout: Optional[float] = None) -> Optional[int]:
+        """
+        log_query()가 반환한 Future에서 log_id 꺼내기 (이미 int면 그대로)
+
+        Args:
+            log_ref: log_id 또는 Future
+            timeout: 최대 대기 시간 (초, 기본값 LOGGER_CONFIG["resolve_timeout"])
+
+        Returns:
+            log_id (아직 저장 안 됐거나 실패하면 None)
+        """
+        if not isinstance(log_ref, Future):
+            return log_ref
+
+        try:
+            return log_ref.result(timeout=LOGGER_CONFIG["resolve_timeout"] if timeout is None else timeout)
+        except Exception:
+            return None
 
-        if self.save_to_file:
-            self._save_to_file(log_entry)
+    def flush(self, timeout: Optional[float] = None):
+        """대기 중인 로그 모두 저장 (테스트/종료 시)"""
+        get_log_writer().flush(timeout=timeout)
 
     def _create_log_entry(
         self,
@@ -202,73 +404,6 @@ class QueryLogger:
 
         return log_entry
 
-    def _save_to_db(self, log_entry: Dict[str, Any]):
-        """DB에 저장"""
-        try:
-            conn = psycopg2.connect(**DB_CONFIG)
-            cur = conn.cursor()
-
-            cur.execute("""
-                INSERT INTO v6_chatbot_logs (
-                    username, timestamp, user_query, complexity,
-                    parsed_entities, sql_queries,
-                    total_queries, successful_queries, failed_queries, total_data_rows,
-                    visualization_strategy, visualization_confidence,
-                    total_duration, processing_steps,
-                    node_details, error_info, final_response_text
-                ) VALUES (
-                    %s, %s, %s, %s,
-                    %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s,
-                    %s, %s,
-                    %s, %s, %s
-                )
-            """, (
-                log_entry["username"],
-                log_entry["timestamp"],
-                log_entry["user_query"],
-                log_entry["complexity"],
-                json.dumps(log_entry["parsed_entities"], ensure_ascii=False),
-                json.dumps(log_entry["sql_queries"], ensure_ascii=False),
-                log_entry["total_queries"],
-                log_entry["successful_queries"],
-                log_entry["failed_queries"],
-                log_entry["total_data_rows"],
-                log_entry["visualization_strategy"],
-                log_entry["visualization_confidence"],
-                log_entry["total_duration"],
-                log_entry["processing_steps"],
-                json.dumps(log_entry["node_details"], ensure_ascii=False),
-                json.dumps(log_entry["error_info"], ensure_ascii=False) if log_entry["error_info"] else None,
-                log_entry["final_response_text"]
-            ))
-
-            conn.commit()
-            cur.close()
-            conn.close()
-
-        except Exception as e:
-            print(f"DB 로그 저장 실패: {e}")
-
-    def _save_to_file(self, log_entry: Dict[str, Any]):
-        """JSON 파일로 저장"""
-        try:
-            # 날짜별 로그 파일
-            date_str = log_entry["timestamp"].strftime("%Y%m%d")
-            log_file = self.log_dir / f"v6_log_{date_str}.jsonl"
-
-            # timestamp를 문자열로 변환
-            log_entry_copy = log_entry.copy()
-            log_entry_copy["timestamp"] = log_entry["timestamp"].isoformat()
-
-            # JSONL 형식으로 추가 (한 줄에 하나씩)
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry_copy, ensure_ascii=False) + "\n")
-
-        except Exception as e:
-            print(f"파일 로그 저장 실패: {e}")
-
     def get_user_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """사용자의 최근 질문 히스토리"""
         if not self.save_to_db:
@@ -0,0 +1,349 @@
+#//==============================================================================//#
+"""
+result_compactor.py
+OutputGenerator 요약 프롬프트용 쿼리 결과 압축 (토큰 예산)
+
+모든 행을 json.dumps(indent=2)로 넣으면 2,000행 결과 하나로 프롬프트가
+수만 토큰이 됩니다. 결과 전체가 예산 안에 들어가면 그대로 넣고,
+넘으면 결과마다 프로필로 바꿉니다.
+
+- 행 수 / 컬럼 / 숫자 컬럼 요약 (min, max, 평균, 합계)
+- 대표 행: 시계열은 고르게 간격 추출, 지표 컬럼이 있으면 상위 N,
+  긴 텍스트 컬럼이 있으면 범주(감정/브랜드 등)별 층화 샘플
+- 대표 행 수는 예산에 맞을 때까지 이분 탐색으로 줄임
+- 생략 내역(elided)은 프롬프트에도 표시해서 LLM이 일부 데이터임을 알게 함
+- 비용 검사로 LIMIT이 붙은 결과(truncated)는 행 수가 전체 건수가 아님을 표시
+
+토큰 수는 tiktoken(없으면 글자 수 기반 추정)으로 셉니다.
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import json
+import logging
+import math
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from .config import RESULT_COMPACTOR_CONFIG
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.result_compactor")
+
+TIME_COLUMNS = ["month", "date", "period", "year", "week", "review_date", "review_dt"]
+METRIC_HINTS = ["count", "avg", "mean", "percentage", "ratio", "rate", "score", "sum", "total"]
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """
+    토큰 수 (gpt-4o 계열 인코딩, tiktoken이 없으면 추정)
+
+    추정치는 한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰 (실제보다 약간 크게 잡음)
+    """
+    global _encoding
+
+    if tiktoken is not None:
+        if _encoding is None:
+            _encoding = tiktoken.get_encoding(RESULT_COMPACTOR_CONFIG["encoding"])
+        return len(_encoding.encode(text))
+
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def _safe_value(value: Any, text_max_chars: Optional[int] = None) -> Any:
+    """JSON 직렬화 가능한 값 (날짜는 isoformat, Decimal은 float, 긴 텍스트는 자름)"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str) and text_max_chars and len(value) > text_max_chars:
+        return value[:text_max_chars] + "…"
+    return value
+
+
+def _render_rows(rows: List[Dict[str, Any]], text_max_chars: Optional[int] = None) -> str:
+    """한 줄에 한 행 (indent 없이)"""
+    return "\n".join(
+        json.dumps({k: _safe_value(v, text_max_chars) for k, v in row.items()}, ensure_ascii=False, default=str)
+        for row in rows
+    )
+
+
+def _row_count_line(result: Dict[str, Any], row_count: int) -> str:
+    """결과 행 수 줄 (LIMIT으로 잘린 결과는 전체 건수가 아님을 명시)"""
+    if result.get("truncated"):
+        return f"결과: {row_count:,}건 (비용 제한으로 LIMIT {row_count:,} 적용 - 실제 전체 건수는 더 많음)"
+    return f"결과: {row_count}건"
+
+
+class ResultCompactor:
+    """
+    쿼리 결과 → 토큰 예산 안의 프롬프트 텍스트
+
+    Example:
+        >>> compacted = ResultCompactor(token_budget=4000).compact(query_results)
+        >>> compacted["text"]      # 프롬프트에 넣을 텍스트
+        >>> compacted["elided"]    # 생략 내역
+    """
+
+    def __init__(self, token_budget: Optional[int] = None):
+        self.token_budget = token_budget or RESULT_COMPACTOR_CONFIG["token_budget"]
+        self.text_max_chars = RESULT_COMPACTOR_CONFIG["text_max_chars"]
+        self.max_strata = RESULT_COMPACTOR_CONFIG["max_strata"]
+
+    def compact(self, query_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        결과 압축
+
+        Args:
+            query_results: Executor 결과 리스트
+
+        Returns:
+            {
+                "text": 프롬프트용 텍스트,
+                "tokens": text 토큰 수,
+                "full_tokens": 전체 데이터를 넣었을 때 토큰 수,
+                "elided": [{"question_id", "total_rows", "included_rows", "reason"}, ...],
+                "truncated": [LIMIT으로 잘린 결과의 question_id, ...]
+            }
+        """
+        full_sections = [self._full_section(i, r) for i, r in enumerate(query_results, 1)]
+        full_tokens = [count_tokens(s) for s in full_sections]
+        total_full = sum(full_tokens)
+        truncated = [
+            r.get("question_id", i) for i, r in enumerate(query_results, 1)
+            if r["success"] and r.get("truncated")
+        ]
+
+        if total_full <= self.token_budget:
+            text = "\n".join(full_sections)
+            return {"text": text, "tokens": total_full, "full_tokens": total_full, "elided": [],
+                    "truncated": truncated}
+
+        # 예산 분배: 작은 결과는 전체를 넣고, 남은 예산을 큰 결과끼리 나눔
+        sections: Dict[int, str] = {}
+        remaining_budget = self.token_budget
+        order = sorted(range(len(query_results)), key=lambda idx: full_tokens[idx])
+        elided = []
+
+        for position, idx in enumerate(order):
+            share = remaining_budget // (len(order) - position)
+            if full_tokens[idx] <= share:
+                sections[idx] = full_sections[idx]
+                remaining_budget -= full_tokens[idx]
+                continue
+
+            section, report = self._profile_section(idx + 1, query_results[idx], share)
+            sections[idx] = section
+            remaining_budget -= count_tokens(section)
+            elided.append(report)
+
+        text = "\n".join(sections[idx] for idx in range(len(query_results)))
+        tokens = count_tokens(text)
+        logger.info(f"결과 압축: {total_full:,} → {tokens:,} tokens (예산 {self.token_budget:,}), 생략 {len(elided)}건")
+
+        return {"text": text, "tokens": tokens, "full_tokens": total_full, "elided": elided,
+                "truncated": truncated}
+
+    def _full_section(self, index: int, result: Dict[str, Any]) -> str:
+        """전체 데이터 섹션 (실패한 쿼리는 오류만)"""
+        if not result["success"]:
+            return f"Q{index}: {result['sub_question']}\n오류: {result['error']}\n"
+
+        return (
+            f"Q{index}: {result['sub_question']}\n"
+            f"{_row_count_line(result, result['row_count'])}\n"
+            f"전체 데이터:\n{_render_rows(list(result['data']))}\n"
+        )
+
+    def _profile_section(self, index: int, result: Dict[str, Any], budget: int):
+        """
+        예산을 넘는 결과 → 프로필 + 대표 행 (대표 행 수는 예산에 맞게 이분 탐색)
+
+        Returns:
+            (섹션 텍스트, 생략 내역)
+        """
+        rows = list(result["data"])
+        columns = list(result.get("columns") or (rows[0].keys() if rows else []))
+        numeric_columns = [c for c in columns if self._is_numeric(rows, c)]
+        stats_text = self._numeric_summary(rows, numeric_columns)
+
+        ordered, strategy, keep_order = self._representative_order(rows, columns, numeric_columns)
+
+        def render(n: int) -> str:
+            # 시계열은 원래 순서대로 보여줌
+            indices = sorted(ordered[:n]) if keep_order else ordered[:n]
+            picked = [rows[i] for i in indices]
+            sample_text = _render_rows(picked, self.text_max_chars) if picked else "(행 생략)"
+            return (
+                f"Q{index}: {result['sub_question']}\n"
+                f"{_row_count_line(result, len(rows))} (토큰 예산으로 일부만 표시)\n"
+                f"컬럼: {', '.join(columns)}\n"
+                f"{stats_text}"
+                f"대표 {len(picked)}행 ({strategy}):\n{sample_text}\n"
+                f"※ 생략: {len(rows) - len(picked)}행\n"
+            )
+
+        # 예산 안에서 가장 많은 대표 행 수
+        low, high = 0, len(ordered)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if count_tokens(render(mid)) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+
+        report = {
+            "question_id": result.get("question_id", index),
+            "total_rows": len(rows),
+            "included_rows": low,
+            "reason": f"{strategy}, 예산 {budget:,} tokens"
+        }
+        return render(low), report
+
+    def _is_numeric(self, rows: List[Dict[str, Any]], column: str) -> bool:
+        values = [row.get(column) for row in rows if row.get(column) is not None]
+        return bool(values) and all(
+            isinstance(v, (int, float, Decimal)) and not isinstance(v, bool) for v in values
+        )
+
+    def _numeric_summary(self, rows: List[Dict[str, Any]], numeric_columns: List[str]) -> str:
+        """숫자 컬럼 요약 (전체 행 기준)"""
+        if not numeric_columns:
+            return ""
+
+        lines = ["숫자 컬럼 요약 (전체 행 기준):"]
+        for column in numeric_columns:
+            values = [float(row[column]) for row in rows if row.get(column) is not None]
+            lines.append(
+                f"- {column}: min={min(values):g}, max={max(values):g}, "
+                f"평균={sum(values) / len(values):.4g}, 합계={sum(values):.6g}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _representative_order(
+        self,
+        rows: List[Dict[str, Any]],
+        columns: List[str],
+        numeric_columns: List[str]
+    ):
+        """
+        대표 행 우선순위 (앞에서부터 예산만큼 사용)
+
+        Returns:
+            (행 인덱스 리스트, 전략 이름, 표시할 때 원래 순서 유지 여부)
+        """
+        time_column = next((c for c in columns if c.lower() in TIME_COLUMNS), None)
+        if time_column and len(rows) > 1:
+            return self._evenly_spaced(len(rows)), "시계열 간격 추출", True
+
+        metric_column = next(
+            (c for c in numeric_columns if any(hint in c.lower() for hint in METRIC_HINTS)),
+            numeric_columns[0] if numeric_columns else None
+        )
+        if metric_column:
+            values = [row.get(metric_column) for row in rows]
+            ranked = sorted(
+                range(len(rows)),
+                key=lambda i: float(values[i]) if values[i] is not None else float("-inf"),
+                reverse=True
+            )
+            return ranked, f"{metric_column} 상위", False
+
+        text_column = self._text_column(rows, columns)
+        if text_column:
+            stratum = self._stratum_column(rows, columns, text_column)
+            if stratum:
+                return self._stratified(rows, stratum), f"{stratum}별 층화 샘플", False
+
+        return list(range(len(rows))), "앞에서부터", True
+
+    def _evenly_spaced(self, n: int) -> List[int]:
+        """처음/끝을 먼저, 그 다음 간격을 절반씩 줄이며 추가 (몇 행만 써도 전체 추세가 보이도록)"""
+        picked = OrderedDict(((0, None), (n - 1, None)))
+        step = n - 1
+        while step > 1:
+            step = max(1, step // 2)
+            for i in range(0, n, step):
+                picked.setdefault(i, None)
+        return list(picked)
+
+    def _text_column(self, rows: List[Dict[str, Any]], columns: List[str]) -> Optional[str]:
+        """평균 길이가 긴 문자열 컬럼 (리뷰 본문 등)"""
+        best, best_length = None, 0
+        for column in columns:
+            values = [row.get(column) for row in rows[:200] if isinstance(row.get(column), str)]
+            if values:
+                average = sum(len(v) for v in values) / len(values)
+                if average > best_length:
+                    best, best_length = column, average
+        return best if best_length >= 30 else None
+
+    def _stratum_column(self, rows: List[Dict[str, Any]], columns: List[str], text_column: str) -> Optional[str]:
+        """층화 기준 컬럼 (값 종류가 2 ~ max_strata개인 컬럼)"""
+        for column in columns:
+            if column == text_column:
+                continue
+            distinct = {str(row.get(column)) for row in rows}
+            if 2 <= len(distinct) <= self.max_strata:
+                return column
+        return None
+
+    def _stratified(self, rows: List[Dict[str, Any]], stratum: str) -> List[int]:
+        """범주별로 번갈아 한 행씩 (앞쪽 n행만 써도 모든 범주 포함)"""
+        groups: "OrderedDict[str, List[int]]" = OrderedDict()
+        for i, row in enumerate(rows):
+            groups.setdefault(str(row.get(stratum)), []).append(i)
+
+        ordered = []
+        position = 0
+        while len(ordered) < len(rows):
+            for members in groups.values():
+                if position < len(members):
+                    ordered.append(members[position])
+            position += 1
+        return ordered
+
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    import random
+
+    random.seed(0)
+    sentiments = ["긍정", "중립", "부정"]
+    big = [
+        {
+            "brand": random.choice(["빌리프", "VT", "라운드랩"]),
+            "sentiment": random.choice(sentiments),
+            "review_clean": "보습력이 좋고 흡수가 빨라요. " * random.randint(2, 6)
+        }
+        for _ in range(2000)
+    ]
+    trend = [{"month": f"2025-{m:02d}-01", "avg_rating": round(4 + random.random(), 2)} for m in range(1, 13)]
+
+    results = [
+        {"question_id": 1, "sub_question": "리뷰 원문", "success": True, "data": big,
+         "columns": ["brand", "sentiment", "review_clean"], "row_count": len(big)},
+        {"question_id": 2, "sub_question": "월별 평점", "success": True, "data": trend,
+         "columns": ["month", "avg_rating"], "row_count": len(trend)},
+        {"question_id": 3, "sub_question": "브랜드별 리뷰 수 (LIMIT 적용)", "success": True,
+         "data": [{"brand": "빌리프", "count": 1}], "columns": ["brand", "count"], "row_count": 1, "truncated": True}
+    ]
+
+    compacted = ResultCompactor(token_budget=3000).compact(results)
+    print(f"tokenizer: {'tiktoken' if tiktoken else '추정'}")
+    print(f"전체 {compacted['full_tokens']:,} → {compacted['tokens']:,} tokens")
+    print(f"생략: {compacted['elided']}")
+    print(f"LIMIT 적용: {compacted['truncated']}")
+    assert compacted["truncated"] == [3] and "실제 전체 건수는 더 많음" in compacted["text"]
+    print(compacted["text"][:1500])
@@ -0,0 +1,96 @@
+#//==============================================================================//#
+"""
+result_set.py
+컬럼 배열 기반 쿼리 결과
+
+- 행마다 dict(zip(columns, row))를 만들지 않고 컬럼별 리스트로 보관
+- 기존 코드 호환: ResultRows는 행 dict 시퀀스처럼 동작 (for row in data, data[0], len(data))
+  행 dict는 접근할 때만 만들어짐
+- DataFrame이 필요하면 to_dataframe()으로 컬럼 배열에서 바로 생성
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List
+
+
+class ResultRows(Sequence):
+    """
+    컬럼 배열 기반 쿼리 결과 (행 dict 시퀀스 인터페이스)
+
+    Example:
+        >>> rows = ResultRows(["brand", "count"], [("빌리프", 3), ("VT", 1)])
+        >>> rows.column_data["count"]
+        [3, 1]
+        >>> rows[0]
+        {'brand': '빌리프', 'count': 3}
+    """
+
+    __slots__ = ("columns", "arrays", "_length")
+
+    def __init__(self, columns: List[str], rows: List[tuple]):
+        """
+        Args:
+            columns: 컬럼명 리스트 (cursor.description 순서)
+            rows: cursor.fetchall() 결과
+        """
+        self.columns = list(columns)
+        self._length = len(rows)
+        if rows:
+            self.arrays = [list(values) for values in zip(*rows)]
+        else:
+            self.arrays = [[] for _ in self.columns]
+
+    @classmethod
+    def from_cursor(cls, cursor) -> "ResultRows":
+        """실행된 커서에서 결과 읽기"""
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        rows = cursor.fetchall() if cursor.description else []
+        return cls(columns, rows)
+
+    @property
+    def column_data(self) -> Dict[str, List[Any]]:
+        """{컬럼명: 값 리스트} (중복 컬럼명은 마지막 컬럼, dict 변환과 동일)"""
+        return dict(zip(self.columns, self.arrays))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ResultRows index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        columns = self.columns
+        for values in zip(*self.arrays):
+            yield dict(zip(columns, values))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ResultRows):
+            return self.columns == other.columns and self.arrays == other.arrays
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ResultRows(columns={self.columns}, rows={self._length})"
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        return {column: array[index] for column, array in zip(self.columns, self.arrays)}
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """행 dict 리스트 (JSON 직렬화 등)"""
+        return list(self)
+
+    def to_dataframe(self):
+        """pandas DataFrame (컬럼 배열에서 바로 생성)"""
+        import pandas as pd
+
+        return pd.DataFrame(self.column_data, index=range(self._length))
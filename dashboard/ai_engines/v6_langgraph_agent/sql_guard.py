@@ -0,0 +1,235 @@
+#//==============================================================================//#
+"""
+sql_guard.py
+LLM이 만든 SQL 실행 전 비용 검사 (EXPLAIN 기반)
+
+LIMIT 없는 SELECT가 reviews(31만건)를 그대로 읽으면 수십만 개 행이
+state와 프롬프트로 넘어갑니다. 실행 전에 EXPLAIN (FORMAT JSON)으로
+플래너 예상 행 수/비용을 확인해서:
+
+1. 예상 행 수가 max_rows 이하 → 그대로 실행 (pass)
+2. 넘으면 → 바깥에 LIMIT auto_limit을 씌워 실행 (limit)
+3. LIMIT을 씌워도 예상 비용이 max_cost를 넘으면 → 실행하지 않음 (reject)
+   에러 메시지에 집계/조건 추가 안내를 넣어 SQLRefiner가 집계 쿼리로 고치도록 함
+
+실행 후에는 예상 행 수/비용과 실제 행 수/시간을 stats_file(JSONL)에 남겨
+max_rows, max_cost 조정에 사용합니다 (python -m v6_langgraph_agent.sql_guard로 요약).
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import json
+import logging
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import SQL_GUARD_CONFIG
+
+# 로거 설정
+logger = logging.getLogger("v6_agent.sql_guard")
+
+_COMMENT_PATTERN = re.compile(r"(--[^\n]*|/\*.*?\*/)", re.DOTALL)
+_SELECT_PATTERN = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+_stats_lock = threading.Lock()
+
+
+class QueryRejected(Exception):
+    """예상 비용 초과로 실행하지 않은 쿼리 (메시지는 SQLRefiner 프롬프트에 그대로 사용)"""
+
+
+def is_select(sql: str) -> bool:
+    """EXPLAIN 대상인 조회 쿼리인지 (주석 제외 SELECT/WITH로 시작)"""
+    return bool(_SELECT_PATTERN.match(_COMMENT_PATTERN.sub(" ", sql)))
+
+
+def with_limit(sql: str, limit: int) -> str:
+    """
+    쿼리 바깥에 LIMIT 추가 (원래 LIMIT/ORDER BY는 안쪽에 그대로 유지)
+
+    Args:
+        sql: 원본 SQL
+        limit: 최대 행 수
+
+    Returns:
+        SELECT * FROM (원본) LIMIT n
+    """
+    inner = sql.strip().rstrip(";").rstrip()
+    return f"SELECT * FROM (\n{inner}\n) AS guarded_result\nLIMIT {int(limit)}"
+
+
+def explain(cursor, sql: str, params: Optional[Sequence[Any]] = None) -> Dict[str, float]:
+    """
+    플래너 예상치 조회 (실행하지 않음)
+
+    Args:
+        cursor: DB 커서
+        sql: SQL
+        params: 바인딩 파라미터
+
+    Returns:
+        {"rows": 예상 행 수, "cost": 예상 총 비용}
+    """
+    cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    top = plan[0]["Plan"]
+    return {"rows": float(top["Plan Rows"]), "cost": float(top["Total Cost"])}
+
+
+def check_sql(cursor, sql: str, params: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
+    """
+    실행 전 비용 검사
+
+    Args:
+        cursor: DB 커서 (EXPLAIN 실행용, 실패하면 psycopg2 예외 그대로 전달)
+        sql: LLM/템플릿이 만든 SQL
+        params: 바인딩 파라미터
+
+    Returns:
+        {
+            "action": "pass" | "limit" | "reject" | "skip",
+            "sql": 실제로 실행할 SQL,
+            "estimated_rows", "estimated_cost": 원본 SQL 예상치,
+            "limited_cost": LIMIT 추가 후 예상 비용 (limit/reject일 때),
+            "reason": 판단 이유
+        }
+    """
+    decision = {
+        "action": "pass",
+        "sql": sql,
+        "estimated_rows": None,
+        "estimated_cost": None,
+        "limited_cost": None,
+        "reason": ""
+    }
+
+    if not SQL_GUARD_CONFIG["enabled"] or not is_select(sql):
+        decision["action"] = "skip"
+        return decision
+
+    estimate = explain(cursor, sql, params)
+    decision["estimated_rows"] = estimate["rows"]
+    decision["estimated_cost"] = estimate["cost"]
+
+    max_rows = SQL_GUARD_CONFIG["max_rows"]
+    if estimate["rows"] <= max_rows:
+        return decision
+
+    # 행 수 초과 → 바깥 LIMIT (플래너가 LIMIT까지 반영한 비용으로 다시 확인)
+    limited_sql = with_limit(sql, SQL_GUARD_CONFIG["auto_limit"])
+    limited_cost = explain(cursor, limited_sql, params)["cost"]
+    decision["limited_cost"] = limited_cost
+
+    if limited_cost > SQL_GUARD_CONFIG["max_cost"]:
+        decision["action"] = "reject"
+        decision["reason"] = (
+            f"쿼리 예상 비용 초과 (예상 {estimate['rows']:,.0f}행, LIMIT 적용 후 cost {limited_cost:,.0f} > "
+            f"{SQL_GUARD_CONFIG['max_cost']:,}). 개별 행 대신 GROUP BY와 COUNT/AVG로 집계하거나 "
+            f"브랜드/제품/기간 조건을 추가하세요."
+        )
+        return decision
+
+    decision["action"] = "limit"
+    decision["sql"] = limited_sql
+    decision["reason"] = f"예상 {estimate['rows']:,.0f}행 > {max_rows:,}행 → LIMIT {SQL_GUARD_CONFIG['auto_limit']}"
+    return decision
+
+
+def record_actual(
+    decision: Dict[str, Any],
+    question_id: Any,
+    actual_rows: Optional[int],
+    duration: float,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    예상치 vs 실제 결과 기록 (로그 + stats_file)
+
+    Args:
+        decision: check_sql 결과
+        question_id: 하위 질문 ID
+        actual_rows: 실제 행 수 (실행 안 했으면 None)
+        duration: 실행 시간 (초)
+        error: 실패 메시지
+
+    Returns:
+        쿼리 결과의 "guard" 항목으로 넣을 기록
+    """
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "question_id": question_id,
+        "action": decision["action"],
+        "estimated_rows": decision["estimated_rows"],
+        "estimated_cost": decision["estimated_cost"],
+        "limited_cost": decision["limited_cost"],
+        "actual_rows": actual_rows,
+        "duration": round(duration, 4),
+        "error": error,
+        "sql": decision["sql"][:500]
+    }
+
+    if decision["action"] != "skip":
+        logger.info(
+            f"Q{question_id} guard={decision['action']} "
+            f"예상 {decision['estimated_rows']}행/cost {decision['estimated_cost']} → "
+            f"실제 {actual_rows}행/{duration:.2f}s"
+        )
+        _append_stats(record)
+
+    return record
+
+
+def _append_stats(record: Dict[str, Any]):
+    stats_file = SQL_GUARD_CONFIG.get("stats_file")
+    if not stats_file:
+        return
+
+    try:
+        path = Path(stats_file)
+        with _stats_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        logger.warning(f"SQL guard 통계 저장 실패: {e}")
+
+
+def load_stats(stats_file: Optional[str] = None) -> List[Dict[str, Any]]:
+    """stats_file 기록 읽기 (없으면 빈 리스트)"""
+    path = Path(stats_file or SQL_GUARD_CONFIG.get("stats_file") or "")
+    if not path.is_file():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# ===== 사용 예시 =====
+if __name__ == "__main__":
+    # 예상 vs 실제 요약: python -m v6_langgraph_agent.sql_guard
+    import statistics
+
+    records = load_stats()
+    print(f"=== SQL guard 기록: {len(records)}건 ({SQL_GUARD_CONFIG.get('stats_file')}) ===")
+
+    for action in ("pass", "limit", "reject"):
+        subset = [r for r in records if r["action"] == action]
+        if not subset:
+            continue
+
+        print(f"\n[{action}] {len(subset)}건")
+        executed = [r for r in subset if r["actual_rows"] is not None and r["estimated_rows"]]
+        if executed:
+            # 실제/예상 행 수 비율 (1보다 크면 플래너가 과소 추정)
+            ratios = [r["actual_rows"] / r["estimated_rows"] for r in executed]
+            durations = [r["duration"] for r in executed]
+            print(f"  실제/예상 행 비율 중앙값: {statistics.median(ratios):.2f}")
+            print(f"  실행 시간 중앙값: {statistics.median(durations):.3f}s / 최대: {max(durations):.3f}s")
+        costs = [r["estimated_cost"] for r in subset if r["estimated_cost"] is not None]
+        if costs:
+            print(f"  예상 cost 중앙값: {statistics.median(costs):,.0f} / 최대: {max(costs):,.0f}")
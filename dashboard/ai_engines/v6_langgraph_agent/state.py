@@ -15,6 +15,7 @@ class AgentState(TypedDict):
     # 1. 입력
     user_query: str
     ui_callback: Optional[Callable]  # Streamlit UI 업데이트 콜백
+    stream_callback: Optional[Callable]  # 요약 텍스트 토큰 스트리밍 콜백 (delta 문자열 전달)
     conversation_history: Optional[List[Dict[str, str]]]  # 대화 히스토리 (맥락 유지)
     # [
     #     {"role": "user", "content": "빌리프 보습력 어때?"},
@@ -77,7 +78,10 @@ class AgentState(TypedDict):
     # 5. Executor 출력
     query_results: Optional[Dict[str, Any]]
     # {
-    #     "results": [...],  # 쿼리 결과 리스트
+    #     "results": [...],  # 쿼리 결과 리스트 (question_id 순서)
+    #                        # 각 결과: data (ResultRows - 컬럼 배열, 행 dict 시퀀스로도 사용),
+    #                        #          columns, row_count, duration, wait_time, latency, success, error,
+    #                        #          guard (sql_guard 판단 + 예상/실제), truncated (LIMIT 자동 추가 여부)
     #     "total_queries": 2,
     #     "total_duration": 1.05,
     #     "data_characteristics": {
@@ -143,6 +147,18 @@ class AgentState(TypedDict):
     debug_mode: Optional[bool]  # Debug 모드 활성화 여부
     debug_traces: Optional[List[Dict[str, Any]]]  # Debug 추적 정보
     sql_metadata: Optional[List[Dict[str, Any]]]  # SQL 쿼리 메타데이터 (UI 표시용)
+    cache_info: Optional[Dict[str, Any]]  # 쿼리 캐시 적중 정보 (query_cache.py)
+    # {
+    #     "sql_cache": {"hit": True},
+    #     "result_cache": {"hits": 1, "misses": 1, "data_version": 12}
+    # }
+    fast_path: Optional[Dict[str, Any]]  # 템플릿 질문 Fast Path 판별 결과 (nodes/fast_path.py)
+    # {
+    #     "matched": True,
+    #     "confidence": 1.0,
+    #     "intent": "pros",
+    #     "reason": "template"
+    # }
 
     # 12. 이미지 생성 워크플로우 (AI Visual Agent)
     workflow_type: Optional[str]  # "sql" | "image_generation"
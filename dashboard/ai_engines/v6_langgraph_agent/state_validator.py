@@ -18,6 +18,7 @@ VALID_STATE_FIELDS: Set[str] = {
     # 기본 필드
     "user_query",
     "ui_callback",
+    "stream_callback",  # 요약 텍스트 토큰 스트리밍
     "conversation_history",  # 대화 맥락 유지
 
     # 워크플로우 필드
@@ -39,6 +40,8 @@ VALID_STATE_FIELDS: Set[str] = {
     "debug_mode",
     "debug_traces",
     "sql_metadata",
+    "cache_info",  # 쿼리 캐시 적중 정보
+    "fast_path",  # 템플릿 질문 Fast Path 판별 결과
 
     # 이미지 생성 워크플로우
     "workflow_type",
@@ -2,7 +2,7 @@
 """
 텍스트 마이닝 시각화 모듈
 
-last_updated : 2025.10.25
+last_updated : 2025.11.02
 """
 #//==============================================================================//#
 import pandas as pd
@@ -14,109 +14,25 @@ import plotly.graph_objects as go
 # 키워드 워드클라우드
 #//==============================================================================//#
 def create_keyword_wordcloud(keyword_df, title="키워드 워드클라우드"):
-    """키워드 워드클라우드 생성
+    """키워드 워드클라우드 생성 (공용 렌더러, 같은 키워드 점수면 캐시된 이미지)
 
     Args:
         keyword_df (DataFrame): [키워드, TF-IDF점수, 문서빈도]
-        title (str): 차트 제목
+        title (str): 차트 제목 (이미지에는 그리지 않음, 표시할 때 캡션으로 사용)
 
     Returns:
-        matplotlib.figure.Figure
+        bytes: PNG 이미지 (st.image로 표시)
     """
     if keyword_df.empty:
         return None
 
     try:
-        from wordcloud import WordCloud
-        import matplotlib.pyplot as plt
-        import matplotlib.font_manager as fm
-        import numpy as np
+        from utils.wordcloud_renderer import render_wordcloud_png
 
         # TF-IDF 점수를 딕셔너리로 변환
         word_freq = dict(zip(keyword_df['키워드'], keyword_df['TF-IDF점수']))
 
-        # 한글 폰트 경로 찾기 (크로스 플랫폼 지원)
-        import os
-        import platform
-
-        font_path = None
-        system = platform.system()
-
-        if system == 'Windows':
-            font_candidates = [
-                'C:/Windows/Fonts/malgun.ttf',
-                'C:/Windows/Fonts/malgunbd.ttf',
-                'C:/Windows/Fonts/NanumGothic.ttf',
-            ]
-        elif system == 'Darwin':  # macOS
-            font_candidates = [
-                '/System/Library/Fonts/AppleGothic.ttf',
-                '/Library/Fonts/AppleGothic.ttf',
-                '/System/Library/Fonts/Supplemental/AppleGothic.ttf',
-            ]
-        else:  # Linux
-            font_candidates = [
-                '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-                '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
-                '/usr/share/fonts/nanum/NanumGothic.ttf',
-            ]
-
-        for font in font_candidates:
-            if os.path.exists(font):
-                font_path = font
-                break
-
-        if not font_path:
-            # 시스템 폰트에서 한글 폰트 찾기
-            font_list = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-            for font in font_list:
-                if 'malgun' in font.lower() or 'nanum' in font.lower():
-                    font_path = font
-                    break
-
-        # 원형 마스크 생성 (동그랗게) - 고해상도
-        x, y = np.ogrid[:800, :800]
-        mask = (x - 400) ** 2 + (y - 400) ** 2 > 380 ** 2
-        mask = 255 * mask.astype(int)
-
-        # 워드클라우드 생성 - 더욱 조밀하고 크기 차이 명확하게
-        wordcloud = WordCloud(
-            font_path=font_path,  # 한글 폰트
-            width=800,
-            height=800,
-            background_color='white',
-            colormap='Set2',
-            relative_scaling=0.7,  # 크기 차이 확대
-            min_font_size=12,      # 최소 크기
-            max_font_size=100,     # 최대 크기
-            prefer_horizontal=1.0,
-            collocations=False,
-            mask=mask,
-            max_words=30,          # 단어 수 제한
-            mode='RGBA',
-            scale=3,               # 2 → 3: 더욱 조밀하게 배치
-            repeat=False,          # 중복 방지
-            contour_width=0,       # 윤곽선 제거
-            contour_color='white',
-            margin=1,              # 2 → 1: 단어 간 여백 최소화
-            random_state=42        # 일관된 배치
-        ).generate_from_frequencies(word_freq)
-
-        # Figure 생성 - 고해상도 유지
-        fig, ax = plt.subplots(figsize=(8, 8), dpi=100)
-        fig.patch.set_facecolor('#f8f9fa')
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-
-        # 한글 폰트로 제목 설정
-        if font_path:
-            font_prop = fm.FontProperties(fname=font_path, size=14, weight='bold')
-            ax.set_title(title, fontproperties=font_prop, pad=20)
-        else:
-            ax.set_title(title, fontsize=14, pad=20, weight='bold')
-
-        plt.tight_layout()
-        return fig
+        return render_wordcloud_png(word_freq, style="keyword_analysis")
 
     except ImportError:
         import streamlit as st
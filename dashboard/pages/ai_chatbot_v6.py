@@ -22,7 +22,7 @@ if ai_engines_dir not in sys.path:
     sys.path.insert(0, ai_engines_dir)
 
 # V6 모듈 임포트
-from v6_langgraph_agent.graph import create_graph
+from v6_langgraph_agent.graph import get_graph
 from v6_langgraph_agent.query_logger import QueryLogger
 from v6_langgraph_agent.config import FEEDBACK_REASONS
 
@@ -97,9 +97,12 @@ def main():
             if msg['role'] == 'assistant' and st.session_state.get('v6_debug_mode', False) and msg.get('debug_traces'):
                 show_debug_traces(msg['debug_traces'])
 
-            # 피드백 버튼 (assistant 메시지에만)
-            if msg['role'] == 'assistant' and msg.get('log_id'):
-                show_feedback_buttons(msg['log_id'], idx)
+            # 피드백 버튼 (assistant 메시지에만, log_id는 백그라운드 저장 완료 후 확정)
+            if msg['role'] == 'assistant' and msg.get('log_id') is not None:
+                log_id = QueryLogger.resolve_log_id(msg['log_id'])
+                if log_id:
+                    msg['log_id'] = log_id
+                    show_feedback_buttons(log_id, idx)
 
     # 사용자 입력
     if prompt := st.chat_input("질문을 입력하세요 (예: 빌리프 보습력 어때?)"):
@@ -120,19 +123,28 @@ def main():
                 # 진행상황 표시를 위한 placeholder
                 progress_placeholder = st.empty()
 
+                # 요약 텍스트 스트리밍 placeholder (생성되는 대로 표시, 차트/표는 완료 후)
+                text_placeholder = st.empty()
+
+                # 디자인 이미지 placeholder (패키징 옵션별로 완성되는 대로 표시)
+                image_placeholder = st.empty()
+
                 # V6 실행
                 response = execute_v6_agent(
                     prompt,
                     st.session_state.v6_api_key,
-                    progress_placeholder
+                    progress_placeholder,
+                    text_placeholder,
+                    image_placeholder
                 )
 
-                # 진행상황 지우기
+                # 진행상황/미리보기 이미지 지우기 (최종 이미지는 아래에서 상세 정보와 함께 표시)
                 progress_placeholder.empty()
+                image_placeholder.empty()
 
-                # 응답 표시
+                # 응답 표시 (스트리밍된 요약을 최종 답변으로 교체)
                 response_text = response.get('text', '응답을 생성하지 못했습니다.')
-                st.markdown(response_text)
+                text_placeholder.markdown(response_text)
 
                 # 시각화
                 if response.get('visualizations'):
@@ -254,20 +266,48 @@ def show_sidebar():
                 st.rerun()
 
 
-def execute_v6_agent(user_query: str, api_key: str, progress_placeholder) -> dict:
-    """V6 Agent 실행"""
+def execute_v6_agent(
+    user_query: str,
+    api_key: str,
+    progress_placeholder,
+    text_placeholder=None,
+    image_placeholder=None
+) -> dict:
+    """
+    V6 Agent 실행
+
+    text_placeholder가 있으면 요약 텍스트를 토큰 단위로 스트리밍하고,
+    image_placeholder가 있으면 디자인 이미지를 완성되는 대로 표시
+    """
 
     try:
         # 환경변수에 API 키 설정 (OpenAI 클라이언트가 자동으로 읽음)
         import os
         os.environ["OPENAI_API_KEY"] = api_key
 
-        # LangGraph 생성
-        graph = create_graph()
+        # LangGraph (프로세스당 한 번만 컴파일, 이후 재사용)
+        graph = get_graph()
+
+        # 진행상황 콜백 (ImageGenerator는 dict로 진행상황/완성 이미지 전달)
+        streamed_images = []
+
+        def update_progress(progress):
+            if isinstance(progress, dict):
+                if progress.get("image") and image_placeholder is not None:
+                    streamed_images.append(progress["image"])
+                    with image_placeholder.container():
+                        for image_info in streamed_images:
+                            st.image(image_info["local_path"], caption=image_info.get("packaging_name"), width=350)
+                progress_placeholder.markdown(progress.get("message", ""))
+                return
+            progress_placeholder.markdown(progress)
 
-        # 진행상황 콜백
-        def update_progress(progress_text):
-            progress_placeholder.markdown(progress_text)
+        # 요약 텍스트 스트리밍 콜백 (도착한 토큰을 누적해서 표시)
+        streamed_parts = []
+
+        def stream_text(delta):
+            streamed_parts.append(delta)
+            text_placeholder.markdown("".join(streamed_parts) + "▌")
 
         # 대화 히스토리 구성 (최근 10개 메시지 = 5턴)
         conversation_history = []
@@ -284,6 +324,7 @@ def execute_v6_agent(user_query: str, api_key: str, progress_placeholder) -> dic
         initial_state = {
             "user_query": user_query,
             "ui_callback": update_progress,
+            "stream_callback": stream_text if text_placeholder is not None else None,
             "debug_mode": st.session_state.get('v6_debug_mode', False),  # Debug 모드 전달
             "conversation_history": conversation_history,  # 대화 히스토리 전달
             "messages": [],
@@ -312,21 +353,17 @@ def execute_v6_agent(user_query: str, api_key: str, progress_placeholder) -> dic
         # 최종 응답
         final_response = final_state.get("final_response", {})
 
-        # 로그 저장
+        # 로그 저장 (백그라운드, 바로 반환)
         logger = st.session_state.v6_logger
-        logger.log_query(
+        log_future = logger.log_query(
             user_query=user_query,
             state=final_state,
             final_response=final_response,
             error=final_state.get("error")
         )
 
-        # 최근 로그 ID 가져오기 (피드백용)
-        history = logger.get_user_history(limit=1)
-        log_id = history[0]['log_id'] if history else None
-
-        # 응답에 log_id 추가
-        final_response['log_id'] = log_id
+        # 응답에 log_id 추가 (저장 완료 시 log_id로 채워지는 Future, 피드백 버튼 표시 때 확정)
+        final_response['log_id'] = log_future
 
         # Debug 모드 추적 정보 추가
         if st.session_state.get('v6_debug_mode', False):
@@ -371,8 +408,8 @@ def show_visualizations(visualizations: list):
 
         if figure:
             if viz_type == 'wordcloud':
-                # Matplotlib figure
-                st.pyplot(figure, use_container_width=False)
+                # PNG bytes (공용 워드클라우드 렌더러)
+                st.image(figure, caption=viz.get('title'), width=600)
             else:
                 # Plotly figure
                 st.plotly_chart(figure, use_container_width=False)
@@ -447,6 +484,13 @@ def show_metadata(metadata: dict):
         if metadata.get('total_data_rows'):
             st.write(f"📊 분석 데이터: {metadata['total_data_rows']:,}개 리뷰")
 
+        # 비용 제한(LIMIT)으로 일부만 조회된 쿼리
+        for truncated in metadata.get('truncated_queries', []):
+            st.warning(
+                f"⚠️ Q{truncated['question_id']} 결과는 비용 제한으로 {truncated['row_count']:,}행까지만 조회되었습니다 "
+                f"(전체 건수 아님)"
+            )
+
         if metadata.get('visualization_confidence'):
             st.write(f"🎨 시각화 신뢰도: {metadata['visualization_confidence']:.0%}")
 
@@ -329,10 +329,10 @@ def show_text_mining_analysis(df, product_name):
     st.markdown("### 📊 키워드 워드클라우드")
     wordcloud_fig = create_keyword_wordcloud(keyword_df, title=f"{product_name} 주요 키워드")
     if wordcloud_fig:
-        # 표시 크기를 살짝 작게 조절 (원본 해상도는 유지)
+        # 가운데 컬럼 너비로 표시 (원본 해상도는 유지)
         col1, col2, col3 = st.columns([1.5, 3, 1.5])
         with col2:
-            st.pyplot(wordcloud_fig, use_container_width=False)
+            st.image(wordcloud_fig, caption=f"{product_name} 주요 키워드", use_column_width=True)
 
     st.markdown("---")
 
@@ -0,0 +1,248 @@
+#//==============================================================================//#
+"""
+utils/wordcloud_renderer.py
+공용 워드클라우드 렌더러 (분석 페이지 키워드 워드클라우드, V6 챗봇 워드클라우드)
+
+- 한글 폰트 경로는 프로세스에서 한 번만 탐색
+- 원형 마스크, WordCloud 인스턴스는 스타일별로 재사용
+- matplotlib Figure 없이 PNG bytes로 바로 렌더링 (st.image로 표시)
+- 같은 빈도 딕셔너리 + 스타일이면 이전 PNG를 그대로 반환 (LRU)
+
+last_updated: 2025.11.02
+"""
+#//==============================================================================//#
+
+import hashlib
+import io
+import json
+import os
+import platform
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional
+
+# 스타일별 WordCloud 설정 (size: 정사각형 한 변, radius: 원형 마스크 반지름)
+WORDCLOUD_STYLES = {
+    # 브랜드/채널/제품/LG생활건강 분석 페이지 키워드 워드클라우드 (고해상도)
+    "keyword_analysis": {
+        "size": 800,
+        "radius": 380,
+        "options": {
+            "background_color": "white",
+            "colormap": "Set2",
+            "relative_scaling": 0.7,  # 크기 차이 확대
+            "min_font_size": 12,
+            "max_font_size": 100,
+            "prefer_horizontal": 1.0,
+            "collocations": False,
+            "max_words": 30,
+            "mode": "RGBA",
+            "scale": 3,               # 조밀하게 배치
+            "repeat": False,
+            "contour_width": 0,
+            "contour_color": "white",
+            "margin": 1,
+            "random_state": 42        # 일관된 배치
+        }
+    },
+    # V6 챗봇 응답 워드클라우드
+    "chatbot": {
+        "size": 600,
+        "radius": 280,
+        "options": {
+            "background_color": "white",
+            "colormap": "Set2",
+            "relative_scaling": 0.7,
+            "min_font_size": 12,
+            "max_font_size": 100,
+            "max_words": 30,
+            "random_state": 42
+        }
+    }
+}
+
+# PNG 결과 캐시 최대 항목 수
+MAX_CACHED_IMAGES = 64
+
+FONT_CANDIDATES = {
+    "Windows": [
+        "C:/Windows/Fonts/malgun.ttf",
+        "C:/Windows/Fonts/malgunbd.ttf",
+        "C:/Windows/Fonts/NanumGothic.ttf",
+    ],
+    "Darwin": [
+        "/System/Library/Fonts/AppleGothic.ttf",
+        "/Library/Fonts/AppleGothic.ttf",
+        "/System/Library/Fonts/Supplemental/AppleGothic.ttf",
+    ],
+    "Linux": [
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
+        "/usr/share/fonts/nanum/NanumGothic.ttf",
+    ]
+}
+
+
+@lru_cache(maxsize=1)
+def get_korean_font_path() -> Optional[str]:
+    """
+    한글 폰트 경로 (처음 한 번만 탐색)
+
+    Returns:
+        폰트 파일 경로 (없으면 None - 한글이 네모로 표시됨)
+    """
+    for font in FONT_CANDIDATES.get(platform.system(), FONT_CANDIDATES["Linux"]):
+        if os.path.exists(font):
+            return font
+
+    # 시스템 폰트에서 한글 폰트 찾기
+    try:
+        import matplotlib.font_manager as fm
+
+        for font in fm.findSystemFonts(fontpaths=None, fontext="ttf"):
+            if "malgun" in font.lower() or "nanum" in font.lower():
+                return font
+    except ImportError:
+        pass
+
+    return None
+
+
+@lru_cache(maxsize=8)
+def get_circle_mask(size: int, radius: int):
+    """원형 마스크 (바깥쪽 255, 읽기 전용으로 공유)"""
+    import numpy as np
+
+    x, y = np.ogrid[:size, :size]
+    center = size // 2
+    mask = 255 * ((x - center) ** 2 + (y - center) ** 2 > radius ** 2).astype(np.uint8)
+    mask.setflags(write=False)
+    return mask
+
+
+class WordCloudRenderer:
+    """
+    스타일별 WordCloud 인스턴스 재사용 + PNG 결과 캐시 (스레드 안전)
+
+    Example:
+        >>> png = get_wordcloud_renderer().render_png({"보습": 10, "향": 3}, style="chatbot")
+        >>> st.image(png)
+    """
+
+    def __init__(self, max_cached_images: int = MAX_CACHED_IMAGES):
+        self.max_cached_images = max_cached_images
+        self._instances: Dict[str, object] = {}
+        self._instance_locks: Dict[str, threading.Lock] = {}
+        self._images: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render_png(self, frequencies: Dict[str, float], style: str = "chatbot") -> Optional[bytes]:
+        """
+        빈도 딕셔너리 → 워드클라우드 PNG
+
+        Args:
+            frequencies: {단어: 빈도/점수}
+            style: WORDCLOUD_STYLES 키
+
+        Returns:
+            PNG bytes (그릴 단어가 없으면 None)
+        """
+        frequencies = {str(k): float(v) for k, v in frequencies.items() if k and v and float(v) > 0}
+        if not frequencies:
+            return None
+
+        key = self._cache_key(frequencies, style)
+        with self._lock:
+            cached = self._images.get(key)
+            if cached is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        wordcloud, instance_lock = self._get_instance(style)
+
+        # WordCloud는 generate 결과(layout_)를 인스턴스에 저장하므로 같은 스타일은 순서대로 렌더링
+        with instance_lock:
+            image = wordcloud.generate_from_frequencies(frequencies).to_image()
+
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        png = buffer.getvalue()
+
+        with self._lock:
+            self._images[key] = png
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_cached_images:
+                self._images.popitem(last=False)
+
+        return png
+
+    def _get_instance(self, style: str):
+        """스타일별 WordCloud 인스턴스 (처음 사용할 때 생성)"""
+        with self._lock:
+            if style not in self._instances:
+                from wordcloud import WordCloud
+
+                config = WORDCLOUD_STYLES[style]
+                self._instances[style] = WordCloud(
+                    font_path=get_korean_font_path(),
+                    width=config["size"],
+                    height=config["size"],
+                    mask=get_circle_mask(config["size"], config["radius"]),
+                    **config["options"]
+                )
+                self._instance_locks[style] = threading.Lock()
+            return self._instances[style], self._instance_locks[style]
+
+    def _cache_key(self, frequencies: Dict[str, float], style: str) -> str:
+        payload = json.dumps([style, sorted(frequencies.items())], ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def clear(self):
+        """PNG 캐시 비우기"""
+        with self._lock:
+            self._images.clear()
+
+
+_renderer: Optional[WordCloudRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_wordcloud_renderer() -> WordCloudRenderer:
+    """프로세스 공유 렌더러"""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = WordCloudRenderer()
+        return _renderer
+
+
+def render_wordcloud_png(frequencies: Dict[str, float], style: str = "chatbot") -> Optional[bytes]:
+    """공유 렌더러로 워드클라우드 PNG 생성"""
+    return get_wordcloud_renderer().render_png(frequencies, style=style)
+
+
+# ===== 테스트 코드 =====
+if __name__ == "__main__":
+    import time
+
+    sample = {"보습": 120, "촉촉": 80, "향": 40, "흡수": 35, "자극": 12, "가격": 9, "용량": 5}
+    renderer = get_wordcloud_renderer()
+
+    print(f"한글 폰트: {get_korean_font_path()}")
+    for style in WORDCLOUD_STYLES:
+        start = time.perf_counter()
+        png = renderer.render_png(sample, style=style)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        renderer.render_png(sample, style=style)
+        cached = time.perf_counter() - start
+
+        print(f"{style}: {len(png):,} bytes, 첫 렌더링 {first * 1000:.0f}ms / 캐시 {cached * 1000:.2f}ms")
+
+    print(f"캐시 적중 {renderer.hits} / 미스 {renderer.misses}")